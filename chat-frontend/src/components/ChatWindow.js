@@ -1,6 +1,6 @@
 import React, { useState, useRef, useEffect } from 'react';
 import './ChatWindow.css';
-import { sendSummaryRequest, querySummary } from '../services/api';
+import { sendSummaryRequest, streamSummaryRequest, querySummary } from '../services/api';
 
 const ChatWindow = () => {
   const [messages, setMessages] = useState([]);
@@ -8,7 +8,10 @@ const ChatWindow = () => {
   const [systemPrompt, setSystemPrompt] = useState('');
   const [isLoading, setIsLoading] = useState(false);
   const [callkey, setCallkey] = useState(null);
+  const [useStreaming, setUseStreaming] = useState(false);
+  const [isStreaming, setIsStreaming] = useState(false);
   const messagesEndRef = useRef(null);
+  const abortControllerRef = useRef(null);
 
   const scrollToBottom = () => {
     messagesEndRef.current?.scrollIntoView({ behavior: 'smooth' });
@@ -22,6 +25,58 @@ const ChatWindow = () => {
     return `test-${Date.now()}`;
   };
 
+  // 마지막 메시지(스트리밍 중인 요약)에 토큰 이어 붙이기
+  const appendToLastMessage = (token) => {
+    setMessages(prev => {
+      const last = prev[prev.length - 1];
+      return [...prev.slice(0, -1), { ...last, text: last.text + token }];
+    });
+  };
+
+  // 스트리밍 요약 요청 (토큰이 도착하는 대로 표시)
+  const handleStreamSend = async (currentCallkey, userMessage) => {
+    const abortController = new AbortController();
+    abortControllerRef.current = abortController;
+    let received = false;
+
+    try {
+      await streamSummaryRequest(
+        currentCallkey,
+        userMessage,
+        systemPrompt.trim() || undefined,
+        (token) => {
+          if (!received) {
+            // 첫 토큰 도착 시 로딩 표시를 요약 메시지로 교체
+            received = true;
+            setIsStreaming(true);
+            setMessages(prev => [...prev, {
+              type: 'summary',
+              text: token,
+              timestamp: new Date()
+            }]);
+          } else {
+            appendToLastMessage(token);
+          }
+        },
+        abortController.signal
+      );
+      if (!received) {
+        setMessages(prev => [...prev, {
+          type: 'summary',
+          text: '(요약 내용 없음)',
+          timestamp: new Date()
+        }]);
+      }
+    } finally {
+      abortControllerRef.current = null;
+      setIsStreaming(false);
+    }
+  };
+
+  const handleStop = () => {
+    abortControllerRef.current?.abort();
+  };
+
   const handleSend = async () => {
     if (!inputText.trim() || isLoading) return;
 
@@ -43,6 +98,11 @@ const ChatWindow = () => {
     setIsLoading(true);
 
     try {
+      if (useStreaming) {
+        await handleStreamSend(currentCallkey, userMessage);
+        return;
+      }
+
       // 요약 요청 (시스템 프롬프트 포함, 없으면 undefined)
       const response = await sendSummaryRequest(
         currentCallkey, 
@@ -61,6 +121,7 @@ const ChatWindow = () => {
         throw new Error(response.answer || '요약 실패');
       }
     } catch (error) {
+      if (error.name === 'AbortError') return;
       console.error('요약 요청 실패:', error);
       setMessages(prev => [...prev, {
         type: 'error',
@@ -120,6 +181,20 @@ const ChatWindow = () => {
           {callkey && <span>Callkey: {callkey}</span>}
         </div>
         <div className="chat-actions">
+          <label className="streaming-toggle">
+            <input
+              type="checkbox"
+              checked={useStreaming}
+              onChange={(e) => setUseStreaming(e.target.checked)}
+              disabled={isLoading}
+            />
+            실시간 스트리밍
+          </label>
+          {isStreaming && (
+            <button onClick={handleStop} className="btn-clear">
+              중지
+            </button>
+          )}
           {callkey && (
             <button onClick={handleQuery} disabled={isLoading} className="btn-query">
               저장된 결과 조회
@@ -150,7 +225,7 @@ const ChatWindow = () => {
           </div>
         ))}
         
-        {isLoading && (
+        {isLoading && !isStreaming && (
           <div className="message message-loading">
             <div className="message-content">
               <div className="loading-spinner"></div>
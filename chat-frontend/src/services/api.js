@@ -36,6 +36,93 @@ export const sendSummaryRequest = async (callkey, text, systemPrompt) => {
   }
 };
 
+// 요약 스트리밍 요청 (Server-Sent Events)
+// 생성되는 토큰마다 onToken(token)을 호출하고, 완료 시 done 이벤트 데이터를 반환
+// 스트리밍 결과는 DB에 저장되지 않음 (Orchestrator 직접 호출)
+export const streamSummaryRequest = async (callkey, text, systemPrompt, onToken, signal) => {
+  const requestBody = {
+    callkey,
+    text,
+  };
+
+  // 시스템 프롬프트가 있으면 추가
+  if (systemPrompt) {
+    requestBody.system_prompt = systemPrompt;
+  }
+
+  let response;
+  try {
+    response = await fetch(`${API_BASE_URL}/api/llm/process/stream`, {
+      method: 'POST',
+      headers: {
+        'Content-Type': 'application/json; charset=utf-8',
+        Accept: 'text/event-stream',
+      },
+      body: JSON.stringify(requestBody),
+      signal,
+    });
+  } catch (error) {
+    if (error.name === 'AbortError') throw error;
+    throw new Error('서버에 연결할 수 없습니다.');
+  }
+
+  if (!response.ok) {
+    let detail = '';
+    try {
+      detail = (await response.json()).detail;
+    } catch (e) {
+      // 본문이 JSON이 아닌 경우 상태 코드만 사용
+    }
+    throw new Error(detail || `요약 스트리밍 요청 실패 (${response.status})`);
+  }
+
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder('utf-8');
+  let buffer = '';
+  let doneData = null;
+
+  // SSE 이벤트 하나 처리 (빈 줄로 구분된 블록)
+  const handleEvent = (block) => {
+    let eventName = 'message';
+    const dataLines = [];
+    block.split('\n').forEach((line) => {
+      if (line.startsWith('event:')) {
+        eventName = line.slice(6).trim();
+      } else if (line.startsWith('data:')) {
+        dataLines.push(line.slice(5).trimStart());
+      }
+    });
+    if (dataLines.length === 0) return;
+
+    const data = JSON.parse(dataLines.join('\n'));
+    if (eventName === 'error') {
+      throw new Error(data.error || '요약 스트리밍 중 오류가 발생했습니다.');
+    } else if (eventName === 'done') {
+      doneData = data;
+    } else if (data.token) {
+      onToken(data.token);
+    }
+  };
+
+  while (true) {
+    const { value, done } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true }).replace(/\r\n/g, '\n');
+
+    let boundary = buffer.indexOf('\n\n');
+    while (boundary !== -1) {
+      handleEvent(buffer.slice(0, boundary));
+      buffer = buffer.slice(boundary + 2);
+      boundary = buffer.indexOf('\n\n');
+    }
+  }
+  if (buffer.trim()) {
+    handleEvent(buffer);
+  }
+
+  return doneData;
+};
+
 // 요약 결과 조회
 export const querySummary = async (callkey) => {
   try {
@@ -4,14 +4,17 @@ import com.fasterxml.jackson.databind.ObjectMapper;
 import lombok.RequiredArgsConstructor;
 import lombok.extern.slf4j.Slf4j;
 import org.springframework.beans.factory.annotation.Value;
+import org.springframework.core.ParameterizedTypeReference;
 import org.springframework.http.HttpEntity;
 import org.springframework.http.HttpHeaders;
+import org.springframework.http.HttpMethod;
 import org.springframework.http.MediaType;
 import org.springframework.http.ResponseEntity;
 import org.springframework.stereotype.Component;
 import org.springframework.web.client.RestTemplate;
 import org.springframework.web.client.RestClientException;
 
+import java.util.List;
 import java.util.Map;
 
 @Slf4j
@@ -84,4 +87,42 @@ public class OrchestratorClient {
             throw new RuntimeException("요청 객체 변환 실패: " + e.getMessage(), e);
         }
     }
+    
+    /**
+     * LLM Orchestrator로 일괄 처리 요청 전달
+     * 
+     * 항목별 오류는 배치 전체를 실패시키지 않고 callkey별 결과에 기록됩니다.
+     * 
+     * @param items 요청 본문 목록 ({callkey, text, pipeline_name, ...})
+     * @return 일괄 처리 결과 (total, succeeded, failed, results: callkey별 결과)
+     */
+    public Map<String, Object> processBatch(List<Map<String, Object>> items) {
+        try {
+            log.debug("LLM Orchestrator 일괄 호출: URL={}, 항목 수={}", orchestratorUrl, items.size());
+            
+            HttpHeaders headers = new HttpHeaders();
+            headers.setContentType(MediaType.APPLICATION_JSON);
+            
+            HttpEntity<Map<String, Object>> httpEntity = new HttpEntity<>(Map.of("items", items), headers);
+            
+            ResponseEntity<Map<String, Object>> response = restTemplate.exchange(
+                    orchestratorUrl + "/api/llm/process/batch",
+                    HttpMethod.POST,
+                    httpEntity,
+                    new ParameterizedTypeReference<Map<String, Object>>() {}
+            );
+            
+            Map<String, Object> result = response.getBody();
+            if (result == null) {
+                throw new RuntimeException("LLM Orchestrator 일괄 처리 응답이 비어있습니다.");
+            }
+            
+            return result;
+            
+        } catch (RestClientException e) {
+            log.error("LLM Orchestrator 일괄 호출 실패: 항목 수={}, error={}", 
+                    items.size(), e.getMessage(), e);
+            throw new RuntimeException("LLM Orchestrator 일괄 호출 실패: " + e.getMessage(), e);
+        }
+    }
 }
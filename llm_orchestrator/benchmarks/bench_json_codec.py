@@ -0,0 +1,229 @@
+"""
+JSON 코덱 벤치마크
+
+요청 1건의 JSON 처리 CPU 시간을 기존 방식(표준 json + 텍스트 디코딩)과 JSON 코덱(json/orjson)으로 비교합니다.
+측정 단계:
+    request   요청 본문 파싱 (기존: request.json())
+    payload   LLM 페이로드 직렬화 (기존: httpx json= 인자, 한글 \\uXXXX 이스케이프)
+    response  LLM 응답 디코딩 (기존: response.encoding = "utf-8" 후 response.json())
+    stream    SSE 청크 디코딩 (기존: aiter_lines() 텍스트 라인 + 라인별 json.loads)
+
+실행 (llm_orchestrator 디렉토리에서):
+    python -m benchmarks.bench_json_codec
+    python -m benchmarks.bench_json_codec --sizes 10000 100000 --iterations 200 --json result.json
+"""
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.json_codec import JsonCodec, ORJSON_AVAILABLE  # noqa: E402
+
+# 상담 전사 문장 샘플 (대괄호 STT 표기 포함)
+SAMPLE_SENTENCES = [
+    "상담사: 네 관세청 고객지원센터입니다 무엇을 도와드릴까요",
+    "고객: 해외 직구로 주문한 물건이 통관 보류라고 나와서요",
+    "상담사: 네 운송장 번호 [일이삼사 오육칠팔 구공] 말씀해 주시겠어요",
+    "고객: 개인통관고유부호는 [피 일이삼 사오육 칠팔구공]입니다",
+    "상담사: 확인해 보니 목록통관 대상이 아니라 일반 수입신고로 전환되었습니다",
+    "고객: 그럼 세금은 얼마 정도 나오나요 \"관부가세\" 포함해서요",
+    "상담사: 물품가격 사만 칠천 엔 기준으로 관세 팔 퍼센트 부가세 십 퍼센트입니다",
+    "고객: 연락처는 [공일공 이삼사오 육칠팔구]로 문자 주세요",
+]
+
+
+def make_transcript(size: int, seed: int = 0) -> str:
+    """지정한 길이(문자 수) 이상의 한국어 상담 전사 생성"""
+    rng = random.Random(seed)
+    lines: List[str] = []
+    length = 0
+    while length < size:
+        line = rng.choice(SAMPLE_SENTENCES)
+        lines.append(line)
+        length += len(line) + 1
+    return "\n".join(lines)
+
+
+def make_fixtures(size: int) -> Dict[str, Any]:
+    """요청 1건의 입력 데이터 생성 (요청 본문, 페이로드, 응답, SSE 스트림)"""
+    transcript = make_transcript(size)
+    summary = make_transcript(600, seed=1)
+    request_body = json.dumps({
+        "callkey": "bench-0001",
+        "text": transcript,
+        "pipeline_name": "summarize_pipeline",
+        "system_prompt": "당신은 관세청 상담내용 요약 전문가입니다."
+    }, ensure_ascii=False).encode("utf-8")
+    payload = {
+        "model": "/model",
+        "messages": [
+            {"role": "system", "content": "당신은 관세청 상담내용 요약 전문가입니다. 주어진 텍스트를 요약하세요."},
+            {"role": "user", "content": f"다음 상담 내용을 요약해주세요:\n\n{transcript}"}
+        ],
+        "max_tokens": 1024,
+        "temperature": 0.7,
+        "top_p": 1.0
+    }
+    response_body = json.dumps({
+        "id": "chatcmpl-bench",
+        "object": "chat.completion",
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": summary}, "finish_reason": "stop"}],
+        "usage": {"prompt_tokens": size // 2, "completion_tokens": 300, "total_tokens": size // 2 + 300}
+    }, ensure_ascii=False).encode("utf-8")
+    # 토큰(2글자) 단위 SSE 청크, 네트워크 읽기 단위(4KB)로 분할
+    events = [
+        "data: " + json.dumps({"id": "chatcmpl-bench", "choices": [{"index": 0, "delta": {"content": summary[i:i + 2]}}]}, ensure_ascii=False) + "\n\n"
+        for i in range(0, len(summary), 2)
+    ]
+    stream_body = ("".join(events) + "data: [DONE]\n\n").encode("utf-8")
+    stream_chunks = [stream_body[i:i + 4096] for i in range(0, len(stream_body), 4096)]
+    return {
+        "request_body": request_body,
+        "payload": payload,
+        "response_body": response_body,
+        "stream_chunks": stream_chunks,
+        "stream_tokens": len(events)
+    }
+
+
+def baseline_steps() -> Dict[str, Callable[[Dict[str, Any]], Any]]:
+    """기존 방식 (표준 json + 텍스트 디코딩)"""
+    def request(f):
+        return json.loads(f["request_body"])
+    
+    def payload(f):
+        # httpx 0.25의 json= 인자와 동일 (ensure_ascii=True)
+        return json.dumps(f["payload"]).encode("utf-8")
+    
+    def response(f):
+        return json.loads(f["response_body"].decode("utf-8"))
+    
+    def stream(f):
+        content = []
+        pending = ""
+        for chunk in f["stream_chunks"]:
+            pending += chunk.decode("utf-8", errors="ignore")
+            lines = pending.split("\n")
+            pending = lines.pop()
+            for line in lines:
+                if line.startswith("data: "):
+                    data = line[6:]
+                    if data == "[DONE]":
+                        break
+                    delta = json.loads(data)["choices"][0].get("delta", {})
+                    if "content" in delta:
+                        content.append(delta["content"])
+        return "".join(content)
+    
+    return {"request": request, "payload": payload, "response": response, "stream": stream}
+
+
+def codec_steps(codec: JsonCodec) -> Dict[str, Callable[[Dict[str, Any]], Any]]:
+    """JSON 코덱 방식 (bytes 그대로 디코딩/인코딩)"""
+    def request(f):
+        return codec.loads(f["request_body"])
+    
+    def payload(f):
+        return codec.dumps(f["payload"])
+    
+    def response(f):
+        return codec.loads(f["response_body"])
+    
+    def stream(f):
+        content = []
+        buffer = b""
+        for chunk in f["stream_chunks"]:
+            buffer += chunk
+            lines = buffer.split(b"\n")
+            buffer = lines.pop()
+            for line in lines:
+                if line.startswith(b"data:"):
+                    data = line[5:].lstrip()
+                    if data == b"[DONE]":
+                        break
+                    delta = codec.loads(data)["choices"][0].get("delta", {})
+                    if "content" in delta:
+                        content.append(delta["content"])
+        return "".join(content)
+    
+    return {"request": request, "payload": payload, "response": response, "stream": stream}
+
+
+def measure(step: Callable[[Dict[str, Any]], Any], fixtures: Dict[str, Any], iterations: int) -> float:
+    """단계 1회 평균 CPU 시간 (µs)"""
+    for _ in range(max(1, iterations // 10)):
+        step(fixtures)
+    start = time.process_time()
+    for _ in range(iterations):
+        step(fixtures)
+    return (time.process_time() - start) / iterations * 1_000_000
+
+
+def run(sizes: List[int], iterations: int) -> Dict[str, Any]:
+    """벤치마크 실행"""
+    variants = {"baseline": baseline_steps(), "codec_json": codec_steps(JsonCodec("json"))}
+    if ORJSON_AVAILABLE:
+        variants["codec_orjson"] = codec_steps(JsonCodec("orjson"))
+    
+    results: Dict[str, Any] = {"iterations": iterations, "orjson_available": ORJSON_AVAILABLE, "sizes": {}}
+    for size in sizes:
+        fixtures = make_fixtures(size)
+        # 모든 방식의 결과가 동일한지 확인
+        expected = {name: step(fixtures) for name, step in variants["baseline"].items() if name != "payload"}
+        for variant, steps in variants.items():
+            for name, value in expected.items():
+                assert steps[name](fixtures) == value, f"{variant}.{name} 결과가 기존 방식과 다릅니다."
+        
+        size_result: Dict[str, Any] = {
+            "request_bytes": len(fixtures["request_body"]),
+            "stream_tokens": fixtures["stream_tokens"],
+            "payload_bytes": {variant: len(steps["payload"](fixtures)) for variant, steps in variants.items()},
+            "cpu_us": {}
+        }
+        for variant, steps in variants.items():
+            timings = {name: round(measure(step, fixtures, iterations), 1) for name, step in steps.items()}
+            timings["total"] = round(sum(timings.values()), 1)
+            size_result["cpu_us"][variant] = timings
+        results["sizes"][str(size)] = size_result
+    return results
+
+
+def print_report(results: Dict[str, Any]) -> None:
+    """결과 표 출력"""
+    print(f"반복 횟수={results['iterations']}, orjson 설치={results['orjson_available']}")
+    for size, size_result in results["sizes"].items():
+        print()
+        print(f"전사 길이 {size}자 (요청 본문 {size_result['request_bytes']:,} bytes, SSE 토큰 {size_result['stream_tokens']}개)")
+        print(f"{'방식':<14}{'request':>10}{'payload':>10}{'response':>10}{'stream':>10}{'total':>10}{'payload bytes':>15}")
+        baseline_total = size_result["cpu_us"]["baseline"]["total"]
+        for variant, timings in size_result["cpu_us"].items():
+            speedup = baseline_total / timings["total"] if timings["total"] else 0.0
+            print(
+                f"{variant:<14}{timings['request']:>10}{timings['payload']:>10}{timings['response']:>10}"
+                f"{timings['stream']:>10}{timings['total']:>10}{size_result['payload_bytes'][variant]:>15,}  x{speedup:.2f}"
+            )
+    print()
+    print("단위: 요청 1건당 CPU 시간 (µs)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="JSON 코덱 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[2000, 20000, 100000], help="전사 길이 (문자 수)")
+    parser.add_argument("--iterations", type=int, default=300, help="단계별 반복 횟수")
+    parser.add_argument("--json", dest="json_path", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+    
+    results = run(args.sizes, args.iterations)
+    print_report(results)
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps(results, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"결과 저장: {args.json_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,455 @@
+"""
+/api/llm/process 부하 테스트
+
+JSONL 파일의 요청 본문({"text": ..., "pipeline_name": ...}, 한 줄에 하나)을 실행 중인 오케스트레이터에 보내
+지연 시간, 처리량, 오류 종류, 대기 시간을 측정합니다. 요청 수가 파일보다 많으면 파일을 처음부터 반복합니다.
+--input을 지정하지 않으면 합성 상담 전사(요청마다 다른 내용, 기본 파이프라인)를 사용합니다.
+
+부하 방식:
+    --rate R          개방형 (도착률 R req/s로 응답과 무관하게 전송, --arrival poisson|uniform)
+                      지연 시간은 예정 전송 시각부터 측정하므로 서버가 밀려도 지연이 과소 측정되지 않음
+                      --max-in-flight로 동시 요청 수를 제한하면 초과 요청은 클라이언트에서 대기 (클라이언트 대기 시간으로 집계)
+    --concurrency C   폐쇄형 (C개 작업자가 응답을 받으면 바로 다음 요청 전송)
+
+측정 항목:
+    지연 시간 p50/p95/p99/max (전체, 클라이언트 대기, 서버 대기(X-Queue-Wait-Ms), 서버 실행(X-Exec-Time-Ms))
+    처리량 (성공 응답/초), 오류 종류 (HTTP 상태 코드, 연결/시간 초과 예외), 처리 모델(X-Served-Model) 분포
+    종료 후 서버 상태 (/api/llm/admission, /concurrency, /pools, /deadline, 워커가 여러 개면 응답한 워커의 값)
+
+모의 백엔드로 실행 (--launch-mock PROFILE):
+    tools.mock_llm_server를 지정한 프로필로 띄우고, 설정 파일(--config, 기본 config/settings.yml)의 모든 모델 base_url을
+    모의 서버로 바꾼 설정으로 오케스트레이터를 --workers 개 워커로 띄운 뒤 측정합니다 (GPU 없이 용량 수치 재현).
+    --set 경로=값으로 설정 값을 바꿔 풀 크기/제한 값별 결과를 비교할 수 있습니다 (값은 YAML로 해석, 리스트는 숫자 인덱스).
+    같은 본문이 반복되면 동일 호출 합치기/응답 캐시의 영향을 받으므로 필요하면 --set으로 끄고 측정합니다.
+
+실행 (llm_orchestrator 디렉토리에서):
+    python -m benchmarks.bench_load --url http://localhost:8000 --input requests.jsonl --rate 20 --duration 60
+    python -m benchmarks.bench_load --url http://localhost:8000 --input requests.jsonl --concurrency 32 --requests 2000
+    python -m benchmarks.bench_load --launch-mock vllm --workers 2 --rate 50 --duration 30 --json result.json
+    python -m benchmarks.bench_load --launch-mock vllm_saturated --concurrency 64 --requests 1000 \\
+        --set llm.vllm.models.0.http_pool.max_connections=16 --set admission.model_default.max_in_flight=16
+"""
+import argparse
+import asyncio
+import copy
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import httpx  # noqa: E402
+import yaml  # noqa: E402
+from benchmarks.bench_summary_util import make_corpus  # noqa: E402
+from core.loader import load_yaml_config  # noqa: E402
+
+ORCHESTRATOR_DIR = Path(__file__).resolve().parent.parent
+
+# 종료 후 조회하는 서버 상태
+SERVER_STATS_PATHS = ["/api/llm/admission", "/api/llm/concurrency", "/api/llm/pools", "/api/llm/deadline"]
+
+
+def free_port() -> int:
+    """사용하지 않는 로컬 포트"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """백분위 값"""
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+
+def latency_summary(values: List[float]) -> Optional[Dict[str, float]]:
+    """지연 시간 요약 (ms)"""
+    if not values:
+        return None
+    return {
+        "p50": round(percentile(values, 50), 1),
+        "p95": round(percentile(values, 95), 1),
+        "p99": round(percentile(values, 99), 1),
+        "max": round(max(values), 1),
+        "mean": round(sum(values) / len(values), 1)
+    }
+
+
+def load_requests(path: Optional[str], synthetic_count: int, synthetic_size: int) -> List[Dict[str, Any]]:
+    """요청 본문 목록 (JSONL 파일 또는 합성 전사)"""
+    if path is None:
+        return [{"text": make_corpus("mixed", synthetic_size, seed=index)} for index in range(synthetic_count)]
+    bodies = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line_num, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            body = json.loads(line)
+            if not isinstance(body, dict) or "text" not in body:
+                raise SystemExit(f"{path}:{line_num}: 요청 본문은 text 필드가 있는 JSON 객체여야 합니다.")
+            bodies.append(body)
+    if not bodies:
+        raise SystemExit(f"{path}: 요청이 없습니다.")
+    return bodies
+
+
+class LoadRun:
+    """부하 실행 상태 (요청별 기록, 동시 요청 수)"""
+    
+    def __init__(self, client: httpx.AsyncClient, url: str, bodies: List[Dict[str, Any]], headers: Dict[str, str], max_in_flight: int):
+        self.client = client
+        self.url = url
+        self.bodies = bodies
+        self.headers = headers
+        self.semaphore = asyncio.Semaphore(max_in_flight) if max_in_flight > 0 else None
+        self.records: List[Dict[str, Any]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+    
+    async def send(self, index: int, scheduled: float) -> None:
+        """요청 1건 전송 (scheduled: 예정 전송 시각, perf_counter 기준)"""
+        if self.semaphore is not None:
+            await self.semaphore.acquire()
+        try:
+            sent = time.perf_counter()
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            record: Dict[str, Any] = {"scheduled": scheduled, "client_queue_ms": (sent - scheduled) * 1000}
+            try:
+                response = await self.client.post(self.url, json=self.bodies[index % len(self.bodies)], headers=self.headers)
+                record["status"] = response.status_code
+                if response.status_code == 200:
+                    record["server_queue_ms"] = float(response.headers.get("X-Queue-Wait-Ms", 0))
+                    record["server_exec_ms"] = float(response.headers.get("X-Exec-Time-Ms", 0))
+                    record["served_model"] = response.headers.get("X-Served-Model", "")
+                    record["response_chars"] = len(response.text)
+            except httpx.HTTPError as e:
+                record["status"] = type(e).__name__
+            done = time.perf_counter()
+            record["service_ms"] = (done - sent) * 1000
+            record["latency_ms"] = (done - scheduled) * 1000
+            record["done"] = done
+            self.records.append(record)
+            self.in_flight -= 1
+        finally:
+            if self.semaphore is not None:
+                self.semaphore.release()
+
+
+async def run_open_loop(run: LoadRun, rate: float, requests: int, duration: Optional[float], arrival: str, seed: int) -> float:
+    """개방형 부하 (도착률 rate로 전송), 시작 시각 반환"""
+    rng = random.Random(seed)
+    tasks: List[asyncio.Task] = []
+    start = time.perf_counter()
+    scheduled = start
+    for index in range(requests):
+        if duration is not None and scheduled - start >= duration:
+            break
+        delay = scheduled - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(asyncio.create_task(run.send(index, scheduled)))
+        scheduled += rng.expovariate(rate) if arrival == "poisson" else 1 / rate
+    await asyncio.gather(*tasks)
+    return start
+
+
+async def run_closed_loop(run: LoadRun, concurrency: int, requests: int, duration: Optional[float]) -> float:
+    """폐쇄형 부하 (작업자 concurrency개), 시작 시각 반환"""
+    start = time.perf_counter()
+    next_index = 0
+    
+    async def worker() -> None:
+        nonlocal next_index
+        while next_index < requests and (duration is None or time.perf_counter() - start < duration):
+            index = next_index
+            next_index += 1
+            await run.send(index, time.perf_counter())
+    
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return start
+
+
+async def fetch_server_stats(client: httpx.AsyncClient, base_url: str) -> Dict[str, Any]:
+    """서버 상태 조회 (실패한 항목은 오류 메시지)"""
+    stats: Dict[str, Any] = {}
+    for path in SERVER_STATS_PATHS:
+        try:
+            response = await client.get(f"{base_url}{path}", timeout=10)
+            stats[path] = response.json() if response.status_code == 200 else f"HTTP {response.status_code}"
+        except (httpx.HTTPError, ValueError) as e:
+            stats[path] = f"{type(e).__name__}: {e}"
+    return stats
+
+
+def summarize(run: LoadRun, start: float, args: argparse.Namespace) -> Dict[str, Any]:
+    """요청별 기록 집계"""
+    records = run.records
+    ok = [record for record in records if record["status"] == 200]
+    end = max((record["done"] for record in records), default=start)
+    elapsed = max(end - start, 1e-9)
+    # 전송률은 마지막 요청을 보낸 시각까지 기준 (남은 응답을 기다린 시간 제외)
+    send_window = max((record["scheduled"] for record in records), default=start) - start
+    errors: Dict[str, int] = {}
+    served: Dict[str, int] = {}
+    for record in records:
+        if record["status"] != 200:
+            errors[str(record["status"])] = errors.get(str(record["status"]), 0) + 1
+        elif record["served_model"]:
+            served[record["served_model"]] = served.get(record["served_model"], 0) + 1
+    return {
+        "mode": "open" if args.rate else "closed",
+        "rate": args.rate,
+        "arrival": args.arrival if args.rate else None,
+        "concurrency": args.concurrency,
+        "max_in_flight_limit": args.max_in_flight,
+        "requests": len(records),
+        "succeeded": len(ok),
+        "failed": len(records) - len(ok),
+        "elapsed_s": round(elapsed, 3),
+        "offered_rps": round(len(records) / send_window, 1) if send_window > 0 else None,
+        "throughput_rps": round(len(ok) / elapsed, 1),
+        "max_in_flight": run.max_in_flight,
+        "latency_ms": latency_summary([record["latency_ms"] for record in ok]),
+        "service_ms": latency_summary([record["service_ms"] for record in ok]),
+        "client_queue_ms": latency_summary([record["client_queue_ms"] for record in records]),
+        "server_queue_ms": latency_summary([record["server_queue_ms"] for record in ok]),
+        "server_exec_ms": latency_summary([record["server_exec_ms"] for record in ok]),
+        "failed_latency_ms": latency_summary([record["latency_ms"] for record in records if record["status"] != 200]),
+        "errors": dict(sorted(errors.items(), key=lambda item: -item[1])),
+        "served_models": dict(sorted(served.items(), key=lambda item: -item[1]))
+    }
+
+
+def set_path(config: Dict[str, Any], assignment: str) -> None:
+    """설정 값 변경 (경로=값, 경로는 점으로 구분하고 리스트는 숫자 인덱스, 값은 YAML로 해석)"""
+    if "=" not in assignment:
+        raise SystemExit(f"--set 형식이 올바르지 않습니다: {assignment} (예: llm.http_pool.max_connections=64)")
+    path, value = assignment.split("=", 1)
+    keys = path.split(".")
+    target: Any = config
+    for key in keys[:-1]:
+        if isinstance(target, list):
+            target = target[int(key)]
+        else:
+            target = target.setdefault(key, {})
+    if isinstance(target, list):
+        target[int(keys[-1])] = yaml.safe_load(value)
+    else:
+        target[keys[-1]] = yaml.safe_load(value)
+
+
+def mock_config(config: Dict[str, Any], mock_url: str) -> Tuple[Dict[str, Any], List[str]]:
+    """모든 모델의 base_url을 모의 서버로 바꾸고 LLM 타입 설정을 모두 켠 설정과 모의 서버가 제공할 모델 이름 목록"""
+    config = copy.deepcopy(config)
+    llm = config.setdefault("llm", {})
+    model_names = set()
+    for llm_type in ("api", "vllm", "ollama"):
+        section = llm.get(llm_type) or {}
+        base_url = mock_url if llm_type == "ollama" else f"{mock_url}/v1"
+        models = list(section.get("models") or [])
+        # Ollama 단일 모델 설정 (models 목록 없이 base_url/model_name 지정)
+        if llm_type == "ollama" and section.get("base_url"):
+            models.append(section)
+        # 모의 서버가 모든 타입을 제공하므로 상태 확인과 /ready 판단 대상에 포함
+        if models:
+            section["enabled"] = True
+        for model in models:
+            model["base_url"] = base_url
+            if "base_urls" in model:
+                model["base_urls"] = [base_url]
+            if llm_type == "api" and not model.get("api_key"):
+                model["api_key"] = "mock"
+            model_names.add(model.get("model_name") or model.get("name"))
+    return config, sorted(name for name in model_names if name)
+
+
+def start_process(command: List[str], log_path: Path, env: Optional[Dict[str, str]] = None) -> subprocess.Popen:
+    """하위 프로세스 시작 (출력은 로그 파일)"""
+    log_file = open(log_path, "w", encoding="utf-8")
+    return subprocess.Popen(command, cwd=ORCHESTRATOR_DIR, stdout=log_file, stderr=subprocess.STDOUT, env=env)
+
+
+def stop_process(process: subprocess.Popen) -> None:
+    """하위 프로세스 종료 (10초 안에 끝나지 않으면 강제 종료)"""
+    if process.poll() is None:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+
+async def wait_until(client: httpx.AsyncClient, url: str, process: subprocess.Popen, timeout: float, log_path: Path) -> None:
+    """URL이 200을 반환할 때까지 대기"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise SystemExit(f"프로세스가 종료되었습니다 (종료 코드 {process.returncode}), 로그: {log_path}")
+        try:
+            if (await client.get(url, timeout=2)).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        await asyncio.sleep(0.5)
+    raise SystemExit(f"{timeout:.0f}초 안에 준비되지 않았습니다: {url}, 로그: {log_path}")
+
+
+async def launch_stack(client: httpx.AsyncClient, args: argparse.Namespace) -> Tuple[str, List[subprocess.Popen], Dict[str, Any]]:
+    """모의 백엔드와 오케스트레이터 실행, (오케스트레이터 URL, 프로세스 목록, 실행 정보) 반환"""
+    work_dir = Path(args.work_dir or tempfile.mkdtemp(prefix="bench_load_"))
+    work_dir.mkdir(parents=True, exist_ok=True)
+    mock_port = free_port()
+    mock_url = f"http://127.0.0.1:{mock_port}"
+    config, model_names = mock_config(load_yaml_config(args.config), mock_url)
+    for assignment in args.set or []:
+        set_path(config, assignment)
+    config_path = work_dir / "settings.yml"
+    config_path.write_text(yaml.safe_dump(config, allow_unicode=True, sort_keys=False), encoding="utf-8")
+    
+    mock_command = [
+        sys.executable, "-m", "tools.mock_llm_server", "--host", "127.0.0.1", "--port", str(mock_port),
+        "--profile", args.launch_mock, "--models", ",".join(model_names or ["/model"]), "--seed", str(args.seed)
+    ]
+    if args.profile_file:
+        mock_command += ["--profile-file", args.profile_file]
+    orchestrator_port = free_port()
+    orchestrator_url = f"http://127.0.0.1:{orchestrator_port}"
+    orchestrator_command = [
+        sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(orchestrator_port),
+        "--workers", str(args.workers), "--log-level", "warning"
+    ]
+    processes: List[subprocess.Popen] = []
+    try:
+        processes.append(start_process(mock_command, work_dir / "mock.log"))
+        await wait_until(client, f"{mock_url}/mock/stats", processes[0], 30, work_dir / "mock.log")
+        processes.append(start_process(orchestrator_command, work_dir / "orchestrator.log", env={**os.environ, "LLM_CONFIG_PATH": str(config_path)}))
+        await wait_until(client, f"{orchestrator_url}/api/llm/ready", processes[1], args.ready_timeout, work_dir / "orchestrator.log")
+    except BaseException:
+        for process in reversed(processes):
+            stop_process(process)
+        raise
+    print(f"모의 백엔드 실행: 프로필={args.launch_mock}, 워커={args.workers}, 작업 폴더={work_dir}")
+    launch_info = {
+        "profile": args.launch_mock,
+        "workers": args.workers,
+        "overrides": args.set or [],
+        "work_dir": str(work_dir),
+        "mock_url": mock_url
+    }
+    return orchestrator_url, processes, launch_info
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    """부하 테스트 실행"""
+    bodies = load_requests(args.input, args.requests or 1000, args.synthetic_size)
+    requests = args.requests or len(bodies)
+    if args.duration and not args.requests:
+        requests = sys.maxsize
+    headers = {"X-Request-Timeout-Ms": str(args.deadline_ms)} if args.deadline_ms else {}
+    connections = args.max_in_flight or args.concurrency or 1000
+    limits = httpx.Limits(max_connections=connections, max_keepalive_connections=connections)
+    processes: List[subprocess.Popen] = []
+    results: Dict[str, Any] = {}
+    async with httpx.AsyncClient(limits=limits, timeout=httpx.Timeout(args.timeout, connect=10.0)) as client:
+        try:
+            base_url = args.url.rstrip("/") if args.url else None
+            if args.launch_mock:
+                base_url, processes, results["launch"] = await launch_stack(client, args)
+            run_state = LoadRun(client, f"{base_url}/api/llm/process", bodies, headers, args.max_in_flight)
+            if args.rate:
+                start = await run_open_loop(run_state, args.rate, requests, args.duration, args.arrival, args.seed)
+            else:
+                start = await run_closed_loop(run_state, args.concurrency, requests, args.duration)
+            results.update(summarize(run_state, start, args))
+            results["url"] = base_url
+            results["input"] = args.input or f"synthetic ({args.synthetic_size} bytes)"
+            results["server_stats"] = await fetch_server_stats(client, base_url)
+            if args.launch_mock:
+                results["mock_stats"] = (await client.get(f"{results['launch']['mock_url']}/mock/stats", timeout=10)).json()
+        finally:
+            for process in reversed(processes):
+                stop_process(process)
+    return results
+
+
+def print_report(results: Dict[str, Any]) -> None:
+    """결과 출력"""
+    if results["mode"] == "open":
+        load = f"개방형 {results['rate']} req/s ({results['arrival']}), 동시 요청 제한={results['max_in_flight_limit'] or '없음'}"
+    else:
+        load = f"폐쇄형 동시 실행 {results['concurrency']}"
+    print(f"대상: {results['url']}, 부하: {load}, 입력: {results['input']}")
+    print(
+        f"요청 {results['requests']}건 (성공 {results['succeeded']}, 실패 {results['failed']}), 경과 {results['elapsed_s']}s, "
+        f"전송률 {results['offered_rps']} req/s, 처리량 {results['throughput_rps']} req/s, 최대 동시 요청 {results['max_in_flight']}"
+    )
+    print()
+    print(f"{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}{'mean':>10}  지연 시간 (ms)")
+    rows = [
+        ("전체 (예정 전송 시각부터)", "latency_ms"),
+        ("응답 (전송부터)", "service_ms"),
+        ("클라이언트 대기", "client_queue_ms"),
+        ("서버 대기 (어드미션)", "server_queue_ms"),
+        ("서버 실행", "server_exec_ms"),
+        ("실패 요청", "failed_latency_ms")
+    ]
+    for label, key in rows:
+        summary = results.get(key)
+        if summary:
+            print(f"{summary['p50']:>10}{summary['p95']:>10}{summary['p99']:>10}{summary['max']:>10}{summary['mean']:>10}  {label}")
+    if results["errors"]:
+        print()
+        print("오류: " + ", ".join(f"{status} x{count}" for status, count in results["errors"].items()))
+    if results["served_models"]:
+        print("처리 모델: " + ", ".join(f"{model} x{count}" for model, count in results["served_models"].items()))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="/api/llm/process 부하 테스트")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--url", help="실행 중인 오케스트레이터 주소 (예: http://localhost:8000)")
+    target.add_argument("--launch-mock", metavar="PROFILE", help="모의 백엔드 프로필로 오케스트레이터를 띄워 측정 (tools.mock_llm_server 프로필)")
+    load = parser.add_mutually_exclusive_group(required=True)
+    load.add_argument("--rate", type=float, help="개방형 도착률 (req/s)")
+    load.add_argument("--concurrency", type=int, help="폐쇄형 동시 실행 수")
+    parser.add_argument("--input", help="요청 JSONL 파일 (지정하지 않으면 합성 전사)")
+    parser.add_argument("--requests", type=int, help="요청 수 (기본: 파일 줄 수, 합성 전사는 1000)")
+    parser.add_argument("--duration", type=float, help="최대 실행 시간 (초, --requests 없이 지정하면 이 시간 동안 전송)")
+    parser.add_argument("--arrival", choices=["poisson", "uniform"], default="poisson", help="개방형 도착 간격 분포")
+    parser.add_argument("--max-in-flight", type=int, default=0, help="개방형 동시 요청 제한 (0이면 제한 없음)")
+    parser.add_argument("--deadline-ms", type=int, help="요청 기한 헤더 값 (X-Request-Timeout-Ms)")
+    parser.add_argument("--timeout", type=float, default=300.0, help="요청별 클라이언트 제한 시간 (초)")
+    parser.add_argument("--synthetic-size", type=int, default=2048, help="합성 전사 크기 (UTF-8 bytes)")
+    parser.add_argument("--seed", type=int, default=0, help="도착 간격/모의 서버 난수 시드")
+    parser.add_argument("--workers", type=int, default=1, help="--launch-mock 오케스트레이터 워커 수")
+    parser.add_argument("--config", help="--launch-mock 기준 설정 파일 (기본: config/settings.yml)")
+    parser.add_argument("--set", action="append", metavar="PATH=VALUE", help="--launch-mock 설정 값 변경 (여러 번 지정 가능)")
+    parser.add_argument("--profile-file", help="모의 서버 프로필 YAML 파일")
+    parser.add_argument("--work-dir", help="--launch-mock 설정/로그 폴더 (기본: 임시 폴더)")
+    parser.add_argument("--ready-timeout", type=float, default=60.0, help="오케스트레이터 준비 대기 시간 (초)")
+    parser.add_argument("--json", dest="json_path", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+    if args.rate is not None and args.rate <= 0:
+        parser.error("--rate는 0보다 커야 합니다.")
+    if args.concurrency is not None and args.concurrency <= 0:
+        parser.error("--concurrency는 0보다 커야 합니다.")
+    
+    results = asyncio.run(run(args))
+    print_report(results)
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps(results, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"결과 저장: {args.json_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+"""
+vLLM 마이크로 배치 벤치마크
+
+같은 모델/샘플링 파라미터의 요청 N건을 동시 실행 수 C로 보내 개별 요청(/chat/completions)과
+마이크로 배치(/completions prompt 목록)의 처리량과 지연 시간을 비교합니다.
+
+--base-url을 지정하지 않으면 내장 모의 vLLM 서버를 띄워 측정합니다.
+모의 서버는 요청마다 고정 처리 시간(--request-overhead-ms)과 프롬프트당 처리 시간(--prompt-ms)을 사용하고,
+동시에 처리하는 요청 수를 --server-concurrency로 제한합니다 (실제 효과는 vLLM 서버를 지정해 측정).
+모의 서버는 같은 이벤트 루프에서 실행되므로 클라이언트 측 요청당 비용(HTTP 연결 풀, JSON 처리)도 함께 측정됩니다.
+
+실행 (llm_orchestrator 디렉토리에서):
+    python -m benchmarks.bench_micro_batch
+    python -m benchmarks.bench_micro_batch --requests 1000 --concurrency 64 --window-ms 5 --max-batch-size 32
+    python -m benchmarks.bench_micro_batch --base-url http://localhost:8000/v1 --model-name /model --json result.json
+"""
+import argparse
+import asyncio
+import json
+import socket
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import uvicorn  # noqa: E402
+from fastapi import FastAPI, Request  # noqa: E402
+from core.llm_client import LLMClient  # noqa: E402
+from core.micro_batcher import get_micro_batch_manager  # noqa: E402
+from core.http_pool import get_http_pool_manager  # noqa: E402
+
+SYSTEM_PROMPT = "당신은 관세청 상담내용 요약 전문가입니다. 주어진 텍스트를 2~4문장으로 요약하세요."
+
+
+def create_mock_vllm(request_overhead_ms: float, prompt_ms: float, server_concurrency: int, counters: Dict[str, int]) -> FastAPI:
+    """모의 vLLM 서버 (/chat/completions, /completions)"""
+    app = FastAPI()
+    slots = asyncio.Semaphore(server_concurrency)
+    
+    async def process(prompt_count: int) -> None:
+        async with slots:
+            await asyncio.sleep((request_overhead_ms + prompt_ms * prompt_count) / 1000)
+    
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        counters["http_requests"] += 1
+        counters["prompts"] += 1
+        await process(1)
+        content = f"요약: {body['messages'][-1]['content'][-20:]}"
+        return {"choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}]}
+    
+    @app.post("/v1/completions")
+    async def completions(request: Request):
+        body = await request.json()
+        prompts = body["prompt"] if isinstance(body["prompt"], list) else [body["prompt"]]
+        counters["http_requests"] += 1
+        counters["prompts"] += len(prompts)
+        await process(len(prompts))
+        # 사용자 프롬프트 끝부분을 그대로 돌려주어 결과가 요청별로 올바르게 나뉘었는지 확인
+        choices = [
+            {"index": index, "text": f"요약: {prompt.split('<|im_end|>')[-2][-20:]}", "finish_reason": "stop"}
+            for index, prompt in enumerate(prompts)
+        ]
+        return {"choices": choices}
+    
+    return app
+
+
+def free_port() -> int:
+    """사용하지 않는 로컬 포트"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """백분위 값"""
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+
+async def run_variant(
+    name: str,
+    model_config: Dict[str, Any],
+    requests: int,
+    concurrency: int,
+    counters: Optional[Dict[str, int]]
+) -> Dict[str, Any]:
+    """요청 N건을 동시 실행 수 C로 실행하고 처리량/지연 시간 측정"""
+    client = LLMClient(model_config, "vllm")
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    mismatches = 0
+    
+    async def one(index: int) -> None:
+        nonlocal mismatches
+        user_prompt = f"다음 상담 내용을 요약해주세요:\n\n고객: 운송장 번호 문의드립니다 요청번호 {index:06d}"
+        async with semaphore:
+            start = time.perf_counter()
+            result = await client.generate(SYSTEM_PROMPT, user_prompt)
+            latencies.append((time.perf_counter() - start) * 1000)
+        if counters is not None and not result.endswith(f"{index:06d}"):
+            mismatches += 1
+    
+    if counters is not None:
+        counters["http_requests"] = 0
+        counters["prompts"] = 0
+    start = time.perf_counter()
+    await asyncio.gather(*(one(index) for index in range(requests)))
+    elapsed = time.perf_counter() - start
+    
+    result: Dict[str, Any] = {
+        "requests": requests,
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(requests / elapsed, 1),
+        "latency_ms": {
+            "p50": round(percentile(latencies, 50), 1),
+            "p95": round(percentile(latencies, 95), 1),
+            "p99": round(percentile(latencies, 99), 1),
+            "max": round(max(latencies), 1)
+        }
+    }
+    if counters is not None:
+        result["http_requests"] = counters["http_requests"]
+        result["result_mismatches"] = mismatches
+    print(f"{name:<10} 처리량={result['throughput_rps']:>8} req/s  p50={result['latency_ms']['p50']:>7}ms  p95={result['latency_ms']['p95']:>7}ms  HTTP 요청={result.get('http_requests', '-')}")
+    return result
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    """벤치마크 실행"""
+    counters: Optional[Dict[str, int]] = None
+    server: Optional[uvicorn.Server] = None
+    server_task: Optional[asyncio.Task] = None
+    base_url = args.base_url
+    if base_url is None:
+        counters = {"http_requests": 0, "prompts": 0}
+        port = free_port()
+        app = create_mock_vllm(args.request_overhead_ms, args.prompt_ms, args.server_concurrency, counters)
+        server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+        server_task = asyncio.create_task(server.serve())
+        while not server.started:
+            await asyncio.sleep(0.01)
+        base_url = f"http://127.0.0.1:{port}/v1"
+    
+    model_config = {
+        "name": "bench",
+        "type": "vllm",
+        "base_url": base_url,
+        "base_urls": [base_url],
+        "model_name": args.model_name,
+        "max_tokens": args.max_tokens,
+        "temperature": 0.0,
+        "top_p": 1.0,
+        "http_pool": {"max_connections": args.concurrency, "max_keepalive_connections": args.concurrency}
+    }
+    batching = {"enabled": True, "window_ms": args.window_ms, "max_batch_size": args.max_batch_size}
+    
+    results: Dict[str, Any] = {
+        "base_url": base_url if args.base_url else "mock",
+        "concurrency": args.concurrency,
+        "window_ms": args.window_ms,
+        "max_batch_size": args.max_batch_size
+    }
+    if args.base_url is None:
+        results["mock"] = {
+            "request_overhead_ms": args.request_overhead_ms,
+            "prompt_ms": args.prompt_ms,
+            "server_concurrency": args.server_concurrency
+        }
+    try:
+        # 연결 수립 비용 제외 (예열)
+        await run_variant("warmup", {**model_config, "micro_batching": {"enabled": False}}, min(args.concurrency, args.requests), args.concurrency, counters)
+        results["single"] = await run_variant("single", {**model_config, "micro_batching": {"enabled": False}}, args.requests, args.concurrency, counters)
+        results["batched"] = await run_variant("batched", {**model_config, "micro_batching": batching}, args.requests, args.concurrency, counters)
+        results["speedup"] = round(results["batched"]["throughput_rps"] / results["single"]["throughput_rps"], 2)
+        results["batcher"] = get_micro_batch_manager().get_stats()["batchers"]
+    finally:
+        await get_http_pool_manager().close_all()
+        if server is not None:
+            server.should_exit = True
+            await server_task
+    print(f"배치 처리량 / 개별 처리량 = x{results['speedup']}")
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="vLLM 마이크로 배치 벤치마크")
+    parser.add_argument("--requests", type=int, default=500, help="요청 수")
+    parser.add_argument("--concurrency", type=int, default=64, help="동시 실행 수")
+    parser.add_argument("--window-ms", type=float, default=5.0, help="배치 수집 시간 (ms)")
+    parser.add_argument("--max-batch-size", type=int, default=16, help="배치 최대 프롬프트 수")
+    parser.add_argument("--base-url", help="vLLM 서버 base_url (지정하지 않으면 내장 모의 서버 사용)")
+    parser.add_argument("--model-name", default="/model", help="vLLM 모델 이름")
+    parser.add_argument("--max-tokens", type=int, default=32, help="생성 최대 토큰 수")
+    parser.add_argument("--request-overhead-ms", type=float, default=5.0, help="모의 서버 요청당 처리 시간 (ms)")
+    parser.add_argument("--prompt-ms", type=float, default=0.5, help="모의 서버 프롬프트당 처리 시간 (ms)")
+    parser.add_argument("--server-concurrency", type=int, default=8, help="모의 서버 동시 처리 요청 수")
+    parser.add_argument("--json", dest="json_path", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+    
+    results = asyncio.run(run(args))
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps(results, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"결과 저장: {args.json_path}")
+
+
+if __name__ == "__main__":
+    main()
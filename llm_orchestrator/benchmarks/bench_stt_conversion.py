@@ -0,0 +1,204 @@
+"""
+STT [] 변환 벤치마크 (기존 방식 vs 트라이)
+
+[] 표기가 많은 합성 상담 전사(bench_summary_util의 bracket_heavy)에서 convert_bracketed_content의 호출당 CPU 시간을
+기존 방식(단어마다 KOREAN_NUMBER_MAP/KOREAN_ALPHABET_MAP을 sorted(..., key=len)로 정렬한 뒤 startswith로 비교)과
+현재 방식(모듈 로드 시 만든 트라이로 숫자/알파벳을 한 번에 분해)으로 비교합니다.
+
+결과가 다른 []는 따로 집계합니다. 기존 방식은 만 앞의 십/백/천 자리(이십만, 천만)와 단위가 있는 수사 안의 고유어 숫자(다섯백)를
+잘못 변환하므로 이런 표기가 포함된 []만 달라야 합니다.
+
+실행 (llm_orchestrator 디렉토리에서):
+    python -m benchmarks.bench_stt_conversion
+    python -m benchmarks.bench_stt_conversion --sizes 10KB 500KB --iterations 20 --json result.json
+"""
+import argparse
+import json
+import logging
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.bench_summary_util import make_corpus, parse_size, size_label  # noqa: E402
+from pipelines.static.summary_util.stt_conversion import KOREAN_ALPHABET_MAP, KOREAN_NUMBER_MAP, convert_bracketed_content  # noqa: E402
+
+logger = logging.getLogger("benchmarks.legacy_stt_conversion")
+
+LEGACY_UNITS = ("십", "백", "천", "만")
+
+
+def legacy_convert_korean_number_to_arabic(korean_number: str) -> int:
+    """기존 방식 수사 변환 (십/백/천/만, 호출마다 정렬)"""
+    s = korean_number.strip().replace(" ", "")
+    if not any(u in s for u in LEGACY_UNITS):
+        digits = []
+        remaining = s
+        while remaining:
+            matched = False
+            for k, a in sorted(KOREAN_NUMBER_MAP.items(), key=lambda x: len(x[0]), reverse=True):
+                if k in LEGACY_UNITS or k in ("억", "조"):
+                    continue
+                if remaining.startswith(k):
+                    digits.append(a)
+                    remaining = remaining[len(k):]
+                    matched = True
+                    break
+            if not matched:
+                break
+        return int("".join(digits)) if digits else 0
+    
+    total = section = num = 0
+    for ch in s:
+        if ch in KOREAN_NUMBER_MAP and ch not in LEGACY_UNITS:
+            num = int(KOREAN_NUMBER_MAP[ch])
+        elif ch in ("십", "백", "천"):
+            section += (num or 1) * {"십": 10, "백": 100, "천": 1000}[ch]
+            num = 0
+        elif ch == "만":
+            section += num or 1
+            total += section * 10000
+            section = num = 0
+        else:
+            break
+    return total + section + num
+
+
+def legacy_can_convert(t: str, mapping: Dict[str, str]) -> bool:
+    """기존 방식 전체 분해 가능 여부 (호출마다 정렬)"""
+    remaining = t.replace(" ", "")
+    if not remaining:
+        return False
+    sorted_map = sorted(mapping.items(), key=lambda x: len(x[0]), reverse=True)
+    while remaining:
+        for korean, _value in sorted_map:
+            if remaining.startswith(korean):
+                remaining = remaining[len(korean):]
+                break
+        else:
+            return False
+    return True
+
+
+def legacy_convert_bracketed_content(text: str) -> str:
+    """기존 방식 [] 변환 (숫자 판단, 순차 숫자 분해, 영문 판단, 영문 치환마다 정렬과 startswith 비교)"""
+    if not text or not text.strip():
+        return text
+    # 기존 방식은 억/조를 숫자 단어로 다루지 않음
+    number_map = {k: v for k, v in KOREAN_NUMBER_MAP.items() if k not in ("억", "조")}
+    
+    def convert_single_content(raw: str) -> str:
+        s = raw.strip()
+        s_nospace = s.replace(" ", "")
+        if re.fullmatch(r"\d+", s_nospace) or re.fullmatch(r"[A-Z]+", s_nospace):
+            return raw
+        if legacy_can_convert(s, number_map):
+            if any(u in s_nospace for u in LEGACY_UNITS):
+                out = str(legacy_convert_korean_number_to_arabic(s))
+                logger.info(f"[] 숫자(단위) 변환: [{raw}] -> [{out}]")
+                return out
+            digits = []
+            remaining = s_nospace
+            while remaining:
+                for k, a in sorted(number_map.items(), key=lambda x: len(x[0]), reverse=True):
+                    if k in LEGACY_UNITS:
+                        continue
+                    if remaining.startswith(k):
+                        digits.append(a)
+                        remaining = remaining[len(k):]
+                        break
+                else:
+                    break
+            if digits:
+                out = "".join(digits)
+                logger.info(f"[] 숫자(순차) 변환: [{raw}] -> [{out}]")
+                return out
+        if legacy_can_convert(s, KOREAN_ALPHABET_MAP):
+            out = s
+            for korean, english in sorted(KOREAN_ALPHABET_MAP.items(), key=lambda x: len(x[0]), reverse=True):
+                out = out.replace(korean, english)
+            logger.info(f"[] 영문 변환: [{raw}] -> [{out}]")
+            return out
+        return raw
+    
+    def repl(m: re.Match) -> str:
+        parts = m.group(1).split()
+        if len(parts) >= 2:
+            return "[" + " ".join(convert_single_content(p) for p in parts) + "]"
+        return "[" + convert_single_content(m.group(1)) + "]"
+    
+    return re.sub(r"\[([^\]]+)\]", repl, text)
+
+
+def measure(call: Callable[[], Any], iterations: int) -> float:
+    """호출 1회 평균 CPU 시간 (µs)"""
+    call()
+    start = time.process_time()
+    for _ in range(iterations):
+        call()
+    return (time.process_time() - start) / iterations * 1_000_000
+
+
+def bracket_differences(before: str, after: str) -> List[List[str]]:
+    """결과가 다른 [] 목록 ([기존 결과, 현재 결과])"""
+    old_brackets = re.findall(r"\[[^\]]*\]", before)
+    new_brackets = re.findall(r"\[[^\]]*\]", after)
+    return [[old, new] for old, new in zip(old_brackets, new_brackets) if old != new]
+
+
+def run(sizes: List[int], iterations: int) -> Dict[str, Any]:
+    """벤치마크 실행"""
+    results: Dict[str, Any] = {"iterations": iterations, "sizes": {}}
+    for size in sizes:
+        corpus = make_corpus("bracket_heavy", size)
+        differences = bracket_differences(legacy_convert_bracketed_content(corpus), convert_bracketed_content(corpus))
+        legacy_us = measure(lambda: legacy_convert_bracketed_content(corpus), iterations)
+        trie_us = measure(lambda: convert_bracketed_content(corpus), iterations)
+        results["sizes"][size_label(size)] = {
+            "bytes": len(corpus.encode("utf-8")),
+            "brackets": corpus.count("["),
+            "legacy_us": round(legacy_us, 1),
+            "trie_us": round(trie_us, 1),
+            "speedup": round(legacy_us / trie_us, 2) if trie_us else None,
+            "different_brackets": len(differences),
+            "difference_examples": sorted({tuple(pair) for pair in differences})[:5]
+        }
+    return results
+
+
+def print_report(results: Dict[str, Any]) -> None:
+    """결과 표 출력"""
+    print(f"반복 횟수={results['iterations']}, 전사=bracket_heavy")
+    print(f"{'크기':>7}{'[] 수':>9}{'기존 (µs)':>14}{'트라이 (µs)':>14}{'배율':>8}{'다른 []':>9}")
+    for label, entry in results["sizes"].items():
+        print(
+            f"{label:>7}{entry['brackets']:>9,}{entry['legacy_us']:>14,.1f}{entry['trie_us']:>14,.1f}"
+            f"{'x' + format(entry['speedup'], '.2f'):>8}{entry['different_brackets']:>9,}"
+        )
+    examples = sorted({tuple(pair) for entry in results["sizes"].values() for pair in entry["difference_examples"]})
+    if examples:
+        print()
+        print("결과가 다른 [] 예 (기존 -> 현재): " + ", ".join(f"{old} -> {new}" for old, new in examples[:5]))
+    print()
+    print("단위: convert_bracketed_content 호출 1회당 CPU 시간 (µs)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="STT [] 변환 벤치마크 (기존 방식 vs 트라이)")
+    parser.add_argument("--sizes", type=parse_size, nargs="+", default=[parse_size(size) for size in ("1KB", "10KB", "100KB")], help="전사 크기 (예: 1KB 10KB 500KB)")
+    parser.add_argument("--iterations", type=int, default=10, help="반복 횟수")
+    parser.add_argument("--json", dest="json_path", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+    
+    results = run(args.sizes, args.iterations)
+    print_report(results)
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps(results, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"결과 저장: {args.json_path}")
+
+
+if __name__ == "__main__":
+    main()
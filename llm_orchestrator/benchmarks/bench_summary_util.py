@@ -0,0 +1,325 @@
+"""
+STT 변환/발언 분리 마이크로 벤치마크
+
+요약 요청마다 이벤트 루프에서 동기로 실행되는 텍스트 처리 함수의 호출당 비용을 측정합니다.
+측정 대상:
+    convert_bracketed_content        [] 안의 한글 숫자/알파벳 변환 (전사 전체)
+    extract_agent_utterances         상담사 발언 추출 (전사 전체, 기본 패턴)
+    extract_customer_utterances      고객 발언 추출 (전사 전체, 기본 패턴)
+    convert_korean_number_to_arabic  한글 수사 1개 변환 (순차 숫자/단위 수사/큰 수)
+
+합성 전사 (실제 상담 내용 없이 생성, 크기는 UTF-8 bytes 기준):
+    mixed           일반 상담 (화자 표시 줄 + 이어지는 줄, 일부 줄에 [] 표기)
+    bracket_heavy   줄마다 [] 표기 여러 개 (전화번호, 금액, 영문 철자, 변환 불가 표기)
+    speaker_heavy   짧은 맞장구 위주로 화자가 자주 바뀌는 상담
+
+측정 항목:
+    ops/sec, 호출당 지연 시간 백분위 (p50/p95/p99, µs)
+    메모리 할당 (tracemalloc, 호출 중 최대 사용량과 호출 후 남은 양, 시간 측정과 별도로 실행)
+
+실행 (llm_orchestrator 디렉토리에서):
+    python -m benchmarks.bench_summary_util
+    python -m benchmarks.bench_summary_util --sizes 1KB 100KB --cases bracket_heavy --json result.json
+    python -m benchmarks.bench_summary_util --json after.json --compare before.json
+"""
+import argparse
+import gc
+import json
+import logging
+import os
+import platform
+import random
+import re
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pipelines.static.summary_util.split_text import extract_agent_utterances, extract_customer_utterances  # noqa: E402
+from pipelines.static.summary_util.stt_conversion import convert_bracketed_content, convert_korean_number_to_arabic  # noqa: E402
+
+CASES = ["mixed", "bracket_heavy", "speaker_heavy"]
+DEFAULT_SIZES = ["1KB", "10KB", "100KB", "500KB"]
+
+DIGIT_WORDS = ["공", "일", "이", "삼", "사", "오", "육", "칠", "팔", "구"]
+NATIVE_DIGIT_WORDS = ["하나", "둘", "셋", "넷", "다섯", "여섯", "일곱", "여덟", "아홉"]
+ALPHABET_WORDS = ["에이", "비", "씨", "디", "에프", "에이치", "아이", "제이", "케이", "엘", "엠", "엔", "피", "큐", "알", "에스", "티", "유", "브이", "더블유", "엑스", "와이"]
+PASSTHROUGH_WORDS = ["통관 보류", "목록통관", "관부가세", "특송", "해외직구", "반송", "사업자", "수입신고"]
+
+AGENT_SENTENCES = [
+    "네 관세청 고객지원센터입니다 무엇을 도와드릴까요",
+    "확인해 보니 목록통관 대상이 아니라 일반 수입신고로 전환되었습니다",
+    "통관 진행 상황은 조회 화면에서 실시간으로 확인하실 수 있습니다",
+    "세액은 물품가격과 운임을 합한 과세가격 기준으로 산정됩니다",
+    "추가 서류는 특송업체를 통해 제출해 주시면 됩니다",
+]
+CUSTOMER_SENTENCES = [
+    "해외 직구로 주문한 물건이 통관 보류라고 나와서요",
+    "그럼 세금은 얼마 정도 나오나요 관부가세 포함해서요",
+    "서류는 어디로 보내면 되는지 알려주세요",
+    "배송이 너무 늦어져서 문의드렸습니다",
+    "지난번에 안내받은 내용이랑 달라서요",
+]
+SHORT_REPLIES = ["네", "네 맞습니다", "아 그렇군요", "잠시만요", "네 알겠습니다", "감사합니다", "여보세요", "네 네"]
+CONTINUATIONS = ["그리고 한 가지 더 여쭤볼게요", "혹시 기간은 얼마나 걸리나요", "그 부분은 제가 다시 확인해 보겠습니다", "이어서 말씀드리면"]
+
+# convert_korean_number_to_arabic 입력 (종류별)
+NUMBER_SAMPLES: Dict[str, List[str]] = {
+    "sequential": ["공일공이삼사오육칠팔구", "일이삼사오육칠팔구공", "공삼이칠이공칠사공공", "팔팔공일"],
+    "units": ["삼만오천", "십이만칠천오백", "백이십", "사천구백팔십"],
+    "large": ["삼천사백만이천", "구천구백구십구만구천구백구십구", "천만", "오백만삼천이백일"],
+}
+
+
+def parse_size(value: str) -> int:
+    """크기 문자열 (1KB, 500KB, 1MB, 2048) → bytes"""
+    match = re.fullmatch(r"(\d+)\s*(KB|MB|B)?", value.strip().upper())
+    if not match:
+        raise argparse.ArgumentTypeError(f"크기 형식이 올바르지 않습니다: {value} (예: 1KB, 500KB, 2048)")
+    unit = {"KB": 1024, "MB": 1024 * 1024}.get(match.group(2) or "B", 1)
+    return int(match.group(1)) * unit
+
+
+def size_label(size: int) -> str:
+    if size % (1024 * 1024) == 0:
+        return f"{size // (1024 * 1024)}MB"
+    if size % 1024 == 0:
+        return f"{size // 1024}KB"
+    return f"{size}B"
+
+
+def bracket_token(rng: random.Random) -> str:
+    """[] STT 표기 1개 (전화번호, 금액, 순차 숫자, 영문 철자, 변환 불가 표기)"""
+    kind = rng.random()
+    if kind < 0.25:
+        groups = [3, 4, 4] if rng.random() < 0.5 else [3, 3, 4]
+        return "[" + " ".join("".join(rng.choice(DIGIT_WORDS) for _ in range(n)) for n in groups) + "]"
+    if kind < 0.45:
+        return "[" + rng.choice(NUMBER_SAMPLES["units"] + NUMBER_SAMPLES["large"]) + "]"
+    if kind < 0.55:
+        return "[" + rng.choice(NATIVE_DIGIT_WORDS) + "]"
+    if kind < 0.8:
+        return "[" + " ".join(rng.choice(ALPHABET_WORDS) for _ in range(rng.randint(1, 3))) + "]"
+    return "[" + rng.choice(PASSTHROUGH_WORDS) + "]"
+
+
+def make_line(case: str, rng: random.Random, speaker: str) -> str:
+    """전사 1줄 (화자 표시 포함, speaker가 빈 문자열이면 이어지는 줄)"""
+    if case == "speaker_heavy":
+        text = rng.choice(SHORT_REPLIES)
+        if rng.random() < 0.1:
+            text += " " + bracket_token(rng)
+    elif case == "bracket_heavy":
+        sentence = rng.choice(AGENT_SENTENCES if speaker == "(상담사)" else CUSTOMER_SENTENCES).split()
+        for _ in range(rng.randint(3, 6)):
+            sentence.insert(rng.randint(0, len(sentence)), bracket_token(rng))
+        text = " ".join(sentence)
+    else:
+        if not speaker:
+            text = rng.choice(CONTINUATIONS)
+        else:
+            text = rng.choice(AGENT_SENTENCES if speaker == "(상담사)" else CUSTOMER_SENTENCES)
+        if rng.random() < 0.3:
+            text += " " + bracket_token(rng)
+    return f"{speaker} {text}" if speaker else text
+
+
+def make_corpus(case: str, size: int, seed: int = 0) -> str:
+    """지정한 크기(UTF-8 bytes) 이상의 합성 상담 전사 생성"""
+    rng = random.Random(f"{case}:{seed}")
+    continuation_rate = {"mixed": 0.3, "bracket_heavy": 0.2, "speaker_heavy": 0.0}[case]
+    lines: List[str] = []
+    length = 0
+    speaker = "(상담사)"
+    while length < size:
+        if lines and rng.random() < continuation_rate:
+            line = make_line(case, rng, "")
+        else:
+            line = make_line(case, rng, speaker)
+            speaker = "(고객)" if speaker == "(상담사)" else "(상담사)"
+        lines.append(line)
+        length += len(line.encode("utf-8")) + 1
+    return "\n".join(lines)
+
+
+def percentile(values: List[float], q: float) -> float:
+    """정렬된 값의 백분위 (최근접 순위)"""
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, int(q / 100 * len(values)))]
+
+
+def measure_latency(call: Callable[[], Any], min_time: float, min_iterations: int, max_iterations: int) -> Dict[str, Any]:
+    """호출당 지연 시간 측정 (min_time 동안 또는 max_iterations까지 반복)"""
+    for _ in range(max(1, min(3, min_iterations))):
+        call()
+    gc.collect()
+    timings: List[float] = []
+    started = time.perf_counter()
+    while len(timings) < max_iterations and (len(timings) < min_iterations or time.perf_counter() - started < min_time):
+        start = time.perf_counter_ns()
+        call()
+        timings.append((time.perf_counter_ns() - start) / 1000)
+    total = sum(timings)
+    timings.sort()
+    return {
+        "iterations": len(timings),
+        "ops_per_sec": round(len(timings) / (total / 1_000_000), 1) if total else 0.0,
+        "mean_us": round(total / len(timings), 1),
+        "p50_us": round(percentile(timings, 50), 1),
+        "p95_us": round(percentile(timings, 95), 1),
+        "p99_us": round(percentile(timings, 99), 1),
+        "max_us": round(timings[-1], 1)
+    }
+
+
+def measure_allocations(call: Callable[[], Any], iterations: int) -> Dict[str, Any]:
+    """호출당 메모리 할당 (tracemalloc, 호출 중 최대 증가량과 호출 후 남은 양(반환값 포함)의 평균)"""
+    gc.collect()
+    tracemalloc.start()
+    peaks: List[int] = []
+    retained: List[int] = []
+    try:
+        for _ in range(max(1, iterations)):
+            before, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            result = call()
+            current, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - before)
+            retained.append(current - before)
+            del result
+    finally:
+        tracemalloc.stop()
+    return {
+        "alloc_peak_kb": round(max(peaks) / 1024, 1),
+        "alloc_retained_kb": round(sum(retained) / len(retained) / 1024, 1)
+    }
+
+
+def run(sizes: List[int], cases: List[str], min_time: float, min_iterations: int, max_iterations: int, alloc_iterations: int) -> Dict[str, Any]:
+    """벤치마크 실행"""
+    functions: Dict[str, Callable[[str], Any]] = {
+        "convert_bracketed_content": convert_bracketed_content,
+        "extract_agent_utterances": extract_agent_utterances,
+        "extract_customer_utterances": extract_customer_utterances,
+    }
+    results: List[Dict[str, Any]] = []
+    for case in cases:
+        for size in sizes:
+            corpus = make_corpus(case, size)
+            corpus_info = {
+                "bytes": len(corpus.encode("utf-8")),
+                "lines": corpus.count("\n") + 1,
+                "brackets": corpus.count("[")
+            }
+            for name, function in functions.items():
+                call = (lambda f=function, text=corpus: f(text))
+                entry = {"function": name, "case": case, "size": size_label(size), "corpus": corpus_info}
+                entry.update(measure_latency(call, min_time, min_iterations, max_iterations))
+                entry.update(measure_allocations(call, alloc_iterations))
+                results.append(entry)
+    for kind, samples in NUMBER_SAMPLES.items():
+        # 한 번 호출 = 샘플 1개 변환 (샘플을 순서대로 돌아가며 사용)
+        position = [0]
+        
+        def call(values=samples, index=position):
+            index[0] = (index[0] + 1) % len(values)
+            return convert_korean_number_to_arabic(values[index[0]])
+        
+        entry = {"function": "convert_korean_number_to_arabic", "case": kind, "size": "token", "corpus": {"samples": len(samples)}}
+        entry.update(measure_latency(call, min_time, min_iterations, max_iterations * 100))
+        entry.update(measure_allocations(call, alloc_iterations * 10))
+        results.append(entry)
+    return {"meta": environment_info(), "results": results}
+
+
+def environment_info() -> Dict[str, Any]:
+    """결과 비교용 실행 환경 정보"""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=Path(__file__).resolve().parent, capture_output=True, text=True, timeout=5
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "git_commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "log_level": logging.getLevelName(logging.getLogger().level)
+    }
+
+
+def result_key(entry: Dict[str, Any]) -> str:
+    return f"{entry['function']}|{entry['case']}|{entry['size']}"
+
+
+def print_report(results: Dict[str, Any], baseline: Optional[Dict[str, Any]] = None) -> None:
+    """결과 표 출력 (baseline이 있으면 p50 대비 배율 표시)"""
+    meta = results["meta"]
+    print(f"commit={meta['git_commit']}, python={meta['python']}, 로그 레벨={meta['log_level']}")
+    previous = {result_key(entry): entry for entry in (baseline or {}).get("results", [])}
+    header = f"{'함수':<33}{'케이스':<15}{'크기':>7}{'ops/sec':>12}{'p50':>13}{'p95':>13}{'p99':>13}{'peak KB':>10}{'retained KB':>13}"
+    if previous:
+        header += f"{'p50 변화':>10}"
+    print(header)
+    for entry in results["results"]:
+        line = (
+            f"{entry['function']:<33}{entry['case']:<15}{entry['size']:>7}{entry['ops_per_sec']:>12,.1f}"
+            f"{entry['p50_us']:>13,.1f}{entry['p95_us']:>13,.1f}{entry['p99_us']:>13,.1f}"
+            f"{entry['alloc_peak_kb']:>10,.1f}{entry['alloc_retained_kb']:>13,.1f}"
+        )
+        before = previous.get(result_key(entry))
+        if before and entry["p50_us"]:
+            line += f"{'x' + format(before['p50_us'] / entry['p50_us'], '.2f'):>10}"
+        print(line)
+    print()
+    print("단위: 지연 시간 µs (호출 1회), 메모리 KB (tracemalloc)")
+    if previous:
+        print("p50 변화: 이전 결과 p50 / 현재 p50 (1보다 크면 빨라짐)")
+
+
+def configure_logging(level: str) -> None:
+    """
+    로그 레벨 설정
+    
+    기본값(WARNING)은 함수 자체 비용만 측정합니다.
+    INFO/DEBUG는 서비스와 같은 포맷의 핸들러(출력은 버림)를 붙여 로그 처리 비용까지 포함합니다.
+    """
+    root = logging.getLogger()
+    root.setLevel(getattr(logging, level.upper(), logging.WARNING))
+    if root.level < logging.WARNING:
+        handler = logging.StreamHandler(open(os.devnull, "w", encoding="utf-8"))
+        handler.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
+        root.addHandler(handler)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="STT 변환/발언 분리 마이크로 벤치마크")
+    parser.add_argument("--sizes", type=parse_size, nargs="+", default=[parse_size(size) for size in DEFAULT_SIZES], help="전사 크기 (예: 1KB 10KB 500KB)")
+    parser.add_argument("--cases", nargs="+", choices=CASES, default=CASES, help="전사 종류")
+    parser.add_argument("--min-time", type=float, default=0.5, help="측정 항목별 최소 측정 시간 (초)")
+    parser.add_argument("--min-iterations", type=int, default=5, help="측정 항목별 최소 반복 횟수")
+    parser.add_argument("--max-iterations", type=int, default=2000, help="측정 항목별 최대 반복 횟수")
+    parser.add_argument("--alloc-iterations", type=int, default=3, help="메모리 할당 측정 반복 횟수")
+    parser.add_argument("--log-level", default="WARNING", help="로그 레벨 (INFO면 로그 처리 비용 포함)")
+    parser.add_argument("--json", dest="json_path", help="결과를 저장할 JSON 파일 경로")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 파일 경로")
+    args = parser.parse_args()
+    
+    configure_logging(args.log_level)
+    baseline = json.loads(Path(args.compare).read_text(encoding="utf-8")) if args.compare else None
+    results = run(args.sizes, args.cases, args.min_time, args.min_iterations, args.max_iterations, args.alloc_iterations)
+    print_report(results, baseline)
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps(results, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"결과 저장: {args.json_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,273 @@
+"""
+어드미션 컨트롤
+
+파이프라인/모델 지정("{type}:{model_name}")별로 동시 실행 수와 대기열 길이를 제한합니다.
+제한을 넘는 요청은 백엔드로 보내지 않고 즉시 거절(429/503 + Retry-After)합니다.
+"""
+import asyncio
+import math
+import time
+from contextlib import asynccontextmanager
+from typing import Optional, Dict, Any, AsyncIterator, List
+from core.loader import load_yaml_config
+from core.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class AdmissionRejected(Exception):
+    """어드미션 거절 예외"""
+    
+    def __init__(self, key: str, reason: str, status_code: int, retry_after: int):
+        """
+        어드미션 거절 예외 초기화
+        
+        Args:
+            key: 거절한 제한 키 (예: "pipeline:summarize_pipeline", "model:vllm:base_model")
+            reason: 거절 사유
+            status_code: HTTP 상태 코드 (대기열 초과 429, 대기 시간 초과 503)
+            retry_after: 재시도 권장 시간 (초)
+        """
+        super().__init__(f"{key}: {reason}")
+        self.key = key
+        self.reason = reason
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+class AdmissionLimiter:
+    """단일 키에 대한 동시 실행/대기열 제한"""
+    
+    def __init__(
+        self,
+        key: str,
+        max_in_flight: int,
+        max_queue: int,
+        queue_timeout: Optional[float],
+        retry_after: int
+    ):
+        """
+        리미터 초기화
+        
+        Args:
+            key: 제한 키
+            max_in_flight: 최대 동시 실행 수
+            max_queue: 최대 대기열 길이 (0이면 대기 없이 즉시 거절)
+            queue_timeout: 최대 대기 시간 (초, None이면 제한 없음)
+            retry_after: Retry-After 기본값 (초, 실행 시간 통계가 없을 때 사용)
+        """
+        self.key = key
+        self.max_in_flight = max_in_flight
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.retry_after = retry_after
+        self._semaphore = asyncio.Semaphore(max_in_flight)
+        self.in_flight = 0
+        self.queued = 0
+        self.admitted = 0
+        self.rejected_queue_full = 0
+        self.rejected_timeout = 0
+        self.total_queue_wait_ms = 0.0
+        self.max_queue_wait_ms = 0.0
+        self.completed = 0
+        self.total_exec_ms = 0.0
+    
+    def _estimate_retry_after(self) -> int:
+        """평균 실행 시간과 대기열 길이로 Retry-After 추정"""
+        if self.completed == 0:
+            return self.retry_after
+        avg_exec_s = self.total_exec_ms / self.completed / 1000
+        return max(1, math.ceil(avg_exec_s * (self.queued + 1) / self.max_in_flight))
+    
+    async def acquire(self) -> float:
+        """
+        실행 슬롯 획득
+        
+        Returns:
+            대기열 대기 시간 (ms)
+        
+        Raises:
+            AdmissionRejected: 대기열이 가득 찼거나 대기 시간을 초과한 경우
+        """
+        # 실행 중 + 대기 중 요청 수가 전체 수용량(동시 실행 + 대기열)을 넘으면 즉시 거절
+        if self.in_flight + self.queued >= self.max_in_flight + self.max_queue:
+            self.rejected_queue_full += 1
+            raise AdmissionRejected(self.key, "대기열이 가득 찼습니다.", 429, self._estimate_retry_after())
+        
+        start = time.perf_counter()
+        self.queued += 1
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            self.rejected_timeout += 1
+            raise AdmissionRejected(self.key, "대기 시간을 초과했습니다.", 503, self._estimate_retry_after())
+        finally:
+            self.queued -= 1
+        
+        wait_ms = (time.perf_counter() - start) * 1000
+        self.in_flight += 1
+        self.admitted += 1
+        self.total_queue_wait_ms += wait_ms
+        self.max_queue_wait_ms = max(self.max_queue_wait_ms, wait_ms)
+        return wait_ms
+    
+    def release(self, exec_ms: float) -> None:
+        """
+        실행 슬롯 반환
+        
+        Args:
+            exec_ms: 실행 시간 (ms)
+        """
+        self.in_flight -= 1
+        self.completed += 1
+        self.total_exec_ms += exec_ms
+        self._semaphore.release()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """리미터 상태 조회"""
+        return {
+            "max_in_flight": self.max_in_flight,
+            "max_queue": self.max_queue,
+            "queue_timeout": self.queue_timeout,
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "admitted": self.admitted,
+            "rejected_queue_full": self.rejected_queue_full,
+            "rejected_timeout": self.rejected_timeout,
+            "avg_queue_wait_ms": round(self.total_queue_wait_ms / self.admitted, 3) if self.admitted else 0.0,
+            "max_queue_wait_ms": round(self.max_queue_wait_ms, 3),
+            "avg_exec_ms": round(self.total_exec_ms / self.completed, 3) if self.completed else 0.0
+        }
+
+
+class AdmissionTicket:
+    """어드미션 통과 정보"""
+    
+    def __init__(self):
+        """어드미션 통과 정보 초기화"""
+        self.queue_wait_ms = 0.0
+        self.exec_start = 0.0
+    
+    @property
+    def exec_ms(self) -> float:
+        """실행 시간 (ms, 어드미션 통과 시점부터)"""
+        return (time.perf_counter() - self.exec_start) * 1000 if self.exec_start else 0.0
+
+
+class AdmissionController:
+    """파이프라인/모델별 어드미션 컨트롤러"""
+    
+    def __init__(self, config_data: Dict[str, Any]):
+        """
+        어드미션 컨트롤러 초기화
+        
+        Args:
+            config_data: 설정 데이터
+        """
+        self.admission_config = config_data.get("admission", {}) or {}
+        self.enabled = self.admission_config.get("enabled", False)
+        self.retry_after = int(self.admission_config.get("retry_after", 1))
+        self._limiters: Dict[str, AdmissionLimiter] = {}
+    
+    def _get_limiter(self, kind: str, name: str) -> Optional[AdmissionLimiter]:
+        """
+        제한 키에 해당하는 리미터 조회 (설정이 없으면 None)
+        
+        Args:
+            kind: "pipeline" 또는 "model"
+            name: 파이프라인 이름 또는 모델 지정
+        """
+        key = f"{kind}:{name}"
+        limiter = self._limiters.get(key)
+        if limiter is not None:
+            return limiter
+        
+        limits = (self.admission_config.get(f"{kind}s") or {}).get(name)
+        if limits is None:
+            limits = self.admission_config.get(f"{kind}_default")
+        if not limits or not limits.get("max_in_flight"):
+            return None
+        
+        limiter = AdmissionLimiter(
+            key=key,
+            max_in_flight=int(limits["max_in_flight"]),
+            max_queue=int(limits.get("max_queue", 0)),
+            queue_timeout=limits.get("queue_timeout"),
+            retry_after=self.retry_after
+        )
+        self._limiters[key] = limiter
+        logger.info(f"어드미션 리미터 생성: {key}, 최대 동시 실행={limiter.max_in_flight}, 최대 대기열={limiter.max_queue}")
+        return limiter
+    
+    @asynccontextmanager
+    async def admit(self, pipeline_name: str, model_spec: Optional[str] = None) -> AsyncIterator[AdmissionTicket]:
+        """
+        파이프라인/모델 어드미션 (컨텍스트 매니저)
+        
+        파이프라인 리미터 → 모델 리미터 순서로 슬롯을 획득하고, 블록 종료 시 반환합니다.
+        
+        Args:
+            pipeline_name: 파이프라인 이름
+            model_spec: 모델 지정 ("{type}:{model_name}")
+        
+        Raises:
+            AdmissionRejected: 제한을 초과한 경우
+        """
+        ticket = AdmissionTicket()
+        limiters: List[AdmissionLimiter] = []
+        if self.enabled:
+            for kind, name in (("pipeline", pipeline_name), ("model", model_spec)):
+                limiter = self._get_limiter(kind, name) if name else None
+                if limiter is not None:
+                    limiters.append(limiter)
+        
+        acquired: List[AdmissionLimiter] = []
+        try:
+            for limiter in limiters:
+                ticket.queue_wait_ms += await limiter.acquire()
+                acquired.append(limiter)
+        except BaseException:
+            for limiter in acquired:
+                limiter.release(0.0)
+            raise
+        
+        ticket.exec_start = time.perf_counter()
+        try:
+            yield ticket
+        finally:
+            exec_ms = ticket.exec_ms
+            for limiter in acquired:
+                limiter.release(exec_ms)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        어드미션 상태 조회
+        
+        Returns:
+            제한 키별 동시 실행/대기열/거절 통계
+        """
+        return {
+            "enabled": self.enabled,
+            "limiters": {key: limiter.get_stats() for key, limiter in self._limiters.items()}
+        }
+
+
+# 전역 어드미션 컨트롤러 인스턴스
+_admission_controller: Optional[AdmissionController] = None
+
+
+def get_admission_controller(config_path: Optional[str] = None) -> AdmissionController:
+    """
+    어드미션 컨트롤러 싱글톤 인스턴스 반환
+    
+    Args:
+        config_path: 설정 파일 경로
+    
+    Returns:
+        AdmissionController 인스턴스
+    """
+    global _admission_controller
+    if _admission_controller is None:
+        config_data = load_yaml_config(config_path)
+        _admission_controller = AdmissionController(config_data)
+    return _admission_controller
@@ -0,0 +1,210 @@
+"""
+서킷 브레이커
+
+LLM 백엔드(base_url)별로 연속 실패를 집계하여, 백엔드가 다운된 동안에는 요청을 보내지 않고
+즉시 실패(open)시킵니다. recovery_timeout이 지나면 시험 요청(half-open)으로 복구 여부를 확인합니다.
+
+상태 전이:
+    closed    → open      연속 실패가 failure_threshold에 도달
+    open      → half_open recovery_timeout 경과 후 첫 요청
+    half_open → closed    시험 요청 성공
+    half_open → open      시험 요청 실패
+"""
+import time
+from typing import Optional, Dict, Any
+from core.loader import load_yaml_config
+from core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 서킷 브레이커 설정 기본값 (settings.yml의 llm.circuit_breaker로 덮어씀)
+DEFAULT_CIRCUIT_BREAKER_CONFIG: Dict[str, Any] = {
+    "enabled": True,
+    "failure_threshold": 5,
+    "recovery_timeout": 30.0,
+    "half_open_max_calls": 1
+}
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """서킷이 열려 있어 요청을 보내지 않고 실패한 경우"""
+    
+    def __init__(self, base_url: str, retry_after: int):
+        self.base_url = base_url
+        self.retry_after = retry_after
+        super().__init__(f"백엔드 서킷이 열려 있습니다: {base_url} (약 {retry_after}초 후 재시도)")
+
+
+class CircuitBreaker:
+    """백엔드 하나의 서킷 브레이커"""
+    
+    def __init__(self, base_url: str, config: Dict[str, Any]):
+        """
+        서킷 브레이커 초기화
+        
+        Args:
+            base_url: 백엔드 base_url
+            config: 서킷 브레이커 설정 (failure_threshold, recovery_timeout, half_open_max_calls)
+        """
+        self.base_url = base_url
+        self.failure_threshold = int(config["failure_threshold"])
+        self.recovery_timeout = float(config["recovery_timeout"])
+        self.half_open_max_calls = int(config["half_open_max_calls"])
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self.half_open_in_flight = 0
+        self.total_failures = 0
+        self.rejected = 0
+        self.open_count = 0
+        self.last_error: Optional[str] = None
+    
+    def _retry_after(self) -> int:
+        """open 상태가 끝날 때까지 남은 시간 (초, 최소 1)"""
+        remaining = self.recovery_timeout - (time.monotonic() - (self.opened_at or 0.0))
+        return max(1, int(remaining + 0.999))
+    
+    def before_request(self) -> None:
+        """
+        요청 전 호출 (요청을 보낼 수 없으면 CircuitOpenError)
+        
+        Raises:
+            CircuitOpenError: 서킷이 열려 있거나 half-open 시험 요청 수를 초과한 경우
+        """
+        if self.state == OPEN:
+            if time.monotonic() - (self.opened_at or 0.0) < self.recovery_timeout:
+                self.rejected += 1
+                raise CircuitOpenError(self.base_url, self._retry_after())
+            self.state = HALF_OPEN
+            self.half_open_in_flight = 0
+            logger.info(f"서킷 half-open 전환 (시험 요청 허용): {self.base_url}")
+        
+        if self.state == HALF_OPEN:
+            if self.half_open_in_flight >= self.half_open_max_calls:
+                self.rejected += 1
+                raise CircuitOpenError(self.base_url, 1)
+            self.half_open_in_flight += 1
+    
+    def record_success(self) -> None:
+        """요청 성공 기록 (half-open이면 closed로 복구)"""
+        if self.state == HALF_OPEN:
+            logger.info(f"서킷 closed 복구: {self.base_url}")
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.half_open_in_flight = 0
+        self.opened_at = None
+    
+    def record_failure(self, error: str) -> None:
+        """요청 실패 기록 (연속 실패가 임계값에 도달하거나 half-open 시험 요청이 실패하면 open)"""
+        self.total_failures += 1
+        self.consecutive_failures += 1
+        self.last_error = error
+        if self.state == HALF_OPEN or (self.state == CLOSED and self.consecutive_failures >= self.failure_threshold):
+            self.state = OPEN
+            self.opened_at = time.monotonic()
+            self.half_open_in_flight = 0
+            self.open_count += 1
+            logger.warning(f"서킷 open 전환: {self.base_url}, 연속 실패={self.consecutive_failures}, 복구 대기={self.recovery_timeout:.0f}초, 마지막 오류={error}")
+    
+    @property
+    def is_open(self) -> bool:
+        """open 상태 여부"""
+        return self.state == OPEN
+    
+    def is_available(self) -> bool:
+        """요청을 보낼 수 있는지 여부 (open이어도 복구 대기 시간이 지났으면 시험 요청 가능)"""
+        return self.state != OPEN or time.monotonic() - (self.opened_at or 0.0) >= self.recovery_timeout
+    
+    def release(self) -> None:
+        """결과를 판정하지 않고 끝난 요청 정리 (취소 등, half-open 시험 요청 슬롯 반환)"""
+        if self.state == HALF_OPEN and self.half_open_in_flight > 0:
+            self.half_open_in_flight -= 1
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """서킷 상태 조회"""
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "failure_threshold": self.failure_threshold,
+            "retry_after": self._retry_after() if self.state == OPEN else None,
+            "total_failures": self.total_failures,
+            "rejected": self.rejected,
+            "open_count": self.open_count,
+            "last_error": self.last_error
+        }
+
+
+class CircuitBreakerManager:
+    """백엔드별 서킷 브레이커 관리자"""
+    
+    def __init__(self, config_data: Dict[str, Any]):
+        """
+        서킷 브레이커 관리자 초기화
+        
+        Args:
+            config_data: 설정 데이터
+        """
+        self.config = {**DEFAULT_CIRCUIT_BREAKER_CONFIG, **(config_data.get("llm", {}).get("circuit_breaker") or {})}
+        self.enabled = bool(self.config.get("enabled", True))
+        self._breakers: Dict[str, CircuitBreaker] = {}
+    
+    def get_breaker(self, base_url: str) -> Optional[CircuitBreaker]:
+        """
+        base_url에 해당하는 서킷 브레이커를 가져오거나 생성
+        
+        Args:
+            base_url: 백엔드 base_url
+        
+        Returns:
+            CircuitBreaker 인스턴스 (비활성화 시 None)
+        """
+        if not self.enabled:
+            return None
+        breaker = self._breakers.get(base_url)
+        if breaker is None:
+            breaker = CircuitBreaker(base_url, self.config)
+            self._breakers[base_url] = breaker
+        return breaker
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        서킷 상태 조회
+        
+        Returns:
+            base_url별 서킷 상태 및 실패/거절 횟수
+        """
+        return {base_url: breaker.get_stats() for base_url, breaker in self._breakers.items()}
+    
+    def is_available(self, base_url: str) -> bool:
+        """base_url로 요청을 보낼 수 있는지 여부 (비활성화 또는 요청 이력이 없으면 True)"""
+        breaker = self._breakers.get(base_url) if self.enabled else None
+        return breaker is None or breaker.is_available()
+    
+    def has_open(self) -> bool:
+        """열린 서킷이 있는지 여부"""
+        return any(breaker.is_open for breaker in self._breakers.values())
+
+
+# 전역 서킷 브레이커 관리자 인스턴스
+_circuit_breaker_manager: Optional[CircuitBreakerManager] = None
+
+
+def get_circuit_breaker_manager(config_path: Optional[str] = None) -> CircuitBreakerManager:
+    """
+    서킷 브레이커 관리자 싱글톤 인스턴스 반환
+    
+    Args:
+        config_path: 설정 파일 경로
+    
+    Returns:
+        CircuitBreakerManager 인스턴스
+    """
+    global _circuit_breaker_manager
+    if _circuit_breaker_manager is None:
+        config_data = load_yaml_config(config_path)
+        _circuit_breaker_manager = CircuitBreakerManager(config_data)
+    return _circuit_breaker_manager
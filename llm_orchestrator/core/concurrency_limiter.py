@@ -0,0 +1,375 @@
+"""
+백엔드별 적응형 동시 요청 제한
+
+백엔드(base_url)마다 동시에 보내는 LLM 요청 수를 측정한 응답 지연 시간으로 조정합니다.
+지연 시간이 기준(장기 평균)보다 늘어나면 vLLM 내부 대기열이 쌓이는 것으로 보고 제한을 줄이고,
+기준 수준이면 제한을 늘려 GPU가 놀지 않도록 합니다. 제한을 넘는 요청은 백엔드로 보내지 않고 대기합니다.
+
+- gradient: 새 제한 = 제한 × clamp(tolerance × 기준 / 최근, 0.5, 1) + √제한 (smoothing 비율로 반영)
+- aimd: 최근 지연 시간이 기준 × tolerance 이하이면 +1/제한, 넘으면 × backoff_ratio
+- 시간 초과, 429/503/504 응답은 두 방식 모두 × backoff_ratio
+- 지연 시간은 요청 종류(경로, 스트리밍 여부)별로 따로 집계 (비스트리밍: 전체 응답 시간, 스트리밍: 첫 조각까지 시간)
+- 기준 지연 시간은 최근 평균이 낮아지면 바로 내려가고 올라갈 때는 천천히 따라감
+"""
+import asyncio
+import math
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Optional, Dict, Any, Deque, Tuple, AsyncIterator
+import httpx
+from core.loader import load_yaml_config
+from core.logger import get_logger
+from core.deadline import current_deadline, wait_within_deadline
+
+logger = get_logger(__name__)
+
+# 적응형 동시 요청 제한 설정 기본값 (settings.yml의 llm.adaptive_concurrency 및 모델별 adaptive_concurrency로 덮어씀)
+DEFAULT_ADAPTIVE_CONCURRENCY_CONFIG: Dict[str, Any] = {
+    "enabled": False,
+    "algorithm": "gradient",
+    "initial_limit": 16,
+    "min_limit": 1,
+    "max_limit": 64,
+    "tolerance": 1.5,
+    "smoothing": 0.2,
+    "backoff_ratio": 0.9,
+    "min_samples": 10,
+    "long_window": 500,
+    "short_window": 10
+}
+
+ALGORITHMS = ("gradient", "aimd")
+
+# 백엔드 과부하로 보는 응답 상태 코드
+OVERLOAD_STATUS = (429, 503, 504)
+
+
+class LimiterSlot:
+    """획득한 동시 요청 슬롯 (반환할 때 측정 결과를 제한 조정에 반영)"""
+    
+    def __init__(self):
+        self.sample: Optional[Tuple[str, float]] = None
+        self.dropped = False
+    
+    def record_latency(self, kind: str, seconds: float) -> None:
+        """
+        지연 시간 기록
+        
+        Args:
+            kind: 요청 종류 (종류별로 기준 지연 시간을 따로 집계)
+            seconds: 지연 시간 (초)
+        """
+        if self.sample is None:
+            self.sample = (kind, seconds)
+    
+    def record_drop(self) -> None:
+        """과부하 실패 기록 (시간 초과, 429/503/504)"""
+        self.dropped = True
+
+
+class _FirstChunkStream(httpx.AsyncByteStream):
+    """스트리밍 응답의 첫 조각까지 시간을 슬롯에 기록하는 스트림 래퍼"""
+    
+    def __init__(self, stream: httpx.AsyncByteStream, slot: LimiterSlot, kind: str, start: float):
+        self._stream = stream
+        self._slot = slot
+        self._kind = kind
+        self._start = start
+    
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            if self._slot.sample is None:
+                self._slot.record_latency(self._kind, time.perf_counter() - self._start)
+            yield chunk
+    
+    async def aclose(self) -> None:
+        await self._stream.aclose()
+
+
+def measure_first_chunk(response: httpx.Response, slot: LimiterSlot, kind: str, start: float) -> None:
+    """
+    스트리밍 응답의 첫 조각까지 시간을 지연 시간으로 기록하도록 설정
+    
+    Args:
+        response: 본문을 읽지 않은 스트리밍 응답
+        slot: 동시 요청 슬롯
+        kind: 요청 종류
+        start: 요청 전송 시각 (time.perf_counter)
+    """
+    response.stream = _FirstChunkStream(response.stream, slot, kind, start)
+
+
+class _LatencyBaseline:
+    """요청 종류별 지연 시간 (long: 기준, short: 최근 평균)"""
+    
+    def __init__(self):
+        self.count = 0
+        self.long = 0.0
+        self.short = 0.0
+    
+    def update(self, seconds: float, long_alpha: float, short_alpha: float) -> None:
+        """
+        지연 시간 표본 반영 (지수 이동 평균)
+        
+        기준은 최근 평균이 더 낮아지면 바로 따라 내려가고, 올라갈 때는 long_alpha로 천천히 따라갑니다.
+        (대기열이 쌓인 상태의 지연 시간이 기준이 되어 제한이 계속 늘어나는 것을 방지)
+        """
+        if self.count == 0:
+            self.long = self.short = seconds
+        else:
+            self.short += short_alpha * (seconds - self.short)
+            self.long = min(self.short, self.long + long_alpha * (seconds - self.long))
+        self.count += 1
+
+
+class AdaptiveLimiter:
+    """백엔드 하나의 적응형 동시 요청 제한"""
+    
+    def __init__(self, base_url: str, config: Dict[str, Any]):
+        """
+        동시 요청 제한 초기화
+        
+        Args:
+            base_url: 백엔드 base_url
+            config: 적응형 동시 요청 제한 설정
+        """
+        self.base_url = base_url
+        self.algorithm = config.get("algorithm", "gradient")
+        if self.algorithm not in ALGORITHMS:
+            logger.warning(f"지원하지 않는 동시 요청 제한 알고리즘입니다: {self.algorithm} ({', '.join(ALGORITHMS)}). gradient를 사용합니다.")
+            self.algorithm = "gradient"
+        self.min_limit = max(1, int(config["min_limit"]))
+        # 정적 상한 (측정 결과와 관계없이 넘지 않음)
+        self.max_limit = max(self.min_limit, int(config["max_limit"]))
+        self.limit = float(min(self.max_limit, max(self.min_limit, int(config["initial_limit"]))))
+        self.tolerance = float(config["tolerance"])
+        self.smoothing = float(config["smoothing"])
+        self.backoff_ratio = float(config["backoff_ratio"])
+        self.min_samples = int(config["min_samples"])
+        self.long_alpha = 2.0 / (int(config["long_window"]) + 1)
+        self.short_alpha = 2.0 / (int(config["short_window"]) + 1)
+        self.in_flight = 0
+        self.queued = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._latency: Dict[str, _LatencyBaseline] = {}
+        self.acquired = 0
+        self.waited = 0
+        self.total_queue_wait_ms = 0.0
+        self.max_queue_wait_ms = 0.0
+        self.drops = 0
+        self.max_observed_limit = self.limit
+        self.min_observed_limit = self.limit
+    
+    async def acquire(self) -> float:
+        """
+        슬롯 획득 (제한에 도달하면 먼저 기다린 요청부터 순서대로 획득)
+        
+        Returns:
+            대기 시간 (ms)
+        """
+        self.acquired += 1
+        if self.in_flight < int(self.limit) and not self._waiters:
+            self.in_flight += 1
+            return 0.0
+        
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        self.queued += 1
+        self.waited += 1
+        start = time.perf_counter()
+        try:
+            await future
+        except asyncio.CancelledError:
+            # 슬롯을 넘겨받은 직후 취소된 경우 다음 요청에 슬롯 반환
+            if not future.cancelled():
+                self.release(LimiterSlot())
+            raise
+        finally:
+            self.queued -= 1
+        
+        wait_ms = (time.perf_counter() - start) * 1000
+        self.total_queue_wait_ms += wait_ms
+        self.max_queue_wait_ms = max(self.max_queue_wait_ms, wait_ms)
+        return wait_ms
+    
+    def _wake(self) -> None:
+        """제한에 여유가 있으면 대기 중인 요청에 슬롯 전달"""
+        while self._waiters and self.in_flight < int(self.limit):
+            future = self._waiters.popleft()
+            if future.done():
+                continue
+            self.in_flight += 1
+            future.set_result(None)
+    
+    def release(self, slot: LimiterSlot) -> None:
+        """
+        슬롯 반환 및 제한 조정
+        
+        Args:
+            slot: 반환할 슬롯 (측정 결과가 없으면 제한을 조정하지 않음)
+        """
+        in_flight = self.in_flight
+        self.in_flight -= 1
+        if slot.dropped:
+            self.drops += 1
+            self._set_limit(self.limit * self.backoff_ratio)
+        elif slot.sample is not None:
+            self._on_sample(*slot.sample, in_flight)
+        self._wake()
+    
+    def _on_sample(self, kind: str, seconds: float, in_flight: int) -> None:
+        """지연 시간 표본으로 제한 조정"""
+        baseline = self._latency.get(kind)
+        if baseline is None:
+            baseline = _LatencyBaseline()
+            self._latency[kind] = baseline
+        baseline.update(seconds, self.long_alpha, self.short_alpha)
+        if baseline.count < self.min_samples:
+            return
+        
+        # 동시 요청 수가 제한의 절반도 안 되면 지연 시간이 좋아도 늘리지 않음 (실제 부하로 검증되지 않은 제한)
+        app_limited = in_flight < self.limit / 2
+        if self.algorithm == "aimd":
+            if baseline.short > baseline.long * self.tolerance:
+                self._set_limit(self.limit * self.backoff_ratio)
+            elif not app_limited:
+                self._set_limit(self.limit + 1.0 / self.limit)
+            return
+        
+        gradient = max(0.5, min(1.0, self.tolerance * baseline.long / baseline.short))
+        if gradient >= 1.0 and app_limited:
+            return
+        new_limit = self.limit * gradient + math.sqrt(self.limit)
+        self._set_limit(self.limit * (1 - self.smoothing) + new_limit * self.smoothing)
+    
+    def _set_limit(self, limit: float) -> None:
+        """제한 변경 (min_limit~max_limit)"""
+        previous = int(self.limit)
+        self.limit = min(float(self.max_limit), max(float(self.min_limit), limit))
+        self.max_observed_limit = max(self.max_observed_limit, self.limit)
+        self.min_observed_limit = min(self.min_observed_limit, self.limit)
+        if int(self.limit) < previous:
+            logger.info(f"동시 요청 제한 감소: {self.base_url}, {previous} → {int(self.limit)}, 처리 중={self.in_flight}, 대기={self.queued}")
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """제한 상태 조회"""
+        return {
+            "algorithm": self.algorithm,
+            "limit": int(self.limit),
+            "limit_value": round(self.limit, 2),
+            "min_limit": self.min_limit,
+            "max_limit": self.max_limit,
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "acquired": self.acquired,
+            "waited": self.waited,
+            "avg_queue_wait_ms": round(self.total_queue_wait_ms / self.waited, 1) if self.waited else 0.0,
+            "max_queue_wait_ms": round(self.max_queue_wait_ms, 1),
+            "drops": self.drops,
+            "observed_limit_range": [int(self.min_observed_limit), int(self.max_observed_limit)],
+            "latency": {
+                kind: {
+                    "samples": baseline.count,
+                    "baseline_ms": round(baseline.long * 1000, 1),
+                    "recent_ms": round(baseline.short * 1000, 1)
+                }
+                for kind, baseline in self._latency.items()
+            }
+        }
+
+
+class ConcurrencyLimiterManager:
+    """백엔드(base_url)별 적응형 동시 요청 제한 관리자"""
+    
+    def __init__(self, config_data: Dict[str, Any]):
+        """
+        동시 요청 제한 관리자 초기화
+        
+        Args:
+            config_data: 설정 데이터
+        """
+        self.config = {**DEFAULT_ADAPTIVE_CONCURRENCY_CONFIG, **(config_data.get("llm", {}).get("adaptive_concurrency") or {})}
+        self._limiters: Dict[str, AdaptiveLimiter] = {}
+    
+    def resolve_config(self, overrides: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """모델별 설정(adaptive_concurrency)을 덮어쓴 설정"""
+        return {**self.config, **(overrides or {})}
+    
+    def get_limiter(self, base_url: str, config: Dict[str, Any]) -> Optional[AdaptiveLimiter]:
+        """
+        백엔드의 동시 요청 제한을 가져오거나 생성 (처음 요청한 모델의 설정 사용)
+        
+        Args:
+            base_url: 백엔드 base_url
+            config: resolve_config로 만든 설정
+        
+        Returns:
+            AdaptiveLimiter 인스턴스 (비활성화된 경우 None)
+        """
+        if not config.get("enabled", False):
+            return None
+        limiter = self._limiters.get(base_url)
+        if limiter is None:
+            limiter = AdaptiveLimiter(base_url, config)
+            self._limiters[base_url] = limiter
+            logger.info(f"적응형 동시 요청 제한 생성: {base_url}, 알고리즘={limiter.algorithm}, 초기 제한={int(limiter.limit)}, 범위={limiter.min_limit}~{limiter.max_limit}")
+        return limiter
+    
+    @asynccontextmanager
+    async def slot(self, base_url: str, config: Dict[str, Any]) -> AsyncIterator[LimiterSlot]:
+        """
+        백엔드 동시 요청 슬롯 (비활성화되어 있으면 제한 없이 통과)
+        
+        슬롯 대기는 요청 기한까지만 하며, 블록이 끝나면 측정 결과를 반영하여 슬롯을 반환합니다.
+        
+        Args:
+            base_url: 백엔드 base_url
+            config: resolve_config로 만든 설정
+        
+        Yields:
+            LimiterSlot (지연 시간/과부하 실패 기록용)
+        """
+        slot = LimiterSlot()
+        limiter = self.get_limiter(base_url, config)
+        if limiter is None:
+            yield slot
+            return
+        await wait_within_deadline(limiter.acquire(), current_deadline(), f"동시 요청 제한 대기 {base_url}")
+        try:
+            yield slot
+        finally:
+            limiter.release(slot)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        동시 요청 제한 상태 조회
+        
+        Returns:
+            백엔드별 현재 제한, 처리 중/대기 중 요청 수, 종류별 기준/최근 지연 시간
+        """
+        return {
+            "enabled": bool(self.config.get("enabled", False)),
+            "backends": {base_url: limiter.get_stats() for base_url, limiter in self._limiters.items()}
+        }
+
+
+# 전역 동시 요청 제한 관리자 인스턴스
+_concurrency_limiter_manager: Optional[ConcurrencyLimiterManager] = None
+
+
+def get_concurrency_limiter_manager(config_path: Optional[str] = None) -> ConcurrencyLimiterManager:
+    """
+    동시 요청 제한 관리자 싱글톤 인스턴스 반환
+    
+    Args:
+        config_path: 설정 파일 경로
+    
+    Returns:
+        ConcurrencyLimiterManager 인스턴스
+    """
+    global _concurrency_limiter_manager
+    if _concurrency_limiter_manager is None:
+        config_data = load_yaml_config(config_path)
+        _concurrency_limiter_manager = ConcurrencyLimiterManager(config_data)
+    return _concurrency_limiter_manager
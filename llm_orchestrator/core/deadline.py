@@ -0,0 +1,382 @@
+"""
+요청 기한(deadline) 전파
+
+호출자(Spring Boot 서버)가 결과를 기다리는 시간을 요청 헤더 또는 파이프라인 설정으로 받아
+컨텍스트 변수에 담고, PipelineManager → LLMClient 호출까지 전달합니다.
+LLM 호출은 남은 시간으로 연결/읽기 제한 시간과 첫 토큰 제한 시간을 줄이고,
+기한이 지나면 폴백 모델로 넘어가지 않고 DeadlineExceeded로 즉시 중단합니다.
+"""
+import asyncio
+import contextvars
+import time
+from contextlib import contextmanager
+from typing import Optional, Dict, Any, Tuple, Mapping, Awaitable, TypeVar, Iterator
+import httpx
+from core.loader import load_yaml_config
+from core.logger import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# 요청 기한 설정 기본값 (settings.yml의 deadline으로 덮어씀)
+DEFAULT_DEADLINE_CONFIG: Dict[str, Any] = {
+    "enabled": True,
+    "header": "X-Request-Timeout-Ms",
+    "default_timeout": None,
+    "max_timeout": 600.0,
+    "first_token_timeout": None,
+    "pipelines": {}
+}
+
+
+class DeadlineExceeded(Exception):
+    """요청 기한 초과 (호출자가 더 이상 결과를 기다리지 않으므로 재시도/폴백하지 않음)"""
+    
+    def __init__(self, stage: str):
+        self.stage = stage
+        super().__init__(f"요청 기한을 초과했습니다: {stage}")
+
+
+def _earliest(*values: Optional[float]) -> Optional[float]:
+    """None(제한 없음)을 제외한 가장 작은 값"""
+    present = [value for value in values if value is not None]
+    return min(present) if present else None
+
+
+class Deadline:
+    """요청 기한 (time.monotonic 기준 시각, 상위 기한보다 늦을 수 없음)"""
+    
+    def __init__(self, at: Optional[float], first_token_timeout: Optional[float] = None, parent: Optional["Deadline"] = None):
+        """
+        요청 기한 초기화
+        
+        Args:
+            at: 기한 시각 (time.monotonic 기준, None이면 제한 없음)
+            first_token_timeout: 스트리밍 첫 조각까지 제한 시간 (초, None이면 제한 없음)
+            parent: 상위 기한
+        """
+        self._at = at
+        self._first_token_timeout = first_token_timeout
+        self.parent = parent
+    
+    @property
+    def at(self) -> Optional[float]:
+        """기한 시각 (상위 기한 포함)"""
+        return _earliest(self._at, self.parent.at if self.parent is not None else None)
+    
+    @property
+    def first_token_timeout(self) -> Optional[float]:
+        """첫 조각까지 제한 시간 (상위 기한 포함)"""
+        return _earliest(self._first_token_timeout, self.parent.first_token_timeout if self.parent is not None else None)
+    
+    def remaining(self) -> Optional[float]:
+        """남은 시간 (초, 제한이 없으면 None, 지났으면 0 이하)"""
+        at = self.at
+        return None if at is None else at - time.monotonic()
+    
+    def expired(self) -> bool:
+        """기한이 지났는지 여부"""
+        remaining = self.remaining()
+        return remaining is not None and remaining <= 0
+    
+    def extend(self, other: Optional["Deadline"]) -> None:
+        """
+        다른 호출자의 기한까지 연장 (여러 호출자가 공유하는 실행의 기한에 사용)
+        
+        Args:
+            other: 함께 기다리는 호출자의 기한 (None이면 제한 없음)
+        """
+        other_at = other.at if other is not None else None
+        self._at = None if self._at is None or other_at is None else max(self._at, other_at)
+        other_first_token = other.first_token_timeout if other is not None else None
+        if self._first_token_timeout is not None and other_first_token is not None:
+            self._first_token_timeout = max(self._first_token_timeout, other_first_token)
+        else:
+            self._first_token_timeout = None
+    
+    @classmethod
+    def detached(cls, deadline: Optional["Deadline"]) -> "Deadline":
+        """상위 기한과 분리된 복사본 (이후 extend로 연장 가능)"""
+        if deadline is None:
+            return cls(None)
+        return cls(deadline.at, deadline.first_token_timeout)
+
+
+# 현재 요청의 기한 (asyncio 태스크는 생성 시점의 값을 물려받음)
+_current_deadline: contextvars.ContextVar[Optional[Deadline]] = contextvars.ContextVar("llm_request_deadline", default=None)
+
+
+def current_deadline() -> Optional[Deadline]:
+    """현재 요청의 기한 (없으면 None)"""
+    return _current_deadline.get()
+
+
+def remaining_time() -> Optional[float]:
+    """현재 요청의 남은 시간 (초, 기한이 없으면 None)"""
+    deadline = _current_deadline.get()
+    return deadline.remaining() if deadline is not None else None
+
+
+def is_deadline_expired() -> bool:
+    """현재 요청의 기한이 지났는지 여부"""
+    deadline = _current_deadline.get()
+    return deadline is not None and deadline.expired()
+
+
+def within_deadline(delay: float) -> bool:
+    """delay초 뒤에도 기한이 남아 있는지 여부 (재시도 대기 판단)"""
+    remaining = remaining_time()
+    return remaining is None or delay < remaining
+
+
+def check_deadline(stage: str) -> None:
+    """
+    기한 확인
+    
+    Args:
+        stage: 오류 메시지에 표시할 처리 단계
+    
+    Raises:
+        DeadlineExceeded: 기한이 지난 경우
+    """
+    if is_deadline_expired():
+        raise DeadlineExceeded(stage)
+
+
+def cap_timeout(timeout: Optional[float]) -> Optional[float]:
+    """제한 시간을 남은 시간 이내로 줄임 (둘 다 없으면 None)"""
+    remaining = remaining_time()
+    if remaining is None:
+        return timeout
+    return _earliest(timeout, max(0.0, remaining))
+
+
+def cap_httpx_timeout(timeout: httpx.Timeout) -> Optional[httpx.Timeout]:
+    """
+    httpx 제한 시간(연결/읽기/쓰기/풀 대기)을 남은 시간 이내로 줄임
+    
+    Args:
+        timeout: 연결 풀의 기본 제한 시간
+    
+    Returns:
+        줄인 제한 시간 (기한이 없으면 None: 풀 기본값 사용)
+    """
+    remaining = remaining_time()
+    if remaining is None:
+        return None
+    # 0이면 httpx가 즉시 시간 초과로 처리하도록 아주 작은 값 사용
+    remaining = max(0.001, remaining)
+    return httpx.Timeout(
+        connect=_earliest(timeout.connect, remaining),
+        read=_earliest(timeout.read, remaining),
+        write=_earliest(timeout.write, remaining),
+        pool=_earliest(timeout.pool, remaining)
+    )
+
+
+def new_deadline(timeout: Optional[float], first_token_timeout: Optional[float] = None) -> Optional[Deadline]:
+    """
+    현재 기한보다 늦지 않은 새 기한 생성
+    
+    Args:
+        timeout: 지금부터의 제한 시간 (초, None이면 현재 기한 유지)
+        first_token_timeout: 스트리밍 첫 조각까지 제한 시간 (초)
+    
+    Returns:
+        새 기한 (둘 다 None이면 현재 기한)
+    """
+    parent = _current_deadline.get()
+    if timeout is None and first_token_timeout is None:
+        return parent
+    at = time.monotonic() + timeout if timeout is not None else None
+    return Deadline(at, first_token_timeout, parent)
+
+
+@contextmanager
+def use_deadline(deadline: Optional[Deadline]) -> Iterator[Optional[Deadline]]:
+    """기한 적용 컨텍스트 (블록 안의 LLM 호출과 새로 만든 태스크에 전달)"""
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+def deadline_scope(timeout: Optional[float], first_token_timeout: Optional[float] = None):
+    """현재 기한보다 늦지 않은 새 기한을 적용하는 컨텍스트 (new_deadline + use_deadline)"""
+    return use_deadline(new_deadline(timeout, first_token_timeout))
+
+
+def deadline_context(deadline: Optional[Deadline]) -> contextvars.Context:
+    """기한을 바꾼 현재 컨텍스트 복사본 (여러 호출자가 공유하는 태스크 생성에 사용)"""
+    context = contextvars.copy_context()
+    context.run(_current_deadline.set, deadline)
+    return context
+
+
+async def wait_within_deadline(awaitable: Awaitable[T], deadline: Optional[Deadline], stage: str) -> T:
+    """
+    기한까지만 결과 대기 (공유 실행을 기다리는 호출자별 기한 적용)
+    
+    Args:
+        awaitable: 대기할 작업 (기한이 지나면 취소되므로 공유 태스크는 shield로 감싸서 전달)
+        deadline: 호출자의 기한
+        stage: 오류 메시지에 표시할 처리 단계
+    
+    Returns:
+        작업 결과
+    
+    Raises:
+        DeadlineExceeded: 결과가 나오기 전에 기한이 지난 경우
+    """
+    timeout = deadline.remaining() if deadline is not None else None
+    if timeout is None:
+        return await awaitable
+    try:
+        return await asyncio.wait_for(awaitable, max(0.0, timeout))
+    except asyncio.TimeoutError:
+        # 작업 자체의 시간 초과(시도 제한 시간 등)는 그대로 전파
+        if deadline.expired():
+            raise DeadlineExceeded(stage) from None
+        raise
+
+
+async def wait_stream_chunk(awaitable: Awaitable[T], first: bool, stage: str) -> T:
+    """
+    스트리밍 응답 조각 대기 (첫 조각은 첫 토큰 제한 시간, 이후는 요청 기한까지)
+    
+    Args:
+        awaitable: 다음 조각을 읽는 작업
+        first: 첫 조각 여부
+        stage: 오류 메시지에 표시할 처리 단계
+    
+    Returns:
+        응답 조각
+    
+    Raises:
+        DeadlineExceeded: 요청 기한이 지난 경우
+        asyncio.TimeoutError: 첫 토큰 제한 시간을 넘긴 경우 (폴백 모델로 전환 가능)
+    """
+    deadline = _current_deadline.get()
+    if deadline is None:
+        return await awaitable
+    timeout = deadline.remaining()
+    if first:
+        timeout = _earliest(timeout, deadline.first_token_timeout)
+    if timeout is None:
+        return await awaitable
+    try:
+        return await asyncio.wait_for(awaitable, max(0.0, timeout))
+    except asyncio.TimeoutError:
+        check_deadline(stage)
+        raise
+
+
+class DeadlineManager:
+    """요청 기한 설정 및 통계"""
+    
+    def __init__(self, config_data: Dict[str, Any]):
+        """
+        요청 기한 관리자 초기화
+        
+        Args:
+            config_data: 설정 데이터
+        """
+        self.config = {**DEFAULT_DEADLINE_CONFIG, **(config_data.get("deadline") or {})}
+        self.enabled = bool(self.config.get("enabled", True))
+        self.header = self.config.get("header") or DEFAULT_DEADLINE_CONFIG["header"]
+        self.requests = 0
+        self.exceeded = 0
+        self.disconnected = 0
+    
+    def request_timeout(self, headers: Mapping[str, str]) -> Optional[float]:
+        """
+        요청 기한 조회 (헤더의 남은 시간(ms) → default_timeout 순서, max_timeout으로 제한)
+        
+        Args:
+            headers: 요청 헤더
+        
+        Returns:
+            제한 시간 (초, None이면 제한 없음)
+        """
+        if not self.enabled:
+            return None
+        timeout = self.config.get("default_timeout")
+        value = headers.get(self.header)
+        if value:
+            try:
+                timeout = float(value) / 1000
+            except ValueError:
+                logger.warning(f"요청 기한 헤더를 해석할 수 없습니다: {self.header}={value}")
+        if timeout is None:
+            return None
+        self.requests += 1
+        return max(0.0, _earliest(float(timeout), self.config.get("max_timeout")))
+    
+    def pipeline_timeouts(self, pipeline_name: str) -> Tuple[Optional[float], Optional[float]]:
+        """
+        파이프라인별 제한 시간 조회
+        
+        Args:
+            pipeline_name: 파이프라인 이름
+        
+        Returns:
+            (제한 시간, 첫 토큰 제한 시간) (초, None이면 제한 없음)
+        """
+        if not self.enabled:
+            return None, None
+        override = (self.config.get("pipelines") or {}).get(pipeline_name) or {}
+        return override.get("timeout"), override.get("first_token_timeout", self.config.get("first_token_timeout"))
+    
+    def pipeline_scope(self, pipeline_name: str):
+        """파이프라인별 제한 시간을 현재 기한에 적용하는 컨텍스트"""
+        return deadline_scope(*self.pipeline_timeouts(pipeline_name))
+    
+    def record_exceeded(self, stage: str) -> None:
+        """기한 초과 기록"""
+        self.exceeded += 1
+        logger.warning(f"요청 기한 초과로 처리 중단: {stage}")
+    
+    def record_disconnect(self, path: str) -> None:
+        """클라이언트 연결 종료로 인한 취소 기록"""
+        self.disconnected += 1
+        logger.warning(f"클라이언트 연결이 끊겨 처리 취소: {path}")
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        요청 기한 상태 조회
+        
+        Returns:
+            설정, 기한이 적용된 요청 수, 기한 초과 수, 연결 종료로 취소된 요청 수
+        """
+        return {
+            "enabled": self.enabled,
+            "header": self.header,
+            "default_timeout": self.config.get("default_timeout"),
+            "max_timeout": self.config.get("max_timeout"),
+            "requests_with_deadline": self.requests,
+            "exceeded": self.exceeded,
+            "client_disconnects": self.disconnected
+        }
+
+
+# 전역 요청 기한 관리자 인스턴스
+_deadline_manager: Optional[DeadlineManager] = None
+
+
+def get_deadline_manager(config_path: Optional[str] = None) -> DeadlineManager:
+    """
+    요청 기한 관리자 싱글톤 인스턴스 반환
+    
+    Args:
+        config_path: 설정 파일 경로
+    
+    Returns:
+        DeadlineManager 인스턴스
+    """
+    global _deadline_manager
+    if _deadline_manager is None:
+        config_data = load_yaml_config(config_path)
+        _deadline_manager = DeadlineManager(config_data)
+    return _deadline_manager
@@ -3,8 +3,12 @@
 
 LLM 엔진 타입별 설정을 관리하고 조회합니다.
 """
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 from core.loader import load_yaml_config
+from core.logger import get_logger
+from core.http_pool import merge_http_pool_config
+
+logger = get_logger(__name__)
 
 
 class EngineRegistry:
@@ -19,6 +23,8 @@ class EngineRegistry:
         """
         self.config_data = config_data
         self.llm_config = config_data.get("llm", {})
+        # 연결 풀 기본 설정 (모델별 http_pool로 덮어씀)
+        self.http_pool_defaults = self.llm_config.get("http_pool", {})
     
     def get_llm_type(self) -> str:
         """
@@ -29,6 +35,14 @@ class EngineRegistry:
         """
         return self.llm_config.get("type", "api")
     
+    @staticmethod
+    def _base_urls(model: Dict[str, Any], default: str) -> List[str]:
+        """레플리카 base_url 목록 (base_urls 또는 base_url, base_url에 목록을 지정해도 됨)"""
+        base_urls = model.get("base_urls") or model.get("base_url") or default
+        if isinstance(base_urls, str):
+            base_urls = [base_urls]
+        return list(base_urls)
+    
     def get_model_config(self, model_spec: str) -> Optional[Dict[str, Any]]:
         """
         모델 설정 조회
@@ -39,6 +53,7 @@ class EngineRegistry:
         
         Returns:
             모델 설정 딕셔너리 또는 None
+            (type: 모델 지정의 LLM 타입, base_urls: 레플리카 목록, base_url: 첫 번째 레플리카)
         """
         # 모델 지정 형식 파싱: "{type}:{model_name}"
         if ":" not in model_spec:
@@ -51,7 +66,14 @@ class EngineRegistry:
             models = self.llm_config.get("api", {}).get("models", [])
             for model in models:
                 if model.get("name") == model_name:
-                    return model
+                    base_urls = self._base_urls(model, "")
+                    return {
+                        **model,
+                        "type": llm_type,
+                        "base_url": base_urls[0],
+                        "base_urls": base_urls,
+                        "http_pool": merge_http_pool_config(self.http_pool_defaults, model.get("http_pool"))
+                    }
             return None
         
         # vLLM (models 배열에서 찾기)
@@ -63,39 +85,115 @@ class EngineRegistry:
             for model in models:
                 if model.get("name") == model_name:
                     # vLLM 모델 설정 구성
+                    base_urls = self._base_urls(model, "http://localhost:8001")
                     return {
                         "name": model.get("name"),
                         "model_name": model.get("model_name"),
+                        "type": llm_type,
                         "provider": "vllm",
                         "api_key": "",
-                        "base_url": model.get("base_url", "http://localhost:8001"),
+                        "base_url": base_urls[0],
+                        "base_urls": base_urls,
                         "max_tokens": model.get("max_tokens", 2000),
                         "temperature": model.get("temperature", 0.7),
                         "top_p": model.get("top_p", 1.0),
                         "streaming": model.get("streaming", False),
                         "stop_strings": model.get("stop_strings", []),
-                        "extra_body": model.get("extra_body", {})
+                        "extra_body": model.get("extra_body", {}),
+                        "http_pool": merge_http_pool_config(self.http_pool_defaults, model.get("http_pool"))
                     }
             return None
         
-        # Ollama
+        # Ollama (models 배열에서 찾기, models가 없으면 이전 형식의 단일 model_name 사용)
         elif llm_type == "ollama":
             ollama_config = self.llm_config.get("ollama", {})
-            actual_model_name = ollama_config.get("model_name")
-            if not actual_model_name:
-                raise ValueError("Ollama 설정에 model_name이 지정되지 않았습니다.")
-            return {
-                "name": actual_model_name,
-                "model_name": actual_model_name,
-                "provider": "ollama",
-                "api_key": "",
-                "base_url": ollama_config.get("base_url", "http://localhost:11434"),
-                "max_tokens": ollama_config.get("max_tokens", 2000),
-                "temperature": ollama_config.get("temperature", 0.7),
-                "top_p": ollama_config.get("top_p", 1.0)
-            }
+            models = ollama_config.get("models")
+            legacy = not models
+            if legacy:
+                if not ollama_config.get("model_name"):
+                    raise ValueError("Ollama 설정에 models 또는 model_name이 지정되지 않았습니다.")
+                models = [{**ollama_config, "name": ollama_config.get("model_name")}]
+            
+            for model in models:
+                # 이전 형식은 모든 "ollama:*" 지정을 단일 model_name으로 해석
+                if legacy or model.get("name") == model_name:
+                    # keep_alive, preload는 모델별 설정이 없으면 ollama 공통 설정 사용
+                    base_urls = self._base_urls(model, ollama_config.get("base_url") or "http://localhost:11434")
+                    return {
+                        "name": model.get("name"),
+                        "model_name": model.get("model_name") or model.get("name"),
+                        "type": llm_type,
+                        "provider": "ollama",
+                        "api_key": "",
+                        "base_url": base_urls[0],
+                        "base_urls": base_urls,
+                        "max_tokens": model.get("max_tokens", 2000),
+                        "temperature": model.get("temperature", 0.7),
+                        "top_p": model.get("top_p", 1.0),
+                        "streaming": model.get("streaming", False),
+                        "keep_alive": model.get("keep_alive", ollama_config.get("keep_alive")),
+                        "preload": model.get("preload", ollama_config.get("preload", False)),
+                        "options": model.get("options", {}),
+                        "http_pool": merge_http_pool_config(self.http_pool_defaults, model.get("http_pool"))
+                    }
+            return None
         
         return None
+    
+    def is_type_enabled(self, llm_type: str) -> bool:
+        """
+        LLM 타입 설정 사용 여부 (타입 설정의 enabled, 지정하지 않으면 사용)
+        
+        Args:
+            llm_type: LLM 타입 ("api", "vllm", "ollama")
+        """
+        return bool(self.llm_config.get(llm_type, {}).get("enabled", True))
+    
+    def get_model_specs(self, llm_type: str) -> List[str]:
+        """
+        LLM 타입에 설정된 모델 지정 목록
+        
+        Args:
+            llm_type: LLM 타입 ("api", "vllm", "ollama")
+        
+        Returns:
+            모델 지정 목록 ("{type}:{name}")
+        """
+        type_config = self.llm_config.get(llm_type, {})
+        models = type_config.get("models") or []
+        # Ollama는 이전 형식의 단일 model_name도 지원
+        if llm_type == "ollama" and not models and type_config.get("model_name"):
+            models = [{"name": type_config["model_name"]}]
+        return [f"{llm_type}:{model.get('name')}" for model in models if model.get("name")]
+    
+    def get_model_chain(self, model_specs: List[str]) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        모델 폴백 체인 조회 (파이프라인의 model → extend_model 순서)
+        
+        찾을 수 없거나 형식이 올바르지 않은 모델은 경고 후 건너뛰고, 중복 지정은 한 번만 포함합니다.
+        
+        Args:
+            model_specs: 모델 지정 목록 ("{type}:{model_name}")
+        
+        Returns:
+            (모델 지정, 모델 설정) 목록
+        """
+        chain: List[Tuple[str, Dict[str, Any]]] = []
+        seen = set()
+        for model_spec in model_specs:
+            if not model_spec or model_spec in seen:
+                continue
+            seen.add(model_spec)
+            try:
+                model_config = self.get_model_config(model_spec)
+            except ValueError as e:
+                logger.warning(f"폴백 모델 설정 오류로 제외합니다: {model_spec}, 오류={str(e)}")
+                continue
+            if model_config is None:
+                logger.warning(f"폴백 모델을 찾을 수 없어 제외합니다: {model_spec}")
+                continue
+            chain.append((model_spec, model_config))
+        return chain
 
 
 # 전역 엔진 레지스트리 인스턴스
@@ -0,0 +1,341 @@
+"""
+모델 엔드포인트 상태 확인
+
+서버 실행 중 백그라운드에서 설정된 모델 엔드포인트(base_url)를 주기적으로 확인합니다.
+- vLLM: GET {base_url}/models (제공 중인 모델 목록에 model_name이 있는지 확인)
+- Ollama: GET {base_url}/api/tags (받아 둔 모델 목록에 model_name이 있는지 확인)
+- API (include_api가 켜진 경우): GET {base_url}/models (연결과 인증만 확인)
+
+연속 실패가 unhealthy_threshold에 도달하면 unhealthy, 연속 성공이 healthy_threshold에 도달하면 healthy로 바꿉니다.
+unhealthy 엔드포인트는 레플리카 선택에서 제외하고, 모든 레플리카가 unhealthy인 모델은 폴백 시 건너뜁니다.
+"""
+import asyncio
+import time
+from collections import deque
+from typing import Optional, Dict, Any, Tuple, Deque, Set
+import httpx
+from core.loader import load_yaml_config
+from core.logger import get_logger
+from core.http_pool import get_http_pool_manager
+from core.json_codec import get_json_codec, JSONDecodeError
+from core.engine_registry import get_engine_registry
+
+logger = get_logger(__name__)
+
+# 상태 확인 설정 기본값 (settings.yml의 llm.health_check로 덮어씀)
+DEFAULT_HEALTH_CHECK_CONFIG: Dict[str, Any] = {
+    "enabled": False,
+    "interval": 15,
+    "timeout": 5,
+    "unhealthy_threshold": 2,
+    "healthy_threshold": 1,
+    "latency_window": 20,
+    "include_api": False
+}
+
+STATUS_UNKNOWN = "unknown"
+STATUS_HEALTHY = "healthy"
+STATUS_UNHEALTHY = "unhealthy"
+
+
+class EndpointHealth:
+    """엔드포인트(base_url) 상태"""
+    
+    def __init__(self, base_url: str, llm_type: str, model_config: Dict[str, Any], latency_window: int):
+        """
+        엔드포인트 상태 초기화
+        
+        Args:
+            base_url: 엔드포인트 base_url
+            llm_type: LLM 타입 ("api", "vllm", "ollama")
+            model_config: 엔드포인트를 사용하는 모델 설정 (연결 풀, 인증 헤더 구성용)
+            latency_window: 최근 응답 시간 보관 개수
+        """
+        self.base_url = base_url
+        self.llm_type = llm_type
+        self.http_pool_config = model_config.get("http_pool")
+        self.probe_url, self.headers = self._probe_request(base_url, llm_type, model_config)
+        self.status = STATUS_UNKNOWN
+        self.consecutive_successes = 0
+        self.consecutive_failures = 0
+        self.probes = 0
+        self.failures = 0
+        self.latencies: Deque[float] = deque(maxlen=latency_window)
+        self.served_models: Optional[Set[str]] = None
+        self.last_checked: Optional[float] = None
+        self.last_changed: Optional[float] = None
+        self.last_error: Optional[str] = None
+    
+    @staticmethod
+    def _probe_request(base_url: str, llm_type: str, model_config: Dict[str, Any]) -> Tuple[str, Dict[str, str]]:
+        """상태 확인 요청 URL과 헤더"""
+        if llm_type == "ollama":
+            return f"{base_url}/api/tags", {}
+        headers: Dict[str, str] = {}
+        api_key = model_config.get("api_key")
+        if llm_type == "api" and api_key:
+            if model_config.get("provider") == "anthropic":
+                headers = {"x-api-key": api_key, "anthropic-version": "2023-06-01"}
+            else:
+                headers = {"Authorization": f"Bearer {api_key}"}
+        return f"{base_url}/models", headers
+    
+    def _set_status(self, status: str) -> bool:
+        """상태 변경 (바뀌었으면 True)"""
+        if self.status == status:
+            return False
+        self.status = status
+        self.last_changed = time.time()
+        return True
+    
+    def record_success(self, latency: float, served_models: Optional[Set[str]], threshold: int) -> bool:
+        """
+        확인 성공 기록
+        
+        Returns:
+            healthy로 바뀌었으면 True
+        """
+        self.probes += 1
+        self.last_checked = time.time()
+        self.latencies.append(latency)
+        self.served_models = served_models
+        self.consecutive_failures = 0
+        self.consecutive_successes += 1
+        # 처음 확인한 엔드포인트는 한 번 성공하면 바로 healthy
+        if self.status == STATUS_UNKNOWN or self.consecutive_successes >= threshold:
+            return self._set_status(STATUS_HEALTHY)
+        return False
+    
+    def record_failure(self, error: str, threshold: int) -> bool:
+        """
+        확인 실패 기록
+        
+        Returns:
+            unhealthy로 바뀌었으면 True
+        """
+        self.probes += 1
+        self.failures += 1
+        self.last_checked = time.time()
+        self.last_error = error
+        self.consecutive_successes = 0
+        self.consecutive_failures += 1
+        # 처음 확인한 엔드포인트는 한 번 실패하면 바로 unhealthy
+        if self.status == STATUS_UNKNOWN or self.consecutive_failures >= threshold:
+            return self._set_status(STATUS_UNHEALTHY)
+        return False
+    
+    def serves(self, model_name: Optional[str]) -> bool:
+        """모델 제공 여부 (모델 목록을 모르면 True)"""
+        if not model_name or self.served_models is None:
+            return True
+        if model_name in self.served_models:
+            return True
+        # Ollama는 태그를 생략하면 latest
+        return self.llm_type == "ollama" and ":" not in model_name and f"{model_name}:latest" in self.served_models
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """엔드포인트 상태 조회"""
+        latencies = sorted(self.latencies)
+        return {
+            "type": self.llm_type,
+            "status": self.status,
+            "consecutive_failures": self.consecutive_failures,
+            "probes": self.probes,
+            "failures": self.failures,
+            "latency_ms": {
+                "last": round(self.latencies[-1] * 1000, 1) if self.latencies else None,
+                "avg": round(sum(latencies) / len(latencies) * 1000, 1) if latencies else None,
+                "max": round(latencies[-1] * 1000, 1) if latencies else None
+            },
+            "served_models": sorted(self.served_models) if self.served_models is not None else None,
+            "last_checked": round(self.last_checked, 3) if self.last_checked else None,
+            "last_changed": round(self.last_changed, 3) if self.last_changed else None,
+            "last_error": self.last_error
+        }
+
+
+class HealthProber:
+    """모델 엔드포인트 백그라운드 상태 확인"""
+    
+    def __init__(self, config_data: Dict[str, Any]):
+        """
+        상태 확인 초기화
+        
+        Args:
+            config_data: 설정 데이터
+        """
+        self.config = {**DEFAULT_HEALTH_CHECK_CONFIG, **(config_data.get("llm", {}).get("health_check") or {})}
+        self.enabled = bool(self.config.get("enabled", False))
+        self.interval = float(self.config["interval"])
+        self.timeout = float(self.config["timeout"])
+        self.unhealthy_threshold = max(1, int(self.config["unhealthy_threshold"]))
+        self.healthy_threshold = max(1, int(self.config["healthy_threshold"]))
+        self.codec = get_json_codec()
+        self._endpoints: Dict[str, EndpointHealth] = {}
+        self._task: Optional[asyncio.Task] = None
+        # 완료한 확인 주기 수 (0이면 아직 한 번도 확인하지 않음)
+        self.rounds = 0
+    
+    def _build_endpoints(self) -> None:
+        """설정된 모델의 엔드포인트 목록 구성 (같은 base_url은 한 번만 확인)"""
+        registry = get_engine_registry()
+        llm_types = ["vllm", "ollama"] + (["api"] if self.config.get("include_api", False) else [])
+        for llm_type in llm_types:
+            if not registry.is_type_enabled(llm_type):
+                logger.info(f"상태 확인 대상에서 제외합니다: {llm_type} (enabled: false)")
+                continue
+            for model_spec in registry.get_model_specs(llm_type):
+                try:
+                    model_config = registry.get_model_config(model_spec)
+                except ValueError as e:
+                    logger.warning(f"상태 확인 대상 모델 설정 오류로 제외합니다: {model_spec}, 오류={str(e)}")
+                    continue
+                if model_config is None:
+                    continue
+                for base_url in model_config.get("base_urls") or [model_config.get("base_url")]:
+                    if base_url and base_url not in self._endpoints:
+                        self._endpoints[base_url] = EndpointHealth(base_url, llm_type, model_config, int(self.config["latency_window"]))
+    
+    def _served_models(self, endpoint: EndpointHealth, response: httpx.Response) -> Optional[Set[str]]:
+        """응답의 모델 목록 (vLLM: data[].id, Ollama: models[].name, API는 확인하지 않음)"""
+        if endpoint.llm_type == "api":
+            return None
+        result = self.codec.loads(response.content)
+        if endpoint.llm_type == "ollama":
+            return {model.get("name") for model in result.get("models", [])}
+        return {model.get("id") for model in result.get("data", [])}
+    
+    async def _probe(self, endpoint: EndpointHealth) -> None:
+        """엔드포인트 하나 확인"""
+        pool = await get_http_pool_manager().get_pool(endpoint.base_url, endpoint.http_pool_config)
+        start = time.perf_counter()
+        try:
+            async with pool.track() as client:
+                response = await client.get(endpoint.probe_url, headers=endpoint.headers, timeout=self.timeout)
+            response.raise_for_status()
+            served_models = self._served_models(endpoint, response)
+        except (httpx.HTTPError, JSONDecodeError) as e:
+            if endpoint.record_failure(f"{type(e).__name__}: {str(e)}", self.unhealthy_threshold):
+                logger.warning(f"모델 엔드포인트 unhealthy: {endpoint.base_url}, 연속 실패={endpoint.consecutive_failures}, 오류={endpoint.last_error}")
+            return
+        if endpoint.record_success(time.perf_counter() - start, served_models, self.healthy_threshold):
+            logger.info(f"모델 엔드포인트 healthy: {endpoint.base_url}, 응답 시간={(time.perf_counter() - start) * 1000:.0f}ms")
+    
+    async def probe_all(self) -> None:
+        """모든 엔드포인트를 동시에 확인"""
+        await asyncio.gather(*(self._probe(endpoint) for endpoint in self._endpoints.values()))
+        self.rounds += 1
+    
+    async def _run(self) -> None:
+        """interval마다 확인 반복"""
+        while True:
+            try:
+                await self.probe_all()
+            except Exception as e:
+                logger.error(f"모델 엔드포인트 상태 확인 오류: {type(e).__name__}: {str(e)}")
+            await asyncio.sleep(self.interval)
+    
+    def start(self) -> None:
+        """백그라운드 상태 확인 시작 (서버 시작 시 호출)"""
+        if not self.enabled or self._task is not None:
+            return
+        self._build_endpoints()
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"모델 엔드포인트 상태 확인 시작: 대상={len(self._endpoints)}개, 주기={self.interval}초")
+    
+    async def stop(self) -> None:
+        """백그라운드 상태 확인 종료 (서버 종료 시 호출)"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+    
+    def is_available(self, base_url: str, model_name: Optional[str] = None) -> bool:
+        """
+        엔드포인트 사용 가능 여부 (확인하지 않는 엔드포인트와 아직 확인 전인 엔드포인트는 사용 가능)
+        
+        Args:
+            base_url: 엔드포인트 base_url
+            model_name: 모델 이름 (지정하면 엔드포인트가 이 모델을 제공하는지도 확인)
+        """
+        endpoint = self._endpoints.get(base_url)
+        if endpoint is None:
+            return True
+        return endpoint.status != STATUS_UNHEALTHY and endpoint.serves(model_name)
+    
+    def is_model_available(self, model_config: Dict[str, Any]) -> bool:
+        """모델 사용 가능 여부 (사용 가능한 레플리카가 하나라도 있으면 True)"""
+        model_name = model_config.get("model_name")
+        base_urls = model_config.get("base_urls") or [model_config.get("base_url", "")]
+        return any(self.is_available(base_url, model_name) for base_url in base_urls)
+    
+    def is_model_ready(self, model_config: Dict[str, Any]) -> bool:
+        """
+        모델 준비 여부 (/ready용, is_model_available과 달리 확인하지 않는 모델은 준비되지 않은 것으로 판단)
+        
+        LLM 타입 설정이 enabled: false이면 False, 상태 확인이 켜져 있으면 healthy이면서 모델을 제공하는 레플리카가 하나 이상 있어야 True
+        """
+        if not get_engine_registry().is_type_enabled(model_config.get("type", "")):
+            return False
+        if not self.enabled:
+            return True
+        model_name = model_config.get("model_name")
+        base_urls = model_config.get("base_urls") or [model_config.get("base_url", "")]
+        for base_url in base_urls:
+            endpoint = self._endpoints.get(base_url)
+            if endpoint is not None and endpoint.status == STATUS_HEALTHY and endpoint.serves(model_name):
+                return True
+        return False
+    
+    def is_model_checked(self, model_config: Dict[str, Any]) -> bool:
+        """
+        모델 준비 여부 판단 가능 여부 (/ready용)
+        
+        LLM 타입 설정이 enabled: false이면 False, 상태 확인이 켜져 있으면 확인 대상 레플리카가 하나 이상 있어야 True
+        """
+        if not get_engine_registry().is_type_enabled(model_config.get("type", "")):
+            return False
+        if not self.enabled:
+            return True
+        base_urls = model_config.get("base_urls") or [model_config.get("base_url", "")]
+        return any(base_url in self._endpoints for base_url in base_urls)
+    
+    def has_unhealthy(self) -> bool:
+        """unhealthy 엔드포인트가 있는지 여부"""
+        return any(endpoint.status == STATUS_UNHEALTHY for endpoint in self._endpoints.values())
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        상태 확인 결과 조회
+        
+        Returns:
+            엔드포인트별 상태, 연속 실패 수, 최근 응답 시간, 제공 모델 목록
+        """
+        return {
+            "enabled": self.enabled,
+            "interval": self.interval,
+            "rounds": self.rounds,
+            "endpoints": {base_url: endpoint.get_stats() for base_url, endpoint in self._endpoints.items()}
+        }
+
+
+# 전역 상태 확인 인스턴스
+_health_prober: Optional[HealthProber] = None
+
+
+def get_health_prober(config_path: Optional[str] = None) -> HealthProber:
+    """
+    상태 확인 싱글톤 인스턴스 반환
+    
+    Args:
+        config_path: 설정 파일 경로
+    
+    Returns:
+        HealthProber 인스턴스
+    """
+    global _health_prober
+    if _health_prober is None:
+        config_data = load_yaml_config(config_path)
+        _health_prober = HealthProber(config_data)
+    return _health_prober
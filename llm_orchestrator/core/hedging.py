@@ -0,0 +1,179 @@
+"""
+헤지 요청 관리
+
+LLM 응답이 최근 지연 시간 분포의 백분위(예: p95)보다 늦어지면 같은 모델 또는
+대체 모델(extend_model)에 중복 요청(헤지)을 보내고, 먼저 끝난 결과를 사용합니다.
+헤지 요청은 예산(요청 수 대비 비율)으로 제한하여 백엔드 부하가 과도하게 늘지 않도록 합니다.
+"""
+import math
+from collections import deque
+from typing import Optional, Dict, Any, Deque
+from core.loader import load_yaml_config
+from core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 헤지 설정 기본값 (settings.yml의 llm.hedging으로 덮어씀)
+DEFAULT_HEDGING_CONFIG: Dict[str, Any] = {
+    "enabled": False,
+    "target": "same",  # "same": 같은 모델, "alternate": 다음 대체 모델 (없으면 같은 모델)
+    "percentile": 95,
+    "min_delay": 0.5,
+    "max_delay": 30.0,
+    "initial_delay": None,
+    "min_samples": 20,
+    "window_size": 200,
+    "budget_ratio": 0.05,
+    "budget_burst": 10
+}
+
+
+class HedgeState:
+    """모델(백엔드) 하나의 지연 시간 통계와 헤지 예산"""
+    
+    def __init__(self, key: str, config: Dict[str, Any]):
+        """
+        헤지 상태 초기화
+        
+        Args:
+            key: 모델 키 ("{모델 이름}@{base_url}")
+            config: 헤지 설정
+        """
+        self.key = key
+        self.config = config
+        self.latencies: Deque[float] = deque(maxlen=int(config["window_size"]))
+        # 토큰 버킷: 요청마다 budget_ratio만큼 적립, 헤지 한 번에 1 소모 (장기적으로 헤지 비율 ≤ budget_ratio)
+        self.budget_ratio = float(config["budget_ratio"])
+        self.budget_burst = float(config["budget_burst"])
+        self.tokens = self.budget_burst
+        self.requests = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self.budget_exhausted = 0
+    
+    def record_request(self) -> None:
+        """요청 한 건 기록 (헤지 예산 적립)"""
+        self.requests += 1
+        self.tokens = min(self.budget_burst, self.tokens + self.budget_ratio)
+    
+    def record_latency(self, seconds: float) -> None:
+        """성공한 요청의 지연 시간 기록"""
+        self.latencies.append(seconds)
+    
+    def percentile_latency(self) -> Optional[float]:
+        """최근 지연 시간의 백분위 값 (표본 부족 시 None)"""
+        if len(self.latencies) < int(self.config["min_samples"]):
+            return None
+        ordered = sorted(self.latencies)
+        rank = math.ceil(float(self.config["percentile"]) / 100 * len(ordered)) - 1
+        return ordered[min(max(rank, 0), len(ordered) - 1)]
+    
+    def hedge_delay(self) -> Optional[float]:
+        """
+        헤지 지연 시간 계산
+        
+        Returns:
+            헤지 요청을 보내기까지 기다릴 시간 (초, None이면 헤지하지 않음)
+        """
+        delay = self.percentile_latency()
+        if delay is None:
+            delay = self.config.get("initial_delay")
+            if delay is None:
+                return None
+        return min(max(delay, float(self.config["min_delay"])), float(self.config["max_delay"]))
+    
+    def try_acquire(self) -> bool:
+        """헤지 예산 사용 (예산이 없으면 False)"""
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            self.hedged += 1
+            return True
+        self.budget_exhausted += 1
+        return False
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """헤지 상태 조회"""
+        percentile = self.percentile_latency()
+        delay = self.hedge_delay()
+        return {
+            "samples": len(self.latencies),
+            f"p{self.config['percentile']}_ms": round(percentile * 1000, 1) if percentile is not None else None,
+            "hedge_delay_ms": round(delay * 1000, 1) if delay is not None else None,
+            "requests": self.requests,
+            "hedged": self.hedged,
+            "hedge_ratio": round(self.hedged / self.requests, 4) if self.requests else 0.0,
+            "hedge_wins": self.hedge_wins,
+            "budget_tokens": round(self.tokens, 3),
+            "budget_exhausted": self.budget_exhausted
+        }
+
+
+class HedgeManager:
+    """모델별 헤지 상태 관리자"""
+    
+    def __init__(self, config_data: Dict[str, Any]):
+        """
+        헤지 관리자 초기화
+        
+        Args:
+            config_data: 설정 데이터
+        """
+        self.config = {**DEFAULT_HEDGING_CONFIG, **(config_data.get("llm", {}).get("hedging") or {})}
+        self.enabled = bool(self.config.get("enabled", False))
+        self.target = self.config.get("target", "same")
+        if self.target not in ("same", "alternate"):
+            logger.warning(f"지원하지 않는 헤지 대상입니다: {self.target} (same, alternate). same을 사용합니다.")
+            self.target = "same"
+        self._states: Dict[str, HedgeState] = {}
+    
+    def get_state(self, key: str) -> HedgeState:
+        """
+        모델 키에 해당하는 헤지 상태를 가져오거나 생성
+        
+        Args:
+            key: 모델 키 ("{모델 이름}@{base_url}")
+        
+        Returns:
+            HedgeState 인스턴스
+        """
+        state = self._states.get(key)
+        if state is None:
+            state = HedgeState(key, self.config)
+            self._states[key] = state
+        return state
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        헤지 상태 조회
+        
+        Returns:
+            헤지 설정 및 모델별 지연 시간/헤지 횟수/예산
+        """
+        return {
+            "enabled": self.enabled,
+            "target": self.target,
+            "percentile": self.config.get("percentile"),
+            "budget_ratio": self.config.get("budget_ratio"),
+            "models": {key: state.get_stats() for key, state in self._states.items()}
+        }
+
+
+# 전역 헤지 관리자 인스턴스
+_hedge_manager: Optional[HedgeManager] = None
+
+
+def get_hedge_manager(config_path: Optional[str] = None) -> HedgeManager:
+    """
+    헤지 관리자 싱글톤 인스턴스 반환
+    
+    Args:
+        config_path: 설정 파일 경로
+    
+    Returns:
+        HedgeManager 인스턴스
+    """
+    global _hedge_manager
+    if _hedge_manager is None:
+        config_data = load_yaml_config(config_path)
+        _hedge_manager = HedgeManager(config_data)
+    return _hedge_manager
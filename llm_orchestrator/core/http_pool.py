@@ -0,0 +1,209 @@
+"""
+HTTP 연결 풀 관리
+
+LLM 백엔드(base_url)별로 독립된 httpx 클라이언트(연결 풀)를 생성하고 관리합니다.
+느린 원격 모델이 로컬 vLLM 연결을 고갈시키지 않도록 풀을 분리합니다.
+"""
+import asyncio
+import importlib.util
+import time
+from contextlib import asynccontextmanager
+from typing import Optional, Dict, Any, AsyncIterator
+import httpx
+from core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 풀 설정 기본값 (settings.yml의 llm.http_pool 및 모델별 http_pool로 덮어씀)
+DEFAULT_HTTP_POOL_CONFIG: Dict[str, Any] = {
+    "max_connections": 200,
+    "max_keepalive_connections": 100,
+    "keepalive_expiry": 30.0,
+    "http2": False,
+    "timeout": {
+        "connect": 10.0,
+        "read": 120.0,
+        "write": 30.0,
+        "pool": 10.0
+    }
+}
+
+# HTTP/2는 h2 패키지가 설치된 경우에만 사용 가능 (pip install httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def merge_http_pool_config(*configs: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    풀 설정 병합 (뒤에 오는 설정이 우선)
+    
+    Args:
+        configs: 병합할 풀 설정 목록
+    
+    Returns:
+        병합된 풀 설정
+    """
+    merged: Dict[str, Any] = {**DEFAULT_HTTP_POOL_CONFIG, "timeout": dict(DEFAULT_HTTP_POOL_CONFIG["timeout"])}
+    for config in configs:
+        if not config:
+            continue
+        for key, value in config.items():
+            if key == "timeout" and isinstance(value, dict):
+                merged["timeout"].update(value)
+            elif key == "timeout" and value is not None:
+                merged["timeout"] = {k: float(value) for k in merged["timeout"]}
+            else:
+                merged[key] = value
+    return merged
+
+
+class HttpPool:
+    """백엔드 하나에 대한 httpx 클라이언트와 사용 통계"""
+    
+    def __init__(self, base_url: str, pool_config: Dict[str, Any]):
+        """
+        연결 풀 초기화
+        
+        Args:
+            base_url: 백엔드 base_url
+            pool_config: 풀 설정 (max_connections, max_keepalive_connections, keepalive_expiry, http2, timeout)
+        """
+        self.base_url = base_url
+        self.pool_config = pool_config
+        
+        http2 = bool(pool_config.get("http2", False))
+        if http2 and not HTTP2_AVAILABLE:
+            logger.warning(f"HTTP/2 설정이 있지만 h2 패키지가 없어 HTTP/1.1을 사용합니다: {base_url}")
+            http2 = False
+        self.http2 = http2
+        
+        timeout_config = pool_config.get("timeout", {})
+        self.client = httpx.AsyncClient(
+            http2=http2,
+            timeout=httpx.Timeout(
+                connect=timeout_config.get("connect"),
+                read=timeout_config.get("read"),
+                write=timeout_config.get("write"),
+                pool=timeout_config.get("pool")
+            ),
+            limits=httpx.Limits(
+                max_connections=pool_config.get("max_connections"),
+                max_keepalive_connections=pool_config.get("max_keepalive_connections"),
+                keepalive_expiry=pool_config.get("keepalive_expiry")
+            )
+        )
+        self.created_at = time.time()
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.total_requests = 0
+        self.errors = 0
+    
+    @asynccontextmanager
+    async def track(self) -> AsyncIterator[httpx.AsyncClient]:
+        """요청 하나의 사용 통계를 기록하며 클라이언트 반환"""
+        self.in_flight += 1
+        self.total_requests += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            yield self.client
+        except Exception:
+            self.errors += 1
+            raise
+        finally:
+            self.in_flight -= 1
+    
+    def _connection_stats(self) -> Dict[str, Any]:
+        """httpcore 연결 풀 상태 (내부 구현에 의존하므로 조회 실패 시 빈 값)"""
+        try:
+            connections = self.client._transport._pool.connections
+            idle = sum(1 for connection in connections if connection.is_idle())
+            return {"connections": len(connections), "idle_connections": idle, "active_connections": len(connections) - idle}
+        except Exception:
+            return {}
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """풀 상태 조회"""
+        max_connections = self.pool_config.get("max_connections")
+        stats = {
+            "http2": self.http2,
+            "max_connections": max_connections,
+            "max_keepalive_connections": self.pool_config.get("max_keepalive_connections"),
+            "keepalive_expiry": self.pool_config.get("keepalive_expiry"),
+            "timeout": self.pool_config.get("timeout"),
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "utilization": round(self.in_flight / max_connections, 3) if max_connections else None,
+            "total_requests": self.total_requests,
+            "errors": self.errors
+        }
+        stats.update(self._connection_stats())
+        return stats
+
+
+class HttpPoolManager:
+    """백엔드별 연결 풀 관리자"""
+    
+    def __init__(self):
+        """연결 풀 관리자 초기화"""
+        self._pools: Dict[str, HttpPool] = {}
+        self._lock = asyncio.Lock()
+    
+    async def get_pool(self, base_url: str, pool_config: Optional[Dict[str, Any]] = None) -> HttpPool:
+        """
+        base_url에 해당하는 연결 풀을 가져오거나 생성
+        
+        최초 생성은 잠금 안에서 한 번만 수행되므로 동시 요청이 몰려도 풀이 중복 생성되지 않습니다.
+        
+        Args:
+            base_url: 백엔드 base_url
+            pool_config: 풀 설정 (없으면 기본값)
+        
+        Returns:
+            HttpPool 인스턴스
+        """
+        pool = self._pools.get(base_url)
+        if pool is not None:
+            return pool
+        
+        async with self._lock:
+            pool = self._pools.get(base_url)
+            if pool is None:
+                pool = HttpPool(base_url, merge_http_pool_config(pool_config))
+                self._pools[base_url] = pool
+                logger.info(f"HTTP 연결 풀 생성: {base_url}, 최대 연결 수={pool.pool_config.get('max_connections')}, HTTP/2={pool.http2}")
+        return pool
+    
+    async def close_all(self) -> None:
+        """모든 연결 풀 종료"""
+        async with self._lock:
+            pools = list(self._pools.values())
+            self._pools.clear()
+        for pool in pools:
+            await pool.client.aclose()
+        if pools:
+            logger.info(f"HTTP 연결 풀 종료: {len(pools)}개")
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        연결 풀 상태 조회
+        
+        Returns:
+            base_url별 풀 설정 및 사용 통계
+        """
+        return {base_url: pool.get_stats() for base_url, pool in self._pools.items()}
+
+
+# 전역 연결 풀 관리자 인스턴스
+_http_pool_manager: Optional[HttpPoolManager] = None
+
+
+def get_http_pool_manager() -> HttpPoolManager:
+    """
+    연결 풀 관리자 싱글톤 인스턴스 반환
+    
+    Returns:
+        HttpPoolManager 인스턴스
+    """
+    global _http_pool_manager
+    if _http_pool_manager is None:
+        _http_pool_manager = HttpPoolManager()
+    return _http_pool_manager
@@ -0,0 +1,104 @@
+"""
+JSON 코덱
+
+요청 본문 파싱, LLM 페이로드 직렬화, 응답/스트리밍 청크 디코딩에 사용하는 JSON 코덱입니다.
+orjson이 설치되어 있으면 orjson을, 없으면 표준 json을 사용합니다.
+bytes를 그대로 디코딩/인코딩하므로 중간 문자열 변환이 필요 없습니다.
+"""
+import json
+from typing import Any, Callable, Optional, Union
+from core.loader import load_yaml_config
+from core.logger import get_logger
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json 사용 (pip install orjson)
+    orjson = None
+
+logger = get_logger(__name__)
+
+# 디코딩 오류 (orjson.JSONDecodeError도 json.JSONDecodeError의 하위 클래스)
+JSONDecodeError = json.JSONDecodeError
+
+ORJSON_AVAILABLE = orjson is not None
+
+JsonInput = Union[bytes, bytearray, memoryview, str]
+
+
+def _orjson_dumps(obj: Any) -> bytes:
+    """orjson 인코딩 (dict 키가 문자열이 아닌 경우도 허용)"""
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _json_loads(data: JsonInput) -> Any:
+    """표준 json 디코딩 (bytes 입력 시 인코딩 감지 없이 UTF-8로 바로 디코딩)"""
+    if isinstance(data, (bytes, bytearray)):
+        data = data.decode("utf-8")
+    elif isinstance(data, memoryview):
+        data = data.tobytes().decode("utf-8")
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """표준 json 인코딩 (한글 이스케이프 없음, 공백 없음)"""
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class JsonCodec:
+    """
+    JSON 코덱 (orjson 또는 표준 json)
+    
+    loads(data): UTF-8 JSON(bytes 또는 str) 디코딩, 형식 오류 시 JSONDecodeError
+    dumps(obj): UTF-8 JSON bytes 인코딩 (한글 이스케이프 없음, 공백 없음)
+    
+    요청마다 여러 번 호출되므로 백엔드 함수를 인스턴스 속성에 직접 바인딩합니다.
+    """
+    
+    def __init__(self, backend: str = "auto"):
+        """
+        JSON 코덱 초기화
+        
+        Args:
+            backend: "auto" (orjson 설치 시 orjson), "orjson", "json"
+        """
+        if backend not in ("auto", "orjson", "json"):
+            raise ValueError(f"지원하지 않는 JSON 코덱입니다: {backend} (auto, orjson, json)")
+        if backend == "orjson" and not ORJSON_AVAILABLE:
+            logger.warning("JSON 코덱이 orjson으로 설정되어 있지만 orjson이 설치되지 않아 표준 json을 사용합니다.")
+            backend = "json"
+        if backend == "auto":
+            backend = "orjson" if ORJSON_AVAILABLE else "json"
+        self.backend = backend
+        
+        if backend == "orjson":
+            self.loads: Callable[[JsonInput], Any] = orjson.loads
+            self.dumps: Callable[[Any], bytes] = _orjson_dumps
+        else:
+            self.loads = _json_loads
+            self.dumps = _json_dumps
+    
+    def dumps_str(self, obj: Any) -> str:
+        """JSON 인코딩 (문자열, SSE/NDJSON 라인 생성용)"""
+        return self.dumps(obj).decode("utf-8")
+
+
+# 전역 JSON 코덱 인스턴스
+_json_codec: Optional[JsonCodec] = None
+
+
+def get_json_codec(config_path: Optional[str] = None) -> JsonCodec:
+    """
+    JSON 코덱 싱글톤 인스턴스 반환
+    
+    Args:
+        config_path: 설정 파일 경로
+    
+    Returns:
+        JsonCodec 인스턴스
+    """
+    global _json_codec
+    if _json_codec is None:
+        config_data = load_yaml_config(config_path)
+        backend = (config_data.get("json") or {}).get("backend", "auto")
+        _json_codec = JsonCodec(backend)
+    return _json_codec
@@ -3,42 +3,30 @@ LLM 클라이언트
 
 LLM 타입별 실제 API 호출을 담당합니다.
 """
+import asyncio
+import hashlib
+import time
+from contextlib import asynccontextmanager
+from typing import Dict, Any, Optional, List, Tuple, AsyncIterator
 import httpx
-import json
-from typing import Dict, Any, Optional, List
 from core.logger import get_logger
-
-logger = get_logger(__name__)
-
-# httpx 연결 풀 제한 설정 (호스트당 최대 연결 수 증가)
-# 기본값: max_connections=100, max_keepalive_connections=20
-# 호스트당 연결 수 제한을 해제하기 위해 충분히 큰 값으로 설정
-HTTPX_LIMITS = httpx.Limits(
-    max_connections=200,  # 전체 최대 연결 수
-    max_keepalive_connections=100  # keepalive 최대 연결 수
+from core.http_pool import get_http_pool_manager, HttpPool
+from core.json_codec import get_json_codec, JSONDecodeError
+from core.hedging import get_hedge_manager, HedgeManager, HedgeState
+from core.retry import get_retry_policy, RETRYABLE_ERRORS
+from core.circuit_breaker import get_circuit_breaker_manager
+from core.load_balancer import get_load_balancer_manager
+from core.response_cache import get_response_cache, build_cache_key
+from core.micro_batcher import get_micro_batch_manager, render_prompt
+from core.concurrency_limiter import get_concurrency_limiter_manager, measure_first_chunk, OVERLOAD_STATUS
+from core.ollama import get_ollama_manager
+from core.health_prober import get_health_prober
+from core.deadline import (
+    DeadlineExceeded, check_deadline, is_deadline_expired, within_deadline, cap_httpx_timeout,
+    current_deadline, wait_within_deadline, wait_stream_chunk
 )
 
-# 전역 httpx 클라이언트 (모든 LLMClient 인스턴스가 공유)
-_global_client: Optional[httpx.AsyncClient] = None
-
-
-async def get_global_httpx_client() -> httpx.AsyncClient:
-    """전역 httpx 클라이언트를 가져오거나 생성 (연결 풀 재사용)"""
-    global _global_client
-    if _global_client is None:
-        _global_client = httpx.AsyncClient(
-            timeout=120.0,
-            limits=HTTPX_LIMITS
-        )
-    return _global_client
-
-
-async def close_global_httpx_client():
-    """전역 httpx 클라이언트 종료"""
-    global _global_client
-    if _global_client is not None:
-        await _global_client.aclose()
-        _global_client = None
+logger = get_logger(__name__)
 
 
 class LLMClient:
@@ -50,20 +38,214 @@ class LLMClient:
         
         Args:
             model_config: 모델 설정
-            llm_type: LLM 타입 ("api", "vllm", "ollama")
+            llm_type: LLM 타입 ("api", "vllm", "ollama", 모델 설정에 type이 있으면 해당 값 사용)
         """
         self.model_config = model_config
-        self.llm_type = llm_type
+        # 폴백 모델은 기본 LLM 타입과 다를 수 있으므로 모델 지정의 타입을 우선 사용
+        self.llm_type = model_config.get("type") or llm_type
         self.provider = model_config.get("provider", "")
         self.base_url = model_config.get("base_url", "")
+        # 레플리카 base_url 목록 (여러 개면 요청마다 부하가 낮은 레플리카 선택)
+        self.base_urls: List[str] = model_config.get("base_urls") or [self.base_url]
         self.api_key = model_config.get("api_key", "")
         self.max_tokens = model_config.get("max_tokens", 1024)
         self.temperature = model_config.get("temperature", 0.7)
         self.top_p = model_config.get("top_p", 1.0)
+        self.http_pool_config = model_config.get("http_pool")
+        self.codec = get_json_codec()
+        # 재시도 정책 (모델별 retry 설정으로 덮어씀)
+        self.retry_policy = get_retry_policy().with_overrides(model_config.get("retry"))
+        # 헤지 통계 키 (같은 모델이라도 백엔드가 다르면 별도 집계)
+        self.hedge_key = f"{model_config.get('name')}@{self.base_url}"
+        # 레플리카 선택기 키
+        self.model_key = f"{self.llm_type}:{model_config.get('name')}"
+        # vLLM 마이크로 배치 설정 (모델별 micro_batching 설정으로 덮어씀)
+        self.micro_batching = get_micro_batch_manager().resolve_config(model_config.get("micro_batching"))
+        # /completions는 모델의 채팅 템플릿과 chat_template_kwargs(enable_thinking 등)를 적용하지 않으므로
+        # chat_template_kwargs를 쓰는 모델은 모델별 prompt_template을 명시한 경우에만 배치
+        model_batching = model_config.get("micro_batching") or {}
+        if (self.llm_type == "vllm" and self.micro_batching.get("enabled", False)
+                and (model_config.get("extra_body") or {}).get("chat_template_kwargs")
+                and not model_batching.get("prompt_template")):
+            self.micro_batching["enabled"] = False
+            logger.warning(
+                f"마이크로 배치 제외: {self.model_key} (extra_body.chat_template_kwargs 사용 모델은 "
+                f"모델별 micro_batching.prompt_template 필요)"
+            )
+        self.adaptive_concurrency = get_concurrency_limiter_manager().resolve_config(model_config.get("adaptive_concurrency"))
+    
+    async def _get_pool(self, base_url: str) -> HttpPool:
+        """base_url별 연결 풀을 가져오거나 생성 (백엔드별 풀 재사용)"""
+        return await get_http_pool_manager().get_pool(base_url, self.http_pool_config)
     
-    async def _get_client(self) -> httpx.AsyncClient:
-        """httpx 클라이언트를 가져오거나 생성 (전역 클라이언트 재사용)"""
-        return await get_global_httpx_client()
+    @asynccontextmanager
+    async def _send(self, path: str, headers: Dict[str, str], payload: Dict[str, Any], stream: bool = False) -> AsyncIterator[httpx.Response]:
+        """
+        POST 요청 전송 (레플리카 선택, 서킷 브레이커, 재시도 적용)
+        
+        응답을 받기 전 연결 실패와 재시도 대상 상태 코드(429, 5xx 등)는 백오프(또는 Retry-After) 후 다시 보내고,
+        그 외 오류 상태 코드는 HTTPStatusError로 전파합니다. 스트리밍은 응답 본문을 읽기 전까지만 재시도합니다.
+        레플리카는 시도마다 다시 선택하므로 재시도는 다른 레플리카로 갈 수 있습니다 (상태 확인에서 unhealthy인 레플리카 제외).
+        시스템 프롬프트가 같은 요청은 같은 레플리카를 우선 선택합니다 (접두사 캐시 재사용).
+        요청 기한이 있으면 연결/읽기 제한 시간을 남은 시간 이내로 줄이고, 기한 안에 끝날 수 없는 재시도는 하지 않습니다.
+        적응형 동시 요청 제한이 켜져 있으면 백엔드 슬롯을 얻을 때까지 기다린 후 보내고, 응답이 닫힐 때 슬롯을 반환합니다.
+        
+        Args:
+            path: base_url 뒤에 붙는 요청 경로 (예: "/chat/completions")
+            headers: 요청 헤더
+            payload: 요청 페이로드
+            stream: True이면 본문을 읽지 않은 스트리밍 응답 반환
+        
+        Yields:
+            성공 응답 (2xx)
+        
+        Raises:
+            CircuitOpenError: 백엔드 서킷이 열려 있는 경우
+            DeadlineExceeded: 요청 기한이 지난 경우
+            httpx.HTTPError: 재시도 후에도 실패한 경우
+        """
+        body = self.codec.dumps(payload)
+        circuit_breaker_manager = get_circuit_breaker_manager()
+        concurrency_limiter_manager = get_concurrency_limiter_manager()
+        health_prober = get_health_prober()
+        model_name = self.model_config.get("model_name")
+        
+        def is_available(base_url: str) -> bool:
+            # 서킷이 열렸거나 상태 확인에서 unhealthy인 레플리카 제외
+            return circuit_breaker_manager.is_available(base_url) and health_prober.is_available(base_url, model_name)
+        
+        balancer = get_load_balancer_manager().get_balancer(self.model_key, self.base_urls)
+        affinity_key = self._prefix_affinity_key(payload) if len(self.base_urls) > 1 else None
+        stage = f"LLM 요청 {self.model_key}{path}"
+        attempt = 0
+        while True:
+            attempt += 1
+            check_deadline(stage)
+            replica = balancer.select(is_available, affinity_key)
+            url = f"{replica.base_url}{path}"
+            breaker = circuit_breaker_manager.get_breaker(replica.base_url)
+            # 레플리카 성공 여부 (None: 판정하지 않음, 취소 등)
+            succeeded: Optional[bool] = None
+            start = time.perf_counter()
+            try:
+                async with concurrency_limiter_manager.slot(replica.base_url, self.adaptive_concurrency) as slot:
+                    # 슬롯 대기 시간은 레플리카 응답 시간에서 제외
+                    start = time.perf_counter()
+                    if breaker is not None:
+                        breaker.before_request()
+                    
+                    pool = await self._get_pool(replica.base_url)
+                    async with pool.track() as client:
+                        response: Optional[httpx.Response] = None
+                        # 요청 기한이 있으면 제한 시간을 남은 시간 이내로 줄임
+                        timeout = cap_httpx_timeout(client.timeout) or httpx.USE_CLIENT_DEFAULT
+                        try:
+                            sent_at = time.perf_counter()
+                            response = await client.send(client.build_request("POST", url, headers=headers, content=body, timeout=timeout), stream=stream)
+                        except httpx.HTTPError as e:
+                            # 요청 기한으로 줄인 제한 시간이 지난 것은 백엔드 실패로 집계하지 않음
+                            if isinstance(e, httpx.TimeoutException) and is_deadline_expired():
+                                if breaker is not None:
+                                    breaker.release()
+                                raise DeadlineExceeded(stage) from e
+                            reason = f"{type(e).__name__}: {str(e)}"
+                            succeeded = False
+                            if isinstance(e, httpx.TimeoutException):
+                                slot.record_drop()
+                            if breaker is not None:
+                                breaker.record_failure(reason)
+                            # 이번 실패로 서킷이 열렸으면 재시도하지 않음
+                            retryable = isinstance(e, RETRYABLE_ERRORS) and not (breaker is not None and breaker.is_open)
+                            delay = self.retry_policy.retry_delay(attempt) if retryable else None
+                            if delay is None or not within_deadline(delay):
+                                raise
+                        except BaseException:
+                            if breaker is not None:
+                                breaker.release()
+                            raise
+                        
+                        if response is not None:
+                            try:
+                                if not response.is_error:
+                                    if breaker is not None:
+                                        breaker.record_success()
+                                    # 동시 요청 제한 조정용 지연 시간 (스트리밍은 첫 조각까지 시간)
+                                    if stream:
+                                        measure_first_chunk(response, slot, f"{path} (stream)", sent_at)
+                                    else:
+                                        slot.record_latency(path, time.perf_counter() - sent_at)
+                                    yield response
+                                    succeeded = True
+                                    return
+                                
+                                # 4xx는 백엔드가 정상 응답한 것이므로 서킷/레플리카 실패로 집계하지 않음
+                                reason = f"HTTP {response.status_code}"
+                                if response.status_code in OVERLOAD_STATUS:
+                                    slot.record_drop()
+                                if response.status_code >= 500:
+                                    succeeded = False
+                                if breaker is not None:
+                                    if response.status_code >= 500:
+                                        breaker.record_failure(reason)
+                                    else:
+                                        breaker.record_success()
+                                delay = None
+                                if self.retry_policy.is_retryable_status(response.status_code) and not (breaker is not None and breaker.is_open):
+                                    delay = self.retry_policy.retry_delay(attempt, response)
+                                if delay is None or not within_deadline(delay):
+                                    response.raise_for_status()
+                            finally:
+                                await response.aclose()
+            finally:
+                balancer.release(replica, succeeded, time.perf_counter() - start)
+            
+            logger.warning(f"LLM 요청 재시도: {url}, 시도={attempt}/{self.retry_policy.max_attempts}, 대기={delay:.2f}초, 사유={reason}")
+            await asyncio.sleep(delay)
+    
+    @staticmethod
+    def _prefix_affinity_key(payload: Dict[str, Any]) -> Optional[str]:
+        """접두사 고정 라우팅 키 (시스템 프롬프트 해시, 시스템 프롬프트가 없으면 None)"""
+        system_prompt = payload.get("system")
+        if system_prompt is None:
+            messages = payload.get("messages") or []
+            if messages and messages[0].get("role") == "system":
+                system_prompt = messages[0].get("content")
+        if not system_prompt:
+            return None
+        return hashlib.sha256(system_prompt.encode("utf-8")).hexdigest()[:16]
+    
+    async def warmup_prefix(self, system_prompt: str, timeout: Optional[float] = None) -> Dict[str, str]:
+        """
+        접두사 캐시 예열 (vLLM 모델의 모든 레플리카에 시스템 프롬프트로 1토큰 생성 요청)
+        
+        레플리카마다 직접 보내며 레플리카 선택, 재시도, 서킷 브레이커 집계는 적용하지 않습니다.
+        
+        Args:
+            system_prompt: 예열할 시스템 프롬프트
+            timeout: 레플리카별 제한 시간 (초, None이면 제한 없음)
+        
+        Returns:
+            base_url별 결과 ("ok" 또는 오류 내용)
+        """
+        path, headers, payload = self._vllm_request(system_prompt, ".", None)
+        payload["max_tokens"] = 1
+        body = self.codec.dumps(payload)
+        
+        async def warm(base_url: str) -> str:
+            pool = await self._get_pool(base_url)
+            try:
+                async with pool.track() as client:
+                    response = await asyncio.wait_for(
+                        client.post(f"{base_url}{path}", headers=headers, content=body),
+                        timeout=timeout
+                    )
+                response.raise_for_status()
+                return "ok"
+            except (asyncio.TimeoutError, httpx.HTTPError) as e:
+                return f"{type(e).__name__}: {str(e)}"
+        
+        results = await asyncio.gather(*(warm(base_url) for base_url in self.base_urls))
+        return dict(zip(self.base_urls, results))
     
     async def generate(
         self,
@@ -74,6 +256,11 @@ class LLMClient:
         """
         LLM 생성 요청
         
+        모델 설정에 캐시 정책(cache_policy)이 있고 temperature가 정책 조건에 맞으면
+        같은 모델/프롬프트/샘플링 파라미터의 캐시된 응답을 반환합니다.
+        헤지가 활성화되어 있으면 응답이 최근 지연 시간 백분위보다 늦어질 때
+        중복 요청을 보내고 먼저 끝난 결과를 사용합니다 (나머지 요청은 취소).
+        
         Args:
             system_prompt: 시스템 프롬프트
             user_prompt: 유저 프롬프트
@@ -82,6 +269,46 @@ class LLMClient:
         Returns:
             생성된 텍스트
         """
+        cache_policy = self.model_config.get("cache_policy")
+        cache_key: Optional[str] = None
+        if get_response_cache().is_cacheable(cache_policy, self.temperature):
+            cache_key = self._cache_key(system_prompt, user_prompt, model_name)
+            cached = await get_response_cache().get(cache_key)
+            if cached is not None:
+                logger.info(f"LLM 응답 캐시 적중: 모델={self.model_key}, 길이={len(cached)}")
+                return cached
+        
+        hedge_manager = get_hedge_manager()
+        winner: LLMClient = self
+        if hedge_manager.enabled:
+            result, winner = await self._generate_hedged(hedge_manager, system_prompt, user_prompt, model_name)
+        else:
+            result = await self._generate(system_prompt, user_prompt, model_name)
+        
+        # 빈 응답은 캐시하지 않음 (일시적인 생성 실패일 수 있음)
+        # 헤지 대체 모델(alternate)의 응답은 이 모델의 캐시 키로 저장하지 않음
+        if cache_key is not None and winner is self and isinstance(result, str) and result.strip():
+            await get_response_cache().set(cache_key, result, cache_policy.get("ttl"))
+        return result
+    
+    def _cache_key(self, system_prompt: str, user_prompt: str, model_name: Optional[str]) -> str:
+        """응답 캐시 키 (LLM 타입, 프로바이더, 모델, 프롬프트, 샘플링 파라미터)"""
+        return build_cache_key(
+            llm_type=self.llm_type,
+            provider=self.provider,
+            name=self.model_config.get("name"),
+            model_name=self.model_config.get("model_name") or model_name,
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            temperature=self.temperature,
+            top_p=self.top_p,
+            max_tokens=self.max_tokens,
+            stop=self.model_config.get("stop_strings") or [],
+            extra_body=self.model_config.get("extra_body") or {}
+        )
+    
+    async def _generate(self, system_prompt: str, user_prompt: str, model_name: Optional[str]) -> str:
+        """LLM 타입별 생성 요청 (헤지 없이 한 번 호출)"""
         if self.llm_type == "api":
             return await self._call_api(system_prompt, user_prompt, model_name)
         elif self.llm_type == "vllm":
@@ -91,6 +318,120 @@ class LLMClient:
         else:
             raise ValueError(f"지원하지 않는 LLM 타입입니다: {self.llm_type}")
     
+    async def _timed_generate(self, state: HedgeState, system_prompt: str, user_prompt: str, model_name: Optional[str]) -> str:
+        """생성 요청 후 성공한 경우 지연 시간 기록"""
+        start = time.perf_counter()
+        result = await self._generate(system_prompt, user_prompt, model_name)
+        state.record_latency(time.perf_counter() - start)
+        return result
+    
+    def _hedge_target(self, hedge_manager: HedgeManager, model_name: Optional[str]) -> Tuple["LLMClient", Optional[str]]:
+        """헤지 요청 대상 (target이 alternate이고 대체 모델이 있으면 대체 모델, 아니면 같은 모델)"""
+        alternate = self.model_config.get("hedge_alternate")
+        if hedge_manager.target == "alternate" and alternate:
+            return LLMClient(alternate, self.llm_type), alternate.get("name")
+        return self, model_name
+    
+    async def _generate_hedged(
+        self,
+        hedge_manager: HedgeManager,
+        system_prompt: str,
+        user_prompt: str,
+        model_name: Optional[str]
+    ) -> Tuple[str, "LLMClient"]:
+        """
+        헤지 생성 요청
+        
+        기본 요청이 헤지 지연 시간 안에 끝나지 않고 헤지 예산이 남아 있으면 중복 요청을 보냅니다.
+        먼저 성공한 결과를 반환하고, 둘 다 실패하면 기본 요청의 오류를 전파합니다.
+        
+        Returns:
+            (생성된 텍스트, 결과를 생성한 클라이언트 (self 또는 헤지 대상 클라이언트))
+        """
+        state = hedge_manager.get_state(self.hedge_key)
+        state.record_request()
+        delay = state.hedge_delay()
+        
+        tasks: List[asyncio.Task] = []
+        try:
+            primary = asyncio.create_task(self._timed_generate(state, system_prompt, user_prompt, model_name))
+            tasks.append(primary)
+            if delay is None:
+                return await primary, self
+            
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done or not state.try_acquire():
+                return await primary, self
+            
+            hedge_client, hedge_model_name = self._hedge_target(hedge_manager, model_name)
+            hedge_state = hedge_manager.get_state(hedge_client.hedge_key)
+            hedge = asyncio.create_task(hedge_client._timed_generate(hedge_state, system_prompt, user_prompt, hedge_model_name))
+            tasks.append(hedge)
+            logger.info(f"헤지 요청 전송: 모델={self.hedge_key}, 헤지 대상={hedge_client.hedge_key}, 지연 기준={delay * 1000:.0f}ms")
+            
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            state.hedge_wins += 1
+                            logger.info(f"헤지 요청이 먼저 완료: 모델={self.hedge_key}, 헤지 대상={hedge_client.hedge_key}")
+                            return task.result(), hedge_client
+                        return task.result(), self
+            raise primary.exception()
+        finally:
+            # 진 요청(또는 호출자가 취소한 경우 모든 요청)은 취소하여 백엔드 연결 반환
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+    
+    async def stream(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        model_name: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """
+        LLM 스트리밍 생성 요청 (토큰 단위 비동기 이터레이터)
+        
+        Args:
+            system_prompt: 시스템 프롬프트
+            user_prompt: 유저 프롬프트
+            model_name: 모델 이름 (None이면 설정에서 가져옴)
+        
+        Yields:
+            생성된 텍스트 조각
+        """
+        if self.llm_type == "api":
+            if model_name is None:
+                model_name = self.model_config.get("name", "gpt-4")
+            if self.provider == "openai":
+                path, headers, payload = self._openai_request(system_prompt, user_prompt, model_name)
+                token_stream = self._stream_openai_compatible(path, headers, payload)
+            elif self.provider == "anthropic":
+                path, headers, payload = self._anthropic_request(system_prompt, user_prompt, model_name)
+                token_stream = self._stream_anthropic(path, headers, payload)
+            else:
+                raise ValueError(f"지원하지 않는 프로바이더입니다: {self.provider}")
+        elif self.llm_type == "vllm":
+            path, headers, payload = self._vllm_request(system_prompt, user_prompt, model_name)
+            token_stream = self._stream_openai_compatible(path, headers, payload)
+        elif self.llm_type == "ollama":
+            path, headers, payload = self._ollama_request(system_prompt, user_prompt, model_name)
+            token_stream = self._stream_ollama(path, headers, payload)
+        else:
+            raise ValueError(f"지원하지 않는 LLM 타입입니다: {self.llm_type}")
+        
+        # 호출자가 중단하면 백엔드 스트림(HTTP 연결)도 즉시 정리
+        try:
+            async for token in token_stream:
+                yield token
+        finally:
+            await token_stream.aclose()
+    
     async def _call_api(self, system_prompt: str, user_prompt: str, model_name: Optional[str]) -> str:
         """API 키가 필요한 LLM 호출 (OpenAI, Anthropic 등)"""
         if model_name is None:
@@ -103,9 +444,9 @@ class LLMClient:
         else:
             raise ValueError(f"지원하지 않는 프로바이더입니다: {self.provider}")
     
-    async def _call_openai(self, system_prompt: str, user_prompt: str, model_name: str) -> str:
-        """OpenAI API 호출"""
-        url = f"{self.base_url}/chat/completions"
+    def _openai_request(self, system_prompt: str, user_prompt: str, model_name: str) -> Tuple[str, Dict[str, str], Dict[str, Any]]:
+        """OpenAI 요청 구성 (경로, 헤더, 페이로드)"""
+        path = "/chat/completions"
         headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json"
@@ -123,20 +464,22 @@ class LLMClient:
             "temperature": self.temperature,
             "top_p": self.top_p
         }
+        return path, headers, payload
+    
+    async def _call_openai(self, system_prompt: str, user_prompt: str, model_name: str) -> str:
+        """OpenAI API 호출"""
+        path, headers, payload = self._openai_request(system_prompt, user_prompt, model_name)
         
-        client = await self._get_client()
-        response = await client.post(url, headers=headers, json=payload)
-        response.raise_for_status()
-        # 인코딩 명시적으로 처리
-        response.encoding = "utf-8"
-        result = response.json()
+        async with self._send(path, headers, payload) as response:
+            # 응답 bytes를 그대로 디코딩 (UTF-8, 중간 문자열 변환 없음)
+            result = self.codec.loads(response.content)
         content = result["choices"][0]["message"]["content"]
         logger.info(f"vLLM API 응답 수신: 길이={len(content)}, 타입={type(content)}")
         return content
     
-    async def _call_anthropic(self, system_prompt: str, user_prompt: str, model_name: str) -> str:
-        """Anthropic API 호출"""
-        url = f"{self.base_url}/messages"
+    def _anthropic_request(self, system_prompt: str, user_prompt: str, model_name: str) -> Tuple[str, Dict[str, str], Dict[str, Any]]:
+        """Anthropic 요청 구성 (경로, 헤더, 페이로드)"""
+        path = "/messages"
         headers = {
             "x-api-key": self.api_key,
             "anthropic-version": "2023-06-01",
@@ -155,20 +498,22 @@ class LLMClient:
         
         if system_prompt:
             payload["system"] = system_prompt
+        return path, headers, payload
+    
+    async def _call_anthropic(self, system_prompt: str, user_prompt: str, model_name: str) -> str:
+        """Anthropic API 호출"""
+        path, headers, payload = self._anthropic_request(system_prompt, user_prompt, model_name)
         
-        client = await self._get_client()
-        response = await client.post(url, headers=headers, json=payload)
-        response.raise_for_status()
-        # 인코딩 명시적으로 처리
-        response.encoding = "utf-8"
-        result = response.json()
+        async with self._send(path, headers, payload) as response:
+            # 응답 bytes를 그대로 디코딩 (UTF-8, 중간 문자열 변환 없음)
+            result = self.codec.loads(response.content)
         content = result["content"][0]["text"]
         logger.info(f"Anthropic API 응답 수신: 길이={len(content)}, 타입={type(content)}")
         return content
     
-    async def _call_vllm(self, system_prompt: str, user_prompt: str, model_name: Optional[str]) -> str:
-        """vLLM API 호출 (OpenAI 호환)"""
-        url = f"{self.base_url}/chat/completions"
+    def _vllm_request(self, system_prompt: str, user_prompt: str, model_name: Optional[str]) -> Tuple[str, Dict[str, str], Dict[str, Any]]:
+        """vLLM 요청 구성 (경로, 헤더, 페이로드, OpenAI 호환)"""
+        path = "/chat/completions"
         headers = {
             "Content-Type": "application/json"
         }
@@ -196,11 +541,6 @@ class LLMClient:
         if stop_strings:
             payload["stop"] = stop_strings
         
-        # streaming 설정
-        streaming = self.model_config.get("streaming", False)
-        if streaming:
-            payload["stream"] = True
-        
         # extra_body 추가
         extra_body = self.model_config.get("extra_body", {})
         if extra_body:
@@ -208,48 +548,79 @@ class LLMClient:
             for key, value in extra_body.items():
                 if key not in payload:  # 기존 키와 충돌하지 않도록
                     payload[key] = value
+        return path, headers, payload
+    
+    async def _call_vllm(self, system_prompt: str, user_prompt: str, model_name: Optional[str]) -> str:
+        """vLLM API 호출 (OpenAI 호환)"""
+        # streaming 설정
+        if self.model_config.get("streaming", False):
+            # 스트리밍 응답을 조각 목록으로 모은 뒤 한 번에 결합
+            chunks: List[str] = []
+            async for token in self.stream(system_prompt, user_prompt, model_name):
+                chunks.append(token)
+            full_content = "".join(chunks)
+            logger.info(f"vLLM 스트리밍 응답 수신: 길이={len(full_content)}")
+            return full_content
         
-        client = await self._get_client()
-        if streaming:
-            # 스트리밍 응답 처리
-            async with client.stream("POST", url, headers=headers, json=payload) as response:
-                response.raise_for_status()
-                response.encoding = "utf-8"
-                full_content = ""
-                async for line in response.aiter_lines():
-                    if line.startswith("data: "):
-                        data = line[6:]  # "data: " 제거
-                        if data == "[DONE]":
-                            break
-                        try:
-                            chunk = json.loads(data)
-                            if "choices" in chunk and len(chunk["choices"]) > 0:
-                                delta = chunk["choices"][0].get("delta", {})
-                                if "content" in delta:
-                                    full_content += delta["content"]
-                        except json.JSONDecodeError:
-                            continue
-                logger.info(f"vLLM 스트리밍 응답 수신: 길이={len(full_content)}")
-                return full_content
-        else:
-            # 일반 응답 처리
-            response = await client.post(url, headers=headers, json=payload)
-            response.raise_for_status()
-            # 인코딩 명시적으로 처리
-            response.encoding = "utf-8"
-            result = response.json()
-            content = result["choices"][0]["message"]["content"]
-            logger.info(f"vLLM 응답 수신: 길이={len(content)}, 타입={type(content)}")
-            return content
+        # 마이크로 배치 (같은 모델/샘플링 파라미터 요청을 모아 /completions 요청 하나로 전송)
+        if self.micro_batching.get("enabled", False):
+            return await self._call_vllm_batched(system_prompt, user_prompt, model_name)
+        
+        path, headers, payload = self._vllm_request(system_prompt, user_prompt, model_name)
+        
+        # 일반 응답 처리
+        async with self._send(path, headers, payload) as response:
+            # 응답 bytes를 그대로 디코딩 (UTF-8, 중간 문자열 변환 없음)
+            result = self.codec.loads(response.content)
+        content = result["choices"][0]["message"]["content"]
+        logger.info(f"vLLM 응답 수신: 길이={len(content)}, 타입={type(content)}")
+        return content
     
-    async def _call_ollama(self, system_prompt: str, user_prompt: str, model_name: Optional[str]) -> str:
-        """Ollama API 호출"""
-        url = f"{self.base_url}/api/chat"
+    def _vllm_batch_request(self, prompts: List[str], model_name: Optional[str]) -> Tuple[str, Dict[str, str], Dict[str, Any]]:
+        """vLLM 배치 요청 구성 (경로, 헤더, 페이로드, /completions의 prompt 목록)"""
+        _, headers, payload = self._vllm_request("", "", model_name)
+        del payload["messages"]
+        # 채팅 템플릿 인자는 /completions에서 쓰이지 않음 (prompt_template로 이미 렌더링)
+        payload.pop("chat_template_kwargs", None)
+        payload["prompt"] = prompts
+        return "/completions", headers, payload
+    
+    async def _send_vllm_batch(self, prompts: List[str], model_name: Optional[str]) -> List[str]:
+        """vLLM 배치 요청 전송 (prompts 순서의 생성 결과 목록 반환)"""
+        path, headers, payload = self._vllm_batch_request(prompts, model_name)
+        async with self._send(path, headers, payload) as response:
+            result = self.codec.loads(response.content)
+        texts = [""] * len(prompts)
+        for choice in result["choices"]:
+            texts[choice["index"]] = choice["text"]
+        return texts
+    
+    async def _call_vllm_batched(self, system_prompt: str, user_prompt: str, model_name: Optional[str]) -> str:
+        """vLLM 마이크로 배치 호출 (같은 배치 키의 요청과 함께 전송 후 이 요청의 결과 반환)"""
+        prompt = render_prompt(self.micro_batching["template"], system_prompt, user_prompt)
+        # 샘플링 파라미터가 같은 요청만 한 배치로 묶을 수 있음
+        _, _, sampling = self._vllm_request("", "", model_name)
+        del sampling["messages"]
+        batch_key = f"{self.model_key}|{self.codec.dumps_str(sampling)}"
+        batcher = get_micro_batch_manager().get_batcher(batch_key, self.micro_batching)
+        # 배치는 다른 호출자와 공유하므로 이 호출자의 기한이 지나면 결과를 기다리지 않고 중단
+        content = await wait_within_deadline(
+            batcher.submit(prompt, lambda prompts: self._send_vllm_batch(prompts, model_name)),
+            current_deadline(),
+            f"vLLM 배치 {self.model_key}"
+        )
+        logger.info(f"vLLM 배치 응답 수신: 길이={len(content)}")
+        return content
+    
+    def _ollama_request(self, system_prompt: str, user_prompt: str, model_name: Optional[str]) -> Tuple[str, Dict[str, str], Dict[str, Any]]:
+        """Ollama 요청 구성 (경로, 헤더, 페이로드)"""
+        path = "/api/chat"
         headers = {
             "Content-Type": "application/json"
         }
         
-        model = model_name or self.model_config.get("model_name", "llama2")
+        # 파이프라인이 넘기는 model_name은 모델 별칭(name)이므로 설정의 Ollama 태그(model_name)를 우선 사용
+        model = self.model_config.get("model_name") or model_name or "llama2"
         
         messages = []
         if system_prompt:
@@ -262,18 +633,119 @@ class LLMClient:
             "options": {
                 "temperature": self.temperature,
                 "top_p": self.top_p,
-                "num_predict": self.max_tokens
+                "num_predict": self.max_tokens,
+                # 모델별 추가 옵션 (num_ctx 등)
+                **(self.model_config.get("options") or {})
             },
             "stream": False
         }
+        # 마지막 요청 후 모델을 메모리에 유지할 시간 (예: "30m", -1이면 계속 유지)
+        keep_alive = self.model_config.get("keep_alive")
+        if keep_alive is not None:
+            payload["keep_alive"] = keep_alive
+        return path, headers, payload
+    
+    async def _call_ollama(self, system_prompt: str, user_prompt: str, model_name: Optional[str]) -> str:
+        """Ollama API 호출"""
+        # streaming 설정
+        if self.model_config.get("streaming", False):
+            chunks: List[str] = []
+            async for token in self.stream(system_prompt, user_prompt, model_name):
+                chunks.append(token)
+            full_content = "".join(chunks)
+            logger.info(f"Ollama 스트리밍 응답 수신: 길이={len(full_content)}")
+            return full_content
         
-        client = await self._get_client()
-        response = await client.post(url, headers=headers, json=payload)
-        response.raise_for_status()
-        # 인코딩 명시적으로 처리
-        response.encoding = "utf-8"
-        result = response.json()
+        path, headers, payload = self._ollama_request(system_prompt, user_prompt, model_name)
+        
+        start = time.perf_counter()
+        async with self._send(path, headers, payload) as response:
+            # 응답 bytes를 그대로 디코딩 (UTF-8, 중간 문자열 변환 없음)
+            result = self.codec.loads(response.content)
+        # 모델 적재(cold)/적재된 모델(warm) 응답 시간 기록
+        get_ollama_manager().record_response(self.model_key, result, time.perf_counter() - start)
         content = result["message"]["content"]
         logger.info(f"Ollama 응답 수신: 길이={len(content)}, 타입={type(content)}")
         return content
-
+    
+    @staticmethod
+    async def _aiter_raw_lines(response: httpx.Response) -> AsyncIterator[bytes]:
+        """
+        스트리밍 응답을 bytes 라인 단위로 반환 (텍스트 디코딩 없음)
+        
+        요청 기한이 있으면 첫 조각은 첫 토큰 제한 시간까지, 이후 조각은 기한까지만 기다립니다.
+        """
+        buffer = b""
+        chunks = response.aiter_bytes()
+        stage = f"LLM 스트리밍 {response.request.url}"
+        first = True
+        while True:
+            try:
+                chunk = await wait_stream_chunk(anext(chunks), first, stage)
+            except StopAsyncIteration:
+                break
+            first = False
+            buffer += chunk
+            lines = buffer.split(b"\n")
+            buffer = lines.pop()
+            for line in lines:
+                yield line.rstrip(b"\r")
+        if buffer:
+            yield buffer.rstrip(b"\r")
+    
+    async def _iter_sse_data(self, path: str, headers: Dict[str, str], payload: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """SSE 응답의 data 라인을 JSON으로 디코딩하여 반환 ([DONE]에서 종료)"""
+        async with self._send(path, headers, payload, stream=True) as response:
+            async for line in self._aiter_raw_lines(response):
+                if not line.startswith(b"data:"):
+                    continue
+                data = line[5:].lstrip()  # "data:" 제거
+                if data == b"[DONE]":
+                    break
+                try:
+                    yield self.codec.loads(data)
+                except JSONDecodeError:
+                    continue
+    
+    async def _stream_openai_compatible(self, path: str, headers: Dict[str, str], payload: Dict[str, Any]) -> AsyncIterator[str]:
+        """OpenAI 호환(OpenAI, vLLM) 스트리밍: choices[0].delta.content"""
+        payload = {**payload, "stream": True}
+        async for chunk in self._iter_sse_data(path, headers, payload):
+            choices = chunk.get("choices")
+            if choices:
+                content = choices[0].get("delta", {}).get("content")
+                if content:
+                    yield content
+    
+    async def _stream_anthropic(self, path: str, headers: Dict[str, str], payload: Dict[str, Any]) -> AsyncIterator[str]:
+        """Anthropic 스트리밍: content_block_delta 이벤트의 delta.text"""
+        payload = {**payload, "stream": True}
+        async for event in self._iter_sse_data(path, headers, payload):
+            event_type = event.get("type")
+            if event_type == "content_block_delta":
+                text = event.get("delta", {}).get("text")
+                if text:
+                    yield text
+            elif event_type == "message_stop":
+                break
+            elif event_type == "error":
+                raise RuntimeError(f"Anthropic 스트리밍 오류: {event.get('error')}")
+    
+    async def _stream_ollama(self, path: str, headers: Dict[str, str], payload: Dict[str, Any]) -> AsyncIterator[str]:
+        """Ollama 스트리밍: 줄 단위 JSON의 message.content (done=true에서 종료, 적재/응답 시간 기록)"""
+        payload = {**payload, "stream": True}
+        start = time.perf_counter()
+        async with self._send(path, headers, payload, stream=True) as response:
+            async for line in self._aiter_raw_lines(response):
+                if not line.strip():
+                    continue
+                try:
+                    chunk = self.codec.loads(line)
+                except JSONDecodeError:
+                    continue
+                content = chunk.get("message", {}).get("content")
+                if content:
+                    yield content
+                if chunk.get("done"):
+                    get_ollama_manager().record_response(self.model_key, chunk, time.perf_counter() - start)
+                    break
@@ -0,0 +1,263 @@
+"""
+레플리카 로드 밸런서
+
+같은 모델을 서비스하는 여러 백엔드(base_urls) 중 요청을 보낼 레플리카를 선택합니다.
+레플리카별 처리 중 요청 수와 응답 시간 EWMA로 부하 점수를 계산하고,
+연속으로 실패한 레플리카는 일정 시간 동안 선택 대상에서 제외(ejection)합니다.
+
+선택 전략:
+    p2c                임의의 레플리카 두 개 중 점수가 낮은 쪽 (power of two choices)
+    least_outstanding  전체 레플리카 중 점수가 가장 낮은 쪽
+
+프롬프트 접두사 고정 라우팅(prefix_affinity):
+    같은 시스템 프롬프트의 요청은 rendezvous 해시로 정한 레플리카로 보내 vLLM 접두사 캐시(prefix caching)를
+    재사용합니다. 해당 레플리카의 처리 중 요청 수가 평균의 affinity_load_factor배를 넘거나
+    제외/서킷 open 상태이면 선택 전략으로 다른 레플리카를 고릅니다 (bounded-load).
+"""
+import hashlib
+import math
+import random
+import time
+from typing import Optional, Dict, Any, List, Callable
+from core.loader import load_yaml_config
+from core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 로드 밸런싱 설정 기본값 (settings.yml의 llm.load_balancing으로 덮어씀)
+DEFAULT_LOAD_BALANCING_CONFIG: Dict[str, Any] = {
+    "strategy": "p2c",
+    "ewma_alpha": 0.3,
+    "eject_threshold": 3,
+    "eject_duration": 30.0,
+    "max_eject_duration": 300.0,
+    "prefix_affinity": True,
+    "affinity_load_factor": 1.25
+}
+
+STRATEGIES = ("p2c", "least_outstanding")
+
+
+class Replica:
+    """레플리카(백엔드) 하나의 부하 및 상태"""
+    
+    def __init__(self, base_url: str):
+        self.base_url = base_url
+        self.in_flight = 0
+        self.requests = 0
+        self.successes = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.ewma_latency: Optional[float] = None
+        self.ejected_until = 0.0
+        self.eject_count = 0
+    
+    def is_ejected(self, now: float) -> bool:
+        """선택 대상에서 제외된 상태인지 여부"""
+        return now < self.ejected_until
+
+
+class ReplicaBalancer:
+    """모델 하나의 레플리카 선택기"""
+    
+    def __init__(self, model_key: str, base_urls: List[str], config: Dict[str, Any]):
+        """
+        레플리카 선택기 초기화
+        
+        Args:
+            model_key: 모델 키 ("{type}:{name}")
+            base_urls: 레플리카 base_url 목록
+            config: 로드 밸런싱 설정 (strategy, ewma_alpha, eject_threshold, eject_duration, max_eject_duration)
+        """
+        self.model_key = model_key
+        self.replicas = [Replica(base_url) for base_url in base_urls]
+        self.strategy = config["strategy"]
+        self.ewma_alpha = float(config["ewma_alpha"])
+        self.eject_threshold = int(config["eject_threshold"])
+        self.eject_duration = float(config["eject_duration"])
+        self.max_eject_duration = float(config["max_eject_duration"])
+        self.prefix_affinity = bool(config["prefix_affinity"])
+        self.affinity_load_factor = max(1.0, float(config["affinity_load_factor"]))
+        self.affinity_routed = 0
+        self.affinity_overflow = 0
+    
+    def _score(self, replica: Replica, default_latency: float) -> float:
+        """부하 점수 (처리 중 요청 수 + 1) × 응답 시간 EWMA (측정 전이면 다른 레플리카 평균)"""
+        latency = replica.ewma_latency if replica.ewma_latency is not None else default_latency
+        return (replica.in_flight + 1) * latency
+    
+    @staticmethod
+    def _affinity_weight(affinity_key: str, replica: Replica) -> bytes:
+        """rendezvous 해시 가중치 (레플리카가 빠져도 나머지 키의 배정은 유지)"""
+        return hashlib.blake2b(f"{affinity_key}|{replica.base_url}".encode("utf-8"), digest_size=8).digest()
+    
+    def _affinity_replica(self, candidates: List[Replica], affinity_key: str) -> Optional[Replica]:
+        """접두사 고정 레플리카 (처리 중 요청 수가 허용 부하를 넘으면 None)"""
+        preferred = max(candidates, key=lambda replica: self._affinity_weight(affinity_key, replica))
+        # bounded-load: 레플리카당 허용 처리 중 요청 수 = ceil(load_factor × (전체 처리 중 요청 수 + 1) / 레플리카 수)
+        capacity = math.ceil(self.affinity_load_factor * (sum(replica.in_flight for replica in candidates) + 1) / len(candidates))
+        if preferred.in_flight + 1 <= capacity:
+            self.affinity_routed += 1
+            return preferred
+        self.affinity_overflow += 1
+        return None
+    
+    def select(self, is_available: Optional[Callable[[str], bool]] = None, affinity_key: Optional[str] = None) -> Replica:
+        """
+        요청을 보낼 레플리카 선택 (선택한 레플리카의 처리 중 요청 수 증가)
+        
+        제외되지 않은 레플리카가 없으면 전체 레플리카 중에서 선택합니다.
+        
+        Args:
+            is_available: base_url별 사용 가능 여부 (예: 서킷 브레이커 상태)
+            affinity_key: 접두사 고정 라우팅 키 (예: 시스템 프롬프트 해시, None이면 선택 전략만 사용)
+        
+        Returns:
+            선택한 레플리카 (요청이 끝나면 release 호출 필요)
+        """
+        if len(self.replicas) == 1:
+            replica = self.replicas[0]
+        else:
+            now = time.monotonic()
+            candidates = [
+                replica for replica in self.replicas
+                if not replica.is_ejected(now) and (is_available is None or is_available(replica.base_url))
+            ] or self.replicas
+            measured = [replica.ewma_latency for replica in candidates if replica.ewma_latency is not None]
+            default_latency = sum(measured) / len(measured) if measured else 1.0
+            
+            preferred = self._affinity_replica(candidates, affinity_key) if self.prefix_affinity and affinity_key else None
+            if preferred is not None:
+                replica = preferred
+            elif self.strategy == "least_outstanding" or len(candidates) <= 2:
+                best = min(self._score(replica, default_latency) for replica in candidates)
+                replica = random.choice([r for r in candidates if self._score(r, default_latency) == best])
+            else:
+                first, second = random.sample(candidates, 2)
+                replica = first if self._score(first, default_latency) <= self._score(second, default_latency) else second
+        
+        replica.in_flight += 1
+        replica.requests += 1
+        return replica
+    
+    def release(self, replica: Replica, success: Optional[bool], latency: float) -> None:
+        """
+        요청 종료 기록
+        
+        Args:
+            replica: select로 선택한 레플리카
+            success: 성공 여부 (None이면 판정하지 않음, 취소 등)
+            latency: 요청 소요 시간 (초)
+        """
+        replica.in_flight -= 1
+        if success is None:
+            return
+        if success:
+            replica.successes += 1
+            replica.consecutive_failures = 0
+            if replica.ewma_latency is None:
+                replica.ewma_latency = latency
+            else:
+                replica.ewma_latency += self.ewma_alpha * (latency - replica.ewma_latency)
+            return
+        
+        replica.failures += 1
+        replica.consecutive_failures += 1
+        if len(self.replicas) > 1 and replica.consecutive_failures >= self.eject_threshold and not replica.is_ejected(time.monotonic()):
+            # 반복해서 제외될수록 제외 시간을 늘림 (max_eject_duration까지)
+            duration = min(self.eject_duration * (2 ** replica.eject_count), self.max_eject_duration)
+            replica.ejected_until = time.monotonic() + duration
+            replica.eject_count += 1
+            replica.consecutive_failures = 0
+            logger.warning(f"레플리카 제외: {self.model_key}, {replica.base_url}, 제외 시간={duration:.0f}초, 제외 횟수={replica.eject_count}")
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """레플리카별 분배 및 상태 조회"""
+        now = time.monotonic()
+        total = sum(replica.requests for replica in self.replicas)
+        return {
+            "strategy": self.strategy,
+            "prefix_affinity": self.prefix_affinity,
+            "affinity_routed": self.affinity_routed,
+            "affinity_overflow": self.affinity_overflow,
+            "replicas": {
+                replica.base_url: {
+                    "in_flight": replica.in_flight,
+                    "requests": replica.requests,
+                    "share": round(replica.requests / total, 4) if total else 0.0,
+                    "successes": replica.successes,
+                    "failures": replica.failures,
+                    "ewma_latency_ms": round(replica.ewma_latency * 1000, 1) if replica.ewma_latency is not None else None,
+                    "ejected": replica.is_ejected(now),
+                    "ejected_remaining": round(replica.ejected_until - now, 1) if replica.is_ejected(now) else None,
+                    "eject_count": replica.eject_count
+                }
+                for replica in self.replicas
+            }
+        }
+
+
+class LoadBalancerManager:
+    """모델별 레플리카 선택기 관리자"""
+    
+    def __init__(self, config_data: Dict[str, Any]):
+        """
+        로드 밸런서 관리자 초기화
+        
+        Args:
+            config_data: 설정 데이터
+        """
+        self.config = {**DEFAULT_LOAD_BALANCING_CONFIG, **(config_data.get("llm", {}).get("load_balancing") or {})}
+        if self.config["strategy"] not in STRATEGIES:
+            logger.warning(f"지원하지 않는 로드 밸런싱 전략입니다: {self.config['strategy']} ({', '.join(STRATEGIES)}). p2c를 사용합니다.")
+            self.config["strategy"] = "p2c"
+        self._balancers: Dict[str, ReplicaBalancer] = {}
+    
+    def get_balancer(self, model_key: str, base_urls: List[str]) -> ReplicaBalancer:
+        """
+        모델에 해당하는 레플리카 선택기를 가져오거나 생성
+        
+        Args:
+            model_key: 모델 키 ("{type}:{name}")
+            base_urls: 레플리카 base_url 목록
+        
+        Returns:
+            ReplicaBalancer 인스턴스
+        """
+        balancer = self._balancers.get(model_key)
+        if balancer is None:
+            balancer = ReplicaBalancer(model_key, base_urls, self.config)
+            self._balancers[model_key] = balancer
+            if len(base_urls) > 1:
+                logger.info(f"레플리카 로드 밸런싱: {model_key}, 레플리카 수={len(base_urls)}, 전략={balancer.strategy}")
+        return balancer
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        레플리카 분배 상태 조회
+        
+        Returns:
+            모델별 레플리카 요청 수/비율, 처리 중 요청 수, 응답 시간 EWMA, 제외 상태
+        """
+        return {model_key: balancer.get_stats() for model_key, balancer in self._balancers.items()}
+
+
+# 전역 로드 밸런서 관리자 인스턴스
+_load_balancer_manager: Optional[LoadBalancerManager] = None
+
+
+def get_load_balancer_manager(config_path: Optional[str] = None) -> LoadBalancerManager:
+    """
+    로드 밸런서 관리자 싱글톤 인스턴스 반환
+    
+    Args:
+        config_path: 설정 파일 경로
+    
+    Returns:
+        LoadBalancerManager 인스턴스
+    """
+    global _load_balancer_manager
+    if _load_balancer_manager is None:
+        config_data = load_yaml_config(config_path)
+        _load_balancer_manager = LoadBalancerManager(config_data)
+    return _load_balancer_manager
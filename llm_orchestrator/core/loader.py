@@ -33,12 +33,15 @@ def load_yaml_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     YAML 설정 파일 로드
     
     Args:
-        config_path: 설정 파일 경로 (None이면 기본 경로 사용)
+        config_path: 설정 파일 경로 (None이면 환경 변수 LLM_CONFIG_PATH, 없으면 기본 경로 사용)
     
     Returns:
         설정 딕셔너리
     """
     if config_path is None:
+        # 환경 변수로 지정한 외부 설정 파일 (main과 모든 설정 싱글톤이 같은 파일을 사용하도록)
+        config_path = os.getenv("LLM_CONFIG_PATH")
+    if not config_path:
         # 기본 경로: config/settings.yml
         config_path = Path(__file__).parent.parent / "config" / "settings.yml"
     
@@ -0,0 +1,262 @@
+"""
+vLLM 마이크로 배치
+
+같은 모델/샘플링 파라미터의 생성 요청을 짧은 시간(window_ms) 동안 또는 max_batch_size개까지 모아
+vLLM /completions 요청 하나(prompt 목록)로 보내고, 결과(choices[].index)를 요청별로 나눠 돌려줍니다.
+chat 형식의 시스템/유저 프롬프트는 프롬프트 템플릿(prompt_template)으로 텍스트 프롬프트로 바꿔 보냅니다.
+"""
+import asyncio
+import time
+from typing import Optional, Dict, Any, List, Tuple, Callable, Awaitable, Set
+from core.loader import load_yaml_config
+from core.deadline import Deadline, current_deadline, deadline_context
+from core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 마이크로 배치 설정 기본값 (settings.yml의 llm.micro_batching 및 모델별 micro_batching으로 덮어씀)
+DEFAULT_MICRO_BATCHING_CONFIG: Dict[str, Any] = {
+    "enabled": False,
+    "window_ms": 5.0,
+    "max_batch_size": 16,
+    "prompt_template": "chatml"
+}
+
+# chat 메시지 → 텍스트 프롬프트 템플릿 ({content}에 프롬프트 삽입)
+PROMPT_TEMPLATES: Dict[str, Dict[str, str]] = {
+    "chatml": {
+        "system": "<|im_start|>system\n{content}<|im_end|>\n",
+        "user": "<|im_start|>user\n{content}<|im_end|>\n",
+        "assistant": "<|im_start|>assistant\n"
+    }
+}
+
+
+def resolve_prompt_template(template: Any) -> Dict[str, str]:
+    """
+    프롬프트 템플릿 조회
+    
+    Args:
+        template: 템플릿 이름 ("chatml") 또는 system/user/assistant 문자열 딕셔너리
+    
+    Returns:
+        system/user/assistant 템플릿 딕셔너리
+    """
+    if isinstance(template, dict):
+        return {**PROMPT_TEMPLATES["chatml"], **template}
+    if template in PROMPT_TEMPLATES:
+        return PROMPT_TEMPLATES[template]
+    logger.warning(f"지원하지 않는 프롬프트 템플릿입니다: {template} ({', '.join(PROMPT_TEMPLATES)}). chatml을 사용합니다.")
+    return PROMPT_TEMPLATES["chatml"]
+
+
+def render_prompt(template: Dict[str, str], system_prompt: str, user_prompt: str) -> str:
+    """
+    시스템/유저 프롬프트를 텍스트 프롬프트로 변환 (프롬프트 안의 중괄호는 그대로 유지)
+    
+    Args:
+        template: system/user/assistant 템플릿
+        system_prompt: 시스템 프롬프트 (비어있으면 생략)
+        user_prompt: 유저 프롬프트
+    
+    Returns:
+        텍스트 프롬프트
+    """
+    parts: List[str] = []
+    if system_prompt:
+        parts.append(template["system"].replace("{content}", system_prompt))
+    parts.append(template["user"].replace("{content}", user_prompt))
+    parts.append(template["assistant"])
+    return "".join(parts)
+
+
+class MicroBatcher:
+    """같은 모델/샘플링 파라미터 요청의 배치 수집기"""
+    
+    def __init__(self, key: str, window_ms: float, max_batch_size: int):
+        """
+        배치 수집기 초기화
+        
+        Args:
+            key: 배치 키 (모델 키 + 샘플링 파라미터)
+            window_ms: 첫 요청 이후 배치를 모으는 시간 (ms)
+            max_batch_size: 배치 최대 프롬프트 수 (도달하면 즉시 전송)
+        """
+        self.key = key
+        self.window = max(0.0, float(window_ms)) / 1000
+        self.max_batch_size = max(1, int(max_batch_size))
+        self._pending: List[Tuple[str, asyncio.Future, Optional[Deadline]]] = []
+        self._send: Optional[Callable[[List[str]], Awaitable[List[str]]]] = None
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+        self.batches = 0
+        self.prompts = 0
+        self.max_observed = 0
+        self.full_batches = 0
+        self.failed_batches = 0
+        self.total_send_ms = 0.0
+    
+    async def submit(self, prompt: str, send: Callable[[List[str]], Awaitable[List[str]]]) -> str:
+        """
+        프롬프트 하나를 배치에 추가하고 결과 대기
+        
+        호출자가 전송 전에 취소되면 해당 프롬프트는 배치에서 제외됩니다.
+        배치 요청에는 배치에 포함된 호출자 중 가장 늦은 요청 기한을 적용합니다.
+        
+        Args:
+            prompt: 텍스트 프롬프트
+            send: 프롬프트 목록을 보내고 같은 순서의 생성 결과 목록을 반환하는 함수
+        
+        Returns:
+            생성된 텍스트
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((prompt, future, current_deadline()))
+        self._send = send
+        if len(self._pending) >= self.max_batch_size:
+            self.full_batches += 1
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.window, self._flush)
+        return await future
+    
+    def _flush(self) -> None:
+        """모인 요청을 배치 하나로 전송 (취소된 요청 제외)"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        pending = [entry for entry in self._pending if not entry[1].done()]
+        self._pending = []
+        if not pending or self._send is None:
+            return
+        # 먼저 기한이 지난 호출자 때문에 다른 호출자의 결과까지 실패하지 않도록 가장 늦은 기한 사용
+        deadline = Deadline.detached(pending[0][2])
+        for _, _, caller_deadline in pending[1:]:
+            deadline.extend(caller_deadline)
+        batch = [(prompt, future) for prompt, future, _ in pending]
+        task = asyncio.create_task(self._run(batch, self._send), context=deadline_context(deadline))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+    
+    async def _run(self, batch: List[Tuple[str, asyncio.Future]], send: Callable[[List[str]], Awaitable[List[str]]]) -> None:
+        """배치 전송 후 결과를 요청별로 전달 (실패하면 배치의 모든 요청에 같은 예외 전달)"""
+        self.batches += 1
+        self.prompts += len(batch)
+        self.max_observed = max(self.max_observed, len(batch))
+        start = time.perf_counter()
+        try:
+            results = await send([prompt for prompt, _ in batch])
+            if len(results) != len(batch):
+                raise ValueError(f"배치 응답 수가 요청 수와 다릅니다: 요청={len(batch)}, 응답={len(results)}")
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as e:
+            self.failed_batches += 1
+            logger.warning(f"마이크로 배치 요청 실패: {self.key}, 프롬프트 수={len(batch)}, 오류={type(e).__name__}: {str(e)}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        finally:
+            self.total_send_ms += (time.perf_counter() - start) * 1000
+        
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """배치 상태 조회"""
+        return {
+            "window_ms": round(self.window * 1000, 3),
+            "max_batch_size": self.max_batch_size,
+            "batches": self.batches,
+            "prompts": self.prompts,
+            "avg_batch_size": round(self.prompts / self.batches, 2) if self.batches else 0.0,
+            "max_observed_batch_size": self.max_observed,
+            "full_batches": self.full_batches,
+            "failed_batches": self.failed_batches,
+            "avg_send_ms": round(self.total_send_ms / self.batches, 1) if self.batches else None,
+            "pending": len(self._pending)
+        }
+
+
+class MicroBatchManager:
+    """배치 키별 마이크로 배치 수집기 관리자"""
+    
+    def __init__(self, config_data: Dict[str, Any]):
+        """
+        마이크로 배치 관리자 초기화
+        
+        Args:
+            config_data: 설정 데이터
+        """
+        self.config = {**DEFAULT_MICRO_BATCHING_CONFIG, **(config_data.get("llm", {}).get("micro_batching") or {})}
+        self._batchers: Dict[str, MicroBatcher] = {}
+    
+    def resolve_config(self, overrides: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        모델별 설정을 덮어쓴 마이크로 배치 설정
+        
+        Args:
+            overrides: 모델 설정의 micro_batching
+        
+        Returns:
+            enabled, window_ms, max_batch_size, template(system/user/assistant 템플릿)
+        """
+        config = {**self.config, **(overrides or {})}
+        config["template"] = resolve_prompt_template(config.get("prompt_template"))
+        return config
+    
+    def get_batcher(self, key: str, config: Dict[str, Any]) -> MicroBatcher:
+        """
+        배치 키에 해당하는 수집기를 가져오거나 생성
+        
+        Args:
+            key: 배치 키 (모델 키 + 샘플링 파라미터)
+            config: resolve_config로 만든 설정
+        
+        Returns:
+            MicroBatcher 인스턴스
+        """
+        batcher = self._batchers.get(key)
+        if batcher is None:
+            batcher = MicroBatcher(key, config["window_ms"], config["max_batch_size"])
+            self._batchers[key] = batcher
+            logger.info(f"마이크로 배치 수집기 생성: {key}, 대기 시간={batcher.window * 1000:.1f}ms, 최대 배치 크기={batcher.max_batch_size}")
+        return batcher
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        마이크로 배치 상태 조회
+        
+        Returns:
+            배치 키별 배치 수, 프롬프트 수, 평균/최대 배치 크기
+        """
+        return {
+            "enabled": bool(self.config.get("enabled", False)),
+            "batchers": {key: batcher.get_stats() for key, batcher in self._batchers.items()}
+        }
+
+
+# 전역 마이크로 배치 관리자 인스턴스
+_micro_batch_manager: Optional[MicroBatchManager] = None
+
+
+def get_micro_batch_manager(config_path: Optional[str] = None) -> MicroBatchManager:
+    """
+    마이크로 배치 관리자 싱글톤 인스턴스 반환
+    
+    Args:
+        config_path: 설정 파일 경로
+    
+    Returns:
+        MicroBatchManager 인스턴스
+    """
+    global _micro_batch_manager
+    if _micro_batch_manager is None:
+        config_data = load_yaml_config(config_path)
+        _micro_batch_manager = MicroBatchManager(config_data)
+    return _micro_batch_manager
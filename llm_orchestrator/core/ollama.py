@@ -0,0 +1,208 @@
+"""
+Ollama 모델 적재 관리
+
+Ollama는 keep_alive 동안 요청이 없으면 모델을 메모리에서 내리고, 다음 요청에서 다시 적재합니다.
+응답의 load_duration(모델 적재 시간)으로 적재가 포함된 응답(cold)과 이미 적재된 모델의 응답(warm)을 나누어 집계하고,
+서버 시작 시 설정된 모델을 레플리카마다 미리 적재합니다 (빈 프롬프트의 /api/generate 요청).
+"""
+import asyncio
+import time
+from typing import Optional, Dict, Any, List, Tuple
+import httpx
+from core.loader import load_yaml_config
+from core.logger import get_logger
+from core.http_pool import get_http_pool_manager
+from core.json_codec import get_json_codec
+from core.engine_registry import get_engine_registry
+
+logger = get_logger(__name__)
+
+# Ollama 설정 기본값 (settings.yml의 llm.ollama로 덮어씀)
+DEFAULT_OLLAMA_CONFIG: Dict[str, Any] = {
+    "preload_timeout": 300,
+    "cold_load_threshold": 1.0
+}
+
+
+class _LatencySummary:
+    """지연 시간 요약 (건수, 평균, 최대)"""
+    
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+    
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total / self.count * 1000, 1) if self.count else 0.0,
+            "max_ms": round(self.max * 1000, 1)
+        }
+
+
+class OllamaModelStats:
+    """모델별 적재/응답 시간 통계"""
+    
+    def __init__(self):
+        self.cold = _LatencySummary()
+        self.warm = _LatencySummary()
+        self.load = _LatencySummary()
+        self.last_load_ms: Optional[float] = None
+        self.preload: Dict[str, Dict[str, Any]] = {}
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self.cold.count + self.warm.count,
+            "cold_latency": self.cold.to_dict(),
+            "warm_latency": self.warm.to_dict(),
+            "load": self.load.to_dict(),
+            "last_load_ms": self.last_load_ms,
+            "preload": self.preload
+        }
+
+
+class OllamaManager:
+    """Ollama 모델 적재 관리자 (예열, cold/warm 응답 시간 집계)"""
+    
+    def __init__(self, config_data: Dict[str, Any]):
+        """
+        Ollama 관리자 초기화
+        
+        Args:
+            config_data: 설정 데이터
+        """
+        ollama_config = config_data.get("llm", {}).get("ollama") or {}
+        self.preload_timeout = float(ollama_config.get("preload_timeout", DEFAULT_OLLAMA_CONFIG["preload_timeout"]))
+        # load_duration이 이 시간(초) 이상이면 모델 적재가 포함된 응답(cold)으로 집계
+        self.cold_load_threshold = float(ollama_config.get("cold_load_threshold", DEFAULT_OLLAMA_CONFIG["cold_load_threshold"]))
+        self.codec = get_json_codec()
+        self._stats: Dict[str, OllamaModelStats] = {}
+    
+    def _get_stats(self, model_key: str) -> OllamaModelStats:
+        stats = self._stats.get(model_key)
+        if stats is None:
+            stats = OllamaModelStats()
+            self._stats[model_key] = stats
+        return stats
+    
+    def record_response(self, model_key: str, result: Dict[str, Any], latency: float) -> bool:
+        """
+        응답 시간 기록 (load_duration으로 cold/warm 구분)
+        
+        Args:
+            model_key: 모델 키 ("ollama:{name}")
+            result: Ollama 응답 (비스트리밍 응답 또는 스트리밍의 done=true 조각)
+            latency: 요청 전송부터 응답 완료까지 시간 (초)
+        
+        Returns:
+            모델 적재가 포함된 응답이면 True
+        """
+        load_seconds = (result.get("load_duration") or 0) / 1e9
+        cold = load_seconds >= self.cold_load_threshold
+        stats = self._get_stats(model_key)
+        if cold:
+            stats.cold.add(latency)
+            stats.load.add(load_seconds)
+            stats.last_load_ms = round(load_seconds * 1000, 1)
+            logger.info(f"Ollama 모델 적재 후 응답: {model_key}, 적재={load_seconds * 1000:.0f}ms, 전체={latency * 1000:.0f}ms")
+        else:
+            stats.warm.add(latency)
+        return cold
+    
+    async def _preload(self, model_key: str, model_config: Dict[str, Any], base_url: str) -> Tuple[str, Dict[str, Any]]:
+        """레플리카 하나에 모델 적재 요청 (빈 프롬프트의 /api/generate)"""
+        payload: Dict[str, Any] = {"model": model_config.get("model_name")}
+        if model_config.get("keep_alive") is not None:
+            payload["keep_alive"] = model_config["keep_alive"]
+        pool = await get_http_pool_manager().get_pool(base_url, model_config.get("http_pool"))
+        start = time.perf_counter()
+        try:
+            async with pool.track() as client:
+                response = await client.post(
+                    f"{base_url}/api/generate",
+                    headers={"Content-Type": "application/json"},
+                    content=self.codec.dumps(payload),
+                    timeout=self.preload_timeout
+                )
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.warning(f"Ollama 모델 예열 실패: {model_key}, {base_url}, 오류={type(e).__name__}: {str(e)}")
+            return base_url, {"status": f"{type(e).__name__}: {str(e)}"}
+        elapsed = time.perf_counter() - start
+        # 응답에 load_duration이 없으면 요청 시간을 적재 시간으로 사용
+        load_seconds = (self.codec.loads(response.content).get("load_duration") or 0) / 1e9 or elapsed
+        stats = self._get_stats(model_key)
+        stats.load.add(load_seconds)
+        stats.last_load_ms = round(load_seconds * 1000, 1)
+        return base_url, {"status": "ok", "load_ms": round(load_seconds * 1000, 1), "elapsed_ms": round(elapsed * 1000, 1)}
+    
+    async def preload_models(self) -> Dict[str, Dict[str, Any]]:
+        """
+        설정된 Ollama 모델을 모든 레플리카에 미리 적재 (서버 시작 시 호출, preload가 켜진 모델만)
+        
+        Returns:
+            모델 키별, base_url별 결과
+        """
+        registry = get_engine_registry()
+        targets: List[Tuple[str, Dict[str, Any]]] = []
+        for model_spec in registry.get_model_specs("ollama"):
+            model_config = registry.get_model_config(model_spec)
+            if model_config is not None and model_config.get("preload", False):
+                targets.append((model_spec, model_config))
+        if not targets:
+            return {}
+        
+        start = time.perf_counter()
+        results = await asyncio.gather(*(
+            self._preload(model_key, model_config, base_url)
+            for model_key, model_config in targets
+            for base_url in model_config["base_urls"]
+        ))
+        preloaded: Dict[str, Dict[str, Any]] = {}
+        index = 0
+        for model_key, model_config in targets:
+            replica_results = dict(results[index:index + len(model_config["base_urls"])])
+            index += len(model_config["base_urls"])
+            self._get_stats(model_key).preload = replica_results
+            preloaded[model_key] = replica_results
+        failed = sum(1 for replicas in preloaded.values() for result in replicas.values() if result["status"] != "ok")
+        logger.info(f"Ollama 모델 예열 완료: 모델={len(preloaded)}개, 실패 레플리카={failed}개, 소요 시간={(time.perf_counter() - start) * 1000:.0f}ms")
+        return preloaded
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Ollama 모델 상태 조회
+        
+        Returns:
+            모델별 cold/warm 응답 시간, 적재 시간, 예열 결과
+        """
+        return {
+            "cold_load_threshold": self.cold_load_threshold,
+            "models": {model_key: stats.to_dict() for model_key, stats in self._stats.items()}
+        }
+
+
+# 전역 Ollama 관리자 인스턴스
+_ollama_manager: Optional[OllamaManager] = None
+
+
+def get_ollama_manager(config_path: Optional[str] = None) -> OllamaManager:
+    """
+    Ollama 관리자 싱글톤 인스턴스 반환
+    
+    Args:
+        config_path: 설정 파일 경로
+    
+    Returns:
+        OllamaManager 인스턴스
+    """
+    global _ollama_manager
+    if _ollama_manager is None:
+        config_data = load_yaml_config(config_path)
+        _ollama_manager = OllamaManager(config_data)
+    return _ollama_manager
@@ -3,10 +3,109 @@
 
 파이프라인 로드, 등록, 조회를 담당합니다.
 """
+import asyncio
+import functools
+import hashlib
 import importlib.util
+import inspect
+import time
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable, List, AsyncIterator, Awaitable, Tuple
+import httpx
 from core.loader import load_yaml_config
+from core.logger import get_logger
+from core.engine_registry import get_engine_registry
+from core.json_codec import get_json_codec, JSONDecodeError
+from core.circuit_breaker import CircuitOpenError
+from core.response_cache import get_response_cache
+from core.llm_client import LLMClient
+from core.health_prober import get_health_prober
+from core.deadline import (
+    Deadline, get_deadline_manager, current_deadline, deadline_context,
+    wait_within_deadline, check_deadline, cap_timeout
+)
+from pipelines.dynamic.graph_pipeline import GraphPipeline
+
+logger = get_logger(__name__)
+
+# 다음 모델로 폴백하는 오류 (시간 초과, 연결 실패, HTTP 오류 응답, 응답 형식 오류, 서킷 open)
+# 설정 오류(ValueError 등)는 다른 모델로 바꿔도 해결되지 않으므로 그대로 전파
+# 요청 기한 초과(DeadlineExceeded)는 호출자가 결과를 기다리지 않으므로 폴백하지 않음
+FAILOVER_ERRORS = (asyncio.TimeoutError, httpx.HTTPError, JSONDecodeError, CircuitOpenError)
+
+
+class LoadedPipelineModule:
+    """로드된 파이프라인 모듈 캐시 항목"""
+    
+    def __init__(
+        self,
+        pipeline_name: str,
+        path: Path,
+        module: Any,
+        execute_func: Callable,
+        accepts_request_data: bool,
+        mtime_ns: int,
+        size: int,
+        sha256: str,
+        load_time_ms: float,
+        stream_func: Optional[Callable] = None
+    ):
+        """
+        캐시 항목 초기화
+        
+        Args:
+            pipeline_name: 파이프라인 이름
+            path: 파이프라인 파일 경로
+            module: 로드된 모듈
+            execute_func: 모듈의 execute 함수
+            accepts_request_data: execute 함수의 request_data 파라미터 여부
+            mtime_ns: 로드 시점의 파일 수정 시각 (ns)
+            size: 로드 시점의 파일 크기
+            sha256: 로드 시점의 파일 해시
+            load_time_ms: 로드 소요 시간 (ms)
+            stream_func: 모듈의 execute_stream 함수 (없으면 None)
+        """
+        self.pipeline_name = pipeline_name
+        self.path = path
+        self.module = module
+        self.execute_func = execute_func
+        self.accepts_request_data = accepts_request_data
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.sha256 = sha256
+        self.load_time_ms = load_time_ms
+        self.stream_func = stream_func
+        self.loaded_at = time.time()
+        self.load_count = 1
+        self.cache_hits = 0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """상태 조회용 딕셔너리 반환"""
+        return {
+            "path": str(self.path),
+            "sha256": self.sha256,
+            "accepts_request_data": self.accepts_request_data,
+            "supports_stream": self.stream_func is not None,
+            "loaded_at": self.loaded_at,
+            "load_time_ms": round(self.load_time_ms, 3),
+            "load_count": self.load_count,
+            "cache_hits": self.cache_hits
+        }
+
+
+class InFlightCall:
+    """실행 중인 파이프라인 호출 (동일 호출 합치기용)"""
+    
+    def __init__(self, pipeline_name: str):
+        self.pipeline_name = pipeline_name
+        self.task: Optional[asyncio.Task] = None
+        # 공유 실행의 요청 기한 (합류한 호출자 중 가장 늦은 기한까지 연장)
+        self.deadline: Optional[Deadline] = None
+        # 실행 태스크가 기록하는 실행 정보 (끝나면 각 호출자의 run_info로 복사)
+        self.run_info: Dict[str, Any] = {}
+        self.waiters = 0
+        self.coalesced = 0
+        self.started_at = time.perf_counter()
 
 
 class PipelineManager:
@@ -23,7 +122,27 @@ class PipelineManager:
         self.pipeline_config = config_data.get("pipeline", {})
         self.static_config = self.pipeline_config.get("static", {})
         self.pipelines: Dict[str, Any] = {}
+        # 파이프라인 모듈 캐시 (파일 변경 시에만 다시 로드)
+        self.hot_reload = self.static_config.get("hot_reload", True)
+        self._module_cache: Dict[str, LoadedPipelineModule] = {}
         self._load_pipelines()
+        
+        # 동적 파이프라인 (YAML로 선언한 스테이지 그래프)
+        self.dynamic_config = self.pipeline_config.get("dynamic", {})
+        self.dynamic_pipelines: Dict[str, Any] = {}
+        self._graphs: Dict[str, GraphPipeline] = {}
+        self._load_dynamic_pipelines()
+        
+        # 모델 폴백 설정 (model → extend_model 순서로 시도)
+        self.failover_config = config_data.get("failover", {})
+        
+        # 동일 호출 합치기 (같은 파이프라인/텍스트/모델/요청 데이터로 실행 중인 호출이 있으면 결과 공유)
+        self.coalescing_config = self.pipeline_config.get("coalescing", {})
+        self.coalescing_enabled = bool(self.coalescing_config.get("enabled", True))
+        self._inflight: Dict[str, InFlightCall] = {}
+        self.coalesce_executions = 0
+        self.coalesce_hits = 0
+        self.coalesce_cancelled = 0
     
     def _load_pipelines(self):
         """설정에서 파이프라인 로드"""
@@ -36,6 +155,38 @@ class PipelineManager:
             if pipeline_name:
                 self.pipelines[pipeline_name] = pipeline_config
     
+    def _load_dynamic_pipelines(self):
+        """설정에서 동적 파이프라인 로드 (스테이지 그래프 검증)"""
+        if not self.dynamic_config.get("enabled", False):
+            return
+        
+        pipelines = self.dynamic_config.get("pipelines", [])
+        for pipeline_config in pipelines:
+            pipeline_name = pipeline_config.get("name")
+            if not pipeline_name:
+                continue
+            try:
+                self._graphs[pipeline_name] = GraphPipeline(pipeline_config)
+                self.dynamic_pipelines[pipeline_name] = pipeline_config
+                logger.info(f"동적 파이프라인 등록: {pipeline_name}, 실행 순서={self._graphs[pipeline_name].order}")
+            except ValueError as e:
+                logger.error(f"동적 파이프라인 설정 오류: {pipeline_name}, 오류={str(e)}")
+    
+    def get_dynamic_pipeline(self, pipeline_name: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        동적 파이프라인 조회
+        
+        Args:
+            pipeline_name: 파이프라인 이름 (None이면 기본 파이프라인)
+        
+        Returns:
+            파이프라인 설정 딕셔너리 또는 None
+        """
+        if pipeline_name is None:
+            pipeline_name = self.dynamic_config.get("default_pipeline")
+        
+        return self.dynamic_pipelines.get(pipeline_name) if pipeline_name else None
+    
     def get_pipeline(self, pipeline_name: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
         파이프라인 조회
@@ -51,15 +202,15 @@ class PipelineManager:
         
         return self.pipelines.get(pipeline_name) if pipeline_name else None
     
-    def load_pipeline_module(self, pipeline_name: str):
+    def _resolve_pipeline_path(self, pipeline_name: str) -> Path:
         """
-        파이프라인 모듈 동적 로드
+        파이프라인 이름에서 파일 경로 추론
         
         Args:
-            pipeline_name: 파이프라인 이름 (파일 경로 자동 추론)
+            pipeline_name: 파이프라인 이름
         
         Returns:
-            로드된 모듈
+            파이프라인 파일 경로
         """
         # 프로젝트 루트 기준으로 경로 변환
         project_root = Path(__file__).parent.parent
@@ -72,8 +223,22 @@ class PipelineManager:
         if not pipeline_path.exists():
             raise FileNotFoundError(f"파이프라인 파일을 찾을 수 없습니다: {pipeline_path}")
         
-        # 모듈 동적 로드
-        spec = importlib.util.spec_from_file_location("pipeline_module", pipeline_path)
+        return pipeline_path
+    
+    def load_pipeline_module(self, pipeline_name: str):
+        """
+        파이프라인 모듈 동적 로드 (캐시를 거치지 않고 항상 새로 로드)
+        
+        Args:
+            pipeline_name: 파이프라인 이름 (파일 경로 자동 추론)
+        
+        Returns:
+            로드된 모듈
+        """
+        pipeline_path = self._resolve_pipeline_path(pipeline_name)
+        
+        # 모듈 동적 로드 (파이프라인별로 모듈 이름 구분)
+        spec = importlib.util.spec_from_file_location(f"pipeline_module_{pipeline_name}", pipeline_path)
         if spec is None or spec.loader is None:
             raise ImportError(f"파이프라인 모듈을 로드할 수 없습니다: {pipeline_path}")
         
@@ -82,21 +247,496 @@ class PipelineManager:
         
         return module
     
+    def _load_and_cache(self, pipeline_name: str, pipeline_path: Path, source: bytes, mtime_ns: int) -> LoadedPipelineModule:
+        """
+        파이프라인 모듈을 로드하고 execute/execute_stream 함수와 호출 방식을 캐시에 등록
+        
+        Args:
+            pipeline_name: 파이프라인 이름
+            pipeline_path: 파이프라인 파일 경로
+            source: 파일 내용 (해시 계산용)
+            mtime_ns: 파일 수정 시각 (ns)
+        
+        Returns:
+            캐시 항목
+        """
+        start = time.perf_counter()
+        module = self.load_pipeline_module(pipeline_name)
+        
+        if not hasattr(module, 'execute'):
+            raise AttributeError(f"파이프라인 모듈에 'execute' 함수가 없습니다: {pipeline_name}")
+        
+        execute_func = getattr(module, 'execute')
+        params = list(inspect.signature(execute_func).parameters.keys())
+        load_time_ms = (time.perf_counter() - start) * 1000
+        
+        previous = self._module_cache.get(pipeline_name)
+        entry = LoadedPipelineModule(
+            pipeline_name=pipeline_name,
+            path=pipeline_path,
+            module=module,
+            execute_func=execute_func,
+            accepts_request_data="request_data" in params,
+            mtime_ns=mtime_ns,
+            size=len(source),
+            sha256=hashlib.sha256(source).hexdigest(),
+            load_time_ms=load_time_ms,
+            stream_func=getattr(module, 'execute_stream', None)
+        )
+        if previous is not None:
+            entry.load_count = previous.load_count + 1
+            logger.info(f"파이프라인 모듈 재로드: {pipeline_name}, 소요 시간={load_time_ms:.2f}ms, 로드 횟수={entry.load_count}")
+        else:
+            logger.info(f"파이프라인 모듈 로드: {pipeline_name}, 소요 시간={load_time_ms:.2f}ms")
+        
+        self._module_cache[pipeline_name] = entry
+        return entry
+    
+    def get_pipeline_module(self, pipeline_name: str) -> LoadedPipelineModule:
+        """
+        캐시된 파이프라인 모듈 조회
+        
+        최초 요청 시 한 번 로드하고, 이후에는 파일의 mtime/크기가 바뀐 경우에만
+        해시를 비교하여 내용이 실제로 변경되었을 때 다시 로드합니다.
+        
+        Args:
+            pipeline_name: 파이프라인 이름
+        
+        Returns:
+            캐시 항목
+        """
+        cached = self._module_cache.get(pipeline_name)
+        if cached is not None and not self.hot_reload:
+            cached.cache_hits += 1
+            return cached
+        
+        pipeline_path = self._resolve_pipeline_path(pipeline_name)
+        stat = pipeline_path.stat()
+        
+        if cached is not None and cached.mtime_ns == stat.st_mtime_ns and cached.size == stat.st_size:
+            cached.cache_hits += 1
+            return cached
+        
+        source = pipeline_path.read_bytes()
+        if cached is not None and cached.sha256 == hashlib.sha256(source).hexdigest():
+            # 수정 시각만 바뀌고 내용은 동일한 경우 재로드하지 않음
+            cached.mtime_ns = stat.st_mtime_ns
+            cached.cache_hits += 1
+            return cached
+        
+        return self._load_and_cache(pipeline_name, pipeline_path, source, stat.st_mtime_ns)
+    
+    def reload_pipeline_modules(self, pipeline_name: Optional[str] = None) -> Dict[str, Any]:
+        """
+        파이프라인 모듈 강제 재로드
+        
+        Args:
+            pipeline_name: 재로드할 파이프라인 이름 (None이면 등록된 전체 파이프라인)
+        
+        Returns:
+            파이프라인별 재로드 결과 (소요 시간 또는 오류)
+        """
+        if pipeline_name is not None:
+            if pipeline_name not in self.pipelines:
+                raise ValueError(f"파이프라인을 찾을 수 없습니다: {pipeline_name}")
+            names: List[str] = [pipeline_name]
+        else:
+            names = list(self.pipelines.keys())
+        
+        results: Dict[str, Any] = {}
+        for name in names:
+            try:
+                pipeline_path = self._resolve_pipeline_path(name)
+                stat = pipeline_path.stat()
+                entry = self._load_and_cache(name, pipeline_path, pipeline_path.read_bytes(), stat.st_mtime_ns)
+                results[name] = {"status": "reloaded", "load_time_ms": round(entry.load_time_ms, 3)}
+            except Exception as e:
+                logger.error(f"파이프라인 모듈 재로드 실패: {name}, 오류={str(e)}", exc_info=True)
+                results[name] = {"status": "error", "error": str(e)}
+        return results
+    
+    def preload_pipeline_modules(self) -> None:
+        """등록된 정적 파이프라인 모듈을 미리 로드 (서버 시작 시 호출)"""
+        for name in self.pipelines.keys():
+            try:
+                self.get_pipeline_module(name)
+            except Exception as e:
+                logger.warning(f"파이프라인 모듈 사전 로드 실패: {name}, 오류={str(e)}")
+    
+    async def warmup_prefix_cache(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        vLLM 접두사 캐시 예열 (서버 시작 시 호출)
+        
+        정적 파이프라인 모듈의 get_system_prompts(pipeline_config)가 반환하는 시스템 프롬프트로
+        파이프라인 모델 체인의 vLLM 모델마다 모든 레플리카에 짧은 요청을 보냅니다.
+        
+        Args:
+            timeout: 레플리카별 제한 시간 (초)
+        
+        Returns:
+            "{파이프라인}/{모델 지정}"별 시스템 프롬프트 해시와 레플리카별 결과
+        """
+        llm_type = self.config_data.get("llm", {}).get("type", "api")
+        targets: Dict[Tuple[str, str], Tuple[str, str, Dict[str, Any]]] = {}
+        for name, pipeline_config in self.pipelines.items():
+            try:
+                module = self.get_pipeline_module(name).module
+            except Exception:
+                continue
+            get_system_prompts = getattr(module, "get_system_prompts", None)
+            model_spec = pipeline_config.get("model")
+            if get_system_prompts is None or not model_spec:
+                continue
+            try:
+                model_config = get_engine_registry().get_model_config(model_spec)
+                system_prompts = get_system_prompts(pipeline_config)
+            except Exception as e:
+                logger.warning(f"접두사 캐시 예열 대상 조회 실패: {name}, 오류={str(e)}")
+                continue
+            if model_config is None:
+                continue
+            for spec, config in self.get_model_chain(pipeline_config, model_config):
+                if (config.get("type") or llm_type) != "vllm":
+                    continue
+                for system_prompt in system_prompts:
+                    # 같은 모델/프롬프트는 한 번만 예열
+                    targets.setdefault((spec, system_prompt), (name, spec, config))
+        
+        async def warm(system_prompt: str, name: str, spec: str, config: Dict[str, Any]) -> Tuple[str, Dict[str, str]]:
+            results = await LLMClient(config, "vllm").warmup_prefix(system_prompt, timeout)
+            prompt_hash = hashlib.sha256(system_prompt.encode("utf-8")).hexdigest()[:16]
+            return f"{name}/{spec}/{prompt_hash}", results
+        
+        start = time.perf_counter()
+        warmed = dict(await asyncio.gather(*(
+            warm(system_prompt, name, spec, config)
+            for (_, system_prompt), (name, spec, config) in targets.items()
+        )))
+        failed = sum(1 for results in warmed.values() for result in results.values() if result != "ok")
+        logger.info(f"접두사 캐시 예열 완료: 대상={len(warmed)}개, 실패 레플리카 요청={failed}건, 소요 시간={(time.perf_counter() - start) * 1000:.0f}ms")
+        return warmed
+    
+    def get_module_stats(self) -> Dict[str, Any]:
+        """
+        파이프라인 모듈 캐시 상태 조회
+        
+        Returns:
+            파이프라인별 로드/재로드 소요 시간 및 캐시 적중 횟수
+        """
+        return {
+            "hot_reload": self.hot_reload,
+            "modules": {name: entry.to_dict() for name, entry in self._module_cache.items()}
+        }
+    
+    def _coalesce_key(
+        self,
+        pipeline_name: str,
+        text: str,
+        model_config: Dict[str, Any],
+        request_data: Optional[Dict[str, Any]]
+    ) -> Optional[str]:
+        """동일 호출 판별 키 (파이프라인 이름, 텍스트, 모델, 요청 데이터의 해시, 직렬화할 수 없으면 None)"""
+        try:
+            encoded = get_json_codec().dumps([
+                pipeline_name,
+                text,
+                model_config.get("type"),
+                model_config.get("name"),
+                request_data or {}
+            ])
+        except (TypeError, ValueError):
+            return None
+        return hashlib.sha256(encoded).hexdigest()
+    
+    def _finish_inflight(self, key: str, call: InFlightCall, task: asyncio.Task) -> None:
+        """실행 태스크 종료 시 실행 중 목록에서 제거"""
+        if self._inflight.get(key) is call:
+            del self._inflight[key]
+        # 기다리는 호출자가 없이 끝난 경우에도 예외를 확인 처리 (미확인 예외 경고 방지)
+        if not task.cancelled():
+            task.exception()
+    
+    async def _run_coalesced(
+        self,
+        pipeline_name: str,
+        text: str,
+        model_config: Dict[str, Any],
+        request_data: Optional[Dict[str, Any]],
+        run_info: Optional[Dict[str, Any]],
+        run: Callable[[Dict[str, Any]], Awaitable[Any]]
+    ) -> Any:
+        """
+        동일 호출 합치기 (single-flight)
+        
+        같은 호출이 실행 중이면 새로 실행하지 않고 실행 중인 결과를 함께 기다립니다.
+        실행은 호출자와 분리된 태스크에서 진행하므로 호출자 하나가 취소(클라이언트 연결 종료)되어도
+        다른 호출자의 결과에는 영향이 없고, 기다리는 호출자가 모두 취소된 경우에만 실행을 취소합니다.
+        호출자는 각자의 요청 기한까지만 기다리고, 공유 실행에는 기다리는 호출자 중 가장 늦은 기한을 적용합니다.
+        
+        Args:
+            pipeline_name: 파이프라인 이름
+            text: 처리할 텍스트
+            model_config: 모델 설정
+            request_data: 전체 요청 데이터
+            run_info: 실행 정보 기록용 딕셔너리 (합쳐진 호출이면 coalesced=True 추가)
+            run: 실행 정보 딕셔너리를 받아 파이프라인을 실행하는 함수
+        
+        Returns:
+            처리 결과
+        """
+        key = self._coalesce_key(pipeline_name, text, model_config, request_data) if self.coalescing_enabled else None
+        if key is None:
+            return await run(run_info)
+        
+        deadline = current_deadline()
+        call = self._inflight.get(key)
+        coalesced = call is not None
+        if call is None:
+            call = InFlightCall(pipeline_name)
+            call.deadline = Deadline.detached(deadline)
+            call.task = asyncio.create_task(run(call.run_info), context=deadline_context(call.deadline))
+            call.task.add_done_callback(functools.partial(self._finish_inflight, key, call))
+            self._inflight[key] = call
+            self.coalesce_executions += 1
+        else:
+            call.deadline.extend(deadline)
+            call.coalesced += 1
+            self.coalesce_hits += 1
+            logger.info(f"실행 중인 동일 호출에 합류: {pipeline_name}, 합류 호출 수={call.coalesced}, 경과 시간={(time.perf_counter() - call.started_at) * 1000:.0f}ms")
+        
+        call.waiters += 1
+        try:
+            # shield: 이 호출자가 취소되거나 기한이 지나도 공유 실행 태스크는 계속 진행
+            return await wait_within_deadline(asyncio.shield(call.task), deadline, f"파이프라인 {pipeline_name}")
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                # 취소 중인 실행에 새 호출자가 합류하지 않도록 바로 실행 중 목록에서 제거
+                # (done 콜백은 나중에 실행되므로 그 사이에 도착한 같은 요청은 새로 실행)
+                if self._inflight.get(key) is call:
+                    del self._inflight[key]
+                call.task.cancel()
+                self.coalesce_cancelled += 1
+                logger.info(f"동일 호출을 기다리는 호출자가 모두 취소되어 실행 취소: {pipeline_name}")
+            if run_info is not None:
+                run_info.update(call.run_info)
+                if coalesced:
+                    run_info["coalesced"] = True
+    
+    def get_coalescing_stats(self) -> Dict[str, Any]:
+        """
+        동일 호출 합치기 상태 조회
+        
+        Returns:
+            실행 횟수, 합류 횟수, 취소 횟수, 실행 중인 호출 목록
+        """
+        now = time.perf_counter()
+        return {
+            "enabled": self.coalescing_enabled,
+            "executions": self.coalesce_executions,
+            "coalesced": self.coalesce_hits,
+            "cancelled": self.coalesce_cancelled,
+            "in_flight": [
+                {
+                    "pipeline": call.pipeline_name,
+                    "waiters": call.waiters,
+                    "coalesced": call.coalesced,
+                    "elapsed_ms": round((now - call.started_at) * 1000, 1)
+                }
+                for call in self._inflight.values()
+            ]
+        }
+    
+    def get_model_chain(self, pipeline_config: Dict[str, Any], model_config: Dict[str, Any]) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        파이프라인 모델 폴백 체인 조회
+        
+        첫 항목은 라우터에서 조회한 기본 모델(model) 설정을 그대로 사용하고,
+        폴백이 활성화되어 있으면 extend_model 순서로 대체 모델을 추가합니다.
+        
+        Args:
+            pipeline_config: 파이프라인 설정
+            model_config: 기본 모델 설정
+        
+        Returns:
+            (모델 지정, 모델 설정) 목록
+        """
+        model_spec = pipeline_config.get("model") or model_config.get("name", "")
+        chain: List[Tuple[str, Dict[str, Any]]] = [(model_spec, model_config)]
+        if self.failover_config.get("enabled", True):
+            extend_models = [spec for spec in (pipeline_config.get("extend_model") or []) if spec != model_spec]
+            chain.extend(get_engine_registry().get_model_chain(extend_models))
+        return chain
+    
+    def _attempt_model_config(self, pipeline_name: str, chain: List[Tuple[str, Dict[str, Any]]], index: int) -> Dict[str, Any]:
+        """시도할 모델 설정 (다음 대체 모델을 헤지 대상(hedge_alternate)으로, 파이프라인 캐시 정책을 cache_policy로 포함)"""
+        model_config = chain[index][1]
+        extra: Dict[str, Any] = {}
+        if index + 1 < len(chain):
+            extra["hedge_alternate"] = chain[index + 1][1]
+        cache_policy = get_response_cache().get_policy(pipeline_name)
+        if cache_policy:
+            extra["cache_policy"] = cache_policy
+        return {**model_config, **extra} if extra else model_config
+    
+    def get_attempt_timeout(self, pipeline_name: str, model_spec: str) -> Optional[float]:
+        """
+        모델 하나의 시도 제한 시간 조회 (모델별 → 파이프라인별 → 기본값 순서)
+        
+        Args:
+            pipeline_name: 파이프라인 이름
+            model_spec: 모델 지정
+        
+        Returns:
+            제한 시간 (초, None이면 제한 없음)
+        """
+        for scope, key in (("models", model_spec), ("pipelines", pipeline_name)):
+            override = (self.failover_config.get(scope) or {}).get(key) or {}
+            if "attempt_timeout" in override:
+                return override["attempt_timeout"]
+        return self.failover_config.get("attempt_timeout")
+    
+    def _record_attempt_failure(
+        self,
+        pipeline_name: str,
+        chain: List[Tuple[str, Dict[str, Any]]],
+        index: int,
+        error: BaseException,
+        attempt_timeout: Optional[float],
+        elapsed_ms: float,
+        attempts: List[Dict[str, Any]]
+    ) -> bool:
+        """
+        모델 시도 실패 기록
+        
+        Returns:
+            다음 모델이 있으면 True (없으면 호출한 쪽에서 오류 전파)
+        """
+        if isinstance(error, asyncio.TimeoutError):
+            reason = f"시간 초과 ({attempt_timeout}초)"
+        elif isinstance(error, httpx.HTTPStatusError):
+            reason = f"HTTP {error.response.status_code}"
+        else:
+            reason = f"{type(error).__name__}: {str(error)}"
+        model_spec = chain[index][0]
+        attempts.append({"model": model_spec, "status": "failed", "error": reason, "elapsed_ms": round(elapsed_ms, 1)})
+        
+        if index + 1 < len(chain):
+            logger.warning(f"파이프라인 모델 실패, 다음 모델로 전환: {pipeline_name}, 실패 모델={model_spec}, 사유={reason}, 소요 시간={elapsed_ms:.0f}ms, 다음 모델={chain[index + 1][0]}")
+            return True
+        logger.error(f"파이프라인 모델 체인 전체 실패: {pipeline_name}, 시도 모델={[attempt['model'] for attempt in attempts]}, 마지막 사유={reason}")
+        return False
+    
+    def _skip_unhealthy_model(
+        self,
+        pipeline_name: str,
+        chain: List[Tuple[str, Dict[str, Any]]],
+        index: int,
+        attempts: List[Dict[str, Any]]
+    ) -> bool:
+        """
+        상태 확인에서 사용할 수 없는 모델 건너뛰기 (시간 초과를 기다리지 않고 바로 대체 모델 사용)
+        
+        뒤에 사용 가능한 대체 모델이 없으면 건너뛰지 않고 시도합니다.
+        
+        Returns:
+            건너뛰었으면 True (attempts에 unhealthy로 기록)
+        """
+        health_prober = get_health_prober()
+        if health_prober.is_model_available(chain[index][1]):
+            return False
+        if not any(health_prober.is_model_available(config) for _, config in chain[index + 1:]):
+            return False
+        model_spec = chain[index][0]
+        attempts.append({"model": model_spec, "status": "unhealthy", "elapsed_ms": 0.0})
+        logger.warning(f"상태 확인에서 사용할 수 없는 모델을 건너뜀: {pipeline_name}, 모델={model_spec}")
+        return True
+    
+    def _record_served_model(
+        self,
+        pipeline_name: str,
+        chain: List[Tuple[str, Dict[str, Any]]],
+        index: int,
+        elapsed_ms: float,
+        attempts: List[Dict[str, Any]],
+        run_info: Optional[Dict[str, Any]]
+    ) -> None:
+        """처리 모델 기록 (run_info의 served_model, fallback)"""
+        model_spec = chain[index][0]
+        attempts.append({"model": model_spec, "status": "success", "elapsed_ms": round(elapsed_ms, 1)})
+        if run_info is not None:
+            run_info["served_model"] = model_spec
+            run_info["fallback"] = index > 0
+        if index > 0:
+            logger.warning(f"대체 모델로 처리: {pipeline_name}, 처리 모델={model_spec}, 기본 모델={chain[0][0]}, 시도 횟수={len(attempts)}")
+    
+    async def _run_with_failover(
+        self,
+        pipeline_name: str,
+        chain: List[Tuple[str, Dict[str, Any]]],
+        run_attempt: Callable[[Dict[str, Any]], Awaitable[Any]],
+        run_info: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        """
+        모델 체인 순서로 파이프라인 실행
+        
+        모델마다 시도 제한 시간을 적용하고, 실패하거나 시간이 초과되면 다음 모델로 다시 실행합니다.
+        상태 확인에서 모든 레플리카가 unhealthy인 모델은 뒤에 사용 가능한 모델이 있으면 건너뜁니다.
+        시도 제한 시간은 요청 기한 이내로 줄이며, 기한이 지나면 다음 모델로 넘어가지 않습니다.
+        
+        Args:
+            pipeline_name: 파이프라인 이름
+            chain: (모델 지정, 모델 설정) 목록
+            run_attempt: 모델 설정을 받아 파이프라인을 한 번 실행하는 함수
+            run_info: 실행 정보 기록용 딕셔너리 (served_model, fallback, attempts)
+        
+        Returns:
+            처리 결과
+        """
+        attempts: List[Dict[str, Any]] = []
+        if run_info is not None:
+            run_info["attempts"] = attempts
+        
+        for index, (model_spec, _) in enumerate(chain):
+            stage = f"파이프라인 {pipeline_name}, 모델 {model_spec}"
+            check_deadline(stage)
+            if self._skip_unhealthy_model(pipeline_name, chain, index, attempts):
+                continue
+            attempt_timeout = self.get_attempt_timeout(pipeline_name, model_spec)
+            start = time.perf_counter()
+            try:
+                result = await asyncio.wait_for(run_attempt(self._attempt_model_config(pipeline_name, chain, index)), timeout=cap_timeout(attempt_timeout))
+            except FAILOVER_ERRORS as e:
+                check_deadline(stage)
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                if self._record_attempt_failure(pipeline_name, chain, index, e, attempt_timeout, elapsed_ms, attempts):
+                    continue
+                raise
+            
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self._record_served_model(pipeline_name, chain, index, elapsed_ms, attempts, run_info)
+            return result
+    
     async def execute_pipeline(
         self, 
         pipeline_name: str, 
         text: str, 
         model_config: Dict[str, Any],
-        request_data: Optional[Dict[str, Any]] = None
+        request_data: Optional[Dict[str, Any]] = None,
+        run_info: Optional[Dict[str, Any]] = None
     ) -> Any:
         """
         파이프라인 실행
         
+        기본 모델이 실패하거나 시도 제한 시간을 넘기면 extend_model 순서로 대체 모델을 사용합니다.
+        같은 호출이 실행 중이면 새로 실행하지 않고 그 결과를 공유합니다.
+        
         Args:
             pipeline_name: 파이프라인 이름
             text: 처리할 텍스트
             model_config: 모델 설정
             request_data: 전체 요청 데이터 (추가 필드 포함)
+            run_info: 실행 정보 기록용 딕셔너리 (served_model: 처리 모델, fallback, attempts, coalesced)
         
         Returns:
             처리 결과 (str 또는 Dict[str, Any])
@@ -105,26 +745,178 @@ class PipelineManager:
         if pipeline_config is None:
             raise ValueError(f"파이프라인을 찾을 수 없습니다: {pipeline_name}")
         
-        # 파이프라인 모듈 로드 (파이프라인 이름에서 파일 경로 자동 추론)
-        pipeline_module = self.load_pipeline_module(pipeline_name)
+        # 캐시된 파이프라인 모듈 조회 (파일 변경 시에만 재로드)
+        loaded = self.get_pipeline_module(pipeline_name)
+        execute_func = loaded.execute_func
         
-        # 파이프라인 실행 함수 호출
-        if not hasattr(pipeline_module, 'execute'):
-            raise AttributeError(f"파이프라인 모듈에 'execute' 함수가 없습니다: {pipeline_name}")
+        # 파이프라인 실행 (async 함수)
+        # request_data 파라미터가 있으면 전달
+        async def run_attempt(attempt_model_config: Dict[str, Any]) -> Any:
+            if loaded.accepts_request_data:
+                return await execute_func(text, attempt_model_config, pipeline_config, self.config_data, request_data or {})
+            else:
+                return await execute_func(text, attempt_model_config, pipeline_config, self.config_data)
+        
+        chain = self.get_model_chain(pipeline_config, model_config)
+        # 파이프라인별 제한 시간을 요청 기한에 적용 (헤더로 받은 기한보다 늦어지지 않음)
+        with get_deadline_manager().pipeline_scope(pipeline_name):
+            return await self._run_coalesced(
+                pipeline_name, text, model_config, request_data, run_info,
+                lambda shared_run_info: self._run_with_failover(pipeline_name, chain, run_attempt, shared_run_info)
+            )
+    
+    async def stream_pipeline(
+        self,
+        pipeline_name: str,
+        text: str,
+        model_config: Dict[str, Any],
+        request_data: Optional[Dict[str, Any]] = None,
+        run_info: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[str]:
+        """
+        파이프라인 스트리밍 실행
         
-        execute_func = getattr(pipeline_module, 'execute')
+        모듈에 execute_stream 함수가 있으면 생성되는 조각을 그대로 전달하고,
+        없으면 execute 결과 전체를 한 번에 전달합니다.
         
-        # 파이프라인 실행 (async 함수)
-        # request_data를 포함하여 전달
-        import inspect
-        sig = inspect.signature(execute_func)
-        params = list(sig.parameters.keys())
+        대체 모델 전환은 첫 조각이 나오기 전까지만 가능하므로,
+        스트리밍에서는 시도 제한 시간을 첫 조각까지의 시간에 적용합니다.
         
-        # request_data 파라미터가 있으면 전달
-        if "request_data" in params:
-            return await execute_func(text, model_config, pipeline_config, self.config_data, request_data or {})
-        else:
-            return await execute_func(text, model_config, pipeline_config, self.config_data)
+        Args:
+            pipeline_name: 파이프라인 이름
+            text: 처리할 텍스트
+            model_config: 모델 설정
+            request_data: 전체 요청 데이터 (추가 필드 포함)
+            run_info: 실행 정보 기록용 딕셔너리 (served_model: 처리 모델, fallback, attempts)
+        
+        Yields:
+            처리 결과 조각
+        """
+        pipeline_config = self.get_pipeline(pipeline_name)
+        if pipeline_config is None:
+            raise ValueError(f"파이프라인을 찾을 수 없습니다: {pipeline_name}")
+        
+        loaded = self.get_pipeline_module(pipeline_name)
+        if loaded.stream_func is None:
+            logger.info(f"파이프라인에 execute_stream 함수가 없어 전체 결과를 한 번에 전달합니다: {pipeline_name}")
+            result = await self.execute_pipeline(pipeline_name, text, model_config, request_data, run_info)
+            yield result if isinstance(result, str) else str(result)
+            return
+        
+        chain = self.get_model_chain(pipeline_config, model_config)
+        attempts: List[Dict[str, Any]] = []
+        if run_info is not None:
+            run_info["attempts"] = attempts
+        
+        # 파이프라인별 제한 시간을 요청 기한에 적용 (첫 조각 제한 시간 포함)
+        with get_deadline_manager().pipeline_scope(pipeline_name):
+            for index, (model_spec, _) in enumerate(chain):
+                stage = f"파이프라인 {pipeline_name}, 모델 {model_spec}"
+                check_deadline(stage)
+                if self._skip_unhealthy_model(pipeline_name, chain, index, attempts):
+                    continue
+                attempt_timeout = self.get_attempt_timeout(pipeline_name, model_spec)
+                start = time.perf_counter()
+                attempt_model_config = self._attempt_model_config(pipeline_name, chain, index)
+                token_stream = loaded.stream_func(text, attempt_model_config, pipeline_config, self.config_data, request_data or {})
+                first_token: Optional[str] = None
+                try:
+                    first_token = await asyncio.wait_for(anext(token_stream), timeout=cap_timeout(attempt_timeout))
+                except StopAsyncIteration:
+                    pass
+                except FAILOVER_ERRORS as e:
+                    await token_stream.aclose()
+                    check_deadline(stage)
+                    elapsed_ms = (time.perf_counter() - start) * 1000
+                    if self._record_attempt_failure(pipeline_name, chain, index, e, attempt_timeout, elapsed_ms, attempts):
+                        continue
+                    raise
+                except BaseException:
+                    await token_stream.aclose()
+                    raise
+                
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                self._record_served_model(pipeline_name, chain, index, elapsed_ms, attempts, run_info)
+                try:
+                    if first_token is not None:
+                        yield first_token
+                    async for token in token_stream:
+                        yield token
+                finally:
+                    await token_stream.aclose()
+                return
+    
+    async def execute_dynamic_pipeline(
+        self,
+        pipeline_name: str,
+        text: str,
+        model_config: Dict[str, Any],
+        request_data: Optional[Dict[str, Any]] = None,
+        run_info: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        """
+        동적 파이프라인 실행
+        
+        기본 모델이 실패하거나 시도 제한 시간을 넘기면 extend_model 순서로 대체 모델을 사용합니다.
+        (스테이지별로 model을 지정한 llm 스테이지는 폴백 대상이 아님)
+        같은 호출이 실행 중이면 새로 실행하지 않고 그 결과를 공유합니다.
+        
+        Args:
+            pipeline_name: 파이프라인 이름
+            text: 처리할 텍스트
+            model_config: 모델 설정
+            request_data: 전체 요청 데이터 (추가 필드 포함)
+            run_info: 실행 정보 기록용 딕셔너리 (served_model: 처리 모델, fallback, attempts, coalesced)
+        
+        Returns:
+            처리 결과 (output 스테이지 결과)
+        """
+        pipeline_config = self.get_dynamic_pipeline(pipeline_name)
+        if pipeline_config is None:
+            raise ValueError(f"동적 파이프라인을 찾을 수 없습니다: {pipeline_name}")
+        
+        graph = self._graphs[pipeline_name]
+        
+        async def run_attempt(attempt_model_config: Dict[str, Any]) -> Any:
+            return await graph.execute(
+                text,
+                attempt_model_config,
+                pipeline_config,
+                self.config_data,
+                request_data=request_data or {},
+                resolve_model=get_engine_registry().get_model_config
+            )
+        
+        chain = self.get_model_chain(pipeline_config, model_config)
+        # 파이프라인별 제한 시간을 요청 기한에 적용 (헤더로 받은 기한보다 늦어지지 않음)
+        with get_deadline_manager().pipeline_scope(pipeline_name):
+            return await self._run_coalesced(
+                pipeline_name, text, model_config, request_data, run_info,
+                lambda shared_run_info: self._run_with_failover(pipeline_name, chain, run_attempt, shared_run_info)
+            )
+    
+    async def stream_dynamic_pipeline(
+        self,
+        pipeline_name: str,
+        text: str,
+        model_config: Dict[str, Any],
+        request_data: Optional[Dict[str, Any]] = None,
+        run_info: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[str]:
+        """
+        동적 파이프라인 스트리밍 실행 (스테이지 그래프는 output 결과 전체를 한 번에 전달)
+        
+        Args:
+            pipeline_name: 파이프라인 이름
+            text: 처리할 텍스트
+            model_config: 모델 설정
+            request_data: 전체 요청 데이터 (추가 필드 포함)
+            run_info: 실행 정보 기록용 딕셔너리 (served_model: 처리 모델, fallback, attempts)
+        
+        Yields:
+            처리 결과
+        """
+        yield await self.execute_dynamic_pipeline(pipeline_name, text, model_config, request_data, run_info)
 
 
 # 전역 파이프라인 관리자 인스턴스
@@ -0,0 +1,355 @@
+"""
+LLM 응답 캐시
+
+같은 모델/프롬프트/샘플링 파라미터의 생성 결과를 재사용합니다.
+메모리 LRU(TTL) → 로컬 디스크(sqlite) 2단계로 조회하며, 디스크에서 찾은 항목은 메모리로 다시 올립니다.
+파이프라인별로 캐시 사용 여부와 조건(예: temperature가 낮은 경우만)을 지정합니다.
+"""
+import asyncio
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Dict, Any, Tuple
+from core.loader import load_yaml_config
+from core.logger import get_logger
+from core.json_codec import get_json_codec
+
+logger = get_logger(__name__)
+
+# 캐시 설정 기본값 (settings.yml의 cache로 덮어씀)
+DEFAULT_CACHE_CONFIG: Dict[str, Any] = {
+    "enabled": False,
+    "memory": {
+        "max_entries": 1000,
+        "ttl": 600
+    },
+    "disk": {
+        "enabled": True,
+        "path": "cache/llm_response_cache.sqlite3",
+        "ttl": 86400,
+        "max_entries": 100000
+    },
+    "pipeline_default": {
+        "enabled": False,
+        "max_temperature": None,
+        "ttl": None
+    },
+    "pipelines": {}
+}
+
+
+def build_cache_key(**fields: Any) -> str:
+    """
+    캐시 키 생성 (필드 전체의 JSON 직렬화 SHA-256)
+    
+    Args:
+        fields: 키 구성 필드 (provider, model, system_prompt, user_prompt, temperature, top_p, max_tokens, stop 등)
+    
+    Returns:
+        16진수 해시 문자열
+    """
+    encoded = get_json_codec().dumps([[name, fields[name]] for name in sorted(fields)])
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class MemoryLRUCache:
+    """TTL이 있는 메모리 LRU 캐시"""
+    
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self.evictions = 0
+        self.expirations = 0
+    
+    def get(self, key: str) -> Optional[str]:
+        """값 조회 (만료된 항목은 삭제 후 None)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            self.expirations += 1
+            return None
+        self._entries.move_to_end(key)
+        return value
+    
+    def set(self, key: str, value: str, expires_at: float) -> None:
+        """값 저장 (최대 항목 수를 넘으면 가장 오래 사용하지 않은 항목부터 제거)"""
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+    
+    def clear(self) -> int:
+        """전체 삭제 (삭제한 항목 수 반환)"""
+        count = len(self._entries)
+        self._entries.clear()
+        return count
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SqliteCache:
+    """sqlite 디스크 캐시 (블로킹 호출이므로 스레드에서 실행)"""
+    
+    # 최대 항목 수 초과 여부는 쓰기마다 확인하지 않고 일정 횟수마다 확인
+    PRUNE_INTERVAL = 100
+    
+    def __init__(self, path: str, max_entries: int):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL, last_access REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_last_access ON llm_cache(last_access)")
+        self._writes = 0
+        self.evictions = 0
+        self.expirations = 0
+    
+    def get(self, key: str) -> Optional[Tuple[str, float]]:
+        """값과 만료 시각 조회 (만료된 항목은 삭제 후 None)"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT value, expires_at FROM llm_cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            if row[1] <= now:
+                self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                self.expirations += 1
+                return None
+            self._conn.execute("UPDATE llm_cache SET last_access = ? WHERE key = ?", (now, key))
+            return row[0], row[1]
+    
+    def set(self, key: str, value: str, expires_at: float) -> None:
+        """값 저장 (일정 횟수마다 만료 항목과 초과 항목 정리)"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, expires_at, last_access) VALUES (?, ?, ?, ?)",
+                (key, value, expires_at, time.time())
+            )
+            self._writes += 1
+            if self._writes % self.PRUNE_INTERVAL == 0:
+                self._prune()
+    
+    def _prune(self) -> None:
+        """만료 항목 삭제 후 최대 항목 수를 넘는 만큼 가장 오래 사용하지 않은 항목 삭제 (잠금 안에서 호출)"""
+        self.expirations += self._conn.execute("DELETE FROM llm_cache WHERE expires_at <= ?", (time.time(),)).rowcount
+        count = self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+        if count > self.max_entries:
+            self.evictions += self._conn.execute(
+                "DELETE FROM llm_cache WHERE key IN (SELECT key FROM llm_cache ORDER BY last_access LIMIT ?)",
+                (count - self.max_entries,)
+            ).rowcount
+    
+    def clear(self) -> int:
+        """전체 삭제 (삭제한 항목 수 반환)"""
+        with self._lock:
+            return self._conn.execute("DELETE FROM llm_cache").rowcount
+    
+    def count(self) -> int:
+        """저장된 항목 수"""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+    
+    def close(self) -> None:
+        """연결 종료"""
+        with self._lock:
+            self._conn.close()
+
+
+class ResponseCache:
+    """2단계(메모리 → 디스크) LLM 응답 캐시"""
+    
+    def __init__(self, config_data: Dict[str, Any]):
+        """
+        응답 캐시 초기화
+        
+        Args:
+            config_data: 설정 데이터
+        """
+        cache_config = config_data.get("cache") or {}
+        self.config = {
+            **DEFAULT_CACHE_CONFIG,
+            **cache_config,
+            "memory": {**DEFAULT_CACHE_CONFIG["memory"], **(cache_config.get("memory") or {})},
+            "disk": {**DEFAULT_CACHE_CONFIG["disk"], **(cache_config.get("disk") or {})},
+            "pipeline_default": {**DEFAULT_CACHE_CONFIG["pipeline_default"], **(cache_config.get("pipeline_default") or {})}
+        }
+        self.enabled = bool(self.config.get("enabled", False))
+        self.memory = MemoryLRUCache(int(self.config["memory"]["max_entries"]))
+        self.memory_ttl = float(self.config["memory"]["ttl"])
+        self.disk: Optional[SqliteCache] = None
+        self.disk_ttl = float(self.config["disk"]["ttl"])
+        if self.enabled and self.config["disk"].get("enabled", True):
+            try:
+                self.disk = SqliteCache(self.config["disk"]["path"], int(self.config["disk"]["max_entries"]))
+                logger.info(f"LLM 응답 디스크 캐시: {self.disk.path}")
+            except Exception as e:
+                logger.warning(f"LLM 응답 디스크 캐시를 열 수 없어 메모리 캐시만 사용합니다: {str(e)}")
+        
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.errors = 0
+    
+    def get_policy(self, pipeline_name: str) -> Optional[Dict[str, Any]]:
+        """
+        파이프라인 캐시 정책 조회
+        
+        Args:
+            pipeline_name: 파이프라인 이름
+        
+        Returns:
+            캐시 정책 (enabled, max_temperature, ttl) 또는 None (캐시 사용 안 함)
+        """
+        if not self.enabled:
+            return None
+        policy = {**self.config["pipeline_default"], **((self.config.get("pipelines") or {}).get(pipeline_name) or {})}
+        return policy if policy.get("enabled") else None
+    
+    @staticmethod
+    def is_cacheable(policy: Optional[Dict[str, Any]], temperature: float) -> bool:
+        """정책상 캐시 대상 여부 (max_temperature가 있으면 temperature가 그 이하인 경우만)"""
+        if not policy:
+            return False
+        max_temperature = policy.get("max_temperature")
+        return max_temperature is None or temperature <= float(max_temperature)
+    
+    async def get(self, key: str) -> Optional[str]:
+        """
+        캐시 조회 (메모리 → 디스크, 디스크 적중 시 메모리에 저장)
+        
+        Args:
+            key: 캐시 키
+        
+        Returns:
+            캐시된 응답 또는 None
+        """
+        value = self.memory.get(key)
+        if value is not None:
+            self.memory_hits += 1
+            return value
+        
+        if self.disk is not None:
+            try:
+                row = await asyncio.to_thread(self.disk.get, key)
+            except Exception as e:
+                self.errors += 1
+                logger.warning(f"LLM 응답 디스크 캐시 조회 실패: {str(e)}")
+                row = None
+            if row is not None:
+                value, expires_at = row
+                self.memory.set(key, value, min(expires_at, time.time() + self.memory_ttl))
+                self.disk_hits += 1
+                return value
+        
+        self.misses += 1
+        return None
+    
+    async def set(self, key: str, value: str, ttl: Optional[float] = None) -> None:
+        """
+        캐시 저장 (메모리와 디스크 모두)
+        
+        Args:
+            key: 캐시 키
+            value: 응답
+            ttl: 유효 시간 (초, None이면 계층별 기본값)
+        """
+        now = time.time()
+        self.memory.set(key, value, now + (ttl if ttl is not None else self.memory_ttl))
+        self.writes += 1
+        if self.disk is not None:
+            try:
+                await asyncio.to_thread(self.disk.set, key, value, now + (ttl if ttl is not None else self.disk_ttl))
+            except Exception as e:
+                self.errors += 1
+                logger.warning(f"LLM 응답 디스크 캐시 저장 실패: {str(e)}")
+    
+    async def clear(self) -> Dict[str, int]:
+        """
+        캐시 전체 삭제
+        
+        Returns:
+            계층별 삭제한 항목 수
+        """
+        cleared = {"memory": self.memory.clear(), "disk": 0}
+        if self.disk is not None:
+            cleared["disk"] = await asyncio.to_thread(self.disk.clear)
+        logger.info(f"LLM 응답 캐시 삭제: 메모리={cleared['memory']}, 디스크={cleared['disk']}")
+        return cleared
+    
+    def close(self) -> None:
+        """디스크 캐시 연결 종료"""
+        if self.disk is not None:
+            self.disk.close()
+            self.disk = None
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        캐시 상태 조회
+        
+        Returns:
+            적중/미적중/저장/제거 횟수 및 계층별 항목 수
+        """
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        stats: Dict[str, Any] = {
+            "enabled": self.enabled,
+            "lookups": lookups,
+            "hit_ratio": round((self.memory_hits + self.disk_hits) / lookups, 4) if lookups else 0.0,
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "errors": self.errors,
+            "memory": {
+                "entries": len(self.memory),
+                "max_entries": self.memory.max_entries,
+                "ttl": self.memory_ttl,
+                "evictions": self.memory.evictions,
+                "expirations": self.memory.expirations
+            }
+        }
+        if self.disk is not None:
+            stats["disk"] = {
+                "path": str(self.disk.path),
+                "entries": self.disk.count(),
+                "max_entries": self.disk.max_entries,
+                "ttl": self.disk_ttl,
+                "evictions": self.disk.evictions,
+                "expirations": self.disk.expirations
+            }
+        return stats
+
+
+# 전역 응답 캐시 인스턴스
+_response_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache(config_path: Optional[str] = None) -> ResponseCache:
+    """
+    응답 캐시 싱글톤 인스턴스 반환
+    
+    Args:
+        config_path: 설정 파일 경로
+    
+    Returns:
+        ResponseCache 인스턴스
+    """
+    global _response_cache
+    if _response_cache is None:
+        config_data = load_yaml_config(config_path)
+        _response_cache = ResponseCache(config_data)
+    return _response_cache
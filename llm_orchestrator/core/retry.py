@@ -0,0 +1,124 @@
+"""
+LLM 호출 재시도 정책
+
+연결 실패와 일시적인 HTTP 오류(429, 502, 503, 504)를 지수 백오프(full jitter)로 재시도합니다.
+응답에 Retry-After 헤더가 있으면 해당 시간을 우선 사용합니다.
+LLM 생성 요청은 서버 상태를 바꾸지 않으므로 응답을 받기 전 실패는 다시 보내도 안전합니다.
+"""
+import random
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any
+import httpx
+from core.loader import load_yaml_config
+
+# 재시도 설정 기본값 (settings.yml의 llm.retry 및 모델별 retry로 덮어씀)
+DEFAULT_RETRY_CONFIG: Dict[str, Any] = {
+    "max_attempts": 3,
+    "base_delay": 0.2,
+    "max_delay": 5.0,
+    "retry_on_status": [429, 502, 503, 504],
+    "max_retry_after": 10.0
+}
+
+# 응답을 받기 전에 실패한 경우만 재시도 (읽기 시간 초과는 생성 중일 수 있으므로 제외)
+RETRYABLE_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout, httpx.RemoteProtocolError)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Retry-After 헤더 파싱
+    
+    Args:
+        value: 헤더 값 (초 또는 HTTP 날짜)
+    
+    Returns:
+        대기 시간 (초, 해석할 수 없으면 None)
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryPolicy:
+    """재시도 정책"""
+    
+    def __init__(self, config: Dict[str, Any]):
+        """
+        재시도 정책 초기화
+        
+        Args:
+            config: 재시도 설정 (max_attempts, base_delay, max_delay, retry_on_status, max_retry_after)
+        """
+        self.config = {**DEFAULT_RETRY_CONFIG, **(config or {})}
+        self.max_attempts = max(1, int(self.config["max_attempts"]))
+        self.base_delay = float(self.config["base_delay"])
+        self.max_delay = float(self.config["max_delay"])
+        self.retry_on_status = set(self.config["retry_on_status"] or [])
+        self.max_retry_after = float(self.config["max_retry_after"])
+    
+    def with_overrides(self, overrides: Optional[Dict[str, Any]]) -> "RetryPolicy":
+        """모델별 설정을 덮어쓴 정책 반환 (덮어쓸 설정이 없으면 자신)"""
+        if not overrides:
+            return self
+        return RetryPolicy({**self.config, **overrides})
+    
+    def is_retryable_status(self, status_code: int) -> bool:
+        """재시도할 HTTP 상태 코드인지 여부"""
+        return status_code in self.retry_on_status
+    
+    def backoff(self, attempt: int) -> float:
+        """지수 백오프 대기 시간 (full jitter, attempt는 1부터)"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** (attempt - 1))))
+    
+    def retry_delay(self, attempt: int, response: Optional[httpx.Response] = None) -> Optional[float]:
+        """
+        다음 재시도까지 대기 시간
+        
+        Args:
+            attempt: 실패한 시도 번호 (1부터)
+            response: 실패한 응답 (연결 실패 시 None)
+        
+        Returns:
+            대기 시간 (초, 재시도하지 않으면 None)
+        """
+        if attempt >= self.max_attempts:
+            return None
+        if response is not None:
+            retry_after = parse_retry_after(response.headers.get("retry-after"))
+            if retry_after is not None:
+                # 서버가 요청한 대기 시간이 너무 길면 재시도하지 않고 실패 처리 (폴백 모델로 전환)
+                return retry_after if retry_after <= self.max_retry_after else None
+        return self.backoff(attempt)
+
+
+# 전역 재시도 정책 인스턴스
+_retry_policy: Optional[RetryPolicy] = None
+
+
+def get_retry_policy(config_path: Optional[str] = None) -> RetryPolicy:
+    """
+    재시도 정책 싱글톤 인스턴스 반환
+    
+    Args:
+        config_path: 설정 파일 경로
+    
+    Returns:
+        RetryPolicy 인스턴스
+    """
+    global _retry_policy
+    if _retry_policy is None:
+        config_data = load_yaml_config(config_path)
+        _retry_policy = RetryPolicy(config_data.get("llm", {}).get("retry") or {})
+    return _retry_policy
@@ -13,6 +13,11 @@ from core.loader import load_yaml_config
 from core.logger import setup_logger, get_logger
 from core.engine_registry import get_engine_registry
 from core.pipeline_manager import get_pipeline_manager
+from core.http_pool import get_http_pool_manager
+from core.json_codec import get_json_codec
+from core.response_cache import get_response_cache
+from core.ollama import get_ollama_manager
+from core.health_prober import get_health_prober
 from routers import pipeline_router
 
 logger = get_logger(__name__)
@@ -40,18 +45,44 @@ async def lifespan(app: FastAPI):
     engine_registry = get_engine_registry()
     pipeline_manager = get_pipeline_manager()
     
+    # 정적 파이프라인 모듈 사전 로드 (요청마다 모듈을 다시 로드하지 않도록 캐시)
+    pipeline_manager.preload_pipeline_modules()
+    
+    # vLLM 접두사 캐시 예열 (파이프라인 시스템 프롬프트를 레플리카마다 미리 처리)
+    prefix_warmup_config = config_data.get("llm", {}).get("prefix_warmup") or {}
+    if prefix_warmup_config.get("enabled", False):
+        await pipeline_manager.warmup_prefix_cache(prefix_warmup_config.get("timeout"))
+    
+    # Ollama 모델 예열 (preload가 켜진 모델을 레플리카마다 미리 적재하여 첫 요청의 모델 적재 시간 제거)
+    await get_ollama_manager().preload_models()
+    
+    # 모델 엔드포인트 백그라운드 상태 확인 시작 (결과는 레플리카/폴백 모델 선택과 /api/llm/ready에 사용)
+    get_health_prober().start()
+    
     # 서버 시작 로그
     server_config = config_data.get("server", {})
     logger.info("=" * 50)
     logger.info("LLM Orchestrator 서버 시작")
     logger.info(f"서버 주소: http://{server_config.get('host', '0.0.0.0')}:{server_config.get('port', 8000)}")
     logger.info(f"LLM 타입: {engine_registry.get_llm_type()}")
+    logger.info(f"JSON 코덱: {get_json_codec().backend}")
+    logger.info(f"LLM 응답 캐시: {'사용' if get_response_cache().enabled else '사용 안 함'}")
     logger.info(f"파이프라인 모드: {pipeline_manager.pipeline_config.get('mode', 'static')}")
     logger.info(f"정적 파이프라인: {len(pipeline_manager.pipelines)}개")
+    logger.info(f"동적 파이프라인: {len(pipeline_manager.dynamic_pipelines)}개")
     logger.info("=" * 50)
     
     yield
     
+    # 모델 엔드포인트 상태 확인 종료
+    await get_health_prober().stop()
+    
+    # 백엔드별 HTTP 연결 풀 종료
+    await get_http_pool_manager().close_all()
+    
+    # LLM 응답 디스크 캐시 연결 종료
+    get_response_cache().close()
+    
     # 서버 종료 로그
     logger.info("LLM Orchestrator 서버 종료")
 
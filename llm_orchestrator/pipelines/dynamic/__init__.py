@@ -1,2 +1 @@
-# Dynamic Pipelines Module (미구현)
-
+# Dynamic Pipelines Module
@@ -0,0 +1,149 @@
+"""
+그래프 파이프라인
+
+YAML로 선언한 스테이지 DAG를 실행하는 동적 파이프라인입니다.
+의존 관계가 없는 스테이지는 이벤트 루프에서 동시에 실행됩니다.
+
+스테이지 설정 예:
+    stages:
+      - name: "normalize"
+        type: "normalize"
+        inputs: ["text"]           # "text"는 요청 원문
+      - name: "agent_summary"
+        type: "llm"
+        inputs: ["normalize"]
+        system_prompt: "..."
+        user_prompt: "다음 상담사 발언을 요약해주세요:\n\n{input}"
+    output: "agent_summary"        # 생략 시 마지막 스테이지
+"""
+import asyncio
+import time
+from typing import Dict, Any, List, Optional, Callable
+from core.logger import get_logger
+from pipelines.base.base_pipeline import BasePipeline
+from pipelines.dynamic.stages import STAGE_HANDLERS, StageContext
+
+logger = get_logger(__name__)
+
+# 요청 원문을 가리키는 예약 입력 이름
+TEXT_INPUT = "text"
+
+
+class GraphPipeline(BasePipeline):
+    """스테이지 DAG 기반 동적 파이프라인"""
+    
+    def __init__(self, pipeline_config: Dict[str, Any]):
+        """
+        그래프 파이프라인 초기화 (스테이지 검증 및 실행 순서 계산)
+        
+        Args:
+            pipeline_config: 파이프라인 설정 (stages, output 포함)
+        """
+        super().__init__(pipeline_config.get("name"), pipeline_config.get("description"))
+        self.stages: Dict[str, Dict[str, Any]] = {}
+        self.dependencies: Dict[str, List[str]] = {}
+        
+        stages = pipeline_config.get("stages") or []
+        if not stages:
+            raise ValueError(f"동적 파이프라인 '{self.name}'에 stages가 정의되지 않았습니다.")
+        
+        for stage_config in stages:
+            stage_name = stage_config.get("name")
+            stage_type = stage_config.get("type")
+            if not stage_name:
+                raise ValueError(f"동적 파이프라인 '{self.name}'에 이름 없는 스테이지가 있습니다.")
+            if stage_name == TEXT_INPUT or stage_name in self.stages:
+                raise ValueError(f"스테이지 이름이 중복되었거나 예약어입니다: {stage_name}")
+            if stage_type not in STAGE_HANDLERS:
+                raise ValueError(f"지원하지 않는 스테이지 타입입니다: {stage_name}={stage_type} (지원: {list(STAGE_HANDLERS.keys())})")
+            self.stages[stage_name] = stage_config
+            self.dependencies[stage_name] = list(stage_config.get("inputs") or [TEXT_INPUT])
+        
+        for stage_name, deps in self.dependencies.items():
+            for dep in deps:
+                if dep != TEXT_INPUT and dep not in self.stages:
+                    raise ValueError(f"스테이지 '{stage_name}'의 입력을 찾을 수 없습니다: {dep}")
+        
+        self.order = self._topological_order()
+        self.output = pipeline_config.get("output") or self.order[-1]
+        if self.output not in self.stages:
+            raise ValueError(f"동적 파이프라인 '{self.name}'의 output 스테이지를 찾을 수 없습니다: {self.output}")
+    
+    def _topological_order(self) -> List[str]:
+        """스테이지 실행 순서 계산 (순환 의존 검출)"""
+        remaining = {name: {d for d in deps if d != TEXT_INPUT} for name, deps in self.dependencies.items()}
+        order: List[str] = []
+        while remaining:
+            ready = [name for name, deps in remaining.items() if not deps]
+            if not ready:
+                raise ValueError(f"동적 파이프라인 '{self.name}'에 순환 의존이 있습니다: {list(remaining.keys())}")
+            for name in ready:
+                order.append(name)
+                del remaining[name]
+            for deps in remaining.values():
+                deps.difference_update(ready)
+        return order
+    
+    async def execute(
+        self,
+        text: str,
+        model_config: Dict[str, Any],
+        pipeline_config: Dict[str, Any],
+        settings: Dict[str, Any],
+        request_data: Optional[Dict[str, Any]] = None,
+        resolve_model: Optional[Callable[[str], Optional[Dict[str, Any]]]] = None
+    ) -> str:
+        """
+        파이프라인 실행
+        
+        모든 스테이지를 태스크로 생성하고, 각 스테이지는 입력 스테이지가 끝나는 즉시 실행됩니다.
+        한 스테이지가 실패하면 나머지 스테이지는 취소됩니다.
+        
+        Args:
+            text: 처리할 텍스트
+            model_config: 파이프라인 기본 모델 설정
+            pipeline_config: 파이프라인 설정
+            settings: 전체 설정
+            request_data: 전체 요청 데이터
+            resolve_model: 스테이지별 모델 지정 해석 함수
+        
+        Returns:
+            output 스테이지 결과
+        """
+        context = StageContext(
+            model_config=model_config,
+            settings=settings,
+            request_data=request_data or {},
+            resolve_model=resolve_model or (lambda spec: None)
+        )
+        text = self.preprocess(text)
+        start = time.perf_counter()
+        tasks: Dict[str, asyncio.Task] = {}
+        
+        async def run_stage(stage_name: str) -> str:
+            stage_config = self.stages[stage_name]
+            inputs: Dict[str, str] = {}
+            for dep in self.dependencies[stage_name]:
+                inputs[dep] = text if dep == TEXT_INPUT else await tasks[dep]
+            
+            stage_start = time.perf_counter()
+            result = await STAGE_HANDLERS[stage_config["type"]](stage_config, inputs, context)
+            elapsed_ms = (time.perf_counter() - stage_start) * 1000
+            logger.info(f"동적 파이프라인 스테이지 완료: {self.name}.{stage_name} ({stage_config['type']}), 소요 시간={elapsed_ms:.0f}ms, 출력 길이={len(result)}")
+            return result
+        
+        # 위상 정렬 순서로 생성하므로 입력 스테이지 태스크가 항상 먼저 존재
+        for stage_name in self.order:
+            tasks[stage_name] = asyncio.create_task(run_stage(stage_name), name=f"{self.name}.{stage_name}")
+        
+        try:
+            await asyncio.gather(*tasks.values())
+        finally:
+            for task in tasks.values():
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+        
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        logger.info(f"동적 파이프라인 완료: {self.name}, 스테이지 수={len(tasks)}, 전체 소요 시간={elapsed_ms:.0f}ms")
+        return self.postprocess(tasks[self.output].result())
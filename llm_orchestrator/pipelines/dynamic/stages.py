@@ -0,0 +1,149 @@
+"""
+동적 파이프라인 스테이지
+
+그래프 파이프라인을 구성하는 스테이지 타입별 실행 함수를 정의합니다.
+CPU 작업 스테이지(normalize, split, cleanup)는 이벤트 루프를 막지 않도록
+스레드로 오프로드합니다.
+"""
+import asyncio
+import re
+from typing import Dict, Any, List, Callable, Awaitable, Optional
+from core.llm_client import LLMClient
+from core.logger import get_logger
+from pipelines.static.summary_util.split_text import extract_agent_utterances, extract_customer_utterances
+from pipelines.static.summary_util.speaker_patterns import get_agent_patterns, get_customer_patterns
+from pipelines.static.summary_util.stt_conversion import normalize_stt_text
+
+logger = get_logger(__name__)
+
+
+class StageContext:
+    """스테이지 실행 컨텍스트"""
+    
+    def __init__(
+        self,
+        model_config: Dict[str, Any],
+        settings: Dict[str, Any],
+        request_data: Dict[str, Any],
+        resolve_model: Callable[[str], Optional[Dict[str, Any]]]
+    ):
+        """
+        스테이지 실행 컨텍스트 초기화
+        
+        Args:
+            model_config: 파이프라인 기본 모델 설정
+            settings: 전체 설정
+            request_data: 전체 요청 데이터
+            resolve_model: 모델 지정 문자열("{type}:{model_name}")을 모델 설정으로 변환하는 함수
+        """
+        self.model_config = model_config
+        self.settings = settings
+        self.request_data = request_data
+        self.resolve_model = resolve_model
+
+
+def _single_input(stage_config: Dict[str, Any], inputs: Dict[str, str]) -> str:
+    """단일 입력 스테이지의 입력값 반환"""
+    if len(inputs) != 1:
+        raise ValueError(f"스테이지 '{stage_config.get('name')}'는 입력이 하나여야 합니다: 입력 수={len(inputs)}")
+    return next(iter(inputs.values()))
+
+
+async def run_normalize(stage_config: Dict[str, Any], inputs: Dict[str, str], context: StageContext) -> str:
+    """대괄호 안 내용 변환 (CPU 작업, 스레드 오프로드)"""
+    text = _single_input(stage_config, inputs)
+    merge_phones = bool(stage_config.get("merge_phones", False))
+    return await asyncio.to_thread(normalize_stt_text, text, merge_phones=merge_phones)
+
+
+async def run_split(stage_config: Dict[str, Any], inputs: Dict[str, str], context: StageContext) -> str:
+    """상담사/고객 발언 분리 (CPU 작업, 스레드 오프로드)"""
+    text = _single_input(stage_config, inputs)
+    speaker = stage_config.get("speaker")
+    speaker_patterns = stage_config.get("speaker_patterns") or {}
+    agent_patterns = get_agent_patterns(speaker_patterns.get("agent"))
+    customer_patterns = get_customer_patterns(speaker_patterns.get("customer"))
+    
+    if speaker == "agent":
+        return await asyncio.to_thread(extract_agent_utterances, text, agent_patterns, customer_patterns)
+    elif speaker == "customer":
+        return await asyncio.to_thread(extract_customer_utterances, text, agent_patterns, customer_patterns)
+    raise ValueError(f"split 스테이지의 speaker 값이 올바르지 않습니다: {speaker} (agent 또는 customer)")
+
+
+async def run_llm(stage_config: Dict[str, Any], inputs: Dict[str, str], context: StageContext) -> str:
+    """LLM 호출"""
+    empty_result = stage_config.get("empty_result", "")
+    if inputs and not any(value and value.strip() for value in inputs.values()):
+        logger.warning(f"스테이지 '{stage_config.get('name')}' 입력이 비어있습니다. 빈 결과 반환")
+        return empty_result
+    
+    system_prompt = stage_config.get("system_prompt", "")
+    user_prompt_template = stage_config.get("user_prompt", "{input}")
+    template_values = dict(inputs)
+    if len(inputs) == 1:
+        template_values["input"] = next(iter(inputs.values()))
+    user_prompt = user_prompt_template.format_map(template_values)
+    
+    # 스테이지별 모델 지정이 있으면 해당 모델 사용
+    model_config = context.model_config
+    model_spec = stage_config.get("model")
+    if model_spec:
+        model_config = context.resolve_model(model_spec)
+        if model_config is None:
+            raise ValueError(f"모델을 찾을 수 없습니다: 모델 지정={model_spec}")
+        # 파이프라인 캐시 정책은 스테이지별 모델에도 적용
+        if context.model_config.get("cache_policy"):
+            model_config = {**model_config, "cache_policy": context.model_config["cache_policy"]}
+    
+    llm_type = context.settings.get("llm", {}).get("type", "api")
+    llm_client = LLMClient(model_config, llm_type)
+    
+    result = await asyncio.wait_for(
+        llm_client.generate(
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            model_name=model_config.get("name")
+        ),
+        timeout=stage_config.get("timeout")
+    )
+    
+    if result is None or not isinstance(result, str) or not result.strip():
+        logger.warning(f"스테이지 '{stage_config.get('name')}' LLM 결과가 비어있습니다.")
+        return empty_result
+    return result
+
+
+async def run_merge(stage_config: Dict[str, Any], inputs: Dict[str, str], context: StageContext) -> str:
+    """입력 결과를 구분자로 병합 (inputs 선언 순서 유지)"""
+    separator = stage_config.get("separator", "---")
+    return f"\n{separator}\n".join(inputs[name] for name in stage_config.get("inputs", []))
+
+
+def _remove_brackets(text: str) -> str:
+    """대괄호, 중괄호, 큰따옴표 제거 (안의 텍스트는 유지)"""
+    text = re.sub(r'\[([^\]]+?)\]', r'\1', text)  # 대괄호 제거
+    text = re.sub(r'\{([^\}]+?)\}', r'\1', text)  # 중괄호 제거
+    text = re.sub(r'"([^"]+?)"', r'\1', text)  # 큰따옴표 제거
+    return text
+
+
+async def run_cleanup(stage_config: Dict[str, Any], inputs: Dict[str, str], context: StageContext) -> str:
+    """대괄호/중괄호/큰따옴표 정리 (CPU 작업, 스레드 오프로드)"""
+    text = _single_input(stage_config, inputs)
+    return await asyncio.to_thread(_remove_brackets, text)
+
+
+# 스테이지 타입별 실행 함수
+STAGE_HANDLERS: Dict[str, Callable[[Dict[str, Any], Dict[str, str], StageContext], Awaitable[str]]] = {
+    "normalize": run_normalize,
+    "split": run_split,
+    "llm": run_llm,
+    "merge": run_merge,
+    "cleanup": run_cleanup,
+}
+
+
+def get_stage_types() -> List[str]:
+    """지원하는 스테이지 타입 목록 반환"""
+    return list(STAGE_HANDLERS.keys())
@@ -4,19 +4,515 @@
 정적 파이프라인 예시입니다.
 시스템 프롬프트와 유저 프롬프트를 구분하여 LLM을 호출합니다.
 """
+import asyncio
 import re
-from typing import Dict, Any, Optional, List
+import time
+from typing import Dict, Any, Optional, List, Tuple, AsyncIterator, Awaitable
 from core.llm_client import LLMClient
 from core.logger import get_logger
-from pipelines.static.summary_util.split_text import extract_agent_utterances, extract_customer_utterances
+from pipelines.static.summary_util.split_text import extract_agent_utterances, extract_customer_utterances, split_utterance_blocks
 from pipelines.static.summary_util.speaker_patterns import get_agent_patterns, get_customer_patterns
 from pipelines.static.summary_util.stt_conversion import (
     convert_bracketed_content,
 )
+from pipelines.static.summary_util.stream_cleanup import StreamingBracketRemover
+from pipelines.static.summary_util.token_budget import estimate_tokens, group_by_token_budget, chunk_by_token_budget
 
 logger = get_logger(__name__)
 
 
+def get_system_prompts(pipeline_config: Dict[str, Any]) -> List[str]:
+    """
+    접두사 캐시 예열용 시스템 프롬프트 목록
+    
+    분리 요약 모드의 상담사/고객 시스템 프롬프트를 반환합니다.
+    (단일 요약 모드는 요청마다 시스템 프롬프트를 지정할 수 있으므로 예열하지 않음)
+    """
+    separate_config = pipeline_config.get("separate_speaker_summary") or {}
+    if separate_config.get("enabled") is not True:
+        return []
+    prompts = [separate_config.get("agent_system_prompt"), separate_config.get("customer_system_prompt")]
+    return [prompt for prompt in prompts if isinstance(prompt, str) and prompt.strip()]
+
+
+def _summary_user_prompt(subject: str, text: str) -> str:
+    """
+    요약 유저 프롬프트 (subject: "상담사 발언", "고객 발언", "상담 내용")
+    
+    고정 문구를 텍스트 앞에 두고 execute/execute_stream에서 같은 바이트로 구성해야
+    vLLM 접두사 캐시가 시스템 프롬프트 다음까지 재사용됩니다.
+    """
+    return f"다음 {subject}을 요약해주세요:\n\n{text}"
+
+
+def _reduce_user_prompt(subject: str, partial_summaries: List[str]) -> str:
+    """구간별 요약을 하나로 합치는 유저 프롬프트"""
+    sections = "\n\n".join(f"(구간 {index})\n{summary}" for index, summary in enumerate(partial_summaries, 1))
+    return f"다음은 {subject}을 구간별로 요약한 내용입니다. 구간 요약을 하나의 요약으로 합쳐주세요:\n\n{sections}"
+
+
+def _get_map_reduce_config(
+    pipeline_config: Dict[str, Any],
+    agent_patterns: List[str],
+    customer_patterns: List[str]
+) -> Optional[Dict[str, Any]]:
+    """
+    구간 분할 요약(map-reduce) 설정 조회
+    
+    Args:
+        pipeline_config: 파이프라인 설정
+        agent_patterns: 상담사 패턴 (발언 단위 분리용)
+        customer_patterns: 고객 패턴 (발언 단위 분리용)
+    
+    Returns:
+        {"token_budget", "max_concurrency", "agent_patterns", "customer_patterns"} 또는 None (사용 안 함)
+    """
+    map_reduce_config = pipeline_config.get("map_reduce") or {}
+    if map_reduce_config.get("enabled") is not True:
+        return None
+    
+    token_budget = map_reduce_config.get("token_budget")
+    if not isinstance(token_budget, int) or token_budget <= 0:
+        logger.warning(f"map_reduce.token_budget 값이 올바르지 않습니다: {token_budget}, 구간 분할 없이 진행")
+        return None
+    
+    max_concurrency = map_reduce_config.get("max_concurrency", 4)
+    if not isinstance(max_concurrency, int) or max_concurrency <= 0:
+        logger.warning(f"map_reduce.max_concurrency 값이 올바르지 않습니다: {max_concurrency}, 기본값(4) 사용")
+        max_concurrency = 4
+    
+    return {
+        "token_budget": token_budget,
+        "max_concurrency": max_concurrency,
+        "agent_patterns": agent_patterns,
+        "customer_patterns": customer_patterns
+    }
+
+
+async def _gather_or_cancel(coros: List[Awaitable[str]]) -> List[str]:
+    """모두 동시에 실행 (하나라도 실패하면 나머지를 취소하고 예외 전파)"""
+    tasks = [asyncio.create_task(coro) for coro in coros]
+    try:
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        for task in done:
+            if task.exception() is not None:
+                raise task.exception()
+        return [task.result() for task in tasks]
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def _resolve_user_prompt(
+    llm_client: LLMClient,
+    system_prompt: str,
+    subject: str,
+    text: str,
+    model_name: Optional[str],
+    map_reduce: Optional[Dict[str, Any]]
+) -> str:
+    """
+    최종 요약 호출의 유저 프롬프트 구성
+    
+    텍스트의 추정 토큰 수가 토큰 예산 이내이면 텍스트 전체를 요약하는 프롬프트를 그대로 사용합니다.
+    예산을 넘으면 발언 단위 구간으로 나눠 구간별 요약(map)을 동시에 실행하고, 구간 요약을 합치는
+    프롬프트(reduce)를 반환합니다. 구간 요약을 합친 내용도 예산을 넘으면 예산 단위로 묶어 먼저 합칩니다.
+    
+    Args:
+        llm_client: LLM 클라이언트
+        system_prompt: 시스템 프롬프트 (구간 요약과 합치기에 같은 프롬프트 사용)
+        subject: 요약 대상 ("상담사 발언", "고객 발언", "상담 내용")
+        text: 요약할 텍스트
+        model_name: 모델 이름
+        map_reduce: 구간 분할 요약 설정 (None이면 구간 분할 없음)
+    
+    Returns:
+        최종 요약 호출의 유저 프롬프트
+    """
+    if map_reduce is None:
+        return _summary_user_prompt(subject, text)
+    
+    token_budget = map_reduce["token_budget"]
+    tokens = estimate_tokens(text)
+    if tokens <= token_budget:
+        return _summary_user_prompt(subject, text)
+    
+    blocks = split_utterance_blocks(text, map_reduce["agent_patterns"], map_reduce["customer_patterns"])
+    chunks = chunk_by_token_budget(blocks, token_budget)
+    if len(chunks) <= 1:
+        return _summary_user_prompt(subject, text)
+    
+    semaphore = asyncio.Semaphore(map_reduce["max_concurrency"])
+    
+    async def summarize(user_prompt: str) -> str:
+        async with semaphore:
+            summary = await llm_client.generate(system_prompt=system_prompt, user_prompt=user_prompt, model_name=model_name)
+        return summary.strip() if isinstance(summary, str) else ""
+    
+    start = time.perf_counter()
+    logger.info(f"{subject} 구간 분할 요약 시작: 추정 토큰={tokens}, 예산={token_budget}, 발언 수={len(blocks)}, 구간 수={len(chunks)}")
+    partials = await _gather_or_cancel([summarize(_summary_user_prompt(subject, chunk)) for chunk in chunks])
+    partials = [summary for summary in partials if summary]
+    
+    # 구간 요약을 합친 프롬프트도 예산을 넘으면 예산 단위로 묶어 중간 합치기 반복
+    while len(partials) > 1 and estimate_tokens(_reduce_user_prompt(subject, partials)) > token_budget:
+        groups = group_by_token_budget(partials, token_budget)
+        if len(groups) >= len(partials):
+            break
+        partials = await _gather_or_cancel([summarize(_reduce_user_prompt(subject, group)) for group in groups])
+        partials = [summary for summary in partials if summary]
+    
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    logger.info(f"{subject} 구간 요약 완료: 구간 요약 수={len(partials)}, 소요 시간={elapsed_ms:.0f}ms")
+    if not partials:
+        return _summary_user_prompt(subject, text)
+    return _reduce_user_prompt(subject, partials)
+
+
+async def _summarize_speaker(
+    llm_client: LLMClient,
+    label: str,
+    system_prompt: str,
+    speaker_text: str,
+    model_name: Optional[str],
+    branch_timeout: Optional[float],
+    map_reduce: Optional[Dict[str, Any]] = None
+) -> str:
+    """
+    화자별 발언 요약 (분리 요약 모드의 단일 브랜치)
+    
+    Args:
+        llm_client: LLM 클라이언트
+        label: 화자 이름 ("상담사" 또는 "고객")
+        system_prompt: 화자별 시스템 프롬프트
+        speaker_text: 화자 발언 텍스트
+        model_name: 모델 이름
+        branch_timeout: 브랜치 타임아웃 (초, None이면 제한 없음, 구간 분할 요약 시간 포함)
+        map_reduce: 구간 분할 요약 설정 (None이면 구간 분할 없음)
+    
+    Returns:
+        요약 결과 (비어있거나 올바르지 않으면 빈 문자열)
+    """
+    logger.info(f"{label} 발언 요약 LLM 호출 시작")
+    logger.info(f"{label} 발언 텍스트 길이: {len(speaker_text) if speaker_text else 0}")
+    logger.debug(f"{label} 발언 텍스트 (처음 200자): {speaker_text[:200] if speaker_text else '(없음)'}")
+    
+    if not speaker_text or not speaker_text.strip():
+        logger.warning(f"{label} 발언이 비어있습니다. 빈 요약 반환")
+        return ""
+    
+    async def run() -> str:
+        user_prompt = await _resolve_user_prompt(llm_client, system_prompt, f"{label} 발언", speaker_text, model_name, map_reduce)
+        return await llm_client.generate(
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            model_name=model_name
+        )
+    
+    start = time.perf_counter()
+    try:
+        summary = await asyncio.wait_for(run(), timeout=branch_timeout)
+    except asyncio.TimeoutError:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        logger.error(f"{label} 발언 요약 LLM 호출 타임아웃: {elapsed_ms:.0f}ms (제한={branch_timeout}초)")
+        raise
+    except asyncio.CancelledError:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        logger.warning(f"{label} 발언 요약 LLM 호출 취소: {elapsed_ms:.0f}ms 경과")
+        raise
+    except Exception as e:
+        error_msg = f"{label} 발언 요약 LLM 호출 중 예외 발생: {str(e)}"
+        logger.error(error_msg, exc_info=True)
+        raise
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    logger.info(f"{label} 발언 요약 LLM 호출 소요 시간: {elapsed_ms:.0f}ms")
+    
+    if summary is None:
+        logger.error(f"{label} 발언 요약 결과가 None입니다.")
+        return ""
+    if not isinstance(summary, str):
+        logger.error(f"{label} 발언 요약 결과 타입이 올바르지 않습니다. 타입={type(summary)}")
+        return ""
+    if not summary.strip():
+        logger.warning(f"{label} 발언 요약 결과가 빈 문자열입니다.")
+        return ""
+    
+    logger.info(f"{label} 발언 요약 완료: 길이={len(summary)}")
+    logger.debug(f"{label} 발언 요약 내용:\n{summary}")
+    return summary
+
+
+async def _summarize_speakers_concurrently(
+    llm_client: LLMClient,
+    model_name: Optional[str],
+    branches: List[Tuple[str, str, str]],
+    branch_timeout: Optional[float] = None,
+    map_reduce: Optional[Dict[str, Any]] = None
+) -> List[str]:
+    """
+    화자별 요약을 동시에 실행
+    
+    한 브랜치가 실패하면 나머지 브랜치는 취소하고 예외를 전파합니다. (호출자가 취소된 경우에도 남은 브랜치를 취소하고 끝날 때까지 대기)
+    
+    Args:
+        llm_client: LLM 클라이언트
+        model_name: 모델 이름
+        branches: (화자 이름, 시스템 프롬프트, 발언 텍스트) 목록
+        branch_timeout: 브랜치별 타임아웃 (초, None이면 제한 없음)
+        map_reduce: 구간 분할 요약 설정 (None이면 구간 분할 없음)
+    
+    Returns:
+        branches 순서와 동일한 요약 결과 목록
+    """
+    start = time.perf_counter()
+    results = await _gather_or_cancel([
+        _summarize_speaker(llm_client, label, system_prompt, speaker_text, model_name, branch_timeout, map_reduce)
+        for label, system_prompt, speaker_text in branches
+    ])
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    logger.info(f"화자별 요약 동시 호출 완료: 브랜치 수={len(results)}, 전체 소요 시간={elapsed_ms:.0f}ms")
+    return results
+
+
+def _prepare_summary(
+    text: str,
+    pipeline_config: Dict[str, Any],
+    request_data: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    요약 요청 준비 (요약 모드 판별, 시스템 프롬프트 및 발언 텍스트 구성)
+    
+    execute와 execute_stream이 공유합니다.
+    
+    Args:
+        text: 처리할 텍스트
+        pipeline_config: 파이프라인 설정
+        request_data: 전체 요청 데이터 (추가 필드 포함)
+    
+    Returns:
+        분리 요약 모드: {"separate": True, "branches": [(화자 이름, 시스템 프롬프트, 발언 텍스트)], "separator", "branch_timeout", "map_reduce"}
+        단일 요약 모드: {"separate": False, "system_prompt", "user_prompt", "summary_text", "map_reduce"}
+    """
+    # 분리 요약 모드 확인
+    separate_config = pipeline_config.get("separate_speaker_summary")
+    is_separate_mode = False
+    
+    if separate_config is not None:
+        enabled = separate_config.get("enabled")
+        if enabled is True:
+            is_separate_mode = True
+            logger.info("상담원/고객 발언 분리 요약 모드 활성화")
+        elif enabled is False:
+            is_separate_mode = False
+            logger.info("상담원/고객 발언 분리 요약 모드 비활성화")
+        else:
+            is_separate_mode = False
+            logger.warning(f"separate_speaker_summary.enabled 값이 올바르지 않습니다: {enabled}, 기본 모드로 진행")
+    else:
+        is_separate_mode = False
+        logger.info("separate_speaker_summary 설정이 없습니다. 기본 모드로 진행")
+    
+    # 분리 요약 모드 처리
+    if is_separate_mode:
+        logger.info("=" * 80)
+        logger.info("상담원/고객 발언 분리 요약 모드 시작")
+        logger.info("=" * 80)
+        
+        # 상담사 발언 요약용 시스템 프롬프트 가져오기
+        agent_system_prompt = separate_config.get("agent_system_prompt")
+        if agent_system_prompt is None:
+            error_msg = "agent_system_prompt 설정이 없습니다."
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+        
+        if not isinstance(agent_system_prompt, str):
+            error_msg = f"agent_system_prompt 타입이 올바르지 않습니다. 타입={type(agent_system_prompt)}"
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+        
+        if not agent_system_prompt.strip():
+            error_msg = "agent_system_prompt가 비어있습니다."
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+        
+        logger.info(f"상담사 발언 요약용 시스템 프롬프트 사용: 길이={len(agent_system_prompt)}")
+        
+        # 고객 발언 요약용 시스템 프롬프트 가져오기
+        customer_system_prompt = separate_config.get("customer_system_prompt")
+        if customer_system_prompt is None:
+            error_msg = "customer_system_prompt 설정이 없습니다."
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+        
+        if not isinstance(customer_system_prompt, str):
+            error_msg = f"customer_system_prompt 타입이 올바르지 않습니다. 타입={type(customer_system_prompt)}"
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+        
+        if not customer_system_prompt.strip():
+            error_msg = "customer_system_prompt가 비어있습니다."
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+        
+        logger.info(f"고객 발언 요약용 시스템 프롬프트 사용: 길이={len(customer_system_prompt)}")
+        
+        # 발언 패턴 가져오기
+        speaker_patterns = separate_config.get("speaker_patterns")
+        if speaker_patterns is None:
+            error_msg = "speaker_patterns 설정이 없습니다."
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+        
+        # 패턴 가져오기 (설정에서 가져오거나 기본값 사용)
+        agent_patterns_config = speaker_patterns.get("agent")
+        customer_patterns_config = speaker_patterns.get("customer")
+        
+        # 패턴 검증 및 기본값 적용
+        agent_patterns = get_agent_patterns(agent_patterns_config)
+        customer_patterns = get_customer_patterns(customer_patterns_config)
+        
+        logger.info(f"상담사 패턴 수: {len(agent_patterns)}, 고객 패턴 수: {len(customer_patterns)}")
+        
+        # 원본 텍스트 사용 여부 확인
+        use_original_text = separate_config.get("use_original_text", False)
+        if not isinstance(use_original_text, bool):
+            use_original_text = False
+            logger.warning(f"use_original_text 값이 올바르지 않습니다: {use_original_text}, 기본값(false) 사용")
+        
+        if use_original_text:
+            logger.info("원본 텍스트 모드: 발언 분리 없이 원본 텍스트 그대로 사용")
+        else:
+            logger.info("발언 분리 모드: 상담사/고객 발언을 분리하여 사용")
+        
+        # 대괄호 안 내용 변환 (이미 []로 감싸진 것만 변환)
+        logger.info("원본 텍스트 대괄호 변환 시작")
+        logger.debug(f"원본 텍스트 (처음 300자): {text[:300]}")
+        converted_text = convert_bracketed_content(text)
+        logger.info("원본 텍스트 대괄호 변환 완료")
+        logger.debug(f"대괄호 변환 후 텍스트 (처음 300자): {converted_text[:300]}")
+        
+        # 발언 분리 또는 원본 텍스트 사용
+        if use_original_text:
+            # 원본 텍스트 그대로 사용
+            agent_text = converted_text
+            customer_text = converted_text
+            logger.info(f"원본 텍스트 사용: 길이={len(converted_text)}")
+        else:
+            # 발언 분리 (변환된 텍스트 사용)
+            logger.info("상담사 발언 추출 시작")
+            agent_text = extract_agent_utterances(converted_text, agent_patterns, customer_patterns)
+            logger.info(f"상담사 발언 추출 완료: 길이={len(agent_text)}")
+            
+            logger.info("고객 발언 추출 시작")
+            customer_text = extract_customer_utterances(converted_text, agent_patterns, customer_patterns)
+            logger.info(f"고객 발언 추출 완료: 길이={len(customer_text)}")
+        
+        # 구분자 가져오기
+        separator = separate_config.get("separator")
+        if separator is None:
+            separator = "---"
+            logger.info("구분자가 설정되지 않아 기본값 사용: ---")
+        else:
+            if not isinstance(separator, str):
+                logger.warning(f"구분자 타입이 올바르지 않습니다. 타입={type(separator)}, 기본값 사용")
+                separator = "---"
+            else:
+                logger.info(f"설정된 구분자 사용: {separator[:20]}")
+        
+        # 브랜치별 타임아웃 (초, 설정하지 않으면 제한 없음)
+        branch_timeout = separate_config.get("branch_timeout")
+        if branch_timeout is not None and (not isinstance(branch_timeout, (int, float)) or branch_timeout <= 0):
+            logger.warning(f"branch_timeout 값이 올바르지 않습니다: {branch_timeout}, 타임아웃 없이 진행")
+            branch_timeout = None
+        
+        return {
+            "separate": True,
+            "branches": [
+                ("상담사", agent_system_prompt, agent_text),
+                ("고객", customer_system_prompt, customer_text),
+            ],
+            "separator": separator,
+            "branch_timeout": branch_timeout,
+            "map_reduce": _get_map_reduce_config(pipeline_config, agent_patterns, customer_patterns)
+        }
+    
+    else:
+        # 기존 단일 요약 모드 (원본 전체 사용)
+        logger.info("=" * 80)
+        logger.info("기존 단일 요약 모드 시작 (원본 전체 사용)")
+        logger.info("=" * 80)
+        
+        # 대괄호 안 내용 변환 (이미 []로 감싸진 것만 변환)
+        logger.info("원본 텍스트 대괄호 변환 시작")
+        converted_text = convert_bracketed_content(text)
+        logger.info("원본 텍스트 대괄호 변환 완료")
+        
+        # 구분자 가져오기 (설정에서 가져오거나 기본값 사용)
+        separator = "---"
+        if separate_config is not None:
+            separator_from_config = separate_config.get("separator")
+            if separator_from_config is not None and isinstance(separator_from_config, str):
+                separator = separator_from_config
+                logger.info(f"설정에서 구분자 사용: {separator[:20]}")
+            else:
+                logger.info("설정에 구분자가 없어 기본값 사용: ---")
+        else:
+            logger.info("separate_speaker_summary 설정이 없어 기본 구분자 사용: ---")
+        
+        # 시스템 프롬프트 (요청에서 받거나 기본값 사용)
+        default_system_prompt = f"""당신은 관세청 상담내용 요약 전문가입니다. 주어진 텍스트를 요약하세요.
+            
+            규칙:
+            1. 텍스트에 명시된 사실만 요약 (추론, 해석, 의도 추측 절대 금지)
+            2. 텍스트에 없는 정보는 절대 추가하지 않음
+            3. 질문과 답변을 정확히 구분하고, 상대방에게 알려준 정보는 반드시 포함 (통관번호, 운송장번호, 전화번호, 주소, 금액, 세율, 날짜 등)
+            4. 한글 숫자는 모두 아라비아 숫자로 변환하여 출력
+              - 대괄호 안: [공삼이 칠사오 구칠삼하나] → [032-745-9731]
+              - 대괄호 밖: 십이월 이십일 → 12월 21일, 오구오팔 → 5958
+              - 숫자+단위 조합은 하나의 토큰으로 인식하여 전체를 변환: 사만 칠천 엔 → 47000엔 (40000+7000), 십이만 삼천 원 → 123000원 (120000+3000)
+              - 이미 숫자/영문인 경우: [EH 0405 14658 US], [8826 5399 291] → 그대로 유지
+            5. 2~4문장으로 간결하게 작성
+            
+            출력 형식:
+            ■ [고객] 고객 발언 요약
+            고객은 ??에 대해 문의하고 ??에 대해 안내받았습니다...
+            {separator}
+            
+            ■ [고객] 고객 발언 요약
+            고객은 ??에 대해 문의하고 ??에 대해 안내받았습니다...
+            """
+        
+        # 요청 데이터에서 시스템 프롬프트 가져오기
+        system_prompt = None
+        if request_data is not None:
+            system_prompt = request_data.get("system_prompt")
+        
+        if system_prompt is None or not system_prompt.strip():
+            system_prompt = default_system_prompt
+            logger.info("기본 시스템 프롬프트 사용")
+        else:
+            logger.info(f"사용자 지정 시스템 프롬프트 사용: 길이={len(system_prompt)}")
+        
+        # 유저 프롬프트 (실제 요약할 상담 내용, 변환된 텍스트 사용)
+        user_prompt = _summary_user_prompt("상담 내용", converted_text)
+        
+        # 구간 분할 요약 시 발언 단위 분리에 사용할 화자 패턴
+        speaker_patterns = (separate_config or {}).get("speaker_patterns") or {}
+        
+        return {
+            "separate": False,
+            "system_prompt": system_prompt,
+            "user_prompt": user_prompt,
+            "summary_text": converted_text,
+            "map_reduce": _get_map_reduce_config(
+                pipeline_config,
+                get_agent_patterns(speaker_patterns.get("agent")),
+                get_customer_patterns(speaker_patterns.get("customer"))
+            )
+        }
+
 
 async def execute(
     text: str,
@@ -54,205 +550,19 @@ async def execute(
         # LLM 클라이언트 생성
         llm_client = LLMClient(model_config, llm_type)
         
-        # 분리 요약 모드 확인
-        separate_config = pipeline_config.get("separate_speaker_summary")
-        is_separate_mode = False
-        
-        if separate_config is not None:
-            enabled = separate_config.get("enabled")
-            if enabled is True:
-                is_separate_mode = True
-                logger.info("상담원/고객 발언 분리 요약 모드 활성화")
-            elif enabled is False:
-                is_separate_mode = False
-                logger.info("상담원/고객 발언 분리 요약 모드 비활성화")
-            else:
-                is_separate_mode = False
-                logger.warning(f"separate_speaker_summary.enabled 값이 올바르지 않습니다: {enabled}, 기본 모드로 진행")
-        else:
-            is_separate_mode = False
-            logger.info("separate_speaker_summary 설정이 없습니다. 기본 모드로 진행")
+        # 요약 요청 준비 (요약 모드 판별, 프롬프트 및 발언 텍스트 구성)
+        prepared = _prepare_summary(text, pipeline_config, request_data)
         
         # 분리 요약 모드 처리
-        if is_separate_mode:
-            logger.info("=" * 80)
-            logger.info("상담원/고객 발언 분리 요약 모드 시작")
-            logger.info("=" * 80)
-            
-            # 상담사 발언 요약용 시스템 프롬프트 가져오기
-            agent_system_prompt = separate_config.get("agent_system_prompt")
-            if agent_system_prompt is None:
-                error_msg = "agent_system_prompt 설정이 없습니다."
-                logger.error(error_msg)
-                raise ValueError(error_msg)
-            
-            if not isinstance(agent_system_prompt, str):
-                error_msg = f"agent_system_prompt 타입이 올바르지 않습니다. 타입={type(agent_system_prompt)}"
-                logger.error(error_msg)
-                raise ValueError(error_msg)
-            
-            if not agent_system_prompt.strip():
-                error_msg = "agent_system_prompt가 비어있습니다."
-                logger.error(error_msg)
-                raise ValueError(error_msg)
-            
-            logger.info(f"상담사 발언 요약용 시스템 프롬프트 사용: 길이={len(agent_system_prompt)}")
-            
-            # 고객 발언 요약용 시스템 프롬프트 가져오기
-            customer_system_prompt = separate_config.get("customer_system_prompt")
-            if customer_system_prompt is None:
-                error_msg = "customer_system_prompt 설정이 없습니다."
-                logger.error(error_msg)
-                raise ValueError(error_msg)
-            
-            if not isinstance(customer_system_prompt, str):
-                error_msg = f"customer_system_prompt 타입이 올바르지 않습니다. 타입={type(customer_system_prompt)}"
-                logger.error(error_msg)
-                raise ValueError(error_msg)
-            
-            if not customer_system_prompt.strip():
-                error_msg = "customer_system_prompt가 비어있습니다."
-                logger.error(error_msg)
-                raise ValueError(error_msg)
-            
-            logger.info(f"고객 발언 요약용 시스템 프롬프트 사용: 길이={len(customer_system_prompt)}")
-            
-            # 발언 패턴 가져오기
-            speaker_patterns = separate_config.get("speaker_patterns")
-            if speaker_patterns is None:
-                error_msg = "speaker_patterns 설정이 없습니다."
-                logger.error(error_msg)
-                raise ValueError(error_msg)
-            
-            # 패턴 가져오기 (설정에서 가져오거나 기본값 사용)
-            agent_patterns_config = speaker_patterns.get("agent")
-            customer_patterns_config = speaker_patterns.get("customer")
-            
-            # 패턴 검증 및 기본값 적용
-            agent_patterns = get_agent_patterns(agent_patterns_config)
-            customer_patterns = get_customer_patterns(customer_patterns_config)
-            
-            logger.info(f"상담사 패턴 수: {len(agent_patterns)}, 고객 패턴 수: {len(customer_patterns)}")
-            
-            # 원본 텍스트 사용 여부 확인
-            use_original_text = separate_config.get("use_original_text", False)
-            if not isinstance(use_original_text, bool):
-                use_original_text = False
-                logger.warning(f"use_original_text 값이 올바르지 않습니다: {use_original_text}, 기본값(false) 사용")
-            
-            if use_original_text:
-                logger.info("원본 텍스트 모드: 발언 분리 없이 원본 텍스트 그대로 사용")
-            else:
-                logger.info("발언 분리 모드: 상담사/고객 발언을 분리하여 사용")
-            
-            # 대괄호 안 내용 변환 (이미 []로 감싸진 것만 변환)
-            logger.info("원본 텍스트 대괄호 변환 시작")
-            logger.debug(f"원본 텍스트 (처음 300자): {text[:300]}")
-            converted_text = convert_bracketed_content(text)
-            logger.info("원본 텍스트 대괄호 변환 완료")
-            logger.debug(f"대괄호 변환 후 텍스트 (처음 300자): {converted_text[:300]}")
-            
-            # 발언 분리 또는 원본 텍스트 사용
-            if use_original_text:
-                # 원본 텍스트 그대로 사용
-                agent_text = converted_text
-                customer_text = converted_text
-                logger.info(f"원본 텍스트 사용: 길이={len(converted_text)}")
-            else:
-                # 발언 분리 (변환된 텍스트 사용)
-                logger.info("상담사 발언 추출 시작")
-                agent_text = extract_agent_utterances(converted_text, agent_patterns, customer_patterns)
-                logger.info(f"상담사 발언 추출 완료: 길이={len(agent_text)}")
-                
-                logger.info("고객 발언 추출 시작")
-                customer_text = extract_customer_utterances(converted_text, agent_patterns, customer_patterns)
-                logger.info(f"고객 발언 추출 완료: 길이={len(customer_text)}")
-            
-            # 구분자 가져오기
-            separator = separate_config.get("separator")
-            if separator is None:
-                separator = "---"
-                logger.info("구분자가 설정되지 않아 기본값 사용: ---")
-            else:
-                if not isinstance(separator, str):
-                    logger.warning(f"구분자 타입이 올바르지 않습니다. 타입={type(separator)}, 기본값 사용")
-                    separator = "---"
-                else:
-                    logger.info(f"설정된 구분자 사용: {separator[:20]}")
-            
-            # 상담사 발언 요약
-            logger.info("상담사 발언 요약 LLM 호출 시작")
-            logger.info(f"상담사 발언 텍스트 길이: {len(agent_text) if agent_text else 0}")
-            logger.debug(f"상담사 발언 텍스트 (처음 200자): {agent_text[:200] if agent_text else '(없음)'}")
-            
-            if not agent_text or not agent_text.strip():
-                logger.warning("상담사 발언이 비어있습니다. 빈 요약 반환")
-                agent_summary = ""
-            else:
-                user_prompt_agent = f"다음 상담사 발언을 요약해주세요:\n\n{agent_text}"
-                
-                try:
-                    agent_summary = await llm_client.generate(
-                        system_prompt=agent_system_prompt,
-                        user_prompt=user_prompt_agent,
-                        model_name=model_config.get("name")
-                    )
-                except Exception as e:
-                    error_msg = f"상담사 발언 요약 LLM 호출 중 예외 발생: {str(e)}"
-                    logger.error(error_msg, exc_info=True)
-                    raise
-                
-                if agent_summary is None:
-                    error_msg = "상담사 발언 요약 결과가 None입니다."
-                    logger.error(error_msg)
-                    agent_summary = ""
-                elif not isinstance(agent_summary, str):
-                    error_msg = f"상담사 발언 요약 결과 타입이 올바르지 않습니다. 타입={type(agent_summary)}"
-                    logger.error(error_msg)
-                    agent_summary = ""
-                elif not agent_summary.strip():
-                    logger.warning("상담사 발언 요약 결과가 빈 문자열입니다.")
-                    agent_summary = ""
-                else:
-                    logger.info(f"상담사 발언 요약 완료: 길이={len(agent_summary)}")
-                    logger.debug(f"상담사 발언 요약 내용:\n{agent_summary}")
-            
-            # 고객 발언 요약
-            logger.info("고객 발언 요약 LLM 호출 시작")
-            logger.info(f"고객 발언 텍스트 길이: {len(customer_text) if customer_text else 0}")
-            logger.debug(f"고객 발언 텍스트 (처음 200자): {customer_text[:200] if customer_text else '(없음)'}")
-            
-            if not customer_text or not customer_text.strip():
-                logger.warning("고객 발언이 비어있습니다. 빈 요약 반환")
-                customer_summary = ""
-            else:
-                user_prompt_customer = f"다음 고객 발언을 요약해주세요:\n\n{customer_text}"
-                
-                try:
-                    customer_summary = await llm_client.generate(
-                        system_prompt=customer_system_prompt,
-                        user_prompt=user_prompt_customer,
-                        model_name=model_config.get("name")
-                    )
-                except Exception as e:
-                    error_msg = f"고객 발언 요약 LLM 호출 중 예외 발생: {str(e)}"
-                    logger.error(error_msg, exc_info=True)
-                    raise
-                
-                if customer_summary is None:
-                    error_msg = "고객 발언 요약 결과가 None입니다."
-                    logger.error(error_msg)
-                    customer_summary = ""
-                elif not isinstance(customer_summary, str):
-                    error_msg = f"고객 발언 요약 결과 타입이 올바르지 않습니다. 타입={type(customer_summary)}"
-                    logger.error(error_msg)
-                    customer_summary = ""
-                elif not customer_summary.strip():
-                    logger.warning("고객 발언 요약 결과가 빈 문자열입니다.")
-                    customer_summary = ""
-                else:
-                    logger.info(f"고객 발언 요약 완료: 길이={len(customer_summary)}")
-                    logger.debug(f"고객 발언 요약 내용:\n{customer_summary}")
+        if prepared["separate"]:
+            # 상담사/고객 발언 요약 동시 호출
+            agent_summary, customer_summary = await _summarize_speakers_concurrently(
+                llm_client=llm_client,
+                model_name=model_config.get("name"),
+                branches=prepared["branches"],
+                branch_timeout=prepared["branch_timeout"],
+                map_reduce=prepared["map_reduce"]
+            )
             
             # 결과 병합
             # 빈 요약이 있는 경우 처리
@@ -261,7 +571,7 @@ async def execute(
             if not customer_summary or not customer_summary.strip():
                 customer_summary = "■ [고객] 고객 발언 요약\n(요약 내용 없음)"
             
-            result = f"{agent_summary}\n{separator}\n{customer_summary}"
+            result = f"{agent_summary}\n{prepared['separator']}\n{customer_summary}"
             
             # 대괄호, 중괄호, 큰따옴표 제거 (안의 텍스트는 유지)
             # [텍스트] → 텍스트, {텍스트} → 텍스트, "텍스트" → 텍스트
@@ -274,68 +584,16 @@ async def execute(
             logger.info("=" * 80)
             
         else:
-            # 기존 단일 요약 모드 (원본 전체 사용)
-            logger.info("=" * 80)
-            logger.info("기존 단일 요약 모드 시작 (원본 전체 사용)")
-            logger.info("=" * 80)
+            system_prompt = prepared["system_prompt"]
             
-            # 대괄호 안 내용 변환 (이미 []로 감싸진 것만 변환)
-            logger.info("원본 텍스트 대괄호 변환 시작")
-            converted_text = convert_bracketed_content(text)
-            logger.info("원본 텍스트 대괄호 변환 완료")
-            
-            # 구분자 가져오기 (설정에서 가져오거나 기본값 사용)
-            separator = "---"
-            if separate_config is not None:
-                separator_from_config = separate_config.get("separator")
-                if separator_from_config is not None and isinstance(separator_from_config, str):
-                    separator = separator_from_config
-                    logger.info(f"설정에서 구분자 사용: {separator[:20]}")
-                else:
-                    logger.info("설정에 구분자가 없어 기본값 사용: ---")
-            else:
-                logger.info("separate_speaker_summary 설정이 없어 기본 구분자 사용: ---")
-            
-            # 시스템 프롬프트 (요청에서 받거나 기본값 사용)
-            default_system_prompt = f"""당신은 관세청 상담내용 요약 전문가입니다. 주어진 텍스트를 요약하세요.
-
-            규칙:
-            1. 텍스트에 명시된 사실만 요약 (추론, 해석, 의도 추측 절대 금지)
-            2. 텍스트에 없는 정보는 절대 추가하지 않음
-            3. 질문과 답변을 정확히 구분하고, 상대방에게 알려준 정보는 반드시 포함 (통관번호, 운송장번호, 전화번호, 주소, 금액, 세율, 날짜 등)
-            4. 한글 숫자는 모두 아라비아 숫자로 변환하여 출력
-              - 대괄호 안: [공삼이 칠사오 구칠삼하나] → [032-745-9731]
-              - 대괄호 밖: 십이월 이십일 → 12월 21일, 오구오팔 → 5958
-              - 숫자+단위 조합은 하나의 토큰으로 인식하여 전체를 변환: 사만 칠천 엔 → 47000엔 (40000+7000), 십이만 삼천 원 → 123000원 (120000+3000)
-              - 이미 숫자/영문인 경우: [EH 0405 14658 US], [8826 5399 291] → 그대로 유지
-            5. 2~4문장으로 간결하게 작성
-
-            출력 형식:
-            ■ [고객] 고객 발언 요약
-            고객은 ??에 대해 문의하고 ??에 대해 안내받았습니다...
-            {separator}
-            
-            ■ [고객] 고객 발언 요약
-            고객은 ??에 대해 문의하고 ??에 대해 안내받았습니다...
-            """
-            
-            # 요청 데이터에서 시스템 프롬프트 가져오기
-            system_prompt = None
-            if request_data is not None:
-                system_prompt = request_data.get("system_prompt")
-            
-            if system_prompt is None or not system_prompt.strip():
-                system_prompt = default_system_prompt
-                logger.info("기본 시스템 프롬프트 사용")
-            else:
-                logger.info(f"사용자 지정 시스템 프롬프트 사용: 길이={len(system_prompt)}")
-            
-            # 유저 프롬프트 (실제 요약할 상담 내용, 변환된 텍스트 사용)
-            user_prompt = f"다음 상담 내용을 요약해주세요:\n\n{converted_text}"
-            
-            # LLM 호출
+            # LLM 호출 (토큰 예산을 넘으면 구간별 요약 후 합치기)
             logger.info(f"LLM 호출 시작: 모델={model_config.get('name')}")
             try:
+                user_prompt = prepared["user_prompt"]
+                if prepared["map_reduce"] is not None:
+                    user_prompt = await _resolve_user_prompt(
+                        llm_client, system_prompt, "상담 내용", prepared["summary_text"], model_config.get("name"), prepared["map_reduce"]
+                    )
                 result = await llm_client.generate(
                     system_prompt=system_prompt,
                     user_prompt=user_prompt,
@@ -376,3 +634,216 @@ async def execute(
     except Exception as e:
         logger.error(f"요약 파이프라인 오류: {str(e)}", exc_info=True)
         raise
+
+
+async def _stream_speaker(
+    llm_client: LLMClient,
+    label: str,
+    system_prompt: str,
+    speaker_text: str,
+    model_name: Optional[str],
+    branch_timeout: Optional[float],
+    queues: List[asyncio.Queue],
+    index: int,
+    map_reduce: Optional[Dict[str, Any]] = None
+) -> None:
+    """
+    화자별 발언 요약 스트리밍 (분리 요약 모드의 단일 브랜치)
+    
+    생성된 조각을 queues[index]에 넣고, 종료 시 None을 넣습니다.
+    실패하면 다른 브랜치를 기다리던 소비자도 즉시 알 수 있도록 모든 큐에 예외를 넣습니다.
+    
+    Args:
+        llm_client: LLM 클라이언트
+        label: 화자 이름 ("상담사" 또는 "고객")
+        system_prompt: 화자별 시스템 프롬프트
+        speaker_text: 화자 발언 텍스트
+        model_name: 모델 이름
+        branch_timeout: 브랜치 타임아웃 (초, None이면 제한 없음)
+        queues: 브랜치별 출력 큐
+        index: 이 브랜치의 큐 인덱스
+        map_reduce: 구간 분할 요약 설정 (토큰 예산을 넘으면 구간 요약 후 합치는 호출만 스트리밍)
+    """
+    queue = queues[index]
+    if not speaker_text or not speaker_text.strip():
+        logger.warning(f"{label} 발언이 비어있습니다. 빈 요약 반환")
+        queue.put_nowait(None)
+        return
+    
+    start = time.perf_counter()
+    first_token_ms: Optional[float] = None
+    
+    async def pump() -> None:
+        nonlocal first_token_ms
+        user_prompt = await _resolve_user_prompt(llm_client, system_prompt, f"{label} 발언", speaker_text, model_name, map_reduce)
+        token_stream = llm_client.stream(system_prompt=system_prompt, user_prompt=user_prompt, model_name=model_name)
+        try:
+            async for token in token_stream:
+                if first_token_ms is None:
+                    first_token_ms = (time.perf_counter() - start) * 1000
+                queue.put_nowait(token)
+        finally:
+            await token_stream.aclose()
+    
+    logger.info(f"{label} 발언 요약 LLM 스트리밍 시작: 발언 길이={len(speaker_text)}")
+    try:
+        await asyncio.wait_for(pump(), timeout=branch_timeout)
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        if isinstance(e, asyncio.TimeoutError):
+            logger.error(f"{label} 발언 요약 LLM 스트리밍 타임아웃 (제한={branch_timeout}초)")
+        else:
+            logger.error(f"{label} 발언 요약 LLM 스트리밍 중 예외 발생: {str(e)}", exc_info=True)
+        for branch_queue in queues:
+            branch_queue.put_nowait(e)
+        return
+    
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    first_token_log = f"{first_token_ms:.0f}ms" if first_token_ms is not None else "없음"
+    logger.info(f"{label} 발언 요약 LLM 스트리밍 완료: 첫 토큰={first_token_log}, 전체 소요 시간={elapsed_ms:.0f}ms")
+    queue.put_nowait(None)
+
+
+async def _stream_speakers_concurrently(
+    llm_client: LLMClient,
+    model_name: Optional[str],
+    branches: List[Tuple[str, str, str]],
+    separator: str,
+    branch_timeout: Optional[float] = None,
+    map_reduce: Optional[Dict[str, Any]] = None
+) -> AsyncIterator[str]:
+    """
+    화자별 요약을 동시에 스트리밍
+    
+    모든 브랜치를 동시에 생성하되, 출력은 branches 순서대로 이어 붙입니다.
+    첫 브랜치는 생성되는 즉시 전달되고, 다음 브랜치는 그동안 버퍼링된 내용부터 전달됩니다.
+    
+    Args:
+        llm_client: LLM 클라이언트
+        model_name: 모델 이름
+        branches: (화자 이름, 시스템 프롬프트, 발언 텍스트) 목록
+        separator: 브랜치 사이 구분자
+        branch_timeout: 브랜치별 타임아웃 (초, None이면 제한 없음)
+        map_reduce: 구간 분할 요약 설정 (None이면 구간 분할 없음)
+    
+    Yields:
+        생성된 텍스트 조각
+    """
+    queues: List[asyncio.Queue] = [asyncio.Queue() for _ in branches]
+    tasks = [
+        asyncio.create_task(
+            _stream_speaker(llm_client, label, system_prompt, speaker_text, model_name, branch_timeout, queues, index, map_reduce)
+        )
+        for index, (label, system_prompt, speaker_text) in enumerate(branches)
+    ]
+    
+    try:
+        for index, (label, _, _) in enumerate(branches):
+            if index > 0:
+                yield f"\n{separator}\n"
+            
+            # 공백만 생성된 경우 빈 요약으로 처리하기 위해 첫 유효 조각 전까지 보류
+            leading = ""
+            has_content = False
+            while True:
+                item = await queues[index].get()
+                if item is None:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                if has_content:
+                    yield item
+                elif item.strip():
+                    has_content = True
+                    yield leading + item
+                else:
+                    leading += item
+            
+            if not has_content:
+                logger.warning(f"{label} 발언 요약 결과가 빈 문자열입니다.")
+                yield f"■ [{label}] {label} 발언 요약\n(요약 내용 없음)"
+    finally:
+        # 실패 또는 클라이언트 연결 종료 시 남은 브랜치 정리
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def execute_stream(
+    text: str,
+    model_config: Dict[str, Any],
+    pipeline_config: Dict[str, Any],
+    settings: Dict[str, Any],
+    request_data: Optional[Dict[str, Any]] = None
+) -> AsyncIterator[str]:
+    """
+    파이프라인 스트리밍 실행 함수
+    
+    execute와 같은 결과를 생성된 순서대로 조각 단위로 전달합니다.
+    대괄호, 중괄호, 큰따옴표 제거는 스트리밍 중 점진적으로 적용합니다.
+    
+    Args:
+        text: 처리할 텍스트
+        model_config: 모델 설정
+        pipeline_config: 파이프라인 설정
+        settings: 전체 설정
+        request_data: 전체 요청 데이터 (추가 필드 포함)
+    
+    Yields:
+        LLM이 생성한 답변 조각 (문자열)
+    """
+    llm_type = settings.get("llm", {}).get("type", "api")
+    logger.info(f"요약 파이프라인 스트리밍 시작: LLM 타입={llm_type}, 모델={model_config.get('name')}, 입력 길이={len(text)}")
+    
+    llm_client = LLMClient(model_config, llm_type)
+    prepared = _prepare_summary(text, pipeline_config, request_data)
+    
+    if prepared["separate"]:
+        token_stream = _stream_speakers_concurrently(
+            llm_client=llm_client,
+            model_name=model_config.get("name"),
+            branches=prepared["branches"],
+            separator=prepared["separator"],
+            branch_timeout=prepared["branch_timeout"],
+            map_reduce=prepared["map_reduce"]
+        )
+    else:
+        # 토큰 예산을 넘으면 구간별 요약 후 합치는 호출만 스트리밍
+        user_prompt = prepared["user_prompt"]
+        if prepared["map_reduce"] is not None:
+            user_prompt = await _resolve_user_prompt(
+                llm_client, prepared["system_prompt"], "상담 내용", prepared["summary_text"], model_config.get("name"), prepared["map_reduce"]
+            )
+        token_stream = llm_client.stream(
+            system_prompt=prepared["system_prompt"],
+            user_prompt=user_prompt,
+            model_name=model_config.get("name")
+        )
+    
+    remover = StreamingBracketRemover()
+    start = time.perf_counter()
+    first_token_ms: Optional[float] = None
+    output_length = 0
+    try:
+        async for token in token_stream:
+            cleaned = remover.feed(token)
+            if cleaned:
+                if first_token_ms is None:
+                    first_token_ms = (time.perf_counter() - start) * 1000
+                output_length += len(cleaned)
+                yield cleaned
+        rest = remover.flush()
+        if rest:
+            output_length += len(rest)
+            yield rest
+    except Exception as e:
+        logger.error(f"요약 파이프라인 스트리밍 오류: {str(e)}", exc_info=True)
+        raise
+    finally:
+        await token_stream.aclose()
+    
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    first_token_log = f"{first_token_ms:.0f}ms" if first_token_ms is not None else "없음"
+    logger.info(f"요약 파이프라인 스트리밍 완료: 첫 토큰={first_token_log}, 전체 소요 시간={elapsed_ms:.0f}ms, 출력 길이={output_length}")
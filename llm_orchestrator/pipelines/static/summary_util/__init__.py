@@ -1,9 +1,9 @@
 """
 요약 유틸리티 모듈
 
-상담사/고객 발언 분리, 패턴 관리, STT 변환을 위한 유틸리티 모듈입니다.
+상담사/고객 발언 분리, 패턴 관리, STT 변환, 스트리밍 출력 정리, 토큰 예산 분할을 위한 유틸리티 모듈입니다.
 """
-from .split_text import extract_agent_utterances, extract_customer_utterances
+from .split_text import extract_agent_utterances, extract_customer_utterances, split_utterance_blocks
 from .speaker_patterns import (
     get_agent_patterns,
     get_customer_patterns,
@@ -15,16 +15,23 @@ from .stt_conversion import (
     convert_korean_number_to_arabic,
     KOREAN_NUMBER_MAP
 )
+from .stream_cleanup import StreamingBracketRemover
+from .token_budget import estimate_tokens, group_by_token_budget, chunk_by_token_budget
 
 __all__ = [
     'extract_agent_utterances',
     'extract_customer_utterances',
+    'split_utterance_blocks',
     'get_agent_patterns',
     'get_customer_patterns',
     'DEFAULT_AGENT_PATTERNS',
     'DEFAULT_CUSTOMER_PATTERNS',
     'convert_bracketed_content',
     'convert_korean_number_to_arabic',
-    'KOREAN_NUMBER_MAP'
+    'KOREAN_NUMBER_MAP',
+    'StreamingBracketRemover',
+    'estimate_tokens',
+    'group_by_token_budget',
+    'chunk_by_token_budget'
 ]
 
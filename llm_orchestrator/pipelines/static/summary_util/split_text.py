@@ -180,3 +180,48 @@ def extract_customer_utterances(
     
     return result
 
+
+
+def split_utterance_blocks(
+    text: str,
+    agent_patterns: List[str] = None,
+    customer_patterns: List[str] = None
+) -> List[str]:
+    """
+    발언 단위 분리 (화자 표시가 있는 줄부터 다음 화자 표시 전까지를 한 발언으로 묶음)
+    
+    긴 상담 내용을 발언 중간에서 자르지 않고 구간으로 나눌 때 사용합니다.
+    화자 표시가 없는 텍스트(화자별로 추출한 발언 등)는 줄 하나를 한 발언으로 처리합니다.
+    
+    Args:
+        text: 상담 내용 또는 화자별 발언 텍스트
+        agent_patterns: 상담사 식별 정규식 패턴 리스트 (None이면 기본값 사용)
+        customer_patterns: 고객 식별 정규식 패턴 리스트 (None이면 기본값 사용)
+    
+    Returns:
+        발언 텍스트 목록 (원래 순서 유지)
+    """
+    if not text or not text.strip():
+        return []
+    
+    speaker_patterns = []
+    for pattern in get_agent_patterns(agent_patterns) + get_customer_patterns(customer_patterns):
+        try:
+            speaker_patterns.append(re.compile(pattern))
+        except re.error as e:
+            logger.error(f"정규식 패턴 오류 (발언 분리): {pattern}, 오류={str(e)}")
+    
+    lines = [line.strip() for line in text.split('\n') if line.strip()]
+    has_speaker = any(pattern.search(line) for line in lines for pattern in speaker_patterns)
+    if not has_speaker:
+        return lines
+    
+    blocks: List[List[str]] = []
+    for line in lines:
+        if not blocks or any(pattern.search(line) for pattern in speaker_patterns):
+            blocks.append([line])
+        else:
+            blocks[-1].append(line)
+    
+    logger.debug(f"발언 단위 분리 완료: 발언 수={len(blocks)}")
+    return ['\n'.join(block) for block in blocks]
@@ -0,0 +1,93 @@
+"""
+스트리밍 출력 정리 모듈
+
+LLM 스트리밍 출력에서 대괄호, 중괄호, 큰따옴표를 점진적으로 제거합니다.
+전체 결과에 정규식 치환을 적용한 것과 동일한 결과를 생성합니다.
+"""
+from typing import List, Tuple
+
+# 제거할 문자 쌍 (적용 순서: 대괄호 → 중괄호 → 큰따옴표)
+BRACKET_PAIRS: List[Tuple[str, str]] = [("[", "]"), ("{", "}"), ('"', '"')]
+
+
+class _PairRemover:
+    r"""
+    단일 문자 쌍 제거기
+    
+    re.sub(r'\[([^\]]+?)\]', r'\1', text)와 동일하게 동작합니다.
+    닫는 문자가 아직 도착하지 않은 여는 문자부터는 다음 조각이 올 때까지 보류합니다.
+    """
+    
+    def __init__(self, opener: str, closer: str):
+        self.opener = opener
+        self.closer = closer
+        self.pending = ""
+    
+    def _process(self, text: str, final: bool) -> str:
+        """처리 가능한 부분을 변환하여 반환하고, 나머지는 pending에 보관"""
+        output: List[str] = []
+        pos = 0
+        while True:
+            start = text.find(self.opener, pos)
+            if start == -1:
+                output.append(text[pos:])
+                self.pending = ""
+                break
+            end = text.find(self.closer, start + 1)
+            if end == -1:
+                if final:
+                    # 닫는 문자가 없으면 치환 대상이 아니므로 그대로 출력
+                    output.append(text[pos:])
+                    self.pending = ""
+                else:
+                    output.append(text[pos:start])
+                    self.pending = text[start:]
+                break
+            if end == start + 1:
+                # 빈 괄호는 치환하지 않고 여는 문자 다음부터 다시 탐색
+                output.append(text[pos:start + 1])
+                pos = start + 1
+                continue
+            output.append(text[pos:start])
+            output.append(text[start + 1:end])
+            pos = end + 1
+        return "".join(output)
+    
+    def feed(self, chunk: str) -> str:
+        return self._process(self.pending + chunk, final=False)
+    
+    def flush(self) -> str:
+        return self._process(self.pending, final=True)
+
+
+class StreamingBracketRemover:
+    """대괄호, 중괄호, 큰따옴표 제거기 (스트리밍용, 안의 텍스트는 유지)"""
+    
+    def __init__(self):
+        self._removers = [_PairRemover(opener, closer) for opener, closer in BRACKET_PAIRS]
+    
+    def feed(self, chunk: str) -> str:
+        """
+        텍스트 조각 입력
+        
+        Args:
+            chunk: LLM 출력 조각
+        
+        Returns:
+            지금까지 확정된 정리 결과 (보류 중인 부분 제외)
+        """
+        for remover in self._removers:
+            chunk = remover.feed(chunk)
+        return chunk
+    
+    def flush(self) -> str:
+        """
+        보류 중인 텍스트를 모두 처리하여 반환 (스트림 종료 시 호출)
+        
+        Returns:
+            남은 정리 결과
+        """
+        output = ""
+        for remover in self._removers:
+            output = remover.feed(output) + remover.flush()
+        return output
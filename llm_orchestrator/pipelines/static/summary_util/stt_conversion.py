@@ -3,9 +3,11 @@ STT 텍스트 변환 모듈
 
 목표:
 - [] 안의 내용을 숫자/영문으로 변환 (이미 []로 감싸진 것만)
+
+숫자/알파벳 발음 단어는 모듈 로드 시 만든 트라이로 한 번에 분해합니다 (가장 긴 단어부터 일치).
 """
 import re
-from typing import Dict
+from typing import Dict, List, Optional, Tuple
 from core.logger import get_logger
 
 logger = get_logger(__name__)
@@ -36,6 +38,8 @@ KOREAN_NUMBER_MAP: Dict[str, str] = {
     "백": "100",
     "천": "1000",
     "만": "10000",
+    "억": "100000000",
+    "조": "1000000000000",
 }
 
 KOREAN_ALPHABET_MAP: Dict[str, str] = {
@@ -68,66 +72,142 @@ KOREAN_ALPHABET_MAP: Dict[str, str] = {
 }
 
 
-def convert_korean_number_to_arabic(korean_number: str) -> int:
-    if not korean_number or not korean_number.strip():
-        return 0
+# 단위 (십/백/천은 만 단위 안의 자리, 만/억/조는 네 자리마다 올라가는 큰 단위)
+SMALL_NUMBER_UNITS: Dict[str, int] = {"십": 10, "백": 100, "천": 1000}
+LARGE_NUMBER_UNITS: Dict[str, int] = {"만": 10 ** 4, "억": 10 ** 8, "조": 10 ** 12}
+NUMBER_UNITS = {**SMALL_NUMBER_UNITS, **LARGE_NUMBER_UNITS}
 
-    s = korean_number.strip().replace(" ", "")
+_DIGITS_RE = re.compile(r"\d+")
+_BRACKET_RE = re.compile(r"\[([^\]]+)\]")
+_UPPER_ALPHABET_RE = re.compile(r"[A-Z]+")
 
-    # 단위 없는 순차 숫자(공사공오/일사육...)
-    if not any(u in s for u in ("십", "백", "천", "만")):
-        digits = []
-        remaining = s
-        while remaining:
-            matched = False
-            for k, a in sorted(KOREAN_NUMBER_MAP.items(), key=lambda x: len(x[0]), reverse=True):
-                if k in ("십", "백", "천", "만"):
-                    continue
-                if remaining.startswith(k):
-                    digits.append(a)
-                    remaining = remaining[len(k) :]
-                    matched = True
-                    break
-            if not matched:
-                break
-        return int("".join(digits)) if digits else 0
 
-    total = 0
-    section = 0
-    num = 0
+class _TrieNode:
+    """한글 숫자/알파벳 발음 트라이 노드 (number/alphabet: 이 노드에서 끝나는 단어, 없으면 None)"""
 
-    def one_if_empty(x: int) -> int:
-        return x if x != 0 else 1
+    __slots__ = ("children", "number", "alphabet")
 
-    i = 0
-    while i < len(s):
-        ch = s[i]
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.number: Optional[str] = None
+        self.alphabet: Optional[str] = None
 
-        if ch in KOREAN_NUMBER_MAP and ch not in ("십", "백", "천", "만"):
-            num = int(KOREAN_NUMBER_MAP[ch])
-            i += 1
-            continue
 
-        if ch in ("십", "백", "천"):
-            unit = {"십": 10, "백": 100, "천": 1000}[ch]
-            section += one_if_empty(num) * unit
-            num = 0
+def _build_trie() -> _TrieNode:
+    """KOREAN_NUMBER_MAP과 KOREAN_ALPHABET_MAP을 합친 트라이 (모듈 로드 시 한 번 생성)"""
+    root = _TrieNode()
+    for words, attr in ((KOREAN_NUMBER_MAP, "number"), (KOREAN_ALPHABET_MAP, "alphabet")):
+        for word in words:
+            node = root
+            for ch in word:
+                node = node.children.setdefault(ch, _TrieNode())
+            setattr(node, attr, word)
+    return root
+
+
+_TRIE = _build_trie()
+
+
+def _scan(s: str) -> Tuple[Optional[List[str]], Optional[List[str]]]:
+    """
+    문자열을 한글 숫자 단어와 알파벳 발음 단어로 동시에 분해 (각각 가장 긴 단어부터 일치)
+
+    숫자/알파벳 분해 위치가 같으면 트라이를 한 번만 따라가고, 한쪽 분해가 실패하면 나머지 한쪽만 계속합니다.
+
+    Returns:
+        (숫자 단어 목록, 알파벳 발음 단어 목록), 문자열 전체를 분해하지 못한 쪽은 None
+    """
+    length = len(s)
+    numbers: Optional[List[str]] = []
+    letters: Optional[List[str]] = []
+    number_pos = alphabet_pos = 0
+    while (numbers is not None and number_pos < length) or (letters is not None and alphabet_pos < length):
+        if numbers is not None and number_pos < length:
+            pos = number_pos if letters is None or alphabet_pos >= length else min(number_pos, alphabet_pos)
+        else:
+            pos = alphabet_pos
+        # pos에서 시작하는 가장 긴 숫자 단어/알파벳 발음 단어
+        node = _TRIE
+        number_word = alphabet_word = None
+        i = pos
+        while i < length:
+            node = node.children.get(s[i])
+            if node is None:
+                break
+            i += 1
+            if node.number is not None:
+                number_word = node.number
+            if node.alphabet is not None:
+                alphabet_word = node.alphabet
+        if numbers is not None and number_pos == pos:
+            if number_word is None:
+                numbers = None
+            else:
+                numbers.append(number_word)
+                number_pos += len(number_word)
+        if letters is not None and alphabet_pos == pos:
+            if alphabet_word is None:
+                letters = None
+            else:
+                letters.append(alphabet_word)
+                alphabet_pos += len(alphabet_word)
+    return numbers, letters
+
+
+def _number_prefix(s: str) -> List[str]:
+    """문자열 앞부분의 한글 숫자 단어 목록 (숫자가 아닌 글자를 만나면 중단)"""
+    words: List[str] = []
+    pos = 0
+    while pos < len(s):
+        node = _TRIE
+        word = None
+        i = pos
+        while i < len(s):
+            node = node.children.get(s[i])
+            if node is None:
+                break
             i += 1
-            continue
+            if node.number is not None:
+                word = node.number
+        if word is None:
+            break
+        words.append(word)
+        pos += len(word)
+    return words
+
+
+def _number_value(words: List[str]) -> int:
+    """
+    숫자 단어 목록의 값
+
+    단위가 없으면 자리 숫자를 이어 붙이고 (공사공오 -> 4005),
+    단위가 있으면 만/억/조 단위 구간마다 십/백/천 자리를 더합니다 (삼억이천오백만 -> 325000000).
+    """
+    if not any(word in NUMBER_UNITS for word in words):
+        return int("".join(KOREAN_NUMBER_MAP[word] for word in words)) if words else 0
 
-        if ch == "만":
-            section += one_if_empty(num)
-            total += section * 10000
+    total = 0
+    section = 0
+    num = 0
+    for word in words:
+        if word in SMALL_NUMBER_UNITS:
+            section += (num or 1) * SMALL_NUMBER_UNITS[word]
+            num = 0
+        elif word in LARGE_NUMBER_UNITS:
+            total += (section + num or 1) * LARGE_NUMBER_UNITS[word]
             section = 0
             num = 0
-            i += 1
-            continue
+        else:
+            num = int(KOREAN_NUMBER_MAP[word])
+    return total + section + num
+
 
-        break
+def convert_korean_number_to_arabic(korean_number: str) -> int:
+    if not korean_number or not korean_number.strip():
+        return 0
 
-    section += num
-    total += section
-    return total
+    s = korean_number.strip().replace(" ", "")
+    return _number_value(_number_prefix(s))
 
 
 def can_convert_to_alphabet(t: str) -> bool:
@@ -135,40 +215,14 @@ def can_convert_to_alphabet(t: str) -> bool:
     t_clean = t.replace(" ", "")
     if not t_clean:
         return False
-
-    remaining = t_clean
-    sorted_map = sorted(KOREAN_ALPHABET_MAP.items(), key=lambda x: len(x[0]), reverse=True)
-
-    while remaining:
-        matched = False
-        for korean, _english in sorted_map:
-            if remaining.startswith(korean):
-                remaining = remaining[len(korean):]
-                matched = True
-                break
-        if not matched:
-            return False
-    return True
+    return _scan(t_clean)[1] is not None
 
 def can_convert_to_number(t: str) -> bool:
     """문자열 전체가 한글 숫자로만 변환 가능한지 체크"""
     t_clean = t.replace(" ", "")
     if not t_clean:
         return False
-    
-    remaining = t_clean
-    sorted_map = sorted(KOREAN_NUMBER_MAP.items(), key=lambda x: len(x[0]), reverse=True)
-    
-    while remaining:
-        matched = False
-        for korean, _arabic in sorted_map:
-            if remaining.startswith(korean):
-                remaining = remaining[len(korean):]
-                matched = True
-                break
-        if not matched:
-            return False
-    return True
+    return _scan(t_clean)[0] is not None
 
 
 def convert_bracketed_content(text: str) -> str:
@@ -191,50 +245,34 @@ def convert_bracketed_content(text: str) -> str:
         raw = single_content
         s = raw.strip()
         s_nospace = s.replace(" ", "")
+        if not s_nospace:
+            return raw
 
         # 이미 숫자/영문이면 그대로
-        if re.fullmatch(r"\d+", s_nospace):
+        if _DIGITS_RE.fullmatch(s_nospace):
             return raw
-        if re.fullmatch(r"[A-Z]+", s_nospace):
+        if _UPPER_ALPHABET_RE.fullmatch(s_nospace):
             return raw
 
-        # 1) 숫자로 전체 변환 가능한지 체크
-        if can_convert_to_number(s):
-            # 단위 있는 수사면 파서로
-            has_units = any(u in s_nospace for u in ("만", "천", "백", "십"))
-            if has_units:
-                out = str(convert_korean_number_to_arabic(s))
+        # 숫자/영문 분해를 한 번에 수행 (숫자 우선)
+        numbers, letters = _scan(s_nospace)
+
+        # 1) 숫자로 전체 변환 가능
+        if numbers is not None:
+            if any(word in NUMBER_UNITS for word in numbers):
+                # 단위 있는 수사
+                out = str(_number_value(numbers))
                 logger.info(f"[] 숫자(단위) 변환: [{raw}] -> [{out}]")
                 return out
-            
+
             # 단위 없는 순차 숫자: 앞자리 0 유지해야 하므로 직접 이어붙이기
-            digits = []
-            remaining = s_nospace
-            for _ in range(len(remaining) + 1):
-                if not remaining:
-                    break
-                matched = False
-                for k, a in sorted(KOREAN_NUMBER_MAP.items(), key=lambda x: len(x[0]), reverse=True):
-                    if k in ("십", "백", "천", "만"):
-                        continue
-                    if remaining.startswith(k):
-                        digits.append(a)
-                        remaining = remaining[len(k):]
-                        matched = True
-                        break
-                if not matched:
-                    break
-
-            if digits:
-                out = "".join(digits)
-                logger.info(f"[] 숫자(순차) 변환: [{raw}] -> [{out}]")
-                return out
+            out = "".join(KOREAN_NUMBER_MAP[word] for word in numbers)
+            logger.info(f"[] 숫자(순차) 변환: [{raw}] -> [{out}]")
+            return out
 
-        # 2) 영문으로 전체 변환 가능한지 체크
-        if can_convert_to_alphabet(s):
-            out = s
-            for korean, english in sorted(KOREAN_ALPHABET_MAP.items(), key=lambda x: len(x[0]), reverse=True):
-                out = out.replace(korean, english)
+        # 2) 영문으로 전체 변환 가능
+        if letters is not None:
+            out = "".join(KOREAN_ALPHABET_MAP[word] for word in letters)
             logger.info(f"[] 영문 변환: [{raw}] -> [{out}]")
             return out
 
@@ -253,7 +291,7 @@ def convert_bracketed_content(text: str) -> str:
 
         return "[" + convert_single_content(inside) + "]"
 
-    return re.sub(r"\[([^\]]+)\]", repl, text)
+    return _BRACKET_RE.sub(repl, text)
 
 
 def merge_phone_blocks(text: str) -> str:
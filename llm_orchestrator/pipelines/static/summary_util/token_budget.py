@@ -0,0 +1,110 @@
+"""
+토큰 예산 모듈
+
+토크나이저 서비스 없이 텍스트의 토큰 수를 추정하고,
+토큰 예산을 넘는 텍스트를 발언 단위 구간으로 나누는 기능을 제공합니다.
+"""
+import math
+import re
+from typing import List
+
+# 글자 하나가 1토큰 이상으로 나뉘는 문자 (한글, 한글 자모, 한자, 가나, 숫자)
+# 숫자는 토크나이저에 따라 자리마다 1토큰으로 나뉘므로 보수적으로 글자당 1토큰으로 계산
+WIDE_CHAR_PATTERN = re.compile(r'[\u1100-\u11ff\u3130-\u318f\uac00-\ud7a3\u3040-\u30ff\u4e00-\u9fff0-9]')
+WHITESPACE_PATTERN = re.compile(r'\s')
+
+# 영문/기호의 토큰당 평균 글자 수
+ASCII_CHARS_PER_TOKEN = 4.0
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    토큰 수 추정 (실제보다 약간 많게 추정)
+    
+    Args:
+        text: 텍스트
+    
+    Returns:
+        추정 토큰 수
+    """
+    if not text:
+        return 0
+    wide = len(WIDE_CHAR_PATTERN.findall(text))
+    whitespace = len(WHITESPACE_PATTERN.findall(text))
+    other = max(0, len(text) - wide - whitespace)
+    return wide + math.ceil(other / ASCII_CHARS_PER_TOKEN)
+
+
+def _split_oversized(block: str, token_budget: int) -> List[str]:
+    """
+    예산을 넘는 발언 하나를 줄 단위로, 줄 하나도 넘으면 글자 수 비율로 나눔
+    
+    Args:
+        block: 발언 텍스트
+        token_budget: 구간별 토큰 예산
+    
+    Returns:
+        나눈 텍스트 목록 (각각 예산 이내)
+    """
+    pieces: List[str] = []
+    for line in block.split('\n'):
+        tokens = estimate_tokens(line)
+        if tokens <= token_budget:
+            if line.strip():
+                pieces.append(line)
+            continue
+        size = max(1, len(line) * token_budget // tokens)
+        pieces.extend(line[start:start + size] for start in range(0, len(line), size))
+    return pieces
+
+
+def group_by_token_budget(items: List[str], token_budget: int, joiner_tokens: int = 1) -> List[List[str]]:
+    """
+    텍스트 목록을 순서대로 토큰 예산 이내의 묶음으로 나눔
+    
+    항목 중간에서는 나누지 않으며, 항목 하나가 예산을 넘는 경우에만 줄/글자 단위로 나눕니다.
+    
+    Args:
+        items: 텍스트 목록 (발언, 구간 요약 등)
+        token_budget: 묶음별 토큰 예산
+        joiner_tokens: 항목 사이 구분 문자열의 토큰 수
+    
+    Returns:
+        묶음 목록 (각 묶음은 텍스트 목록)
+    """
+    groups: List[List[str]] = []
+    current: List[str] = []
+    current_tokens = 0
+    
+    for item in items:
+        tokens = estimate_tokens(item)
+        parts = [item] if tokens <= token_budget else _split_oversized(item, token_budget)
+        for part in parts:
+            part_tokens = tokens if len(parts) == 1 else estimate_tokens(part)
+            if current and current_tokens + joiner_tokens + part_tokens > token_budget:
+                groups.append(current)
+                current = []
+                current_tokens = 0
+            if current:
+                current_tokens += joiner_tokens
+            current.append(part)
+            current_tokens += part_tokens
+    
+    if current:
+        groups.append(current)
+    return groups
+
+
+def chunk_by_token_budget(blocks: List[str], token_budget: int, joiner: str = '\n') -> List[str]:
+    """
+    발언 목록을 순서대로 이어 붙여 토큰 예산 이내의 구간으로 묶음
+    
+    Args:
+        blocks: 발언 텍스트 목록
+        token_budget: 구간별 토큰 예산
+        joiner: 발언 사이 구분 문자열
+    
+    Returns:
+        구간 텍스트 목록
+    """
+    return [joiner.join(group) for group in group_by_token_budget(blocks, token_budget, estimate_tokens(joiner))]
@@ -4,20 +4,222 @@
 FastAPI 라우터 및 파이프라인 엔드포인트를 정의합니다.
 다양한 형태의 요청을 받아 LLM 답변(문자열)을 반환합니다.
 """
+import asyncio
+import time
+from collections import Counter
+from contextlib import AsyncExitStack
 from fastapi import APIRouter, Request, HTTPException
-from fastapi.responses import PlainTextResponse
-from typing import Dict, Any
+from fastapi.responses import PlainTextResponse, StreamingResponse, Response
+from starlette.background import BackgroundTask
+from typing import Dict, Any, Optional, Tuple, Callable, Awaitable, AsyncIterator
 
 from core.engine_registry import get_engine_registry
 from core.pipeline_manager import get_pipeline_manager
+from core.admission import get_admission_controller, AdmissionRejected, AdmissionTicket
+from core.http_pool import get_http_pool_manager
+from core.hedging import get_hedge_manager
+from core.circuit_breaker import get_circuit_breaker_manager, CircuitOpenError
+from core.load_balancer import get_load_balancer_manager
+from core.response_cache import get_response_cache
+from core.micro_batcher import get_micro_batch_manager
+from core.concurrency_limiter import get_concurrency_limiter_manager
+from core.ollama import get_ollama_manager
+from core.health_prober import get_health_prober
+from core.deadline import get_deadline_manager, deadline_scope, new_deadline, use_deadline, DeadlineExceeded
+from core.json_codec import get_json_codec
 from core.logger import get_logger
 
 router = APIRouter()
 logger = get_logger(__name__)
 
 
+def _resolve_pipeline(
+    pipeline_name: Optional[str]
+) -> Tuple[str, str, Dict[str, Any], Callable[..., Awaitable[Any]], Callable[..., AsyncIterator[str]]]:
+    """
+    파이프라인 모드에 따라 파이프라인/모델 설정과 실행 함수 조회
+    
+    Args:
+        pipeline_name: 파이프라인 이름 (None이면 기본 파이프라인)
+    
+    Returns:
+        (파이프라인 이름, 모델 지정, 모델 설정, 실행 함수, 스트리밍 실행 함수)
+    
+    Raises:
+        HTTPException: 파이프라인/모델을 찾을 수 없거나 설정이 올바르지 않은 경우
+    """
+    engine_registry = get_engine_registry()
+    pipeline_manager = get_pipeline_manager()
+    
+    # 파이프라인 모드 확인
+    pipeline_mode = pipeline_manager.pipeline_config.get("mode", "static")
+    
+    if pipeline_mode == "static":
+        # 정적 파이프라인 처리
+        static_config = pipeline_manager.pipeline_config.get("static", {})
+        
+        if not static_config.get("enabled", True):
+            raise HTTPException(status_code=400, detail="정적 파이프라인이 비활성화되어 있습니다.")
+        
+        # 파이프라인 이름이 지정되지 않으면 기본 파이프라인 사용
+        if pipeline_name is None:
+            pipeline_name = static_config.get("default_pipeline")
+        
+        # 파이프라인 조회
+        pipeline_config = pipeline_manager.get_pipeline(pipeline_name)
+        if pipeline_config is None:
+            raise HTTPException(status_code=404, detail=f"파이프라인을 찾을 수 없습니다: {pipeline_name}")
+        
+        # 파이프라인 실행 함수 (전체 요청 본문과 설정 전달)
+        execute_func = pipeline_manager.execute_pipeline
+        stream_func = pipeline_manager.stream_pipeline
+    
+    elif pipeline_mode == "dynamic":
+        # 동적 파이프라인 처리 (스테이지 그래프)
+        dynamic_config = pipeline_manager.pipeline_config.get("dynamic", {})
+        
+        if not dynamic_config.get("enabled", False):
+            raise HTTPException(status_code=400, detail="동적 파이프라인이 비활성화되어 있습니다.")
+        
+        # 파이프라인 이름이 지정되지 않으면 기본 파이프라인 사용
+        if pipeline_name is None:
+            pipeline_name = dynamic_config.get("default_pipeline")
+        
+        # 파이프라인 조회
+        pipeline_config = pipeline_manager.get_dynamic_pipeline(pipeline_name)
+        if pipeline_config is None:
+            raise HTTPException(status_code=404, detail=f"동적 파이프라인을 찾을 수 없습니다: {pipeline_name}")
+        
+        # 동적 파이프라인 실행 함수
+        execute_func = pipeline_manager.execute_dynamic_pipeline
+        stream_func = pipeline_manager.stream_dynamic_pipeline
+    
+    else:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 파이프라인 모드입니다: {pipeline_mode}")
+    
+    # 모델 설정 조회
+    # 파이프라인 설정의 model 필드 사용 ("{type}:{model_name}" 형식 필수)
+    model_spec = pipeline_config.get("model")
+    if model_spec is None:
+        raise HTTPException(status_code=400, detail=f"파이프라인 '{pipeline_name}'에 모델이 지정되지 않았습니다. 형식: '{{type}}:{{model_name}}' (예: 'vllm:base_clova')")
+    
+    logger.info(f"파이프라인 라우터: 모드={pipeline_mode}, 파이프라인={pipeline_name}, 모델 지정={model_spec}")
+    
+    try:
+        model_config = engine_registry.get_model_config(model_spec)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    if model_config is None:
+        raise HTTPException(status_code=404, detail=f"모델을 찾을 수 없습니다: 모델 지정={model_spec}")
+    logger.info(f"파이프라인 라우터: 모델 설정={model_config.get('name')}, 타입={model_config.get('provider')}")
+    
+    return pipeline_name, model_spec, model_config, execute_func, stream_func
+
+
+async def _execute_request(body: Dict[str, Any]) -> Tuple[str, AdmissionTicket, float, Dict[str, Any]]:
+    """
+    요청 본문 하나를 파이프라인으로 처리
+    
+    Args:
+        body: 요청 본문 (text, pipeline_name 및 추가 필드)
+    
+    Returns:
+        (LLM 답변 문자열, 어드미션 정보, 실행 시간 ms, 실행 정보(served_model: 처리 모델))
+    
+    Raises:
+        HTTPException: 파이프라인/모델 조회 실패
+        AdmissionRejected: 어드미션 제한 초과
+    """
+    # 필드 추출 (검증은 Spring Boot 서버에서 이미 수행)
+    text = body.get("text", "")
+    pipeline_name, model_spec, model_config, execute_func, _ = _resolve_pipeline(body.get("pipeline_name"))
+    
+    # 어드미션 컨트롤 (파이프라인/모델별 동시 실행 수 및 대기열 제한, 모델은 기본 모델 기준)
+    admission_controller = get_admission_controller()
+    run_info: Dict[str, Any] = {}
+    async with admission_controller.admit(pipeline_name, model_spec) as ticket:
+        result = await execute_func(
+            pipeline_name=pipeline_name,
+            text=text,
+            model_config=model_config,
+            request_data=body,  # 전체 요청 데이터 전달
+            run_info=run_info
+        )
+        exec_ms = ticket.exec_ms
+    
+    result_str = str(result) if result is not None else ""
+    return result_str, ticket, exec_ms, run_info
+
+
+def _circuit_open_http_exception(e: CircuitOpenError) -> HTTPException:
+    """서킷 open을 HTTP 예외(503 + Retry-After)로 변환"""
+    logger.warning(f"파이프라인 라우터: 백엔드 서킷 open - {e.base_url}, Retry-After={e.retry_after}")
+    return HTTPException(
+        status_code=503,
+        detail=f"LLM 백엔드를 일시적으로 사용할 수 없습니다: {e.base_url}",
+        headers={"Retry-After": str(e.retry_after)}
+    )
+
+
+def _deadline_http_exception(e: DeadlineExceeded) -> HTTPException:
+    """요청 기한 초과를 HTTP 예외(504)로 변환"""
+    get_deadline_manager().record_exceeded(e.stage)
+    return HTTPException(status_code=504, detail=f"요청 기한 안에 처리하지 못했습니다: {e.stage}")
+
+
+async def _wait_disconnect(request: Request) -> None:
+    """클라이언트 연결 종료(http.disconnect)까지 대기 (요청 본문을 모두 읽은 뒤 호출)"""
+    while True:
+        message = await request.receive()
+        if message["type"] == "http.disconnect":
+            return
+
+
+async def _run_until_disconnected(request: Request, awaitable: Awaitable[Any]) -> Any:
+    """
+    클라이언트 연결이 유지되는 동안만 처리 실행
+    
+    연결이 끊기면 처리 태스크를 취소하여 진행 중인 LLM 요청(HTTP 연결)을 닫습니다.
+    
+    Args:
+        request: 요청 (본문을 이미 읽은 상태)
+        awaitable: 처리 작업
+    
+    Returns:
+        처리 결과
+    
+    Raises:
+        HTTPException: 클라이언트 연결이 끊긴 경우 (499, 응답은 전달되지 않음)
+    """
+    task = asyncio.ensure_future(awaitable)
+    watcher = asyncio.create_task(_wait_disconnect(request))
+    try:
+        await asyncio.wait((task, watcher), return_when=asyncio.FIRST_COMPLETED)
+        if task.done():
+            return task.result()
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        get_deadline_manager().record_disconnect(request.url.path)
+        raise HTTPException(status_code=499, detail="클라이언트 연결이 끊겨 처리를 취소했습니다.")
+    finally:
+        watcher.cancel()
+        if not task.done():
+            task.cancel()
+
+
+def _admission_http_exception(e: AdmissionRejected) -> HTTPException:
+    """어드미션 거절을 HTTP 예외(429/503 + Retry-After)로 변환"""
+    logger.warning(f"파이프라인 라우터: 요청 거절 - {e.key}, 사유={e.reason}, Retry-After={e.retry_after}")
+    return HTTPException(
+        status_code=e.status_code,
+        detail=f"요청이 많아 처리할 수 없습니다: {e.key} ({e.reason})",
+        headers={"Retry-After": str(e.retry_after)}
+    )
+
+
 @router.post("/process", response_class=PlainTextResponse)
-async def process(request: Request) -> str:
+async def process(request: Request) -> PlainTextResponse:
     """
     LLM 처리 요청
     
@@ -25,80 +227,36 @@ async def process(request: Request) -> str:
     응답 필드 구성은 Spring Boot 서버에서 처리합니다.
     
     PlainTextResponse를 사용하여 JSON 직렬화 없이 순수 문자열로 반환합니다.
+    
+    요청 기한 헤더(기본 X-Request-Timeout-Ms, 남은 시간 ms)가 있으면 그 안에서만 처리하고 (초과 시 504),
+    처리 중 클라이언트 연결이 끊기면 진행 중인 LLM 요청을 취소합니다.
     """
     try:
-        # 요청 본문을 Dict로 파싱
-        body = await request.json()
-        
-        # 필드 추출 (검증은 Spring Boot 서버에서 이미 수행)
-        text = body.get("text", "")
-        pipeline_name = body.get("pipeline_name")
-        
-        engine_registry = get_engine_registry()
-        pipeline_manager = get_pipeline_manager()
-        
-        # 파이프라인 모드 확인
-        pipeline_mode = pipeline_manager.pipeline_config.get("mode", "static")
-        
-        if pipeline_mode == "static":
-            # 정적 파이프라인 처리
-            static_config = pipeline_manager.pipeline_config.get("static", {})
-            
-            if not static_config.get("enabled", True):
-                raise HTTPException(status_code=400, detail="정적 파이프라인이 비활성화되어 있습니다.")
-            
-            # 파이프라인 이름이 지정되지 않으면 기본 파이프라인 사용
-            if pipeline_name is None:
-                pipeline_name = static_config.get("default_pipeline")
-            
-            # 파이프라인 조회
-            pipeline_config = pipeline_manager.get_pipeline(pipeline_name)
-            if pipeline_config is None:
-                raise HTTPException(status_code=404, detail=f"파이프라인을 찾을 수 없습니다: {pipeline_name}")
-            
-            # 모델 설정 조회
-            # 파이프라인 설정의 model 필드 사용 ("{type}:{model_name}" 형식 필수)
-            model_spec = pipeline_config.get("model")
-            if model_spec is None:
-                raise HTTPException(status_code=400, detail=f"파이프라인 '{pipeline_name}'에 모델이 지정되지 않았습니다. 형식: '{{type}}:{{model_name}}' (예: 'vllm:base_clova')")
-            
-            logger.info(f"파이프라인 라우터: 파이프라인={pipeline_name}, 모델 지정={model_spec}")
-            
-            try:
-                model_config = engine_registry.get_model_config(model_spec)
-            except ValueError as e:
-                raise HTTPException(status_code=400, detail=str(e))
-            
-            if model_config is None:
-                raise HTTPException(status_code=404, detail=f"모델을 찾을 수 없습니다: 모델 지정={model_spec}")
-            logger.info(f"파이프라인 라우터: 모델 설정={model_config.get('name')}, 타입={model_config.get('provider')}")
-            
-            # 파이프라인 실행 (전체 요청 본문과 설정 전달)
-            result = await pipeline_manager.execute_pipeline(
-                pipeline_name=pipeline_name,
-                text=text,
-                model_config=model_config,
-                request_data=body  # 전체 요청 데이터 전달
-            )
-            
-        elif pipeline_mode == "dynamic":
-            # 동적 파이프라인 처리 (미구현)
-            dynamic_config = pipeline_manager.pipeline_config.get("dynamic", {})
-            
-            if not dynamic_config.get("enabled", False):
-                raise HTTPException(status_code=400, detail="동적 파이프라인이 비활성화되어 있습니다.")
-            
-            raise HTTPException(status_code=501, detail="동적 파이프라인은 아직 구현되지 않았습니다.")
+        # 요청 본문을 Dict로 파싱 (bytes를 그대로 디코딩)
+        body = get_json_codec().loads(await request.body())
         
-        else:
-            raise HTTPException(status_code=400, detail=f"지원하지 않는 파이프라인 모드입니다: {pipeline_mode}")
+        with deadline_scope(get_deadline_manager().request_timeout(request.headers)):
+            result_str, ticket, exec_ms, run_info = await _run_until_disconnected(request, _execute_request(body))
+        served_model = run_info.get("served_model", "")
         
         # LLM 답변(문자열) 반환
         # PlainTextResponse를 사용하여 JSON 직렬화 없이 순수 문자열로 반환
-        result_str = str(result) if result is not None else ""
-        logger.info(f"파이프라인 라우터: 응답 반환 - 길이={len(result_str)}")
-        return result_str
+        logger.info(f"파이프라인 라우터: 응답 반환 - 길이={len(result_str)}, 처리 모델={served_model}, 대기 시간={ticket.queue_wait_ms:.0f}ms, 실행 시간={exec_ms:.0f}ms")
+        return PlainTextResponse(
+            result_str,
+            headers={
+                "X-Queue-Wait-Ms": f"{ticket.queue_wait_ms:.0f}",
+                "X-Exec-Time-Ms": f"{exec_ms:.0f}",
+                "X-Served-Model": served_model
+            }
+        )
         
+    except AdmissionRejected as e:
+        raise _admission_http_exception(e)
+    except CircuitOpenError as e:
+        raise _circuit_open_http_exception(e)
+    except DeadlineExceeded as e:
+        raise _deadline_http_exception(e)
     except HTTPException:
         raise
     except Exception as e:
@@ -106,12 +264,370 @@ async def process(request: Request) -> str:
         raise HTTPException(status_code=500, detail=f"처리 중 오류가 발생했습니다: {str(e)}")
 
 
+def _sse_event(data: Dict[str, Any], event: Optional[str] = None) -> str:
+    """SSE 이벤트 문자열 생성 (data는 JSON 한 줄)"""
+    prefix = f"event: {event}\n" if event else ""
+    return f"{prefix}data: {get_json_codec().dumps_str(data)}\n\n"
+
+
+@router.post("/process/stream")
+async def process_stream(request: Request) -> StreamingResponse:
+    """
+    LLM 스트리밍 처리 요청 (Server-Sent Events)
+    
+    /process와 같은 요청 본문을 받아 생성되는 토큰을 즉시 전달합니다.
+    
+    이벤트:
+        data: {"token": "..."}                 생성된 텍스트 조각 (반복)
+        event: done / data: {...}             완료 (출력 길이, 처리 모델, 대기/첫 토큰/실행 시간 ms)
+        event: error / data: {"error": "..."} 스트리밍 중 오류
+    
+    파이프라인 조회 실패와 어드미션 거절은 스트림 시작 전에 HTTP 오류(4xx/503)로 응답합니다.
+    요청 기한(헤더 또는 파이프라인 설정)이 지나면 error 이벤트로 끝내고,
+    클라이언트 연결이 끊기면 백엔드 스트림을 닫아 vLLM이 생성을 중단하도록 합니다.
+    """
+    try:
+        body = get_json_codec().loads(await request.body())
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"요청 본문을 파싱할 수 없습니다: {str(e)}")
+    
+    text = body.get("text", "")
+    pipeline_name, model_spec, model_config, _, stream_func = _resolve_pipeline(body.get("pipeline_name"))
+    # 요청 기한은 요청을 받은 시점부터 계산 (스트림은 응답을 시작한 뒤 실행)
+    deadline = new_deadline(get_deadline_manager().request_timeout(request.headers))
+    
+    # 어드미션 슬롯은 응답 시작 전에 획득하고, 스트림이 끝나거나 클라이언트 연결이 끊기면 반환
+    exit_stack = AsyncExitStack()
+    try:
+        ticket = await exit_stack.enter_async_context(get_admission_controller().admit(pipeline_name, model_spec))
+    except AdmissionRejected as e:
+        raise _admission_http_exception(e)
+    
+    async def sse_events() -> AsyncIterator[str]:
+        with use_deadline(deadline):
+            first_token_ms: Optional[float] = None
+            length = 0
+            run_info: Dict[str, Any] = {}
+            token_stream = stream_func(
+                pipeline_name=pipeline_name,
+                text=text,
+                model_config=model_config,
+                request_data=body,  # 전체 요청 데이터 전달
+                run_info=run_info
+            )
+            try:
+                async for token in token_stream:
+                    if not token:
+                        continue
+                    if first_token_ms is None:
+                        first_token_ms = ticket.exec_ms
+                    length += len(token)
+                    yield _sse_event({"token": token})
+                
+                exec_ms = ticket.exec_ms
+                served_model = run_info.get("served_model")
+                logger.info(f"파이프라인 라우터: 스트리밍 완료 - 길이={length}, 처리 모델={served_model}, 대기 시간={ticket.queue_wait_ms:.0f}ms, 첫 토큰={first_token_ms or 0:.0f}ms, 실행 시간={exec_ms:.0f}ms")
+                yield _sse_event({
+                    "length": length,
+                    "served_model": served_model,
+                    "queue_wait_ms": round(ticket.queue_wait_ms, 1),
+                    "first_token_ms": round(first_token_ms, 1) if first_token_ms is not None else None,
+                    "exec_ms": round(exec_ms, 1)
+                }, event="done")
+            except DeadlineExceeded as e:
+                get_deadline_manager().record_exceeded(e.stage)
+                yield _sse_event({"error": f"요청 기한 안에 처리하지 못했습니다: {e.stage}"}, event="error")
+            except asyncio.CancelledError:
+                # 클라이언트 연결 종료 (finally에서 백엔드 스트림을 닫아 vLLM 생성 중단)
+                get_deadline_manager().record_disconnect(request.url.path)
+                raise
+            except Exception as e:
+                logger.error(f"스트리밍 처리 중 오류 발생: {str(e)}", exc_info=True)
+                yield _sse_event({"error": f"처리 중 오류가 발생했습니다: {str(e)}"}, event="error")
+            finally:
+                await token_stream.aclose()
+                await exit_stack.aclose()
+    
+    return StreamingResponse(
+        sse_events(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",  # 프록시 버퍼링 비활성화
+            "X-Queue-Wait-Ms": f"{ticket.queue_wait_ms:.0f}"
+        },
+        # 스트림이 시작되기 전에 연결이 끊긴 경우에도 어드미션 슬롯 반환
+        background=BackgroundTask(exit_stack.aclose)
+    )
+
+
+async def _execute_batch_item(index: int, item: Any, semaphore: asyncio.Semaphore) -> Dict[str, Any]:
+    """
+    배치 항목 하나 처리 (항목 오류는 결과에 기록하고 예외를 전파하지 않음)
+    
+    Args:
+        index: 배치 내 순번
+        item: 배치 항목 ({callkey, text, pipeline_name, ...})
+        semaphore: 배치 동시 실행 제한
+    
+    Returns:
+        항목 처리 결과
+    """
+    if not isinstance(item, dict):
+        return {"callkey": str(index), "index": index, "status": "error", "status_code": 400, "error": "배치 항목은 객체여야 합니다."}
+    
+    callkey = str(item.get("callkey", index))
+    outcome: Dict[str, Any] = {"callkey": callkey, "index": index}
+    async with semaphore:
+        try:
+            result_str, ticket, exec_ms, run_info = await _execute_request(item)
+            outcome.update({
+                "status": "success",
+                "answer": result_str,
+                "served_model": run_info.get("served_model"),
+                "queue_wait_ms": round(ticket.queue_wait_ms, 1),
+                "exec_ms": round(exec_ms, 1)
+            })
+        except AdmissionRejected as e:
+            outcome.update({"status": "error", "status_code": e.status_code, "error": str(e), "retry_after": e.retry_after})
+        except CircuitOpenError as e:
+            outcome.update({"status": "error", "status_code": 503, "error": str(e), "retry_after": e.retry_after})
+        except DeadlineExceeded as e:
+            get_deadline_manager().record_exceeded(e.stage)
+            outcome.update({"status": "error", "status_code": 504, "error": str(e)})
+        except HTTPException as e:
+            outcome.update({"status": "error", "status_code": e.status_code, "error": e.detail})
+        except Exception as e:
+            logger.error(f"배치 항목 처리 중 오류 발생: callkey={callkey}, 오류={str(e)}", exc_info=True)
+            outcome.update({"status": "error", "status_code": 500, "error": f"처리 중 오류가 발생했습니다: {str(e)}"})
+    return outcome
+
+
+@router.post("/process/batch")
+async def process_batch(request: Request):
+    """
+    LLM 일괄 처리 요청
+    
+    {callkey, text, pipeline_name} 항목 배열을 제한된 동시 실행 수로 처리하고
+    callkey별 결과/오류를 반환합니다. 항목 하나의 오류는 배치 전체를 실패시키지 않습니다.
+    callkey는 배치 안에서 고유해야 하며 (중복이면 400), 생략하면 항목 인덱스를 사용합니다.
+    
+    요청 본문: [{...}, ...] 또는 {"items": [...], "max_concurrency": 8, "stream": false}
+    stream이 true이거나 Accept 헤더가 application/x-ndjson이면 완료되는 순서대로 NDJSON으로 반환합니다.
+    요청 기한 헤더는 배치 전체에 적용하며 (기한이 지난 항목은 504), 클라이언트 연결이 끊기면 남은 항목을 취소합니다.
+    """
+    try:
+        body = get_json_codec().loads(await request.body())
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"요청 본문을 파싱할 수 없습니다: {str(e)}")
+    
+    options: Dict[str, Any] = body if isinstance(body, dict) else {}
+    items = body if isinstance(body, list) else options.get("items")
+    if not isinstance(items, list):
+        raise HTTPException(status_code=400, detail="items 배열이 필요합니다.")
+    
+    batch_config = get_pipeline_manager().config_data.get("batch", {})
+    max_items = batch_config.get("max_items", 1000)
+    if len(items) > max_items:
+        raise HTTPException(status_code=413, detail=f"배치 항목 수가 너무 많습니다: {len(items)} (최대 {max_items})")
+    
+    # 결과는 callkey별로 반환하므로 중복 callkey는 실행 전에 거부 (callkey가 없는 항목은 인덱스 사용)
+    callkeys = [str(item.get("callkey", i)) if isinstance(item, dict) else str(i) for i, item in enumerate(items)]
+    duplicates = sorted(callkey for callkey, count in Counter(callkeys).items() if count > 1)
+    if duplicates:
+        raise HTTPException(status_code=400, detail=f"중복된 callkey가 있습니다: {', '.join(duplicates)} (callkey가 없는 항목은 인덱스를 callkey로 사용)")
+    
+    # 동시 실행 수: 요청 값은 설정 상한을 넘을 수 없음
+    max_concurrency = batch_config.get("max_concurrency", 8)
+    requested_concurrency = options.get("max_concurrency")
+    if isinstance(requested_concurrency, int) and requested_concurrency > 0:
+        max_concurrency = min(requested_concurrency, max_concurrency)
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    stream = options.get("stream") is True or "application/x-ndjson" in request.headers.get("accept", "")
+    logger.info(f"배치 처리 시작: 항목 수={len(items)}, 동시 실행 수={max_concurrency}, 스트리밍={stream}")
+    
+    start = time.perf_counter()
+    # 항목 태스크는 생성 시점의 요청 기한을 물려받음
+    with deadline_scope(get_deadline_manager().request_timeout(request.headers)):
+        tasks = [asyncio.create_task(_execute_batch_item(i, item, semaphore)) for i, item in enumerate(items)]
+    
+    if stream:
+        async def ndjson_lines() -> AsyncIterator[str]:
+            try:
+                for future in asyncio.as_completed(tasks):
+                    outcome = await future
+                    yield get_json_codec().dumps_str(outcome) + "\n"
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                logger.info(f"배치 처리 완료(스트리밍): 항목 수={len(tasks)}, 소요 시간={elapsed_ms:.0f}ms")
+            finally:
+                # 클라이언트 연결이 끊긴 경우 남은 항목 취소
+                for task in tasks:
+                    if not task.done():
+                        task.cancel()
+        
+        return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+    
+    # 클라이언트 연결이 끊기면 gather 취소로 남은 항목도 취소
+    outcomes = await _run_until_disconnected(request, asyncio.gather(*tasks))
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    succeeded = sum(1 for outcome in outcomes if outcome["status"] == "success")
+    logger.info(f"배치 처리 완료: 항목 수={len(outcomes)}, 성공={succeeded}, 실패={len(outcomes) - succeeded}, 소요 시간={elapsed_ms:.0f}ms")
+    
+    return Response(
+        get_json_codec().dumps({
+            "total": len(outcomes),
+            "succeeded": succeeded,
+            "failed": len(outcomes) - succeeded,
+            "elapsed_ms": round(elapsed_ms, 1),
+            "results": {outcome["callkey"]: outcome for outcome in outcomes}
+        }),
+        media_type="application/json"
+    )
+
+
+@router.get("/pipelines/modules")
+async def pipeline_modules():
+    """파이프라인 모듈 캐시 상태 조회 (로드/재로드 소요 시간 포함)"""
+    pipeline_manager = get_pipeline_manager()
+    return pipeline_manager.get_module_stats()
+
+
+@router.get("/coalescing")
+async def coalescing_stats():
+    """동일 호출 합치기 상태 조회 (실행 횟수, 합류 횟수, 실행 중인 호출)"""
+    return get_pipeline_manager().get_coalescing_stats()
+
+
+@router.post("/pipelines/reload")
+async def reload_pipelines(pipeline_name: Optional[str] = None):
+    """
+    파이프라인 모듈 재로드
+    
+    pipeline_name을 지정하지 않으면 등록된 전체 파이프라인을 재로드합니다.
+    """
+    pipeline_manager = get_pipeline_manager()
+    try:
+        results = pipeline_manager.reload_pipeline_modules(pipeline_name)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    return {"results": results}
+
+
+@router.get("/admission")
+async def admission_stats():
+    """어드미션 컨트롤 상태 조회 (동시 실행 수, 대기열, 대기 시간, 거절 횟수)"""
+    return get_admission_controller().get_stats()
+
+
+@router.get("/pools")
+async def pool_stats():
+    """백엔드별 HTTP 연결 풀 상태 조회 (설정, 동시 요청 수, 연결 수, 사용률)"""
+    return get_http_pool_manager().get_stats()
+
+
+@router.get("/replicas")
+async def replica_stats():
+    """모델별 레플리카 분배 상태 조회 (요청 수/비율, 처리 중 요청 수, 응답 시간 EWMA, 제외 상태)"""
+    return get_load_balancer_manager().get_stats()
+
+
+@router.get("/hedging")
+async def hedging_stats():
+    """헤지 요청 상태 조회 (모델별 지연 시간 백분위, 헤지 지연 시간, 헤지 횟수/비율, 예산)"""
+    return get_hedge_manager().get_stats()
+
+
+@router.get("/cache")
+async def cache_stats():
+    """LLM 응답 캐시 상태 조회 (메모리/디스크 적중, 미적중, 저장, 제거 횟수 및 항목 수)"""
+    return await asyncio.to_thread(get_response_cache().get_stats)
+
+
+@router.delete("/cache")
+async def clear_cache():
+    """LLM 응답 캐시 전체 삭제"""
+    return {"cleared": await get_response_cache().clear()}
+
+
+@router.get("/deadline")
+async def deadline_stats():
+    """요청 기한 상태 조회 (기한이 적용된 요청 수, 기한 초과 수, 클라이언트 연결 종료로 취소된 요청 수)"""
+    return get_deadline_manager().get_stats()
+
+
+@router.get("/microbatching")
+async def micro_batching_stats():
+    """vLLM 마이크로 배치 상태 조회 (배치 키별 배치 수, 프롬프트 수, 평균/최대 배치 크기)"""
+    return get_micro_batch_manager().get_stats()
+
+
+@router.get("/concurrency")
+async def concurrency_stats():
+    """적응형 동시 요청 제한 상태 조회 (백엔드별 현재 제한, 처리 중/대기 중 요청 수, 기준/최근 지연 시간)"""
+    return get_concurrency_limiter_manager().get_stats()
+
+
+@router.get("/ollama")
+async def ollama_stats():
+    """Ollama 모델 상태 조회 (모델별 적재 포함(cold)/적재된(warm) 응답 시간, 적재 시간, 예열 결과)"""
+    return get_ollama_manager().get_stats()
+
+
 @router.get("/health")
 async def health_check():
-    """헬스 체크"""
+    """헬스 체크 (백엔드별 서킷 상태와 엔드포인트 상태 확인 결과 포함, 열린 서킷이나 unhealthy 엔드포인트가 있으면 degraded)"""
     pipeline_manager = get_pipeline_manager()
+    circuit_breaker_manager = get_circuit_breaker_manager()
+    health_prober = get_health_prober()
     return {
-        "status": "healthy",
+        "status": "degraded" if circuit_breaker_manager.has_open() or health_prober.has_unhealthy() else "healthy",
         "pipeline_mode": pipeline_manager.pipeline_config.get("mode", "static"),
-        "static_pipelines": len(pipeline_manager.pipelines)
+        "static_pipelines": len(pipeline_manager.pipelines),
+        "dynamic_pipelines": len(pipeline_manager.dynamic_pipelines),
+        "circuit_breakers": circuit_breaker_manager.get_stats(),
+        "endpoints": health_prober.get_stats()
     }
+
+
+@router.get("/ready")
+async def readiness_check():
+    """
+    준비 상태 확인 (트래픽 전달 여부 판단용)
+    
+    현재 모드의 파이프라인마다 모델 폴백 체인에 준비된 모델이 하나 이상 있으면 200, 아니면 503을 반환합니다.
+    상태 확인이 켜져 있으면 첫 확인이 끝날 때까지 503을 반환하고, 확인 결과 healthy인 모델만 준비된 것으로 봅니다.
+    폴백 체인의 모든 모델이 enabled: false인 LLM 타입이거나 확인하지 않는 모델인 파이프라인은 판단에서 제외합니다
+    (checked: false, 판단할 수 있는 파이프라인이 하나도 없으면 503).
+    """
+    health_prober = get_health_prober()
+    pipeline_manager = get_pipeline_manager()
+    engine_registry = get_engine_registry()
+    
+    if health_prober.enabled and health_prober.rounds == 0:
+        content: Dict[str, Any] = {"ready": False, "reason": "모델 엔드포인트 첫 상태 확인 중"}
+    else:
+        if pipeline_manager.pipeline_config.get("mode", "static") == "dynamic":
+            pipelines = pipeline_manager.dynamic_pipelines
+        else:
+            pipelines = pipeline_manager.pipelines
+        pipeline_states: Dict[str, Any] = {}
+        for name, pipeline_config in pipelines.items():
+            try:
+                model_config = engine_registry.get_model_config(pipeline_config.get("model") or "")
+            except ValueError:
+                model_config = None
+            chain = pipeline_manager.get_model_chain(pipeline_config, model_config) if model_config is not None else []
+            available = [model_spec for model_spec, config in chain if health_prober.is_model_ready(config)]
+            checked = any(health_prober.is_model_checked(config) for _, config in chain)
+            pipeline_states[name] = {"ready": bool(available), "checked": checked, "available_models": available}
+        checked_states = [state for state in pipeline_states.values() if state["checked"]]
+        content = {
+            "ready": bool(checked_states) and all(state["ready"] for state in checked_states),
+            "pipelines": pipeline_states
+        }
+    return Response(
+        content=get_json_codec().dumps(content),
+        status_code=200 if content["ready"] else 503,
+        media_type="application/json"
+    )
@@ -0,0 +1,618 @@
+"""
+모의 LLM 서버 (오프라인 부하 테스트용)
+
+LLMClient가 사용하는 백엔드 응답 형식을 흉내 내는 로컬 서버입니다. GPU나 외부 네트워크 없이 오케스트레이터를 부하 테스트할 때 사용합니다.
+    vLLM/OpenAI   POST /v1/chat/completions (스트리밍/비스트리밍), POST /v1/completions (prompt 목록), GET /v1/models
+    Anthropic     POST /v1/messages (스트리밍/비스트리밍)
+    Ollama        POST /api/chat (스트리밍/비스트리밍), POST /api/generate (모델 적재), GET /api/tags
+    상태 조회     GET /mock/stats
+
+지연 프로필 (내장 프로필: PROFILES, 또는 --profile-file YAML의 profiles 항목):
+    ttft_ms, ttft_jitter_ms       첫 토큰까지 시간 (평균, ± 범위)
+    tokens_per_sec                토큰 생성 속도 (0이면 지연 없음)
+    output_tokens                 생성 토큰 수 [최소, 최대] (요청의 max_tokens/num_predict 이하)
+    error_rate, error_statuses    오류 응답 비율과 상태 코드 목록
+    stall_rate, stall_ms          응답 중간에 멈추는 비율과 시간
+    max_concurrency               동시에 생성하는 요청 수 (넘는 요청은 대기, 0이면 제한 없음)
+    cold_load_ms                  Ollama 모델 첫 요청의 적재 시간 (load_duration으로 보고)
+
+모드 (--mode):
+    synthetic   프로필에 따라 합성 응답 생성 (기본, 같은 요청 본문이면 같은 내용)
+    record      --upstream 서버로 요청을 전달하고 성공 응답을 --cassette 파일(JSONL)에 기록
+    replay      --cassette 파일의 응답을 요청 본문 기준으로 그대로 반환 (없으면 404, --replay-fallback이면 합성 응답)
+                스트리밍 응답은 기록된 조각을 프로필의 TTFT와 생성 속도로 다시 보냄
+
+실행 (llm_orchestrator 디렉토리에서):
+    python -m tools.mock_llm_server --port 8133 --profile vllm
+    python -m tools.mock_llm_server --port 8133 --profile-file profiles.yml --profile slow_gpu
+    python -m tools.mock_llm_server --port 8133 --mode record --upstream http://localhost:8000 --cassette cassette.jsonl
+    python -m tools.mock_llm_server --port 8133 --mode replay --cassette cassette.jsonl --profile instant
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import random
+import sys
+import time
+import uuid
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Set, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import httpx  # noqa: E402
+import uvicorn  # noqa: E402
+import yaml  # noqa: E402
+from fastapi import FastAPI, Request  # noqa: E402
+from fastapi.responses import Response, StreamingResponse  # noqa: E402
+from core.json_codec import get_json_codec  # noqa: E402
+
+# 프로필 기본값 (지연/오류 없음)
+DEFAULT_PROFILE: Dict[str, Any] = {
+    "ttft_ms": 0,
+    "ttft_jitter_ms": 0,
+    "tokens_per_sec": 0,
+    "output_tokens": [32, 32],
+    "error_rate": 0.0,
+    "error_statuses": [503],
+    "stall_rate": 0.0,
+    "stall_ms": 0,
+    "max_concurrency": 0,
+    "cold_load_ms": 0
+}
+
+# 내장 프로필
+PROFILES: Dict[str, Dict[str, Any]] = {
+    "instant": {},
+    "vllm": {"ttft_ms": 150, "ttft_jitter_ms": 50, "tokens_per_sec": 60, "output_tokens": [64, 256], "max_concurrency": 32},
+    "vllm_saturated": {"ttft_ms": 400, "ttft_jitter_ms": 200, "tokens_per_sec": 30, "output_tokens": [64, 256], "max_concurrency": 8},
+    "ngrok": {"ttft_ms": 600, "ttft_jitter_ms": 300, "tokens_per_sec": 25, "output_tokens": [64, 256], "error_rate": 0.02, "error_statuses": [502, 504], "stall_rate": 0.05, "stall_ms": 3000},
+    "ollama_cpu": {"ttft_ms": 800, "ttft_jitter_ms": 200, "tokens_per_sec": 8, "output_tokens": [32, 128], "max_concurrency": 2, "cold_load_ms": 4000},
+    "flaky": {"ttft_ms": 100, "tokens_per_sec": 100, "output_tokens": [32, 64], "error_rate": 0.2, "error_statuses": [429, 500, 503]}
+}
+
+# 스트리밍 조각 사이 최소 간격 (초, 생성 속도가 빨라도 조각마다 깨어나지 않도록 토큰을 묶어 보냄)
+MIN_CHUNK_INTERVAL = 0.02
+
+# record 모드에서 상위 서버로 전달하는 요청 헤더
+FORWARD_HEADERS = ("authorization", "x-api-key", "anthropic-version", "content-type")
+
+
+class MockProfile:
+    """지연/오류 프로필"""
+    
+    def __init__(self, name: str, values: Dict[str, Any]):
+        """
+        프로필 초기화
+        
+        Args:
+            name: 프로필 이름
+            values: 프로필 값 (없는 항목은 DEFAULT_PROFILE 사용)
+        """
+        config = {**DEFAULT_PROFILE, **(values or {})}
+        self.name = name
+        self.ttft = float(config["ttft_ms"]) / 1000
+        self.ttft_jitter = float(config["ttft_jitter_ms"]) / 1000
+        self.tokens_per_sec = float(config["tokens_per_sec"])
+        self.output_tokens = (int(config["output_tokens"][0]), int(config["output_tokens"][-1]))
+        self.error_rate = float(config["error_rate"])
+        self.error_statuses = [int(status) for status in config["error_statuses"]] or [503]
+        self.stall_rate = float(config["stall_rate"])
+        self.stall = float(config["stall_ms"]) / 1000
+        self.max_concurrency = int(config["max_concurrency"])
+        self.cold_load = float(config["cold_load_ms"]) / 1000
+        self.values = config
+    
+    def sample_ttft(self, rng: random.Random) -> float:
+        """첫 토큰까지 시간 (초)"""
+        return max(0.0, self.ttft + rng.uniform(-self.ttft_jitter, self.ttft_jitter))
+    
+    def decode_time(self, tokens: int) -> float:
+        """토큰 생성 시간 (초)"""
+        return tokens / self.tokens_per_sec if self.tokens_per_sec > 0 else 0.0
+
+
+def load_profiles(path: Optional[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    내장 프로필과 YAML 파일의 프로필 (같은 이름은 파일 우선)
+    
+    YAML 형식:
+        profiles:
+          slow_gpu:
+            ttft_ms: 1200
+            tokens_per_sec: 15
+    """
+    profiles = dict(PROFILES)
+    if path:
+        with open(path, "r", encoding="utf-8") as f:
+            data = yaml.safe_load(f) or {}
+        profiles.update(data.get("profiles") or {})
+    return profiles
+
+
+class Cassette:
+    """기록/재생 파일 (JSONL, 요청 경로와 본문의 해시를 키로 사용)"""
+    
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        if self.path.exists():
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        self.entries[entry["key"]] = entry
+    
+    @staticmethod
+    def key(path: str, body: Dict[str, Any]) -> str:
+        """기록 키 (경로 + 키 정렬한 요청 본문)"""
+        canonical = json.dumps(body, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+        return hashlib.sha256(f"{path}\n{canonical}".encode("utf-8")).hexdigest()
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        return self.entries.get(key)
+    
+    def add(self, entry: Dict[str, Any]) -> None:
+        """기록 추가 (파일 끝에 한 줄 추가)"""
+        self.entries[entry["key"]] = entry
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+
+class MockLLMServer:
+    """모의 LLM 서버 상태 (프로필, 동시 생성 제한, 적재된 Ollama 모델, 기록/재생, 통계)"""
+    
+    def __init__(
+        self,
+        profile: MockProfile,
+        models: List[str],
+        mode: str = "synthetic",
+        cassette: Optional[Cassette] = None,
+        upstream: Optional[str] = None,
+        replay_fallback: bool = False,
+        seed: int = 0
+    ):
+        if mode not in ("synthetic", "record", "replay"):
+            raise ValueError(f"지원하지 않는 모드입니다: {mode} (synthetic, record, replay)")
+        if mode in ("record", "replay") and cassette is None:
+            raise ValueError(f"{mode} 모드에는 cassette 파일이 필요합니다.")
+        if mode == "record" and not upstream:
+            raise ValueError("record 모드에는 upstream 서버가 필요합니다.")
+        self.profile = profile
+        self.models = models
+        self.mode = mode
+        self.cassette = cassette
+        self.upstream = upstream.rstrip("/") if upstream else None
+        self.replay_fallback = replay_fallback
+        self.codec = get_json_codec()
+        # 지연/오류 추첨용 (요청 내용과 무관, --seed로 재현)
+        self.rng = random.Random(seed)
+        self.seed = seed
+        self.slots = asyncio.Semaphore(profile.max_concurrency) if profile.max_concurrency > 0 else None
+        self.loaded_models: Set[str] = set()
+        self.upstream_client: Optional[httpx.AsyncClient] = None
+        self.stats: Dict[str, Any] = {
+            "requests": {},
+            "errors_injected": 0,
+            "stalls": 0,
+            "active": 0,
+            "max_active": 0,
+            "queued": 0,
+            "cold_loads": 0,
+            "replay_hits": 0,
+            "replay_misses": 0,
+            "recorded": 0
+        }
+    
+    # 공통
+    
+    def _content_rng(self, path: str, body: Dict[str, Any]) -> random.Random:
+        """요청 내용별 난수 (같은 요청이면 같은 응답 내용과 토큰 수)"""
+        return random.Random(f"{self.seed}:{Cassette.key(path, body)}")
+    
+    def _synthetic_tokens(self, prompt: str, max_tokens: Optional[int], rng: random.Random) -> List[str]:
+        """프롬프트 단어로 만든 합성 토큰 목록"""
+        low, high = self.profile.output_tokens
+        count = rng.randint(low, max(low, high))
+        if max_tokens:
+            count = min(count, int(max_tokens))
+        words = prompt.split()[-64:] or ["응답"]
+        return [rng.choice(words) + " " for _ in range(max(1, count))]
+    
+    def _inject_error(self) -> Optional[int]:
+        """오류 응답 상태 코드 추첨 (오류가 아니면 None)"""
+        if self.profile.error_rate > 0 and self.rng.random() < self.profile.error_rate:
+            self.stats["errors_injected"] += 1
+            return self.rng.choice(self.profile.error_statuses)
+        return None
+    
+    def _stall_index(self, tokens: int) -> Optional[int]:
+        """응답이 멈출 토큰 위치 (멈추지 않으면 None)"""
+        if self.profile.stall_rate > 0 and self.rng.random() < self.profile.stall_rate:
+            self.stats["stalls"] += 1
+            return self.rng.randint(0, max(0, tokens - 1))
+        return None
+    
+    async def _acquire(self) -> None:
+        """동시 생성 슬롯 획득"""
+        if self.slots is not None:
+            self.stats["queued"] += 1
+            try:
+                await self.slots.acquire()
+            finally:
+                self.stats["queued"] -= 1
+        self.stats["active"] += 1
+        self.stats["max_active"] = max(self.stats["max_active"], self.stats["active"])
+    
+    def _release(self) -> None:
+        self.stats["active"] -= 1
+        if self.slots is not None:
+            self.slots.release()
+    
+    async def _generate(self, tokens: List[str]) -> None:
+        """비스트리밍 생성 시간 대기 (TTFT + 토큰 생성 시간 + 멈춤)"""
+        delay = self.profile.sample_ttft(self.rng) + self.profile.decode_time(len(tokens))
+        if self._stall_index(len(tokens)) is not None:
+            delay += self.profile.stall
+        await self._acquire()
+        try:
+            if delay > 0:
+                await asyncio.sleep(delay)
+        finally:
+            self._release()
+    
+    async def _paced(self, pieces: List[Any]) -> AsyncIterator[List[Any]]:
+        """스트리밍 조각 묶음을 프로필 속도로 반환 (첫 묶음은 TTFT 후)"""
+        ttft = self.profile.sample_ttft(self.rng)
+        stall_at = self._stall_index(len(pieces))
+        per_piece = self.profile.decode_time(1)
+        group = max(1, int(MIN_CHUNK_INTERVAL / per_piece)) if per_piece > 0 else len(pieces) or 1
+        await self._acquire()
+        try:
+            if ttft > 0:
+                await asyncio.sleep(ttft)
+            for start in range(0, len(pieces), group):
+                batch = pieces[start:start + group]
+                if stall_at is not None and start <= stall_at < start + group:
+                    await asyncio.sleep(self.profile.stall)
+                yield batch
+                if per_piece > 0:
+                    await asyncio.sleep(per_piece * len(batch))
+        finally:
+            self._release()
+    
+    def _count(self, path: str) -> None:
+        self.stats["requests"][path] = self.stats["requests"].get(path, 0) + 1
+    
+    def _json(self, content: Any, status_code: int = 200, headers: Optional[Dict[str, str]] = None) -> Response:
+        return Response(content=self.codec.dumps(content), status_code=status_code, media_type="application/json", headers=headers)
+    
+    # 기록/재생
+    
+    async def _record(self, request: Request, path: str, body: Dict[str, Any]) -> Response:
+        """상위 서버로 전달하고 성공 응답 기록"""
+        if self.upstream_client is None:
+            self.upstream_client = httpx.AsyncClient(timeout=httpx.Timeout(600.0, connect=10.0))
+        headers = {name: value for name, value in request.headers.items() if name.lower() in FORWARD_HEADERS}
+        upstream_request = self.upstream_client.build_request("POST", f"{self.upstream}{path}", headers=headers, content=self.codec.dumps(body))
+        response = await self.upstream_client.send(upstream_request, stream=True)
+        key = Cassette.key(path, body)
+        media_type = response.headers.get("content-type", "application/json")
+        if not body.get("stream") or response.is_error:
+            content = await response.aread()
+            await response.aclose()
+            if not response.is_error:
+                self.cassette.add({"key": key, "path": path, "request": body, "status": response.status_code, "media_type": media_type, "body": content.decode("utf-8")})
+                self.stats["recorded"] += 1
+            return Response(content=content, status_code=response.status_code, media_type=media_type)
+        
+        async def forward() -> AsyncIterator[bytes]:
+            chunks: List[str] = []
+            try:
+                async for chunk in response.aiter_raw():
+                    chunks.append(chunk.decode("utf-8"))
+                    yield chunk
+            finally:
+                await response.aclose()
+            self.cassette.add({"key": key, "path": path, "request": body, "status": response.status_code, "media_type": media_type, "chunks": chunks})
+            self.stats["recorded"] += 1
+        
+        return StreamingResponse(forward(), status_code=response.status_code, media_type=media_type)
+    
+    def _replay(self, path: str, body: Dict[str, Any]) -> Optional[Response]:
+        """기록된 응답 반환 (없으면 None)"""
+        entry = self.cassette.get(Cassette.key(path, body))
+        if entry is None:
+            self.stats["replay_misses"] += 1
+            return None
+        self.stats["replay_hits"] += 1
+        if "chunks" not in entry:
+            return Response(content=entry["body"].encode("utf-8"), status_code=entry["status"], media_type=entry["media_type"])
+        
+        async def chunks() -> AsyncIterator[bytes]:
+            async for batch in self._paced(entry["chunks"]):
+                yield "".join(batch).encode("utf-8")
+        
+        return StreamingResponse(chunks(), status_code=entry["status"], media_type=entry["media_type"])
+    
+    async def handle(self, request: Request, path: str, synthetic: Callable[[Dict[str, Any]], Any]) -> Response:
+        """모드에 따라 요청 처리 (synthetic은 합성 응답 생성 함수)"""
+        self._count(path)
+        body = self.codec.loads(await request.body())
+        if self.mode == "record":
+            return await self._record(request, path, body)
+        if self.mode == "replay":
+            replayed = self._replay(path, body)
+            if replayed is not None:
+                return replayed
+            if not self.replay_fallback:
+                return self._json({"error": {"message": "기록된 응답이 없습니다.", "type": "replay_miss"}}, status_code=404)
+        return await synthetic(body)
+    
+    # 응답 형식
+    
+    async def openai_chat(self, body: Dict[str, Any]) -> Response:
+        """OpenAI/vLLM /chat/completions"""
+        status = self._inject_error()
+        if status is not None:
+            return self._json({"error": {"message": "모의 오류", "type": "server_error", "code": status}}, status_code=status, headers={"Retry-After": "1"})
+        messages = body.get("messages") or []
+        prompt = messages[-1].get("content", "") if messages else ""
+        tokens = self._synthetic_tokens(prompt, body.get("max_tokens"), self._content_rng("/v1/chat/completions", body))
+        model = body.get("model", self.models[0])
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:24]}"
+        created = int(time.time())
+        usage = {"prompt_tokens": len(prompt) // 2, "completion_tokens": len(tokens), "total_tokens": len(prompt) // 2 + len(tokens)}
+        if not body.get("stream"):
+            await self._generate(tokens)
+            return self._json({
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": created,
+                "model": model,
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": "".join(tokens)}, "finish_reason": "stop"}],
+                "usage": usage
+            })
+        
+        async def events() -> AsyncIterator[bytes]:
+            async for batch in self._paced(tokens):
+                for token in batch:
+                    chunk = {"id": completion_id, "object": "chat.completion.chunk", "created": created, "model": model,
+                             "choices": [{"index": 0, "delta": {"content": token}, "finish_reason": None}]}
+                    yield b"data: " + self.codec.dumps(chunk) + b"\n\n"
+            final = {"id": completion_id, "object": "chat.completion.chunk", "created": created, "model": model,
+                     "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]}
+            yield b"data: " + self.codec.dumps(final) + b"\n\n"
+            yield b"data: [DONE]\n\n"
+        
+        return StreamingResponse(events(), media_type="text/event-stream")
+    
+    async def openai_completions(self, body: Dict[str, Any]) -> Response:
+        """OpenAI/vLLM /completions (prompt 목록은 한 번에 생성)"""
+        status = self._inject_error()
+        if status is not None:
+            return self._json({"error": {"message": "모의 오류", "type": "server_error", "code": status}}, status_code=status, headers={"Retry-After": "1"})
+        prompts = body.get("prompt") or [""]
+        if isinstance(prompts, str):
+            prompts = [prompts]
+        rng = self._content_rng("/v1/completions", body)
+        outputs = [self._synthetic_tokens(prompt, body.get("max_tokens"), rng) for prompt in prompts]
+        # 배치는 가장 긴 출력만큼 생성 시간이 걸림
+        await self._generate(max(outputs, key=len))
+        return self._json({
+            "id": f"cmpl-{uuid.uuid4().hex[:24]}",
+            "object": "text_completion",
+            "created": int(time.time()),
+            "model": body.get("model", self.models[0]),
+            "choices": [{"index": index, "text": "".join(tokens), "finish_reason": "stop"} for index, tokens in enumerate(outputs)]
+        })
+    
+    async def anthropic_messages(self, body: Dict[str, Any]) -> Response:
+        """Anthropic /messages"""
+        status = self._inject_error()
+        if status is not None:
+            return self._json({"type": "error", "error": {"type": "overloaded_error", "message": "모의 오류"}}, status_code=status, headers={"Retry-After": "1"})
+        messages = body.get("messages") or []
+        prompt = messages[-1].get("content", "") if messages else ""
+        tokens = self._synthetic_tokens(prompt, body.get("max_tokens"), self._content_rng("/v1/messages", body))
+        model = body.get("model", self.models[0])
+        message_id = f"msg_{uuid.uuid4().hex[:24]}"
+        usage = {"input_tokens": len(prompt) // 2, "output_tokens": len(tokens)}
+        if not body.get("stream"):
+            await self._generate(tokens)
+            return self._json({
+                "id": message_id,
+                "type": "message",
+                "role": "assistant",
+                "model": model,
+                "content": [{"type": "text", "text": "".join(tokens)}],
+                "stop_reason": "end_turn",
+                "usage": usage
+            })
+        
+        def event(name: str, data: Dict[str, Any]) -> bytes:
+            return f"event: {name}\ndata: ".encode("utf-8") + self.codec.dumps(data) + b"\n\n"
+        
+        async def events() -> AsyncIterator[bytes]:
+            yield event("message_start", {"type": "message_start", "message": {"id": message_id, "type": "message", "role": "assistant", "model": model, "content": [], "usage": {"input_tokens": usage["input_tokens"], "output_tokens": 0}}})
+            yield event("content_block_start", {"type": "content_block_start", "index": 0, "content_block": {"type": "text", "text": ""}})
+            async for batch in self._paced(tokens):
+                for token in batch:
+                    yield event("content_block_delta", {"type": "content_block_delta", "index": 0, "delta": {"type": "text_delta", "text": token}})
+            yield event("content_block_stop", {"type": "content_block_stop", "index": 0})
+            yield event("message_delta", {"type": "message_delta", "delta": {"stop_reason": "end_turn"}, "usage": {"output_tokens": len(tokens)}})
+            yield event("message_stop", {"type": "message_stop"})
+        
+        return StreamingResponse(events(), media_type="text/event-stream")
+    
+    async def _ollama_load(self, model: str, keep_alive: Any) -> float:
+        """Ollama 모델 적재 (적재되지 않은 모델이면 cold_load 대기, 적재 시간(초) 반환)"""
+        if model in self.loaded_models:
+            load = 0.001
+        else:
+            load = self.profile.cold_load
+            self.stats["cold_loads"] += 1
+            if load > 0:
+                await asyncio.sleep(load)
+            self.loaded_models.add(model)
+        # keep_alive 0이면 응답 후 바로 내림
+        if keep_alive in (0, "0", "0s", "0m"):
+            self.loaded_models.discard(model)
+        return load
+    
+    async def ollama_chat(self, body: Dict[str, Any]) -> Response:
+        """Ollama /api/chat"""
+        status = self._inject_error()
+        if status is not None:
+            return self._json({"error": "모의 오류"}, status_code=status)
+        start = time.perf_counter()
+        messages = body.get("messages") or []
+        prompt = messages[-1].get("content", "") if messages else ""
+        model = body.get("model", self.models[0])
+        tokens = self._synthetic_tokens(prompt, (body.get("options") or {}).get("num_predict"), self._content_rng("/api/chat", body))
+        load = await self._ollama_load(model, body.get("keep_alive"))
+        
+        def final(content: str) -> Dict[str, Any]:
+            return {
+                "model": model,
+                "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                "message": {"role": "assistant", "content": content},
+                "done": True,
+                "done_reason": "stop",
+                "total_duration": int((time.perf_counter() - start) * 1e9),
+                "load_duration": int(load * 1e9),
+                "prompt_eval_count": len(prompt) // 2,
+                "eval_count": len(tokens),
+                "eval_duration": int(self.profile.decode_time(len(tokens)) * 1e9)
+            }
+        
+        if not body.get("stream", True):
+            await self._generate(tokens)
+            return self._json(final("".join(tokens)))
+        
+        async def lines() -> AsyncIterator[bytes]:
+            async for batch in self._paced(tokens):
+                for token in batch:
+                    chunk = {"model": model, "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                             "message": {"role": "assistant", "content": token}, "done": False}
+                    yield self.codec.dumps(chunk) + b"\n"
+            yield self.codec.dumps(final("")) + b"\n"
+        
+        return StreamingResponse(lines(), media_type="application/x-ndjson")
+    
+    async def ollama_generate(self, body: Dict[str, Any]) -> Response:
+        """Ollama /api/generate (빈 프롬프트는 모델 적재만 수행)"""
+        model = body.get("model", self.models[0])
+        start = time.perf_counter()
+        load = await self._ollama_load(model, body.get("keep_alive"))
+        return self._json({
+            "model": model,
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "response": "",
+            "done": True,
+            "done_reason": "load",
+            "total_duration": int((time.perf_counter() - start) * 1e9),
+            "load_duration": int(load * 1e9)
+        })
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {"profile": self.profile.name, "mode": self.mode, "loaded_models": sorted(self.loaded_models), **self.stats}
+
+
+def create_app(server: MockLLMServer) -> FastAPI:
+    """
+    모의 LLM 서버 FastAPI 애플리케이션
+    
+    Args:
+        server: 서버 상태 (프로필, 모드, 기록 파일)
+    
+    Returns:
+        FastAPI 애플리케이션 (벤치마크에서 같은 프로세스로 띄울 때도 사용)
+    """
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        yield
+        if server.upstream_client is not None:
+            await server.upstream_client.aclose()
+    
+    app = FastAPI(title="Mock LLM Server", lifespan=lifespan)
+    
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        return await server.handle(request, "/v1/chat/completions", server.openai_chat)
+    
+    @app.post("/v1/completions")
+    async def completions(request: Request):
+        return await server.handle(request, "/v1/completions", server.openai_completions)
+    
+    @app.post("/v1/messages")
+    async def messages(request: Request):
+        return await server.handle(request, "/v1/messages", server.anthropic_messages)
+    
+    @app.post("/api/chat")
+    async def ollama_chat(request: Request):
+        return await server.handle(request, "/api/chat", server.ollama_chat)
+    
+    @app.post("/api/generate")
+    async def ollama_generate(request: Request):
+        server._count("/api/generate")
+        return await server.ollama_generate(server.codec.loads(await request.body()))
+    
+    @app.get("/v1/models")
+    async def models():
+        return {"object": "list", "data": [{"id": model, "object": "model", "owned_by": "mock"} for model in server.models]}
+    
+    @app.get("/api/tags")
+    async def tags():
+        return {"models": [{"name": model, "model": model} for model in server.models]}
+    
+    @app.get("/mock/stats")
+    async def stats():
+        return server.get_stats()
+    
+    return app
+
+
+def build_server(args: argparse.Namespace) -> Tuple[MockLLMServer, MockProfile]:
+    """명령행 인자로 서버 상태 구성"""
+    profiles = load_profiles(args.profile_file)
+    if args.profile not in profiles:
+        raise SystemExit(f"프로필을 찾을 수 없습니다: {args.profile} (사용 가능: {', '.join(sorted(profiles))})")
+    profile = MockProfile(args.profile, profiles[args.profile])
+    cassette = Cassette(args.cassette) if args.cassette else None
+    server = MockLLMServer(
+        profile,
+        [model.strip() for model in args.models.split(",") if model.strip()],
+        mode=args.mode,
+        cassette=cassette,
+        upstream=args.upstream,
+        replay_fallback=args.replay_fallback,
+        seed=args.seed
+    )
+    return server, profile
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="모의 LLM 서버 (vLLM/OpenAI, Anthropic, Ollama 응답 형식)")
+    parser.add_argument("--host", default="127.0.0.1", help="바인드 주소")
+    parser.add_argument("--port", type=int, default=8133, help="포트")
+    parser.add_argument("--profile", default="vllm", help="지연 프로필 이름")
+    parser.add_argument("--profile-file", help="프로필 YAML 파일 (profiles: {이름: {항목: 값}})")
+    parser.add_argument("--models", default="/model", help="제공 모델 목록 (쉼표 구분, /v1/models와 /api/tags 응답)")
+    parser.add_argument("--mode", default="synthetic", choices=["synthetic", "record", "replay"], help="응답 모드")
+    parser.add_argument("--upstream", help="record 모드에서 요청을 전달할 서버 (예: http://localhost:8000)")
+    parser.add_argument("--cassette", help="기록/재생 파일 (JSONL)")
+    parser.add_argument("--replay-fallback", action="store_true", help="replay 모드에서 기록이 없으면 합성 응답 반환")
+    parser.add_argument("--seed", type=int, default=0, help="난수 시드")
+    args = parser.parse_args()
+    
+    server, profile = build_server(args)
+    print(f"모의 LLM 서버: http://{args.host}:{args.port}, 프로필={profile.name} {profile.values}, 모드={args.mode}")
+    uvicorn.run(create_app(server), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -27,6 +27,19 @@ public class RouteConfig {
         @Value("${gateway.routes.summary.path}")
         private String summaryServicePath;
 
+        // LLM 스트리밍 라우트 (Orchestrator SSE)
+        @Value("${gateway.routes.llm-stream.enabled:false}")
+        private boolean llmStreamEnabled;
+
+        @Value("${gateway.routes.llm-stream.uri:http://localhost:8000}")
+        private String llmStreamUri;
+
+        @Value("${gateway.routes.llm-stream.prod-uri:}")
+        private String llmStreamProdUri;
+
+        @Value("${gateway.routes.llm-stream.path:/api/llm/process/stream}")
+        private String llmStreamPath;
+
         // 확장용 라우트 1
         @Value("${gateway.routes.route1.enabled:false}")
         private boolean route1Enabled;
@@ -156,6 +169,17 @@ public class RouteConfig {
                                                 )
                                                 .uri(webSocketUri));
 
+                // LLM 스트리밍 라우트 (prod-uri가 없으면 uri 사용)
+                if (llmStreamEnabled) {
+                        final String llmStreamUriFinal = "prod".equals(activeProfile) && !llmStreamProdUri.isEmpty()
+                                        ? llmStreamProdUri
+                                        : llmStreamUri;
+                        System.out.println("LLM 스트리밍 라우트 활성화 - URI: " + llmStreamUriFinal + ", Path: " + llmStreamPath);
+                        routesBuilder.route("llmStreamRoute", r -> r
+                                        .path(llmStreamPath)
+                                        .uri(llmStreamUriFinal));
+                }
+
                 // 확장용 라우트 1
                 if (route1Enabled) {
                         final String route1UriFinal = "prod".equals(activeProfile) ? route1ProdUri : route1Uri;